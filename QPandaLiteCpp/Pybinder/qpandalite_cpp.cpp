@@ -6,94 +6,244 @@
 #include "pybind11/pybind11.h"
 #include "pybind11/stl.h"
 #include "pybind11/complex.h"
+#include "pybind11/numpy.h"
 #include "pybind11/functional.h"
 #include "pybind11/operators.h"
 
 #include "simulator.h"
 #include "density_operator_simulator.h"
 #include "rng.h"
+#include "parallel.h"
 using namespace std;
 using namespace pybind11::literals;
 namespace py = pybind11;
 
-PYBIND11_MODULE(qpandalite_cpp, m)
+/* A copy of the state as a NumPy array (one memcpy, no Python complex objects).
+ * init_n_qubit and load_state replace the simulator's buffer and every gate
+ * changes it, so an array sharing it could outlive it or change under the
+ * reader; the returned array owns its data. */
+template<typename SimulatorType>
+py::array state_copy(const SimulatorType& simulator)
 {
-	m.doc() = "[Module qpandalite_cpp]";
-	m.def("seed", &qpandalite::seed);
-	m.def("rand", &qpandalite::rand);
+	using amp_t = typename decltype(simulator.state)::value_type;
+	return py::array_t<amp_t>(simulator.state.size(), simulator.state.data());
+}
+
+/* Copy an array (any shape, converted to the amplitude type) into the simulator's state */
+template<typename SimulatorType, typename amp_t = typename decltype(SimulatorType::state)::value_type>
+void load_state_from_array(SimulatorType& simulator, py::array_t<amp_t, py::array::c_style | py::array::forcecast> state)
+{
+	simulator.load_state(std::vector<amp_t>(state.data(), state.data() + state.size()));
+}
+
+/* Whole-state operations run without the GIL, so threads can simulate in parallel */
+static const auto release_gil = py::call_guard<py::gil_scoped_release>();
+
+/* Compact pickling of OpcodeProgram: one NumPy array per field */
+template<typename T>
+py::array_t<T> vector_to_array(const std::vector<T>& v)
+{
+	return py::array_t<T>(v.size(), v.data());
+}
+
+template<typename T>
+std::vector<T> array_to_vector(py::handle obj)
+{
+	auto arr = py::array_t<T, py::array::c_style | py::array::forcecast>::ensure(obj);
+	if (!arr)
+		throw py::value_error("OpcodeProgram state must hold arrays.");
+	return std::vector<T>(arr.data(), arr.data() + arr.size());
+}
+
+py::tuple program_getstate(const qpandalite::OpcodeProgram& program)
+{
+	std::vector<uint8_t> daggers(program.daggers.begin(), program.daggers.end());
+	return py::make_tuple(vector_to_array(program.ops), vector_to_array(daggers),
+		vector_to_array(program.qubit_offsets), vector_to_array(program.qubits),
+		vector_to_array(program.param_offsets), vector_to_array(program.params),
+		vector_to_array(program.controller_offsets), vector_to_array(program.controllers));
+}
+
+qpandalite::OpcodeProgram program_setstate(py::tuple state)
+{
+	if (state.size() != 8)
+		throw py::value_error("Invalid OpcodeProgram state.");
+	auto daggers = array_to_vector<uint8_t>(state[1]);
+	qpandalite::OpcodeProgram program(array_to_vector<uint32_t>(state[0]),
+		std::vector<bool>(daggers.begin(), daggers.end()),
+		array_to_vector<size_t>(state[2]), array_to_vector<size_t>(state[3]),
+		array_to_vector<size_t>(state[4]), array_to_vector<double>(state[5]),
+		array_to_vector<size_t>(state[6]), array_to_vector<size_t>(state[7]));
+	program.validate();
+	return program;
+}
 
+/* StatevectorSimulator and StatevectorSimulatorF32 share the same interface */
+template<typename SimulatorType>
+void bind_statevector_simulator(py::module_& m, const char* name)
+{
 	auto py_arg_global_controller = (py::arg("global_controller") = std::vector<size_t>{});
 	auto py_arg_dagger = (py::arg("dagger") = false);
 
-	using get_prob_type1 = qpandalite::dtype(qpandalite::StatevectorSimulator::*)(size_t, int);
-	using get_prob_type2 = qpandalite::dtype(qpandalite::StatevectorSimulator::*)(const std::map<size_t, int>&);
+	using get_prob_type1 = qpandalite::dtype(SimulatorType::*)(size_t, int);
+	using get_prob_type2 = qpandalite::dtype(SimulatorType::*)(const std::map<size_t, int>&);
 
-	using pmeasure_type1 = std::vector<qpandalite::dtype>(qpandalite::StatevectorSimulator::*)(size_t);
-	using pmeasure_type2 = std::vector<qpandalite::dtype>(qpandalite::StatevectorSimulator::*)(const std::vector<size_t>&);
+	using pmeasure_type1 = std::vector<qpandalite::dtype>(SimulatorType::*)(size_t);
+	using pmeasure_type2 = std::vector<qpandalite::dtype>(SimulatorType::*)(const std::vector<size_t>&);
 	
-	using measure_single_shot_type1 = size_t(qpandalite::StatevectorSimulator::*)(size_t);
-	using measure_single_shot_type2 = size_t(qpandalite::StatevectorSimulator::*)(const std::vector<size_t>&);
+	using measure_single_shot_type1 = size_t(SimulatorType::*)(size_t);
+	using measure_single_shot_type2 = size_t(SimulatorType::*)(const std::vector<size_t>&);
 
-	py::class_<qpandalite::StatevectorSimulator>(m, "StatevectorSimulator")
+	py::class_<SimulatorType>(m, name)
 		.def(py::init<>())
-		.def_readwrite_static("max_qubit_num", &qpandalite::StatevectorSimulator::max_qubit_num)
-		.def_readonly("total_qubit", &qpandalite::StatevectorSimulator::total_qubit)
-		.def_readonly("state", &qpandalite::StatevectorSimulator::state)
-		.def("init_n_qubit", &qpandalite::StatevectorSimulator::init_n_qubit)
-		.def("hadamard", &qpandalite::StatevectorSimulator::hadamard, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
-		.def("u22", &qpandalite::StatevectorSimulator::u22, py::arg("qn"), py::arg("unitary"), py_arg_global_controller, py_arg_dagger)
-		.def("x", &qpandalite::StatevectorSimulator::x, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
-		.def("sx", &qpandalite::StatevectorSimulator::sx, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
-		.def("y", &qpandalite::StatevectorSimulator::y, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
-		.def("z", &qpandalite::StatevectorSimulator::z, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
-		.def("s", &qpandalite::StatevectorSimulator::s, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
-		.def("t", &qpandalite::StatevectorSimulator::t, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
-		.def("cz", &qpandalite::StatevectorSimulator::cz, py::arg("qn1"), py::arg("qn2"), py_arg_global_controller, py_arg_dagger)
-		.def("iswap", &qpandalite::StatevectorSimulator::iswap, py::arg("qn1"), py::arg("qn2"), py_arg_global_controller, py_arg_dagger)
-		.def("swap", &qpandalite::StatevectorSimulator::swap, py::arg("qn1"), py::arg("qn2"), py_arg_global_controller, py_arg_dagger)
-		.def("xy", &qpandalite::StatevectorSimulator::xy, py::arg("qn1"), py::arg("qn2"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
-		.def("cnot", &qpandalite::StatevectorSimulator::cnot, py::arg("controller"), py::arg("target"), py_arg_global_controller, py_arg_dagger)
-		.def("rx", &qpandalite::StatevectorSimulator::rx, py::arg("qn"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
-		.def("ry", &qpandalite::StatevectorSimulator::ry, py::arg("qn"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
-		.def("rz", &qpandalite::StatevectorSimulator::rz, py::arg("qn"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
-		.def("u1", &qpandalite::StatevectorSimulator::u1, py::arg("qn"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
-		.def("u2", &qpandalite::StatevectorSimulator::u2, py::arg("qn"), py::arg("phi"), py::arg("lamda"), py_arg_global_controller, py_arg_dagger)
-		.def("rphi90", &qpandalite::StatevectorSimulator::rphi90, py::arg("qn"), py::arg("phi"), py_arg_global_controller, py_arg_dagger)
-		.def("rphi180", &qpandalite::StatevectorSimulator::rphi180, py::arg("qn"), py::arg("phi"), py_arg_global_controller, py_arg_dagger)
-		.def("rphi", &qpandalite::StatevectorSimulator::rphi, py::arg("qn"), py::arg("theta"), py::arg("phi"), py_arg_global_controller, py_arg_dagger)
-		.def("toffoli", &qpandalite::StatevectorSimulator::toffoli, py::arg("controller1"), py::arg("controller2"), py::arg("target"), py_arg_global_controller, py_arg_dagger)
-		.def("cswap", &qpandalite::StatevectorSimulator::cswap, py::arg("controller"), py::arg("target1"), py::arg("target2"), py_arg_global_controller, py_arg_dagger)
-		.def("xx", &qpandalite::StatevectorSimulator::xx, py::arg("qn1"), py::arg("qn2"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
-		.def("yy", &qpandalite::StatevectorSimulator::yy, py::arg("qn1"), py::arg("qn2"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
-		.def("zz", &qpandalite::StatevectorSimulator::zz, py::arg("qn1"), py::arg("qn2"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
-		.def("u3", &qpandalite::StatevectorSimulator::u3, py::arg("qn"), py::arg("theta"), py::arg("phi"), py::arg("lamda"), py_arg_global_controller, py_arg_dagger)
-		.def("phase2q", &qpandalite::StatevectorSimulator::phase2q, py::arg("qn1"), py::arg("qn2"), py::arg("theta1"), py::arg("theta2"), py::arg("thetazz"), py_arg_global_controller, py_arg_dagger)
-		.def("uu15", &qpandalite::StatevectorSimulator::uu15, py::arg("qn1"), py::arg("qn2"), py::arg("parameters"), py_arg_global_controller, py_arg_dagger)
+		.def_readwrite_static("max_qubit_num", &SimulatorType::max_qubit_num)
+		.def_readonly("total_qubit", &SimulatorType::total_qubit)
+		.def_property_readonly("state", &state_copy<SimulatorType>)
+		.def("__copy__", [](const SimulatorType& self) { return SimulatorType(self); })
+		.def("__deepcopy__", [](const SimulatorType& self, py::dict) { return SimulatorType(self); }, py::arg("memo"))
+		.def("init_n_qubit", &SimulatorType::init_n_qubit, release_gil)
+		.def("load_state", &load_state_from_array<SimulatorType>, py::arg("state"))
+		.def("hadamard", &SimulatorType::hadamard, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
+		.def("u22", &SimulatorType::u22, py::arg("qn"), py::arg("unitary"), py_arg_global_controller, py_arg_dagger)
+		.def("x", &SimulatorType::x, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
+		.def("sx", &SimulatorType::sx, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
+		.def("y", &SimulatorType::y, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
+		.def("z", &SimulatorType::z, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
+		.def("s", &SimulatorType::s, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
+		.def("t", &SimulatorType::t, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
+		.def("cz", &SimulatorType::cz, py::arg("qn1"), py::arg("qn2"), py_arg_global_controller, py_arg_dagger)
+		.def("iswap", &SimulatorType::iswap, py::arg("qn1"), py::arg("qn2"), py_arg_global_controller, py_arg_dagger)
+		.def("swap", &SimulatorType::swap, py::arg("qn1"), py::arg("qn2"), py_arg_global_controller, py_arg_dagger)
+		.def("xy", &SimulatorType::xy, py::arg("qn1"), py::arg("qn2"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
+		.def("cnot", &SimulatorType::cnot, py::arg("controller"), py::arg("target"), py_arg_global_controller, py_arg_dagger)
+		.def("rx", &SimulatorType::rx, py::arg("qn"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
+		.def("ry", &SimulatorType::ry, py::arg("qn"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
+		.def("rz", &SimulatorType::rz, py::arg("qn"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
+		.def("u1", &SimulatorType::u1, py::arg("qn"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
+		.def("u2", &SimulatorType::u2, py::arg("qn"), py::arg("phi"), py::arg("lamda"), py_arg_global_controller, py_arg_dagger)
+		.def("rphi90", &SimulatorType::rphi90, py::arg("qn"), py::arg("phi"), py_arg_global_controller, py_arg_dagger)
+		.def("rphi180", &SimulatorType::rphi180, py::arg("qn"), py::arg("phi"), py_arg_global_controller, py_arg_dagger)
+		.def("rphi", &SimulatorType::rphi, py::arg("qn"), py::arg("theta"), py::arg("phi"), py_arg_global_controller, py_arg_dagger)
+		.def("toffoli", &SimulatorType::toffoli, py::arg("controller1"), py::arg("controller2"), py::arg("target"), py_arg_global_controller, py_arg_dagger)
+		.def("cswap", &SimulatorType::cswap, py::arg("controller"), py::arg("target1"), py::arg("target2"), py_arg_global_controller, py_arg_dagger)
+		.def("xx", &SimulatorType::xx, py::arg("qn1"), py::arg("qn2"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
+		.def("yy", &SimulatorType::yy, py::arg("qn1"), py::arg("qn2"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
+		.def("zz", &SimulatorType::zz, py::arg("qn1"), py::arg("qn2"), py::arg("theta"), py_arg_global_controller, py_arg_dagger)
+		.def("u3", &SimulatorType::u3, py::arg("qn"), py::arg("theta"), py::arg("phi"), py::arg("lamda"), py_arg_global_controller, py_arg_dagger)
+		.def("phase2q", &SimulatorType::phase2q, py::arg("qn1"), py::arg("qn2"), py::arg("theta1"), py::arg("theta2"), py::arg("thetazz"), py_arg_global_controller, py_arg_dagger)
+		.def("uu15", &SimulatorType::uu15, py::arg("qn1"), py::arg("qn2"), py::arg("parameters"), py_arg_global_controller, py_arg_dagger)
+		.def("unitary", &SimulatorType::unitary, py::arg("qubits"), py::arg("matrix"), py_arg_global_controller, py_arg_dagger, release_gil)
 		
-		.def("pauli_error_1q", &qpandalite::StatevectorSimulator::pauli_error_1q, py::arg("qn"), py::arg("px"), py::arg("py"), py::arg("pz"))
-		.def("depolarizing", &qpandalite::StatevectorSimulator::depolarizing, py::arg("qn"), py::arg("p"))
-		.def("bitflip", &qpandalite::StatevectorSimulator::bitflip, py::arg("qn"), py::arg("p"))
-		.def("phaseflip", &qpandalite::StatevectorSimulator::phaseflip, py::arg("qn"), py::arg("p"))
-		.def("pauli_error_2q", &qpandalite::StatevectorSimulator::pauli_error_2q, py::arg("qn1"), py::arg("qn2"), py::arg("p"))
-		.def("twoqubit_depolarizing", &qpandalite::StatevectorSimulator::twoqubit_depolarizing, py::arg("qn1"), py::arg("qn2"), py::arg("p"))
-		.def("kraus1q", &qpandalite::StatevectorSimulator::kraus1q, py::arg("qn"), py::arg("kraus_ops"))
-		.def("amplitude_damping", &qpandalite::StatevectorSimulator::amplitude_damping, py::arg("qn"), py::arg("gamma"))
-
-		.def("get_prob", (get_prob_type1)&qpandalite::StatevectorSimulator::get_prob, py::arg("qn"), py::arg("qstate"))
-		.def("get_prob", (get_prob_type2)&qpandalite::StatevectorSimulator::get_prob, py::arg("measure_map"))
-		.def("pmeasure", (pmeasure_type1)&qpandalite::StatevectorSimulator::pmeasure, py::arg("qn"))
-		.def("pmeasure", (pmeasure_type2)&qpandalite::StatevectorSimulator::pmeasure, py::arg("measure_qubits"))
+		.def("pauli_error_1q", &SimulatorType::pauli_error_1q, py::arg("qn"), py::arg("px"), py::arg("py"), py::arg("pz"))
+		.def("depolarizing", &SimulatorType::depolarizing, py::arg("qn"), py::arg("p"))
+		.def("bitflip", &SimulatorType::bitflip, py::arg("qn"), py::arg("p"))
+		.def("phaseflip", &SimulatorType::phaseflip, py::arg("qn"), py::arg("p"))
+		.def("pauli_error_2q", &SimulatorType::pauli_error_2q, py::arg("qn1"), py::arg("qn2"), py::arg("p"))
+		.def("twoqubit_depolarizing", &SimulatorType::twoqubit_depolarizing, py::arg("qn1"), py::arg("qn2"), py::arg("p"))
+		.def("kraus1q", &SimulatorType::kraus1q, py::arg("qn"), py::arg("kraus_ops"))
+		.def("amplitude_damping", &SimulatorType::amplitude_damping, py::arg("qn"), py::arg("gamma"))
+		.def("run_program", &SimulatorType::run_program, py::arg("program"), release_gil)
+
+		.def("get_prob", (get_prob_type1)&SimulatorType::get_prob, py::arg("qn"), py::arg("qstate"), release_gil)
+		.def("get_prob", (get_prob_type2)&SimulatorType::get_prob, py::arg("measure_map"), release_gil)
+		.def("pmeasure", (pmeasure_type1)&SimulatorType::pmeasure, py::arg("qn"), release_gil)
+		.def("pmeasure", (pmeasure_type2)&SimulatorType::pmeasure, py::arg("measure_qubits"), release_gil)
 		
-		.def("measure_single_shot", (measure_single_shot_type1)&qpandalite::StatevectorSimulator::measure_single_shot, py::arg("qubit"))
-		.def("measure_single_shot", (measure_single_shot_type2)&qpandalite::StatevectorSimulator::measure_single_shot, py::arg("qubits"))
+		.def("measure_single_shot", (measure_single_shot_type1)&SimulatorType::measure_single_shot, py::arg("qubit"))
+		.def("measure_single_shot", (measure_single_shot_type2)&SimulatorType::measure_single_shot, py::arg("qubits"))
+
+		.def("expval_pauli", &SimulatorType::expval_pauli, py::arg("pauli_string"), release_gil)
+		.def("expval_pauli_sum", &SimulatorType::expval_pauli_sum, py::arg("terms"), py::arg("coeffs"), release_gil)
+		;
+}
+
+PYBIND11_MODULE(qpandalite_cpp, m)
+{
+	m.doc() = "[Module qpandalite_cpp]";
+	m.def("seed", &qpandalite::seed);
+	m.def("rand", &qpandalite::rand);
+	m.def("set_num_threads", &qpandalite::set_num_threads, py::arg("n"));
+	m.def("get_num_threads", &qpandalite::get_num_threads);
+
+	auto py_arg_global_controller = (py::arg("global_controller") = std::vector<size_t>{});
+	auto py_arg_dagger = (py::arg("dagger") = false);
+
+	py::enum_<qpandalite::OpType>(m, "OpType")
+		.value("H", qpandalite::OpType::H)
+		.value("X", qpandalite::OpType::X)
+		.value("Y", qpandalite::OpType::Y)
+		.value("Z", qpandalite::OpType::Z)
+		.value("S", qpandalite::OpType::S)
+		.value("T", qpandalite::OpType::T)
+		.value("SX", qpandalite::OpType::SX)
+		.value("CZ", qpandalite::OpType::CZ)
+		.value("SWAP", qpandalite::OpType::SWAP)
+		.value("ISWAP", qpandalite::OpType::ISWAP)
+		.value("XY", qpandalite::OpType::XY)
+		.value("CNOT", qpandalite::OpType::CNOT)
+		.value("RX", qpandalite::OpType::RX)
+		.value("RY", qpandalite::OpType::RY)
+		.value("RZ", qpandalite::OpType::RZ)
+		.value("U1", qpandalite::OpType::U1)
+		.value("U2", qpandalite::OpType::U2)
+		.value("U3", qpandalite::OpType::U3)
+		.value("RPhi90", qpandalite::OpType::RPhi90)
+		.value("RPhi180", qpandalite::OpType::RPhi180)
+		.value("RPhi", qpandalite::OpType::RPhi)
+		.value("TOFFOLI", qpandalite::OpType::TOFFOLI)
+		.value("CSWAP", qpandalite::OpType::CSWAP)
+		.value("XX", qpandalite::OpType::XX)
+		.value("YY", qpandalite::OpType::YY)
+		.value("ZZ", qpandalite::OpType::ZZ)
+		.value("PHASE2Q", qpandalite::OpType::PHASE2Q)
+		.value("UU15", qpandalite::OpType::UU15)
+		.value("PauliError1Q", qpandalite::OpType::PauliError1Q)
+		.value("Depolarizing", qpandalite::OpType::Depolarizing)
+		.value("BitFlip", qpandalite::OpType::BitFlip)
+		.value("PhaseFlip", qpandalite::OpType::PhaseFlip)
+		.value("AmplitudeDamping", qpandalite::OpType::AmplitudeDamping)
+		.value("PauliError2Q", qpandalite::OpType::PauliError2Q)
+		.value("TwoQubitDepolarizing", qpandalite::OpType::TwoQubitDepolarizing)
+		.value("UNITARY", qpandalite::OpType::UNITARY)
 		;
 
+	py::class_<qpandalite::OpcodeProgram>(m, "OpcodeProgram")
+		.def(py::init<>())
+		.def(py::init<std::vector<uint32_t>, std::vector<bool>,
+			std::vector<size_t>, std::vector<size_t>,
+			std::vector<size_t>, std::vector<double>,
+			std::vector<size_t>, std::vector<size_t>>(),
+			py::arg("ops"), py::arg("daggers"),
+			py::arg("qubit_offsets"), py::arg("qubits"),
+			py::arg("param_offsets"), py::arg("params"),
+			py::arg("controller_offsets"), py::arg("controllers"))
+		.def_readonly("ops", &qpandalite::OpcodeProgram::ops)
+		.def_readonly("daggers", &qpandalite::OpcodeProgram::daggers)
+		.def_readonly("qubit_offsets", &qpandalite::OpcodeProgram::qubit_offsets)
+		.def_readonly("qubits", &qpandalite::OpcodeProgram::qubits)
+		.def_readonly("param_offsets", &qpandalite::OpcodeProgram::param_offsets)
+		.def_readwrite("params", &qpandalite::OpcodeProgram::params)
+		.def_readonly("controller_offsets", &qpandalite::OpcodeProgram::controller_offsets)
+		.def_readonly("controllers", &qpandalite::OpcodeProgram::controllers)
+		.def("validate", &qpandalite::OpcodeProgram::validate)
+		.def("with_params", &qpandalite::OpcodeProgram::with_params, py::arg("params"))
+		.def("__len__", &qpandalite::OpcodeProgram::size)
+		.def("__copy__", [](const qpandalite::OpcodeProgram& self) { return qpandalite::OpcodeProgram(self); })
+		.def(py::pickle(&program_getstate, &program_setstate))
+		;
+
+	bind_statevector_simulator<qpandalite::StatevectorSimulator>(m, "StatevectorSimulator");
+	bind_statevector_simulator<qpandalite::StatevectorSimulatorF32>(m, "StatevectorSimulatorF32");
+
 	py::class_<qpandalite::DensityOperatorSimulator>(m, "DensityOperatorSimulator")
 		.def(py::init<>())
 		.def_readwrite_static("max_qubit_num", &qpandalite::DensityOperatorSimulator::max_qubit_num)
 		.def_readonly("total_qubit", &qpandalite::DensityOperatorSimulator::total_qubit)
-		.def_readonly("state", &qpandalite::DensityOperatorSimulator::state)
+		.def_property_readonly("state", &state_copy<qpandalite::DensityOperatorSimulator>)
+		.def("__copy__", [](const qpandalite::DensityOperatorSimulator& self) { return qpandalite::DensityOperatorSimulator(self); })
+		.def("__deepcopy__", [](const qpandalite::DensityOperatorSimulator& self, py::dict) { return qpandalite::DensityOperatorSimulator(self); }, py::arg("memo"))
 		.def("init_n_qubit", &qpandalite::DensityOperatorSimulator::init_n_qubit)
+		.def("load_state", &load_state_from_array<qpandalite::DensityOperatorSimulator>, py::arg("state"))
 		.def("hadamard", &qpandalite::DensityOperatorSimulator::hadamard, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
 		.def("u22", &qpandalite::DensityOperatorSimulator::u22, py::arg("qn"), py::arg("unitary"), py_arg_global_controller, py_arg_dagger)
 		.def("x", &qpandalite::DensityOperatorSimulator::x, py::arg("qn"), py_arg_global_controller, py_arg_dagger)
@@ -123,6 +273,7 @@ PYBIND11_MODULE(qpandalite_cpp, m)
 		.def("u3", &qpandalite::DensityOperatorSimulator::u3, py::arg("qn"), py::arg("theta"), py::arg("phi"), py::arg("lamda"), py_arg_global_controller, py_arg_dagger)
 		.def("phase2q", &qpandalite::DensityOperatorSimulator::phase2q, py::arg("qn1"), py::arg("qn2"), py::arg("theta1"), py::arg("theta2"), py::arg("thetazz"), py_arg_global_controller, py_arg_dagger)
 		.def("uu15", &qpandalite::DensityOperatorSimulator::uu15, py::arg("qn1"), py::arg("qn2"), py::arg("parameters"), py_arg_global_controller, py_arg_dagger)
+		.def("unitary", &qpandalite::DensityOperatorSimulator::unitary, py::arg("qubits"), py::arg("matrix"), py_arg_global_controller, py_arg_dagger)
 		
 		.def("pauli_error_1q", &qpandalite::DensityOperatorSimulator::pauli_error_1q, py::arg("qn"), py::arg("px"), py::arg("py"), py::arg("pz"))
 		.def("depolarizing", &qpandalite::DensityOperatorSimulator::depolarizing, py::arg("qn"), py::arg("p"))
@@ -132,12 +283,15 @@ PYBIND11_MODULE(qpandalite_cpp, m)
 		.def("twoqubit_depolarizing", &qpandalite::DensityOperatorSimulator::twoqubit_depolarizing, py::arg("qn1"), py::arg("qn2"), py::arg("p"))
 		.def("kraus1q", &qpandalite::DensityOperatorSimulator::kraus1q, py::arg("qn"), py::arg("kraus_ops"))
 		.def("amplitude_damping", &qpandalite::DensityOperatorSimulator::amplitude_damping, py::arg("qn"), py::arg("gamma"))
+		.def("run_program", &qpandalite::DensityOperatorSimulator::run_program, py::arg("program"), release_gil)
 				
-		.def("get_prob", &qpandalite::DensityOperatorSimulator::get_prob)
-		.def("get_prob", &qpandalite::DensityOperatorSimulator::get_prob_map)
-		.def("pmeasure", &qpandalite::DensityOperatorSimulator::pmeasure)
-		.def("pmeasure", &qpandalite::DensityOperatorSimulator::pmeasure_list)
-		.def("stateprob", &qpandalite::DensityOperatorSimulator::stateprob)
+		.def("get_prob", &qpandalite::DensityOperatorSimulator::get_prob, release_gil)
+		.def("get_prob", &qpandalite::DensityOperatorSimulator::get_prob_map, release_gil)
+		.def("pmeasure", &qpandalite::DensityOperatorSimulator::pmeasure, release_gil)
+		.def("pmeasure", &qpandalite::DensityOperatorSimulator::pmeasure_list, release_gil)
+		.def("stateprob", &qpandalite::DensityOperatorSimulator::stateprob, release_gil)
+		.def("expval_pauli", &qpandalite::DensityOperatorSimulator::expval_pauli, py::arg("pauli_string"), release_gil)
+		.def("expval_pauli_sum", &qpandalite::DensityOperatorSimulator::expval_pauli_sum, py::arg("terms"), py::arg("coeffs"), release_gil)
 		;
 	
 	/*py::enum_<qpandalite::NoiseType>(m, "NoiseType")
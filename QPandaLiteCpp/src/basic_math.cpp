@@ -46,6 +46,30 @@ namespace qpandalite
         return true;
     }
 
+    bool _assert_unitary(const std::vector<complex_t>& u, size_t dim)
+    {
+        if (u.size() != dim * dim)
+        {
+            return false;
+        }
+        for (size_t i = 0; i < dim; ++i)
+        {
+            for (size_t j = 0; j < dim; ++j)
+            {
+                complex_t sum = 0;
+                for (size_t k = 0; k < dim; ++k)
+                {
+                    sum += u[i * dim + k] * std::conj(u[j * dim + k]);
+                }
+                if (!complex_equal(sum, i == j ? 1 : 0))
+                {
+                    return false;
+                }
+            }
+        }
+        return true;
+    }
+
     u22_t matmul(const u22_t& u1, const u22_t& u2)
     {
         // 0 1
@@ -14,7 +14,18 @@ namespace qpandalite {
     constexpr dtype INVSQRT2 = 1.0 / SQRT2;
     constexpr dtype eps = 1e-7;
 
+    /* largest number of qubits of a generic unitary gate */
+    constexpr size_t max_unitary_qubits = 6;
+
     constexpr unsigned long long pow2(size_t n) { return 1ull << n; }
+
+    /* number of set bits of x, modulo 2 */
+    constexpr size_t bit_parity(unsigned long long x)
+    {
+        x ^= x >> 32; x ^= x >> 16; x ^= x >> 8;
+        x ^= x >> 4; x ^= x >> 2; x ^= x >> 1;
+        return x & 1;
+    }
     
     size_t extract_digit(size_t i, size_t digit);
 
@@ -44,6 +55,9 @@ namespace qpandalite {
 
     bool _assert_u22(const u22_t& u);
 
+    /* Check U * U^dag = I for a dim x dim row-major matrix. */
+    bool _assert_unitary(const std::vector<complex_t>& u, size_t dim);
+
     constexpr complex_t val(const u22_t& u, int i, int j)
     {
         constexpr int rowsz = 2;
@@ -18,6 +18,27 @@ namespace qpandalite
         total_qubit = nqubit;
 	}
 
+    void DensityOperatorSimulator::load_state(std::vector<complex_t> new_state)
+    {
+        size_t nqubit = 0;
+        while (pow2(nqubit * 2) < new_state.size())
+            nqubit++;
+
+        if (new_state.empty() || pow2(nqubit * 2) != new_state.size())
+        {
+            auto errstr = fmt::format("Density matrix size must be a power of 4 (size = {})", new_state.size());
+            ThrowInvalidArgument(errstr);
+        }
+        if (nqubit > max_qubit_num)
+        {
+            auto errstr = fmt::format("Exceed max_qubit_num (nqubit = {}, limit = {})", nqubit, max_qubit_num);
+            ThrowInvalidArgument(errstr);
+        }
+
+        state = std::move(new_state);
+        total_qubit = nqubit;
+    }
+
     /* Hadamard gate
       matrix form
       1/sqrt(2) * [ 1 1 ]
@@ -621,6 +642,24 @@ namespace qpandalite
         uu15_unsafe_impl(state, qn1, qn2, parameters, total_qubit, controller_mask, is_dagger);
     }
 
+    void DensityOperatorSimulator::unitary(const std::vector<size_t>& qubits, const std::vector<complex_t>& matrix, const std::vector<size_t>& global_controller, bool is_dagger)
+    {
+        auto u = prepare_unitary(qubits, matrix, total_qubit, is_dagger);
+        size_t controller_mask = make_controller_mask(global_controller);
+
+        /* rho[i, j] is state[i * 2^n + j], so rho is a 2n-qubit vector whose
+         * high n qubits index the row and low n qubits index the column.
+         * rho -> U rho U^dag is U on the row qubits and conj(U) on the column qubits. */
+        std::vector<size_t> row_qubits;
+        for (size_t qn : qubits)
+            row_qubits.push_back(qn + total_qubit);
+        statevector_simulator_impl::unitary_unsafe_impl(state, row_qubits, u, 2 * total_qubit, controller_mask << total_qubit);
+
+        for (auto& elem : u)
+            elem = std::conj(elem);
+        statevector_simulator_impl::unitary_unsafe_impl(state, qubits, u, 2 * total_qubit, controller_mask);
+    }
+
     void DensityOperatorSimulator::pauli_error_1q(size_t qn, double px, double py, double pz)
     {
         double sum = px + py + pz;
@@ -815,6 +854,11 @@ namespace qpandalite
         kraus1q(qn, { E0, E1 });
     }
 
+    void DensityOperatorSimulator::run_program(const OpcodeProgram& program)
+    {
+        execute_program(*this, program);
+    }
+
     dtype DensityOperatorSimulator::get_prob_map(const std::map<size_t, int>& measure_qubits)
     {
         size_t N = pow2(total_qubit);
@@ -901,6 +945,29 @@ namespace qpandalite
         return ret;
     } 
 
+    dtype DensityOperatorSimulator::expval_pauli(const std::string& pauli_string)
+    {
+        const PauliMask pauli = parse_pauli_string(pauli_string, total_qubit);
+        const size_t N = pow2(total_qubit);
+        const complex_t* rho = state.data();
+
+        /* Tr(rho P) = sum_b rho[b, b ^ x] * phase * (-1)^parity(b & z) */
+        return parallel_sum(N, [&](size_t b) {
+            const double term = std::real(pauli.phase * rho[b * N + (b ^ pauli.x_mask)]);
+            return bit_parity(b & pauli.z_mask) ? -term : term;
+        });
+    }
+
+    dtype DensityOperatorSimulator::expval_pauli_sum(const std::vector<std::string>& terms, const std::vector<double>& coeffs)
+    {
+        check_pauli_sum(terms, coeffs);
+
+        dtype ret = 0;
+        for (size_t i = 0; i < terms.size(); ++i)
+            ret += coeffs[i] * expval_pauli(terms[i]);
+        return ret;
+    }
+
     std::string u22_to_str(const u22_t& E)
     {
         return fmt::format("[{}+{}j, {}+{}j; {}+{}j, {}+{}j]\n",
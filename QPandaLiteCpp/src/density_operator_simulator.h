@@ -10,6 +10,7 @@
 
 #include "errors.h"
 #include "simulator_impl.h"
+#include "opcode_program.h"
 
 namespace qpandalite {
     
@@ -20,6 +21,8 @@ namespace qpandalite {
         std::vector<complex_t> state;
 
         void init_n_qubit(size_t nqubit);
+        /* replace the state by a given row-major density matrix of size 4^n */
+        void load_state(std::vector<complex_t> new_state);
 
         void hadamard(size_t qn, const std::vector<size_t>& global_controller = {}, bool is_dagger = false);
         void u22(size_t qn, const u22_t& unitary, const std::vector<size_t>& global_controller = {}, bool is_dagger = false);
@@ -50,6 +53,8 @@ namespace qpandalite {
         void u3(size_t qn, double theta, double phi, double lambda, const std::vector<size_t>& global_controller = {}, bool is_dagger = false);
         void phase2q(size_t qn1, size_t qn2, double theta1, double theta2, double thetazz, const std::vector<size_t>& global_controller = {}, bool is_dagger = false);
         void uu15(size_t qn1, size_t qn2, const std::vector<double>& parameters, const std::vector<size_t>& global_controller = {}, bool is_dagger = false);
+        /* generic k-qubit gate, matrix is row-major and bit b of its index corresponds to qubits[b] */
+        void unitary(const std::vector<size_t>& qubits, const std::vector<complex_t>& matrix, const std::vector<size_t>& global_controller = {}, bool is_dagger = false);
 
         void pauli_error_1q(size_t qn, double px, double py, double pz);
         void depolarizing(size_t qn, double p);
@@ -61,12 +66,19 @@ namespace qpandalite {
         void kraus2q(size_t qn, size_t qn2, const Kraus2Q& kraus_ops);
         void amplitude_damping(size_t qn, double gamma);
 
+        /* run a whole compiled program in one call */
+        void run_program(const OpcodeProgram& program);
+
         dtype get_prob_map(const std::map<size_t, int>& measure_qubits);
         dtype get_prob(size_t qn, int state);
         std::vector<dtype> pmeasure_list(const std::vector<size_t>& measure_list);
         std::vector<dtype> pmeasure(size_t measure_qubit);
 
         std::vector<dtype> stateprob() const;
+
+        /* expectation values of Pauli strings, Tr(rho P) */
+        dtype expval_pauli(const std::string& pauli_string);
+        dtype expval_pauli_sum(const std::vector<std::string>& terms, const std::vector<double>& coeffs);
     };
 
     std::string kraus2str(const Kraus1Q& kraus_ops);
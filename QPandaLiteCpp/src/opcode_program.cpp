@@ -0,0 +1,119 @@
+﻿#include "opcode_program.h"
+namespace qpandalite {
+
+    size_t op_qubit_count(OpType op)
+    {
+        switch (op)
+        {
+        case OpType::CZ: case OpType::SWAP: case OpType::ISWAP: case OpType::XY:
+        case OpType::CNOT: case OpType::XX: case OpType::YY: case OpType::ZZ:
+        case OpType::PHASE2Q: case OpType::UU15:
+        case OpType::PauliError2Q: case OpType::TwoQubitDepolarizing:
+            return 2;
+        case OpType::TOFFOLI: case OpType::CSWAP:
+            return 3;
+        default:
+            return 1;
+        }
+    }
+
+    size_t op_param_count(OpType op)
+    {
+        switch (op)
+        {
+        case OpType::XY: case OpType::RX: case OpType::RY: case OpType::RZ:
+        case OpType::U1: case OpType::RPhi90: case OpType::RPhi180:
+        case OpType::XX: case OpType::YY: case OpType::ZZ:
+        case OpType::Depolarizing: case OpType::BitFlip: case OpType::PhaseFlip:
+        case OpType::AmplitudeDamping: case OpType::TwoQubitDepolarizing:
+            return 1;
+        case OpType::U2: case OpType::RPhi:
+            return 2;
+        case OpType::U3: case OpType::PHASE2Q: case OpType::PauliError1Q:
+            return 3;
+        case OpType::UU15: case OpType::PauliError2Q:
+            return 15;
+        default:
+            return 0;
+        }
+    }
+
+    OpcodeProgram::OpcodeProgram(std::vector<uint32_t> ops_,
+        std::vector<bool> daggers_,
+        std::vector<size_t> qubit_offsets_,
+        std::vector<size_t> qubits_,
+        std::vector<size_t> param_offsets_,
+        std::vector<double> params_,
+        std::vector<size_t> controller_offsets_,
+        std::vector<size_t> controllers_)
+        : ops(std::move(ops_)),
+        daggers(std::move(daggers_)),
+        qubit_offsets(std::move(qubit_offsets_)),
+        qubits(std::move(qubits_)),
+        param_offsets(std::move(param_offsets_)),
+        params(std::move(params_)),
+        controller_offsets(std::move(controller_offsets_)),
+        controllers(std::move(controllers_))
+    {
+        validate();
+    }
+
+    OpcodeProgram OpcodeProgram::with_params(std::vector<double> params_) const
+    {
+        if (params_.size() != params.size())
+            ThrowInvalidArgument(fmt::format("params must hold {} entries (got {}).", params.size(), params_.size()));
+        OpcodeProgram program(*this);
+        program.params = std::move(params_);
+        return program;
+    }
+
+    static void validate_offsets(const std::vector<size_t>& offsets, size_t n_ops, size_t data_size, const char* name)
+    {
+        if (offsets.size() != n_ops + 1)
+            ThrowInvalidArgument(fmt::format("{}_offsets must hold {} entries (got {}).", name, n_ops + 1, offsets.size()));
+        if (offsets[0] != 0 || offsets[n_ops] != data_size)
+            ThrowInvalidArgument(fmt::format("{}_offsets must start at 0 and end at {}.", name, data_size));
+        for (size_t i = 0; i < n_ops; ++i)
+        {
+            if (offsets[i] > offsets[i + 1])
+                ThrowInvalidArgument(fmt::format("{}_offsets is not monotonic at position {}.", name, i));
+        }
+    }
+
+    void OpcodeProgram::validate() const
+    {
+        const size_t n_ops = ops.size();
+        if (daggers.size() != n_ops)
+            ThrowInvalidArgument(fmt::format("daggers must hold {} entries (got {}).", n_ops, daggers.size()));
+
+        validate_offsets(qubit_offsets, n_ops, qubits.size(), "qubit");
+        validate_offsets(param_offsets, n_ops, params.size(), "param");
+        validate_offsets(controller_offsets, n_ops, controllers.size(), "controller");
+
+        for (size_t i = 0; i < n_ops; ++i)
+        {
+            if (ops[i] >= static_cast<uint32_t>(OpType::Count))
+                ThrowInvalidArgument(fmt::format("Unknown op code {} at position {}.", ops[i], i));
+
+            OpType op = static_cast<OpType>(ops[i]);
+            size_t nqubit = qubit_offsets[i + 1] - qubit_offsets[i];
+            size_t nparam = param_offsets[i + 1] - param_offsets[i];
+            if (op == OpType::UNITARY)
+            {
+                if (nqubit == 0 || nqubit > max_unitary_qubits)
+                    ThrowInvalidArgument(fmt::format("UNITARY at position {} must act on 1 to {} qubits (got {}).",
+                        i, max_unitary_qubits, nqubit));
+                if (nparam != 2 * pow2(2 * nqubit))
+                    ThrowInvalidArgument(fmt::format("UNITARY at position {} expects {} parameters (got {}).",
+                        i, 2 * pow2(2 * nqubit), nparam));
+                continue;
+            }
+            if (nqubit != op_qubit_count(op))
+                ThrowInvalidArgument(fmt::format("Op code {} at position {} expects {} qubits (got {}).",
+                    ops[i], i, op_qubit_count(op), nqubit));
+            if (nparam != op_param_count(op))
+                ThrowInvalidArgument(fmt::format("Op code {} at position {} expects {} parameters (got {}).",
+                    ops[i], i, op_param_count(op), nparam));
+        }
+    }
+}
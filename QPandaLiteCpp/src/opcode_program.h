@@ -0,0 +1,142 @@
+#pragma once
+
+#include <cstdint>
+#include <vector>
+
+#include "errors.h"
+#include "basic_math.h"
+
+namespace qpandalite {
+
+    /* Integer codes of the operations understood by execute_program.
+     * The names match the operation strings of the Python opcodes. */
+    enum class OpType : uint32_t
+    {
+        H, X, Y, Z, S, T, SX,
+        CZ, SWAP, ISWAP, XY, CNOT,
+        RX, RY, RZ, U1, U2, U3,
+        RPhi90, RPhi180, RPhi,
+        TOFFOLI, CSWAP,
+        XX, YY, ZZ, PHASE2Q, UU15,
+
+        PauliError1Q, Depolarizing, BitFlip, PhaseFlip, AmplitudeDamping,
+        PauliError2Q, TwoQubitDepolarizing,
+
+        /* generic k-qubit gate, params hold the row-major matrix as
+         * interleaved (real, imag) pairs, 2 * 4^k values */
+        UNITARY,
+
+        Count
+    };
+
+    /* Operand counts of fixed-size operations (UNITARY is checked separately). */
+    size_t op_qubit_count(OpType op);
+    size_t op_param_count(OpType op);
+
+    /* A flattened opcode list (struct of arrays).
+     * The qubits / params / controllers of the i-th operation are
+     * qubits[qubit_offsets[i] : qubit_offsets[i + 1]] and so on, so each
+     * offset array holds ops.size() + 1 entries. */
+    struct OpcodeProgram
+    {
+        std::vector<uint32_t> ops;
+        std::vector<bool> daggers;
+        std::vector<size_t> qubit_offsets;
+        std::vector<size_t> qubits;
+        std::vector<size_t> param_offsets;
+        std::vector<double> params;
+        std::vector<size_t> controller_offsets;
+        std::vector<size_t> controllers;
+
+        OpcodeProgram() = default;
+        OpcodeProgram(std::vector<uint32_t> ops_,
+            std::vector<bool> daggers_,
+            std::vector<size_t> qubit_offsets_,
+            std::vector<size_t> qubits_,
+            std::vector<size_t> param_offsets_,
+            std::vector<double> params_,
+            std::vector<size_t> controller_offsets_,
+            std::vector<size_t> controllers_);
+
+        size_t size() const { return ops.size(); }
+
+        /* A copy with the parameter array replaced (same length), e.g. to
+         * run one compiled circuit for many parameter bindings. */
+        OpcodeProgram with_params(std::vector<double> params_) const;
+
+        /* Check that the arrays are consistent with each other and with the
+         * operand counts of each operation. Throws std::invalid_argument. */
+        void validate() const;
+    };
+
+    template<typename SimulatorType>
+    void execute_program(SimulatorType& simulator, const OpcodeProgram& program)
+    {
+        program.validate();
+
+        std::vector<size_t> controller;
+        std::vector<size_t> targets;
+        std::vector<complex_t> matrix;
+        for (size_t i = 0; i < program.size(); ++i)
+        {
+            const size_t* q = program.qubits.data() + program.qubit_offsets[i];
+            const double* p = program.params.data() + program.param_offsets[i];
+            const bool dagger = program.daggers[i];
+            controller.assign(
+                program.controllers.begin() + program.controller_offsets[i],
+                program.controllers.begin() + program.controller_offsets[i + 1]);
+
+            switch (static_cast<OpType>(program.ops[i]))
+            {
+            case OpType::H: simulator.hadamard(q[0], controller, dagger); break;
+            case OpType::X: simulator.x(q[0], controller, dagger); break;
+            case OpType::Y: simulator.y(q[0], controller, dagger); break;
+            case OpType::Z: simulator.z(q[0], controller, dagger); break;
+            case OpType::S: simulator.s(q[0], controller, dagger); break;
+            case OpType::T: simulator.t(q[0], controller, dagger); break;
+            case OpType::SX: simulator.sx(q[0], controller, dagger); break;
+            case OpType::CZ: simulator.cz(q[0], q[1], controller, dagger); break;
+            case OpType::SWAP: simulator.swap(q[0], q[1], controller, dagger); break;
+            case OpType::ISWAP: simulator.iswap(q[0], q[1], controller, dagger); break;
+            case OpType::XY: simulator.xy(q[0], q[1], p[0], controller, dagger); break;
+            case OpType::CNOT: simulator.cnot(q[0], q[1], controller, dagger); break;
+            case OpType::RX: simulator.rx(q[0], p[0], controller, dagger); break;
+            case OpType::RY: simulator.ry(q[0], p[0], controller, dagger); break;
+            case OpType::RZ: simulator.rz(q[0], p[0], controller, dagger); break;
+            case OpType::U1: simulator.u1(q[0], p[0], controller, dagger); break;
+            case OpType::U2: simulator.u2(q[0], p[0], p[1], controller, dagger); break;
+            case OpType::U3: simulator.u3(q[0], p[0], p[1], p[2], controller, dagger); break;
+            case OpType::RPhi90: simulator.rphi90(q[0], p[0], controller, dagger); break;
+            case OpType::RPhi180: simulator.rphi180(q[0], p[0], controller, dagger); break;
+            case OpType::RPhi: simulator.rphi(q[0], p[0], p[1], controller, dagger); break;
+            case OpType::TOFFOLI: simulator.toffoli(q[0], q[1], q[2], controller, dagger); break;
+            case OpType::CSWAP: simulator.cswap(q[0], q[1], q[2], controller, dagger); break;
+            case OpType::XX: simulator.xx(q[0], q[1], p[0], controller, dagger); break;
+            case OpType::YY: simulator.yy(q[0], q[1], p[0], controller, dagger); break;
+            case OpType::ZZ: simulator.zz(q[0], q[1], p[0], controller, dagger); break;
+            case OpType::PHASE2Q: simulator.phase2q(q[0], q[1], p[0], p[1], p[2], controller, dagger); break;
+            case OpType::UU15: simulator.uu15(q[0], q[1], std::vector<double>(p, p + 15), controller, dagger); break;
+
+            case OpType::PauliError1Q: simulator.pauli_error_1q(q[0], p[0], p[1], p[2]); break;
+            case OpType::Depolarizing: simulator.depolarizing(q[0], p[0]); break;
+            case OpType::BitFlip: simulator.bitflip(q[0], p[0]); break;
+            case OpType::PhaseFlip: simulator.phaseflip(q[0], p[0]); break;
+            case OpType::AmplitudeDamping: simulator.amplitude_damping(q[0], p[0]); break;
+            case OpType::PauliError2Q: simulator.pauli_error_2q(q[0], q[1], std::vector<double>(p, p + 15)); break;
+            case OpType::TwoQubitDepolarizing: simulator.twoqubit_depolarizing(q[0], q[1], p[0]); break;
+            case OpType::UNITARY:
+            {
+                targets.assign(q, program.qubits.data() + program.qubit_offsets[i + 1]);
+                matrix.resize((program.param_offsets[i + 1] - program.param_offsets[i]) / 2);
+                for (size_t j = 0; j < matrix.size(); ++j)
+                    matrix[j] = complex_t(p[2 * j], p[2 * j + 1]);
+                simulator.unitary(targets, matrix, controller, dagger);
+                break;
+            }
+            default:
+                ThrowInvalidArgument(fmt::format("Unknown op code {} at position {}.", program.ops[i], i));
+            }
+        }
+    }
+
+}
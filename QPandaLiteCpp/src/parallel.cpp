@@ -0,0 +1,22 @@
+﻿#include "parallel.h"
+#include <atomic>
+
+namespace qpandalite {
+
+    static std::atomic<int> num_threads{ 0 };
+
+    void set_num_threads(int n)
+    {
+        num_threads = n > 0 ? n : 0;
+    }
+
+    int get_num_threads()
+    {
+#ifdef _OPENMP
+        int n = num_threads;
+        return n > 0 ? n : omp_get_max_threads();
+#else
+        return 1;
+#endif
+    }
+}
@@ -0,0 +1,61 @@
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+namespace qpandalite {
+
+    /* Number of threads used by the statevector kernels.
+     * n <= 0 restores the default (OpenMP's maximum number of threads).
+     * Without OpenMP the kernels always run on a single thread. */
+    void set_num_threads(int n);
+    int get_num_threads();
+
+    /* Loops shorter than this run serially: starting the threads would cost
+     * more than the work itself. */
+    constexpr size_t parallel_threshold = size_t(1) << 14;
+
+    /* Call f(k) for k in [0, n), split over get_num_threads() threads. */
+    template <typename Func>
+    inline void parallel_for(size_t n, const Func& f)
+    {
+#ifdef _OPENMP
+        const int nthreads = get_num_threads();
+        if (nthreads > 1 && n >= parallel_threshold)
+        {
+            #pragma omp parallel for num_threads(nthreads) schedule(static)
+            for (std::int64_t k = 0; k < static_cast<std::int64_t>(n); ++k)
+                f(static_cast<size_t>(k));
+            return;
+        }
+#endif
+        for (size_t k = 0; k < n; ++k)
+            f(k);
+    }
+
+    /* Sum of f(k) for k in [0, n), split over get_num_threads() threads.
+       The threads add their partial sums in an unspecified order, so the
+       result equals the serial sum only within floating-point rounding. */
+    template <typename Func>
+    inline double parallel_sum(size_t n, const Func& f)
+    {
+        double sum = 0;
+#ifdef _OPENMP
+        const int nthreads = get_num_threads();
+        if (nthreads > 1 && n >= parallel_threshold)
+        {
+            #pragma omp parallel for num_threads(nthreads) schedule(static) reduction(+:sum)
+            for (std::int64_t k = 0; k < static_cast<std::int64_t>(n); ++k)
+                sum += f(static_cast<size_t>(k));
+            return sum;
+        }
+#endif
+        for (size_t k = 0; k < n; ++k)
+            sum += f(k);
+        return sum;
+    }
+}
@@ -1,11 +1,16 @@
 #pragma once
+#include <mutex>
 #include <random>
 
 namespace qpandalite
 {
+	/* Shared engine of the noise channels and measurements. The simulator
+	 * bindings may run without the GIL, so access is serialized. */
 	struct RandomEngine
 	{
 		std::default_random_engine eng;
+		std::uniform_real_distribution<double> dist;
+		std::mutex mutex;
 		inline RandomEngine()
 		{}
 
@@ -17,12 +22,14 @@ namespace qpandalite
 
 		inline void seed(unsigned int seed_)
 		{
+			std::lock_guard<std::mutex> lock(mutex);
 			eng.seed(seed_);
+			dist.reset();
 		}
 
 		inline double rand()
 		{
-			static std::uniform_real_distribution<double> dist;
+			std::lock_guard<std::mutex> lock(mutex);
 			return dist(eng);
 		}
 	};
@@ -3,7 +3,8 @@ namespace qpandalite {
 
     using namespace statevector_simulator_impl;
 
-    void StatevectorSimulator::init_n_qubit(size_t nqubit)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::init_n_qubit(size_t nqubit)
     {
         if (nqubit > max_qubit_num)
         {
@@ -11,12 +12,35 @@ namespace qpandalite {
             ThrowInvalidArgument(errstr);
         }
 
-        state = std::vector<complex_t>(pow2(nqubit), 0);
+        state = std::vector<amp_t>(pow2(nqubit), 0);
         state[0] = 1;
         total_qubit = nqubit;
     }
 
-    void StatevectorSimulator::id(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::load_state(std::vector<amp_t> new_state)
+    {
+        size_t nqubit = 0;
+        while (pow2(nqubit) < new_state.size())
+            nqubit++;
+
+        if (new_state.empty() || pow2(nqubit) != new_state.size())
+        {
+            auto errstr = fmt::format("State size must be a power of 2 (size = {})", new_state.size());
+            ThrowInvalidArgument(errstr);
+        }
+        if (nqubit > max_qubit_num)
+        {
+            auto errstr = fmt::format("Exceed max_qubit_num (nqubit = {}, limit = {})", nqubit, max_qubit_num);
+            ThrowInvalidArgument(errstr);
+        }
+
+        state = std::move(new_state);
+        total_qubit = nqubit;
+    }
+
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::id(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
 
@@ -28,7 +52,8 @@ namespace qpandalite {
       1/sqrt(2) * [ 1 1 ]
                   [ 1 -1 ]
     */
-    void StatevectorSimulator::hadamard(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::hadamard(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
 
@@ -41,7 +66,8 @@ namespace qpandalite {
        [ u00 u01 ]
        [ u10 u11 ]
     */
-    void StatevectorSimulator::u22(size_t qn, const u22_t& unitary, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::u22(size_t qn, const u22_t& unitary, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
 
@@ -77,7 +103,8 @@ namespace qpandalite {
        [ 0 1 ]
        [ 1 0 ]
     */
-    void StatevectorSimulator::x(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::x(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
 
@@ -93,7 +120,8 @@ namespace qpandalite {
 
        Note: global phase is effective when controlled qubits are applied.
     */
-    void StatevectorSimulator::y(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::y(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
         size_t controller_mask = make_controller_mask(global_controller);
@@ -106,7 +134,8 @@ namespace qpandalite {
        [ 1  0 ]
        [ 0 -1 ]    
     */
-    void StatevectorSimulator::z(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::z(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
         size_t controller_mask = make_controller_mask(global_controller);
@@ -119,7 +148,8 @@ namespace qpandalite {
        [ 1  0 ]
        [ 0 -1 ]
     */
-    void StatevectorSimulator::s(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::s(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
             size_t controller_mask = make_controller_mask(global_controller);
@@ -135,7 +165,8 @@ namespace qpandalite {
        [ 1  0 ]
        [ 0 -1 ]
     */
-    void StatevectorSimulator::t(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::t(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
             size_t controller_mask = make_controller_mask(global_controller);
@@ -154,7 +185,8 @@ namespace qpandalite {
        [ 0  0  1  0 ]
        [ 0  0  0 -1 ]
     */
-    void StatevectorSimulator::cz(size_t qn1, size_t qn2, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::cz(size_t qn1, size_t qn2, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE2(qn1, input1)
         CHECK_QUBIT_RANGE2(qn2, input2)
@@ -172,7 +204,8 @@ namespace qpandalite {
        [ 0  1  0  0 ]
        [ 0  0  0  1 ]
     */
-    void StatevectorSimulator::swap(size_t qn1, size_t qn2, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::swap(size_t qn1, size_t qn2, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE2(qn1, input1)
         CHECK_QUBIT_RANGE2(qn2, input2)
@@ -190,7 +223,8 @@ namespace qpandalite {
        [ 0  1j 0  0 ]
        [ 0  0  0  1 ]
     */
-    void StatevectorSimulator::iswap(size_t qn1, size_t qn2, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::iswap(size_t qn1, size_t qn2, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE2(qn1, input1)
         CHECK_QUBIT_RANGE2(qn2, input2)
@@ -210,7 +244,8 @@ namespace qpandalite {
 
       where c = cos(theta/2), s = -1j * sin(theta/2)
     */
-    void StatevectorSimulator::xy(size_t qn1, size_t qn2, double theta, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::xy(size_t qn1, size_t qn2, double theta, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE2(qn1, input1)
         CHECK_QUBIT_RANGE2(qn2, input2)
@@ -228,7 +263,8 @@ namespace qpandalite {
        [ 0  0  0  1 ]
        [ 0  0  1  0 ]
     */
-    void StatevectorSimulator::cnot(size_t controller, size_t target, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::cnot(size_t controller, size_t target, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE2(controller, controller)
         CHECK_QUBIT_RANGE2(target, target)
@@ -244,7 +280,8 @@ namespace qpandalite {
        [ cos(theta/2)    -i*sin(theta/2) ]
        [ -i*sin(theta/2)    cos(theta/2) ]
     */
-    void StatevectorSimulator::rx(size_t qn, double angle, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::rx(size_t qn, double angle, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
 
@@ -273,7 +310,8 @@ namespace qpandalite {
 
        Note: global phase is effective when controlled qubits are applied.
     */
-    void StatevectorSimulator::sx(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::sx(size_t qn, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
 
@@ -303,7 +341,8 @@ namespace qpandalite {
        [ cos(theta/2)   -sin(theta/2) ]
        [ sin(theta/2)    cos(theta/2) ]
     */
-    void StatevectorSimulator::ry(size_t qn, double angle, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::ry(size_t qn, double angle, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
 
@@ -329,7 +368,8 @@ namespace qpandalite {
        [ exp(-it/2)     0     ]
        [     0      exp(it/2) ]
     */
-    void StatevectorSimulator::rz(size_t qn, double angle, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::rz(size_t qn, double angle, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
 
@@ -343,7 +383,8 @@ namespace qpandalite {
        [     1     0     ]
        [     0     exp(it) ]
     */
-    void StatevectorSimulator::u1(size_t qn, double angle, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::u1(size_t qn, double angle, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
 
@@ -358,7 +399,8 @@ namespace qpandalite {
        1/sqrt(2) * [     1         -exp(i*lambda) ]
                    [ exp(i*phi)  exp(i*(phi+lambda)]
     */
-    void StatevectorSimulator::u2(size_t qn, double phi, double lambda, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::u2(size_t qn, double phi, double lambda, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
 
@@ -389,7 +431,8 @@ namespace qpandalite {
        1/sqrt(2) * [     1           -iexp(-i*phi) ]
                    [ -iexp(i*phi)        1         ]
     */
-    void StatevectorSimulator::rphi90(size_t qn, double phi, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::rphi90(size_t qn, double phi, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
 
@@ -419,7 +462,8 @@ namespace qpandalite {
        [   0           -i*exp(-i*phi) ]
        [ -i*exp(i*phi)      0         ]    
     */
-    void StatevectorSimulator::rphi180(size_t qn, double phi, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::rphi180(size_t qn, double phi, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
 
@@ -450,7 +494,8 @@ namespace qpandalite {
        [ -iexp(i*phi)*sin(theta/2)         cos(theta/2)         ]
     
     */
-    void StatevectorSimulator::rphi(size_t qn, double theta, double phi, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::rphi(size_t qn, double theta, double phi, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
 
@@ -476,7 +521,8 @@ namespace qpandalite {
     }
 
     /* Toffoli gate */
-    void StatevectorSimulator::toffoli(size_t qn1, size_t qn2, size_t target, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::toffoli(size_t qn1, size_t qn2, size_t target, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE2(qn1, qn1)
         CHECK_QUBIT_RANGE2(qn2, qn2)
@@ -490,7 +536,8 @@ namespace qpandalite {
         toffoli_unsafe_impl(state, qn1, qn2, target, total_qubit, controller_mask);
     }
 
-    void StatevectorSimulator::cswap(size_t controller, size_t target1, size_t target2, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::cswap(size_t controller, size_t target1, size_t target2, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE2(controller, controller)
         CHECK_QUBIT_RANGE2(target1, target1)
@@ -510,7 +557,8 @@ namespace qpandalite {
     *    |10> -> exp(it/2) * |10>
     *    |11> -> exp(-it/2) * |11> 
     */
-    void StatevectorSimulator::zz(size_t qn1, size_t qn2, double theta, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::zz(size_t qn1, size_t qn2, double theta, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE2(qn1, qn1)
         CHECK_QUBIT_RANGE2(qn2, qn2)
@@ -530,7 +578,8 @@ namespace qpandalite {
     *    |10> -> [   0     isin(t)  cos(t)    0     ]
     *    |11> -> [ isin(t)   0       0       cos(t) ]
     */
-    void StatevectorSimulator::xx(size_t qn1, size_t qn2, double theta, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::xx(size_t qn1, size_t qn2, double theta, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE2(qn1, qn1)
         CHECK_QUBIT_RANGE2(qn2, qn2)
@@ -552,7 +601,8 @@ namespace qpandalite {
    *    |10> -> [   0     isin(t)  cos(t)    0     ]
    *    |11> -> [ -isin(t)   0       0       cos(t) ] where t=-theta/2
    */
-    void StatevectorSimulator::yy(size_t qn1, size_t qn2, double theta, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::yy(size_t qn1, size_t qn2, double theta, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE2(qn1, qn1)
         CHECK_QUBIT_RANGE2(qn2, qn2)
@@ -573,7 +623,8 @@ namespace qpandalite {
         [  cos(theta/2)                -exp(i*lambda)*sin(theta/2)     ]
         [  exp(i*phi)*sin(theta/2)   exp(i*(phi+lambda))*cos(theta/2)  ]
     */
-    void StatevectorSimulator::u3(size_t qn, double theta, double phi, double lambda, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::u3(size_t qn, double theta, double phi, double lambda, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE(qn)
 
@@ -581,7 +632,8 @@ namespace qpandalite {
         u3_unsafe_impl(state, qn, theta, phi, lambda, total_qubit, controller_mask, is_dagger);
     }
 
-    void StatevectorSimulator::phase2q(size_t qn1, size_t qn2, double theta1, double theta2, double thetazz, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::phase2q(size_t qn1, size_t qn2, double theta1, double theta2, double thetazz, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE2(qn1, qn1)
         CHECK_QUBIT_RANGE2(qn2, qn2)
@@ -600,7 +652,8 @@ namespace qpandalite {
     }
 
 
-    void StatevectorSimulator::uu15(size_t qn1, size_t qn2, const std::vector<double>& parameters, const std::vector<size_t>& global_controller, bool is_dagger)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::uu15(size_t qn1, size_t qn2, const std::vector<double>& parameters, const std::vector<size_t>& global_controller, bool is_dagger)
     {
         CHECK_QUBIT_RANGE2(qn1, qn1)
         CHECK_QUBIT_RANGE2(qn2, qn2)
@@ -611,7 +664,17 @@ namespace qpandalite {
         uu15_unsafe_impl(state, qn1, qn2, parameters, total_qubit, controller_mask, is_dagger);
     }
 
-    void StatevectorSimulator::pauli_error_1q(size_t qn, double px, double py, double pz)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::unitary(const std::vector<size_t>& qubits, const std::vector<complex_t>& matrix, const std::vector<size_t>& global_controller, bool is_dagger)
+    {
+        auto u = prepare_unitary(qubits, matrix, total_qubit, is_dagger);
+
+        size_t controller_mask = make_controller_mask(global_controller);
+        unitary_unsafe_impl(state, qubits, u, total_qubit, controller_mask);
+    }
+
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::pauli_error_1q(size_t qn, double px, double py, double pz)
     {
         double sum = px + py + pz;
 
@@ -645,14 +708,16 @@ namespace qpandalite {
         id(qn);
     }
 
-    void StatevectorSimulator::depolarizing(size_t qn, double p)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::depolarizing(size_t qn, double p)
     {
         CHECK_PROBABILITY_BOUND(p)        
 
         return pauli_error_1q(qn, p / 3, p / 3, p / 3);
     }
 
-    void StatevectorSimulator::bitflip(size_t qn, double p)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::bitflip(size_t qn, double p)
     {
         CHECK_PROBABILITY_BOUND(p)       
 
@@ -660,14 +725,16 @@ namespace qpandalite {
         return pauli_error_1q(qn, p, 0, 0);
     }
 
-    void StatevectorSimulator::phaseflip(size_t qn, double p)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::phaseflip(size_t qn, double p)
     {
         CHECK_PROBABILITY_BOUND(p)        
 
         return pauli_error_1q(qn, 0, 0, p);
     }
 
-    void StatevectorSimulator::pauli_error_2q(size_t qn1, size_t qn2, const std::vector<double>& p)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::pauli_error_2q(size_t qn1, size_t qn2, const std::vector<double>& p)
     {
         // the input must be a 15-sized vector
         // Depolarizing matrix
@@ -737,7 +804,8 @@ namespace qpandalite {
         id(qn1); id(qn2);
     }
 
-    void StatevectorSimulator::twoqubit_depolarizing(size_t qn1, size_t qn2, double p)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::twoqubit_depolarizing(size_t qn1, size_t qn2, double p)
     {
         CHECK_QUBIT_RANGE2(qn1, qn1)
         CHECK_QUBIT_RANGE2(qn2, qn2)
@@ -748,7 +816,8 @@ namespace qpandalite {
     }
 
 
-    void StatevectorSimulator::kraus1q(size_t qn, const Kraus1Q& kraus_ops) {
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::kraus1q(size_t qn, const Kraus1Q& kraus_ops) {
 
         CHECK_QUBIT_RANGE(qn)
 
@@ -760,7 +829,8 @@ namespace qpandalite {
         kraus1q_unsafe_impl(state, qn, kraus_ops, total_qubit);
     }
 
-    void StatevectorSimulator::amplitude_damping(size_t qn, double gamma)
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::amplitude_damping(size_t qn, double gamma)
     {
         CHECK_PROBABILITY_BOUND(gamma)
         CHECK_QUBIT_RANGE(qn)
@@ -768,8 +838,15 @@ namespace qpandalite {
         amplitude_damping_unsafe_impl(state, qn, gamma, total_qubit);
     }
 
+    template<typename fp_t>
+    void StatevectorSimulatorT<fp_t>::run_program(const OpcodeProgram& program)
+    {
+        execute_program(*this, program);
+    }
 
-    dtype StatevectorSimulator::get_prob(const std::map<size_t, int> &measure_qubits)
+
+    template<typename fp_t>
+    dtype StatevectorSimulatorT<fp_t>::get_prob(const std::map<size_t, int> &measure_qubits)
     {
         for (auto &&[qn, qstate] : measure_qubits)
         {
@@ -788,19 +865,22 @@ namespace qpandalite {
         return get_prob_unsafe_impl(state, measure_qubits, total_qubit);
     }
 
-    dtype StatevectorSimulator::get_prob(size_t qn, int qstate)
+    template<typename fp_t>
+    dtype StatevectorSimulatorT<fp_t>::get_prob(size_t qn, int qstate)
     {
         CHECK_QUBIT_RANGE(qn)
 
         return get_prob_unsafe_impl(state, qn, qstate, total_qubit);
     }
 
-    std::vector<dtype> StatevectorSimulator::pmeasure(size_t measure_qubit)
+    template<typename fp_t>
+    std::vector<dtype> StatevectorSimulatorT<fp_t>::pmeasure(size_t measure_qubit)
     {
         return pmeasure(std::vector{ measure_qubit });
     }
 
-    std::vector<dtype> StatevectorSimulator::pmeasure(const std::vector<size_t>& measure_list)
+    template<typename fp_t>
+    std::vector<dtype> StatevectorSimulatorT<fp_t>::pmeasure(const std::vector<size_t>& measure_list)
     {
         auto measure_map = preprocess_measure_list(measure_list, total_qubit);
 
@@ -815,12 +895,14 @@ namespace qpandalite {
         return ret;
     }
 
-    size_t StatevectorSimulator::measure_single_shot(size_t qubit)
+    template<typename fp_t>
+    size_t StatevectorSimulatorT<fp_t>::measure_single_shot(size_t qubit)
     {
         return measure_single_shot({ qubit });
     }
 
-    size_t StatevectorSimulator::measure_single_shot(const std::vector<size_t>& qubit)
+    template<typename fp_t>
+    size_t StatevectorSimulatorT<fp_t>::measure_single_shot(const std::vector<size_t>& qubit)
     {
         double r = qpandalite::rand();
         size_t N = pow2(total_qubit);
@@ -835,5 +917,24 @@ namespace qpandalite {
         return extract_digits(N - 1, qubit);
     }
 
+    template<typename fp_t>
+    dtype StatevectorSimulatorT<fp_t>::expval_pauli(const std::string& pauli_string)
+    {
+        return expval_pauli_unsafe_impl(state, parse_pauli_string(pauli_string, total_qubit), total_qubit);
+    }
+
+    template<typename fp_t>
+    dtype StatevectorSimulatorT<fp_t>::expval_pauli_sum(const std::vector<std::string>& terms, const std::vector<double>& coeffs)
+    {
+        check_pauli_sum(terms, coeffs);
+
+        dtype ret = 0;
+        for (size_t i = 0; i < terms.size(); ++i)
+            ret += coeffs[i] * expval_pauli(terms[i]);
+        return ret;
+    }
+
 
+    template struct StatevectorSimulatorT<double>;
+    template struct StatevectorSimulatorT<float>;
 }
\ No newline at end of file
@@ -1,18 +1,30 @@
 #pragma once
 
+#include <type_traits>
+
 #include "errors.h"
 #include "simulator_impl.h"
+#include "opcode_program.h"
 #include "rng.h"
 
 namespace qpandalite {
 
-    struct StatevectorSimulator
+    /* Statevector simulator storing amplitudes as std::complex<fp_t>.
+     * Use the StatevectorSimulator (double) and StatevectorSimulatorF32
+     * (float) aliases below. */
+    template<typename fp_t>
+    struct StatevectorSimulatorT
     {
-        static inline size_t max_qubit_num = 30;
+        using amp_t = std::complex<fp_t>;
+
+        /* a single-precision amplitude takes half the memory, so one more qubit fits */
+        static inline size_t max_qubit_num = std::is_same_v<fp_t, float> ? 31 : 30;
         size_t total_qubit = 0;
-        std::vector<complex_t> state;
+        std::vector<amp_t> state;
 
         void init_n_qubit(size_t nqubit);
+        /* replace the state by a given statevector of size 2^n */
+        void load_state(std::vector<amp_t> new_state);
 
         void id(size_t qn, const std::vector<size_t>& global_controller = {}, bool is_dagger = false);
         void hadamard(size_t qn, const std::vector<size_t>& global_controller = {}, bool is_dagger = false);
@@ -44,6 +56,8 @@ namespace qpandalite {
         void u3(size_t qn, double theta, double phi, double lambda, const std::vector<size_t>& global_controller = {}, bool is_dagger = false);
         void phase2q(size_t qn1, size_t qn2, double theta1, double theta2, double thetazz, const std::vector<size_t>& global_controller = {}, bool is_dagger = false);
         void uu15(size_t qn1, size_t qn2, const std::vector<double>& parameters, const std::vector<size_t>& global_controller = {}, bool is_dagger = false);
+        /* generic k-qubit gate, matrix is row-major and bit b of its index corresponds to qubits[b] */
+        void unitary(const std::vector<size_t>& qubits, const std::vector<complex_t>& matrix, const std::vector<size_t>& global_controller = {}, bool is_dagger = false);
 
         void pauli_error_1q(size_t qn, double px, double py, double pz);
         void depolarizing(size_t qn, double p);
@@ -54,6 +68,9 @@ namespace qpandalite {
         void kraus1q(size_t qn, const Kraus1Q& kraus_ops);
         void amplitude_damping(size_t qn, double gamma);
 
+        /* run a whole compiled program in one call */
+        void run_program(const OpcodeProgram& program);
+
         /* measurement protocol */
         dtype get_prob(size_t qn, int state);
         dtype get_prob(const std::map<size_t, int>& measure_qubits);
@@ -64,6 +81,16 @@ namespace qpandalite {
         size_t measure_single_shot(size_t qubit);
         size_t measure_single_shot(const std::vector<size_t>& qubit);
 
+        /* expectation values of Pauli strings on the current state */
+        dtype expval_pauli(const std::string& pauli_string);
+        dtype expval_pauli_sum(const std::vector<std::string>& terms, const std::vector<double>& coeffs);
+
     };
 
+    using StatevectorSimulator = StatevectorSimulatorT<double>;
+    using StatevectorSimulatorF32 = StatevectorSimulatorT<float>;
+
+    extern template struct StatevectorSimulatorT<double>;
+    extern template struct StatevectorSimulatorT<float>;
+
 }
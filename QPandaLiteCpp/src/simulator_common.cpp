@@ -47,4 +47,100 @@ namespace qpandalite {
         }
         return mask;
     }
+
+    std::vector<complex_t> prepare_unitary(const std::vector<size_t>& qubits, const std::vector<complex_t>& matrix,
+        size_t total_qubit, bool is_dagger)
+    {
+        const size_t k = qubits.size();
+        if (k == 0 || k > max_unitary_qubits)
+        {
+            auto errstr = fmt::format("Unitary gate must act on 1 to {} qubits (input = {})", max_unitary_qubits, k);
+            ThrowInvalidArgument(errstr);
+        }
+
+        size_t qubit_mask = 0;
+        for (size_t qn : qubits)
+        {
+            CHECK_QUBIT_RANGE(qn)
+            if (qubit_mask & pow2(qn))
+            {
+                auto errstr = fmt::format("Duplicate qubit in unitary gate ({})", qn);
+                ThrowInvalidArgument(errstr);
+            }
+            qubit_mask |= pow2(qn);
+        }
+
+        const size_t dim = pow2(k);
+        if (matrix.size() != dim * dim)
+        {
+            auto errstr = fmt::format("Unitary matrix size mismatch (expect = {}, input = {})", dim * dim, matrix.size());
+            ThrowInvalidArgument(errstr);
+        }
+        if (!_assert_unitary(matrix, dim))
+        {
+            ThrowInvalidArgument("Input is not a unitary matrix.");
+        }
+
+        if (!is_dagger)
+            return matrix;
+
+        std::vector<complex_t> adjoint(dim * dim);
+        for (size_t i = 0; i < dim; ++i)
+            for (size_t j = 0; j < dim; ++j)
+                adjoint[i * dim + j] = std::conj(matrix[j * dim + i]);
+        return adjoint;
+    }
+
+    PauliMask parse_pauli_string(const std::string& pauli_string, size_t total_qubit)
+    {
+        if (pauli_string.size() > total_qubit)
+        {
+            auto errstr = fmt::format("Pauli string is longer than total_qubit (length = {}, total_qubit = {})",
+                pauli_string.size(), total_qubit);
+            ThrowInvalidArgument(errstr);
+        }
+
+        PauliMask pauli;
+        size_t n_y = 0;
+        for (size_t i = 0; i < pauli_string.size(); ++i)
+        {
+            switch (pauli_string[i])
+            {
+            case 'I': case 'i':
+                break;
+            case 'X': case 'x':
+                pauli.x_mask |= pow2(i);
+                break;
+            case 'Y': case 'y':
+                pauli.x_mask |= pow2(i);
+                pauli.z_mask |= pow2(i);
+                n_y++;
+                break;
+            case 'Z': case 'z':
+                pauli.z_mask |= pow2(i);
+                break;
+            default:
+            {
+                auto errstr = fmt::format("Invalid Pauli operator '{}' at qubit {} (must be I, X, Y or Z)",
+                    pauli_string[i], i);
+                ThrowInvalidArgument(errstr);
+            }
+            }
+        }
+
+        /* Y = iXZ */
+        static const complex_t powers_of_i[4] = { 1, { 0, 1 }, -1, { 0, -1 } };
+        pauli.phase = powers_of_i[n_y % 4];
+        return pauli;
+    }
+
+    void check_pauli_sum(const std::vector<std::string>& terms, const std::vector<double>& coeffs)
+    {
+        if (terms.size() != coeffs.size())
+        {
+            auto errstr = fmt::format("Number of terms and coefficients differ (terms = {}, coeffs = {})",
+                terms.size(), coeffs.size());
+            ThrowInvalidArgument(errstr);
+        }
+    }
 } // namespace qpandalite
@@ -6,11 +6,14 @@
 #include <vector>
 #include <set>
 #include <map>
+#include <string>
 #include <cstdint>
+#include <initializer_list>
 
 #include "errors.h"
 #include "basic_math.h"
 #include "rng.h"
+#include "parallel.h"
 
 #define CHECK_QUBIT_RANGE(qn) \
         if (qn >= total_qubit)\
@@ -45,16 +48,104 @@ namespace qpandalite {
     size_t get_state_with_qubit(size_t i, const std::map<size_t, size_t>& measure_map);
     size_t make_controller_mask(const std::vector<size_t>& global_controller);
 
+    /* Check the qubits and the 2^k x 2^k row-major matrix of a generic unitary
+     * gate and return the matrix to apply (conjugate transposed if is_dagger). */
+    std::vector<complex_t> prepare_unitary(const std::vector<size_t>& qubits, const std::vector<complex_t>& matrix,
+        size_t total_qubit, bool is_dagger);
+
+    /* A Pauli string as bit masks, P|b> = phase * (-1)^parity(b & z_mask) |b ^ x_mask>,
+     * with phase = i^(number of Y). */
+    struct PauliMask
+    {
+        size_t x_mask = 0;
+        size_t z_mask = 0;
+        complex_t phase = 1;
+    };
+
+    /* Character i of the string (I, X, Y or Z, case-insensitive) acts on qubit i;
+     * qubits beyond the end of the string are I. */
+    PauliMask parse_pauli_string(const std::string& pauli_string, size_t total_qubit);
+
+    /* Check that there is one coefficient per term of a Pauli sum */
+    void check_pauli_sum(const std::vector<std::string>& terms, const std::vector<double>& coeffs);
+
+    // ============================================================
+    // Pair indexing
+    // A gate on target qubits T acts on groups of 2^|T| amplitudes that
+    // differ only in the bits of T. BaseIndexer enumerates the base index
+    // of every group (target bits 0, controller bits 1) by inserting zero
+    // bits into a counter, so kernels never visit indices they skip.
+    // ============================================================
+
+    /* Insert a 0 at bit position qn of k. */
+    inline size_t insert_zero_bit(size_t k, size_t qn)
+    {
+        const size_t low = k & (pow2(qn) - 1);
+        return ((k ^ low) << 1) | low;
+    }
+
+    struct BaseIndexer
+    {
+        size_t fixed_bits[64];
+        size_t n_fixed = 0;
+        size_t set_mask = 0;
+        size_t count = 0;   /* number of base indices */
+
+        /* A gate controlled by one of its own targets (or by a qubit out of
+         * range) never acts, so count is 0 in that case. */
+        BaseIndexer(size_t total_qubit, std::initializer_list<size_t> targets, size_t controller_mask)
+        {
+            size_t target_mask = 0;
+            for (size_t qn : targets)
+                target_mask |= pow2(qn);
+            init(total_qubit, target_mask, controller_mask);
+        }
+
+        BaseIndexer(size_t total_qubit, const std::vector<size_t>& targets, size_t controller_mask)
+        {
+            size_t target_mask = 0;
+            for (size_t qn : targets)
+                target_mask |= pow2(qn);
+            init(total_qubit, target_mask, controller_mask);
+        }
+
+        /* the k-th base index, k in [0, count) */
+        size_t operator()(size_t k) const
+        {
+            for (size_t j = 0; j < n_fixed; ++j)
+                k = insert_zero_bit(k, fixed_bits[j]);
+            return k | set_mask;
+        }
+
+    private:
+        void init(size_t total_qubit, size_t target_mask, size_t controller_mask)
+        {
+            if ((controller_mask & target_mask) || controller_mask >= pow2(total_qubit))
+                return;
+
+            const size_t fixed_mask = target_mask | controller_mask;
+            for (size_t qn = 0; qn < total_qubit; ++qn)
+            {
+                if ((fixed_mask >> qn) & 1)
+                    fixed_bits[n_fixed++] = qn;
+            }
+            set_mask = controller_mask;
+            count = pow2(total_qubit - n_fixed);
+        }
+    };
+
     // ============================================================
     // Inline 2x2 statevector (matrix × vector) operation
     // |ψ'⟩ = U |ψ⟩, where ψ = (a0, a1), U = [[u00,u01],[u10,u11]]
+    // amp_t is the amplitude type of the state (complex<double> or complex<float>)
     // ============================================================
+    template<typename amp_t>
     inline void sv_apply_u22(
-        const complex_t& u00, const complex_t& u01,
-        const complex_t& u10, const complex_t& u11,
-        complex_t& a0, complex_t& a1)
+        const amp_t& u00, const amp_t& u01,
+        const amp_t& u10, const amp_t& u11,
+        amp_t& a0, amp_t& a1)
     {
-        const complex_t o0 = a0, o1 = a1;
+        const amp_t o0 = a0, o1 = a1;
         a0 = u00 * o0 + u01 * o1;
         a1 = u10 * o0 + u11 * o1;
     }
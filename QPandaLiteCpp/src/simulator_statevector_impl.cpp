@@ -2,41 +2,39 @@
 
 namespace qpandalite {
 namespace statevector_simulator_impl {
-        void hadamard_unsafe_impl(std::vector<complex_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
+        template<typename amp_t>
+        void hadamard_unsafe_impl(std::vector<amp_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
         {
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
-                if ((i >> qn) & 1)
-                    continue;
-
-                size_t i0 = i;
-                size_t i1 = i + pow2(qn);
-
-                sv_apply_u22(INVSQRT2, INVSQRT2, INVSQRT2, -INVSQRT2, state[i0], state[i1]);
-            }
-        }
-        void u22_unsafe_impl(std::vector<std::complex<double>>& state, size_t qn, complex_t u00, complex_t u01, complex_t u10, complex_t u11, size_t total_qubit, size_t controller_mask)
+            const BaseIndexer base(total_qubit, { qn }, controller_mask);
+            const size_t offset = pow2(qn);
+            const amp_t h = INVSQRT2;
+            amp_t* psi = state.data();
+
+            parallel_for(base.count, [&](size_t k) {
+                const size_t i0 = base(k);
+                sv_apply_u22(h, h, h, -h, psi[i0], psi[i0 + offset]);
+            });
+        }
+        template<typename amp_t>
+        void u22_unsafe_impl(std::vector<amp_t>& state, size_t qn, complex_t u00, complex_t u01, complex_t u10, complex_t u11, size_t total_qubit, size_t controller_mask)
         {
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
-                if ((i >> qn) & 1)
-                    continue;
-
-                size_t i0 = i;
-                size_t i1 = i + pow2(qn);
-
-                sv_apply_u22(u00, u01, u10, u11, state[i0], state[i1]);
-            }
-        }
-        void u22_unsafe_impl(std::vector<std::complex<double>>& state, size_t qn, u22_t unitary, size_t total_qubit, size_t controller_mask)
+            const BaseIndexer base(total_qubit, { qn }, controller_mask);
+            const size_t offset = pow2(qn);
+            const amp_t v00(u00), v01(u01), v10(u10), v11(u11);
+            amp_t* psi = state.data();
+
+            parallel_for(base.count, [&](size_t k) {
+                const size_t i0 = base(k);
+                sv_apply_u22(v00, v01, v10, v11, psi[i0], psi[i0 + offset]);
+            });
+        }
+        template<typename amp_t>
+        void u22_unsafe_impl(std::vector<amp_t>& state, size_t qn, u22_t unitary, size_t total_qubit, size_t controller_mask)
         {
             return u22_unsafe_impl(state, qn, unitary[0], unitary[1], unitary[2], unitary[3], total_qubit, controller_mask);
         }
-        void u3_unsafe_impl(std::vector<complex_t>& state, size_t qn, double theta, double phi, double lambda, size_t total_qubit, size_t controller_mask, bool is_dagger)
+        template<typename amp_t>
+        void u3_unsafe_impl(std::vector<amp_t>& state, size_t qn, double theta, double phi, double lambda, size_t total_qubit, size_t controller_mask, bool is_dagger)
         {
 
             /* build the matrix */
@@ -62,160 +60,117 @@ namespace statevector_simulator_impl {
             u22_unsafe_impl(state, qn, u00, u01, u10, u11, total_qubit, controller_mask);
 
         }
-        void x_unsafe_impl(std::vector<complex_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
-        {
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
 
-                if ((i >> qn) & 1)
-                {
-                    std::swap(state[i], state[i - pow2(qn)]);
-                }
-            }
-        }
-        void y_unsafe_impl(std::vector<complex_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
+        /* Multiply the amplitudes whose qn-th bit is 1 by a phase. */
+        template<typename amp_t>
+        static void phase1_unsafe_impl(std::vector<amp_t>& state, size_t qn, complex_t phase, size_t total_qubit, size_t controller_mask)
         {
-            using namespace std::literals::complex_literals;
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
+            const BaseIndexer base(total_qubit, { qn }, controller_mask);
+            const size_t offset = pow2(qn);
+            const amp_t p(phase);
+            amp_t* psi = state.data();
 
-                if ((i >> qn) & 1)
-                {
-                    std::swap(state[i], state[i - pow2(qn)]);
-                    state[i - pow2(qn)] *= -1i;
-                    state[i] *= 1i;
-                }
-            }
+            parallel_for(base.count, [&](size_t k) {
+                psi[base(k) + offset] *= p;
+            });
         }
-        void z_unsafe_impl(std::vector<complex_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
+
+        template<typename amp_t>
+        void x_unsafe_impl(std::vector<amp_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
         {
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
+            const BaseIndexer base(total_qubit, { qn }, controller_mask);
+            const size_t offset = pow2(qn);
+            amp_t* psi = state.data();
 
-                if ((i >> qn) & 1)
-                {
-                    state[i] *= -1;
-                }
-            }
+            parallel_for(base.count, [&](size_t k) {
+                const size_t i0 = base(k);
+                std::swap(psi[i0], psi[i0 + offset]);
+            });
         }
-        void s_unsafe_impl(std::vector<complex_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
+        template<typename amp_t>
+        void y_unsafe_impl(std::vector<amp_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
         {
             using namespace std::literals::complex_literals;
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
-
-                if ((i >> qn) & 1)
-                {
-                    state[i] *= 1i;
-                }
-            }
+            const BaseIndexer base(total_qubit, { qn }, controller_mask);
+            const size_t offset = pow2(qn);
+            const amp_t minus_i(-1i), plus_i(1i);
+            amp_t* psi = state.data();
+
+            parallel_for(base.count, [&](size_t k) {
+                const size_t i0 = base(k);
+                const size_t i1 = i0 + offset;
+                std::swap(psi[i0], psi[i1]);
+                psi[i0] *= minus_i;
+                psi[i1] *= plus_i;
+            });
+        }
+        template<typename amp_t>
+        void z_unsafe_impl(std::vector<amp_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
+        {
+            phase1_unsafe_impl(state, qn, -1, total_qubit, controller_mask);
         }
-        void sdg_unsafe_impl(std::vector<complex_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
+        template<typename amp_t>
+        void s_unsafe_impl(std::vector<amp_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
         {
-            using namespace std::literals::complex_literals;
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
-
-                if ((i >> qn) & 1)
-                {
-                    state[i] *= -1i;
-                }
-            }
+            phase1_unsafe_impl(state, qn, complex_t(0, 1), total_qubit, controller_mask);
         }
-        void t_unsafe_impl(std::vector<complex_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
+        template<typename amp_t>
+        void sdg_unsafe_impl(std::vector<amp_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
         {
-            using namespace std::literals::complex_literals;
-
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
-
-                if ((i >> qn) & 1)
-                {
-                    state[i] *= complex_t(INVSQRT2, INVSQRT2);
-                }
-            }
+            phase1_unsafe_impl(state, qn, complex_t(0, -1), total_qubit, controller_mask);
         }
-        void tdg_unsafe_impl(std::vector<complex_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
+        template<typename amp_t>
+        void t_unsafe_impl(std::vector<amp_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
         {
-            using namespace std::literals::complex_literals;
-
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
-
-                if ((i >> qn) & 1)
-                {
-                    state[i] *= complex_t(INVSQRT2, -INVSQRT2);
-                }
-            }
+            phase1_unsafe_impl(state, qn, complex_t(INVSQRT2, INVSQRT2), total_qubit, controller_mask);
         }
-        void cz_unsafe_impl(std::vector<complex_t>& state, size_t qn1, size_t qn2, size_t total_qubit, size_t controller_mask)
+        template<typename amp_t>
+        void tdg_unsafe_impl(std::vector<amp_t>& state, size_t qn, size_t total_qubit, size_t controller_mask)
         {
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
-
-                if (((i >> qn1) & 1) && ((i >> qn2) & 1))
-                {
-                    state[i] *= -1;
-                }
-            }
+            phase1_unsafe_impl(state, qn, complex_t(INVSQRT2, -INVSQRT2), total_qubit, controller_mask);
         }
-        void swap_unsafe_impl(std::vector<complex_t>& state, size_t qn1, size_t qn2, size_t total_qubit, size_t controller_mask)
+        template<typename amp_t>
+        void cz_unsafe_impl(std::vector<amp_t>& state, size_t qn1, size_t qn2, size_t total_qubit, size_t controller_mask)
         {
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
+            const BaseIndexer base(total_qubit, { qn1, qn2 }, controller_mask);
+            const size_t offset = pow2(qn1) + pow2(qn2);
+            amp_t* psi = state.data();
 
-                bool v1 = (i >> qn1) & 1;
-                bool v2 = (i >> qn2) & 1;
-                if (v1 && (!v2))
-                {
-                    // |10>
-                    // let it swap with |01>
-                    std::swap(state[i - pow2(qn1) + pow2(qn2)], state[i]);
-                }
-            }
+            parallel_for(base.count, [&](size_t k) {
+                psi[base(k) + offset] *= -1;
+            });
         }
-        void iswap_unsafe_impl(std::vector<complex_t>& state, size_t qn1, size_t qn2, size_t total_qubit, size_t controller_mask, bool is_dagger)
+        template<typename amp_t>
+        void swap_unsafe_impl(std::vector<amp_t>& state, size_t qn1, size_t qn2, size_t total_qubit, size_t controller_mask)
         {
-            using namespace std::literals::complex_literals;
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
-
-                // |01>
-                if (((i >> qn1) & 1) == 0 && ((i >> qn2) & 1) == 1)
-                {
-                    std::swap(state[i], state[i + pow2(qn1) - pow2(qn2)]);
-                    if (is_dagger)
-                    {
-                        state[i] *= -1i;
-                        state[i + pow2(qn1) - pow2(qn2)] *= -1i;
-                    }
-                    else
-                    {
-                        state[i] *= 1i;
-                        state[i + pow2(qn1) - pow2(qn2)] *= 1i;
-                    }
-                }
-            }
+            const BaseIndexer base(total_qubit, { qn1, qn2 }, controller_mask);
+            const size_t offset1 = pow2(qn1);
+            const size_t offset2 = pow2(qn2);
+            amp_t* psi = state.data();
+
+            parallel_for(base.count, [&](size_t k) {
+                const size_t i = base(k);
+                // |10> <-> |01>
+                std::swap(psi[i + offset1], psi[i + offset2]);
+            });
+        }
+        template<typename amp_t>
+        void iswap_unsafe_impl(std::vector<amp_t>& state, size_t qn1, size_t qn2, size_t total_qubit, size_t controller_mask, bool is_dagger)
+        {
+            const BaseIndexer base(total_qubit, { qn1, qn2 }, controller_mask);
+            const size_t offset1 = pow2(qn1);
+            const size_t offset2 = pow2(qn2);
+            const amp_t phase(is_dagger ? complex_t(0, -1) : complex_t(0, 1));
+            amp_t* psi = state.data();
+
+            parallel_for(base.count, [&](size_t k) {
+                const size_t i = base(k);
+                const size_t i01 = i + offset2;
+                const size_t i10 = i + offset1;
+                std::swap(psi[i01], psi[i10]);
+                psi[i01] *= phase;
+                psi[i10] *= phase;
+            });
         }
 
         /* H = 1/2 * (XX+YY)
@@ -226,115 +181,97 @@ namespace statevector_simulator_impl {
         [ 0 -i sin(theta/2) cos(theta/2) 0 ]
         [ 0 0 0 1 ]
         */
-        void xy_unsafe_impl(std::vector<complex_t>& state, size_t qn1, size_t qn2, double theta, size_t total_qubit, size_t controller_mask, bool is_dagger)
+        template<typename amp_t>
+        void xy_unsafe_impl(std::vector<amp_t>& state, size_t qn1, size_t qn2, double theta, size_t total_qubit, size_t controller_mask, bool is_dagger)
         {
             using namespace std::literals::complex_literals;
-            complex_t cos_t = std::cos(theta / 2);
-            complex_t sin_t = (is_dagger ? complex_t(0, 1) : -complex_t(0, 1)) * std::sin(theta / 2);
-
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
-
-                // |01>
-                if (((i >> qn1) & 1) == 0 && ((i >> qn2) & 1) == 1)
-                {
-                    size_t i2 = i + pow2(qn1) - pow2(qn2);
-                    complex_t s1 = state[i];
-                    complex_t s2 = state[i2];
-
-                    state[i] = s1 * cos_t + s2 * sin_t;
-                    state[i2] = s1 * sin_t + s2 * cos_t;
-                }
-            }
-        }
-        void cnot_unsafe_impl(std::vector<complex_t>& state, size_t controller, size_t target, size_t total_qubit, size_t controller_mask)
+            const amp_t cos_t(std::cos(theta / 2));
+            const amp_t sin_t((is_dagger ? complex_t(0, 1) : -complex_t(0, 1)) * std::sin(theta / 2));
+
+            const BaseIndexer base(total_qubit, { qn1, qn2 }, controller_mask);
+            const size_t offset1 = pow2(qn1);
+            const size_t offset2 = pow2(qn2);
+            amp_t* psi = state.data();
+
+            parallel_for(base.count, [&](size_t k) {
+                const size_t i = base(k);
+                // |01> and |10>
+                const size_t i1 = i + offset2;
+                const size_t i2 = i + offset1;
+                const amp_t s1 = psi[i1];
+                const amp_t s2 = psi[i2];
+
+                psi[i1] = s1 * cos_t + s2 * sin_t;
+                psi[i2] = s1 * sin_t + s2 * cos_t;
+            });
+        }
+        template<typename amp_t>
+        void cnot_unsafe_impl(std::vector<amp_t>& state, size_t controller, size_t target, size_t total_qubit, size_t controller_mask)
         {
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
+            const BaseIndexer base(total_qubit, { target }, controller_mask | pow2(controller));
+            const size_t offset_t = pow2(target);
+            amp_t* psi = state.data();
 
-                if (((i >> controller) & 1) && ((i >> target) & 1))
-                {
-                    std::swap(state[i], state[i - pow2(target)]);
-                }
-            }
+            parallel_for(base.count, [&](size_t k) {
+                const size_t i = base(k);
+                std::swap(psi[i], psi[i + offset_t]);
+            });
         }
 
-        void rz_unsafe_impl(std::vector<complex_t>& state, size_t qn, double theta, size_t total_qubit, size_t controller_mask, bool is_dagger)
+        template<typename amp_t>
+        void rz_unsafe_impl(std::vector<amp_t>& state, size_t qn, double theta, size_t total_qubit, size_t controller_mask, bool is_dagger)
         {
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
+            // |0> -> exp(-it/2), |1> -> exp(it/2); conjugated for dagger
+            amp_t phase0(std::complex(cos(theta / 2), -sin(theta / 2)));
+            amp_t phase1(std::complex(cos(theta / 2), sin(theta / 2)));
+            if (is_dagger)
+                std::swap(phase0, phase1);
 
-                if (((i >> qn) & 1) ^ is_dagger)
-                {
-                    // 0 and not dagger -> exp(-it/2)
-                    // 1 and dagger -> exp(-it/2)
-                    state[i] *= std::complex(cos(theta / 2), sin(theta / 2));
-                }
-                else
-                {
-                    // 0 and dagger -> exp(it/2)
-                    // 1 and not dagger -> exp(it/2)
-                    state[i] *= std::complex(cos(theta / 2), -sin(theta / 2));
-                }
-            }
+            const BaseIndexer base(total_qubit, { qn }, controller_mask);
+            const size_t offset = pow2(qn);
+            amp_t* psi = state.data();
+
+            parallel_for(base.count, [&](size_t k) {
+                const size_t i0 = base(k);
+                psi[i0] *= phase0;
+                psi[i0 + offset] *= phase1;
+            });
         }
 
-        void u1_unsafe_impl(std::vector<complex_t>& state, size_t qn, double theta, size_t total_qubit, size_t controller_mask, bool is_dagger)
+        template<typename amp_t>
+        void u1_unsafe_impl(std::vector<amp_t>& state, size_t qn, double theta, size_t total_qubit, size_t controller_mask, bool is_dagger)
         {
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
-
-                if ((i >> qn) & 1)
-                {
-                    if (is_dagger)
-                        state[i] *= std::complex(cos(theta), -sin(theta));
-                    else
-                        state[i] *= std::complex(cos(theta), sin(theta));
-                }
-            }
+            const complex_t phase = is_dagger ? std::complex(cos(theta), -sin(theta)) : std::complex(cos(theta), sin(theta));
+            phase1_unsafe_impl(state, qn, phase, total_qubit, controller_mask);
         }
 
-        void toffoli_unsafe_impl(std::vector<complex_t>& state, size_t qn1, size_t qn2, size_t target, size_t total_qubit, size_t controller_mask)
+        template<typename amp_t>
+        void toffoli_unsafe_impl(std::vector<amp_t>& state, size_t qn1, size_t qn2, size_t target, size_t total_qubit, size_t controller_mask)
         {
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
+            const BaseIndexer base(total_qubit, { target }, controller_mask | pow2(qn1) | pow2(qn2));
+            const size_t offset_t = pow2(target);
+            amp_t* psi = state.data();
 
-                if (((i >> qn1) & 1) && ((i >> qn2) & 1) && ((i >> target) & 1))
-                {
-                    std::swap(state[i], state[i - pow2(target)]);
-                }
-            }
+            parallel_for(base.count, [&](size_t k) {
+                const size_t i = base(k);
+                std::swap(psi[i], psi[i + offset_t]);
+            });
         }
 
-        void cswap_unsafe_impl(std::vector<complex_t>& state, size_t controller, size_t target1, size_t target2, size_t total_qubit, size_t controller_mask)
+        template<typename amp_t>
+        void cswap_unsafe_impl(std::vector<amp_t>& state, size_t controller, size_t target1, size_t target2, size_t total_qubit, size_t controller_mask)
         {
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
+            // the controller may already be part of controller_mask
+            const BaseIndexer base(total_qubit, { target1, target2 }, controller_mask | pow2(controller));
+            const size_t offset1 = pow2(target1);
+            const size_t offset2 = pow2(target2);
+            amp_t* psi = state.data();
 
-                if (!((i >> controller) & 1))
-                    continue;
-
-                bool v1 = (i >> target1) & 1;
-                bool v2 = (i >> target2) & 1;
-                if (v1 && (!v2))
-                {
-                    // |10>
-                    // let it swap with |01>
-                    std::swap(state[i - pow2(target1) + pow2(target2)], state[i]);
-                }
-            }
+            parallel_for(base.count, [&](size_t k) {
+                const size_t i = base(k);
+                // |10> <-> |01>
+                std::swap(psi[i + offset1], psi[i + offset2]);
+            });
         }
 
         /* ZZ interaction
@@ -344,23 +281,24 @@ namespace statevector_simulator_impl {
         *    |10> -> exp(i*theta/2) * |10>
         *    |11> -> exp(-i*theta/2) * |11>
         */
-        void zz_unsafe_impl(std::vector<complex_t>& state, size_t qn1, size_t qn2, double theta, size_t total_qubit, size_t controller_mask)
+        template<typename amp_t>
+        void zz_unsafe_impl(std::vector<amp_t>& state, size_t qn1, size_t qn2, double theta, size_t total_qubit, size_t controller_mask)
         {
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
-                bool v1 = (i >> qn1) & 1;
-                bool v2 = (i >> qn2) & 1;
-                if (v1 == v2) /* 00 or 11 */
-                {
-                    state[i] *= complex_t(cos(theta / 2), sin(-theta / 2));
-                }
-                else /* 01 or 10 */
-                {
-                    state[i] *= complex_t(cos(theta / 2), sin(theta / 2));
-                }
-            }
+            const amp_t same(complex_t(cos(theta / 2), sin(-theta / 2)));
+            const amp_t diff(complex_t(cos(theta / 2), sin(theta / 2)));
+
+            const BaseIndexer base(total_qubit, { qn1, qn2 }, controller_mask);
+            const size_t offset1 = pow2(qn1);
+            const size_t offset2 = pow2(qn2);
+            amp_t* psi = state.data();
+
+            parallel_for(base.count, [&](size_t k) {
+                const size_t i = base(k);
+                psi[i] *= same;
+                psi[i + offset1] *= diff;
+                psi[i + offset2] *= diff;
+                psi[i + offset1 + offset2] *= same;
+            });
         }
 
         /* XX interaction
@@ -370,42 +308,39 @@ namespace statevector_simulator_impl {
         *    |10> -> [   0     isin(t)  cos(t)    0     ]
         *    |11> -> [ isin(t)   0       0       cos(t) ] where t=-theta/2
         */
-        void xx_unsafe_impl(std::vector<complex_t>& state, size_t qn1, size_t qn2, double theta, size_t total_qubit, size_t controller_mask)
+        template<typename amp_t>
+        void xx_unsafe_impl(std::vector<amp_t>& state, size_t qn1, size_t qn2, double theta, size_t total_qubit, size_t controller_mask)
         {
             using namespace std::literals::complex_literals;
 
             /* the RXX will be implemented as exp(-i*theta/2 * XX) */
             theta = -theta / 2;
 
-            complex_t ctheta = cos(theta);
-            complex_t stheta = sin(theta);
-            complex_t istheta = 1i * stheta;
+            const amp_t ctheta(cos(theta));
+            const complex_t stheta = sin(theta);
+            const amp_t istheta(1i * stheta);
 
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
-                bool v1 = (i >> qn1) & 1;
-                bool v2 = (i >> qn2) & 1;
-                if (v1 == false && v2 == false) /* 00 */
-                {
-                    /* only 00 will be operated */
-                    size_t i00 = i;
-                    size_t i01 = i + pow2(qn1);
-                    size_t i10 = i + pow2(qn2);
-                    size_t i11 = i + pow2(qn1) + pow2(qn2);
-
-                    complex_t a00 = state[i00];
-                    complex_t a01 = state[i01];
-                    complex_t a10 = state[i10];
-                    complex_t a11 = state[i11];
-
-                    state[i00] = a00 * ctheta + a11 * istheta;
-                    state[i01] = a01 * ctheta + a10 * istheta;
-                    state[i10] = a01 * istheta + a10 * ctheta;
-                    state[i11] = a00 * istheta + a11 * ctheta;
-                }
-            }
+            const BaseIndexer base(total_qubit, { qn1, qn2 }, controller_mask);
+            const size_t offset1 = pow2(qn1);
+            const size_t offset2 = pow2(qn2);
+            amp_t* psi = state.data();
+
+            parallel_for(base.count, [&](size_t k) {
+                size_t i00 = base(k);
+                size_t i01 = i00 + offset1;
+                size_t i10 = i00 + offset2;
+                size_t i11 = i00 + offset1 + offset2;
+
+                const amp_t a00 = psi[i00];
+                const amp_t a01 = psi[i01];
+                const amp_t a10 = psi[i10];
+                const amp_t a11 = psi[i11];
+
+                psi[i00] = a00 * ctheta + a11 * istheta;
+                psi[i01] = a01 * ctheta + a10 * istheta;
+                psi[i10] = a01 * istheta + a10 * ctheta;
+                psi[i11] = a00 * istheta + a11 * ctheta;
+            });
         }
 
         /* YY interaction
@@ -416,49 +351,47 @@ namespace statevector_simulator_impl {
         *    |10> -> [   0     isin(t)  cos(t)    0     ]
         *    |11> -> [ -isin(t)   0       0       cos(t) ] where t=-theta/2
         */
-        void yy_unsafe_impl(std::vector<complex_t>& state, size_t qn1, size_t qn2, double theta, size_t total_qubit, size_t controller_mask)
+        template<typename amp_t>
+        void yy_unsafe_impl(std::vector<amp_t>& state, size_t qn1, size_t qn2, double theta, size_t total_qubit, size_t controller_mask)
         {
             using namespace std::literals::complex_literals;
 
             /* the RYY will be implemented as exp(-i*theta/2 * YY) */
             theta = -theta / 2;
 
-            complex_t ctheta = cos(theta);
-            complex_t stheta = sin(theta);
-            complex_t istheta = 1i * stheta;
+            const amp_t ctheta(cos(theta));
+            const complex_t stheta = sin(theta);
+            const amp_t istheta(1i * stheta);
 
-            for (size_t i = 0; i < pow2(total_qubit); ++i)
-            {
-                if ((i & controller_mask) != controller_mask)
-                    continue;
-                bool v1 = (i >> qn1) & 1;
-                bool v2 = (i >> qn2) & 1;
-                if (v1 == false && v2 == false) /* 00 */
-                {
-                    /* only 00 will be operated */
-                    size_t i00 = i;
-                    size_t i01 = i + pow2(qn1);
-                    size_t i10 = i + pow2(qn2);
-                    size_t i11 = i + pow2(qn1) + pow2(qn2);
-
-                    complex_t a00 = state[i00];
-                    complex_t a01 = state[i01];
-                    complex_t a10 = state[i10];
-                    complex_t a11 = state[i11];
-
-                    state[i00] = a00 * ctheta - a11 * istheta;
-                    state[i01] = a01 * ctheta + a10 * istheta;
-                    state[i10] = a01 * istheta + a10 * ctheta;
-                    state[i11] = -a00 * istheta + a11 * ctheta;
-                }
-            }
+            const BaseIndexer base(total_qubit, { qn1, qn2 }, controller_mask);
+            const size_t offset1 = pow2(qn1);
+            const size_t offset2 = pow2(qn2);
+            amp_t* psi = state.data();
+
+            parallel_for(base.count, [&](size_t k) {
+                size_t i00 = base(k);
+                size_t i01 = i00 + offset1;
+                size_t i10 = i00 + offset2;
+                size_t i11 = i00 + offset1 + offset2;
+
+                const amp_t a00 = psi[i00];
+                const amp_t a01 = psi[i01];
+                const amp_t a10 = psi[i10];
+                const amp_t a11 = psi[i11];
+
+                psi[i00] = a00 * ctheta - a11 * istheta;
+                psi[i01] = a01 * ctheta + a10 * istheta;
+                psi[i10] = a01 * istheta + a10 * ctheta;
+                psi[i11] = -a00 * istheta + a11 * ctheta;
+            });
         }
 
         /* u1(qn1, theta1),
            u1(qn2, theta2),
            zz(qn1, qn2, thetazz)
         */
-        void phase2q_unsafe_impl(std::vector<complex_t>& state, size_t qn1, size_t qn2, double theta1, double theta2, double thetazz,
+        template<typename amp_t>
+        void phase2q_unsafe_impl(std::vector<amp_t>& state, size_t qn1, size_t qn2, double theta1, double theta2, double thetazz,
             size_t total_qubit, size_t controller_mask)
         {
             using namespace std::literals::complex_literals;
@@ -487,7 +420,8 @@ namespace statevector_simulator_impl {
 
         where parameters[0:15] are the 15 parameters of the gate.
         */
-        void uu15_unsafe_impl(std::vector<complex_t>& state, size_t qn1, size_t qn2, const std::vector<double>& parameters, size_t total_qubit, size_t controller_mask, bool is_dagger)
+        template<typename amp_t>
+        void uu15_unsafe_impl(std::vector<amp_t>& state, size_t qn1, size_t qn2, const std::vector<double>& parameters, size_t total_qubit, size_t controller_mask, bool is_dagger)
         {
             using namespace std::literals::complex_literals;
 
@@ -572,82 +506,135 @@ namespace statevector_simulator_impl {
             }
         }
 
-        dtype prob_0(const std::vector<complex_t>& state, size_t qn, size_t total_qubit)
+        /* k-qubit kernel with the size known at compile time, so the
+         * gather / multiply / scatter loops are unrolled */
+        template<size_t K, typename amp_t>
+        static void unitary_k_unsafe_impl(std::vector<amp_t>& state, const std::vector<size_t>& qubits, const std::vector<complex_t>& matrix, size_t total_qubit, size_t controller_mask)
         {
-            const size_t mask = pow2(qn); // 确定目标量子比特的掩码
-            const size_t N = pow2(total_qubit);
-            double p0 = 0.0;
-            for (size_t i = 0; i < N; ++i) {
-                if (!(i & mask)) {
-                    p0 += abs_sqr(state[i]);
+            constexpr size_t dim = pow2(K);
+            const BaseIndexer base(total_qubit, qubits, controller_mask);
+
+            /* offsets[j]: the state index offset of local basis state j */
+            std::array<size_t, dim> offsets;
+            for (size_t j = 0; j < dim; ++j)
+            {
+                offsets[j] = 0;
+                for (size_t b = 0; b < K; ++b)
+                {
+                    if ((j >> b) & 1)
+                        offsets[j] |= pow2(qubits[b]);
                 }
             }
-            return p0;
+
+            /* the matrix in the precision of the state */
+            const std::vector<amp_t> mat(matrix.begin(), matrix.end());
+            amp_t* psi = state.data();
+
+            parallel_for(base.count, [&](size_t n) {
+                const size_t i0 = base(n);
+                std::array<amp_t, dim> amp;
+                for (size_t j = 0; j < dim; ++j)
+                    amp[j] = psi[i0 + offsets[j]];
+
+                for (size_t r = 0; r < dim; ++r)
+                {
+                    const amp_t* row = mat.data() + r * dim;
+                    amp_t sum = 0;
+                    for (size_t j = 0; j < dim; ++j)
+                        sum += row[j] * amp[j];
+                    psi[i0 + offsets[r]] = sum;
+                }
+            });
         }
 
-        dtype prob_1(const std::vector<complex_t>& state, size_t qn, size_t total_qubit)
+        template<typename amp_t>
+        void unitary_unsafe_impl(std::vector<amp_t>& state, const std::vector<size_t>& qubits, const std::vector<complex_t>& matrix, size_t total_qubit, size_t controller_mask)
         {
-            const size_t mask = pow2(qn); // 确定目标量子比特的掩码
-            const size_t N = pow2(total_qubit);
-            double p1 = 0.0;
-            for (size_t i = 0; i < N; ++i) {
-                if (i & mask) {
-                    p1 += abs_sqr(state[i]);
-                }
+            switch (qubits.size())
+            {
+            case 1: u22_unsafe_impl(state, qubits[0], matrix[0], matrix[1], matrix[2], matrix[3], total_qubit, controller_mask); break;
+            case 2: unitary_k_unsafe_impl<2>(state, qubits, matrix, total_qubit, controller_mask); break;
+            case 3: unitary_k_unsafe_impl<3>(state, qubits, matrix, total_qubit, controller_mask); break;
+            case 4: unitary_k_unsafe_impl<4>(state, qubits, matrix, total_qubit, controller_mask); break;
+            case 5: unitary_k_unsafe_impl<5>(state, qubits, matrix, total_qubit, controller_mask); break;
+            case 6: unitary_k_unsafe_impl<6>(state, qubits, matrix, total_qubit, controller_mask); break;
+            default:
+                ThrowInvalidArgument(fmt::format("Unitary gate must act on 1 to {} qubits (input = {})", max_unitary_qubits, qubits.size()));
             }
-            return p1;
         }
 
-        void rescale_state(std::vector<complex_t>& state, double norm) {
+        template<typename amp_t>
+        dtype prob_0(const std::vector<amp_t>& state, size_t qn, size_t total_qubit)
+        {
+            const BaseIndexer base(total_qubit, { qn }, 0);
+            const amp_t* psi = state.data();
+            return parallel_sum(base.count, [&](size_t k) {
+                return abs_sqr(psi[base(k)]);
+            });
+        }
+
+        template<typename amp_t>
+        dtype prob_1(const std::vector<amp_t>& state, size_t qn, size_t total_qubit)
+        {
+            const BaseIndexer base(total_qubit, { qn }, 0);
+            const size_t offset = pow2(qn);
+            const amp_t* psi = state.data();
+            return parallel_sum(base.count, [&](size_t k) {
+                return abs_sqr(psi[base(k) + offset]);
+            });
+        }
+
+        template<typename amp_t>
+        void rescale_state(std::vector<amp_t>& state, double norm) {
             if (norm < eps)
                 ThrowInvalidArgument(fmt::format("The normalization factor ({}) is invalid.", norm));
 
             const double inv_norm = 1.0 / norm;
-            for (auto& amp : state) {
-                amp *= inv_norm;
-            }
+            amp_t* psi = state.data();
+            parallel_for(state.size(), [&](size_t i) {
+                psi[i] *= inv_norm;
+            });
         }
 
-        void amplitude_damping_unsafe_impl(std::vector<complex_t>& state, size_t qn, double gamma, size_t total_qubit)
+        template<typename amp_t>
+        void amplitude_damping_unsafe_impl(std::vector<amp_t>& state, size_t qn, double gamma, size_t total_qubit)
         {
             // 计算|1⟩态的总概率
             double p1 = prob_1(state, qn, total_qubit);
-            size_t mask = pow2(qn);
-            size_t N = pow2(total_qubit);
+            const BaseIndexer base(total_qubit, { qn }, 0);
+            const size_t mask = pow2(qn);
+            amp_t* psi = state.data();
 
             const double prob_E1 = gamma * p1; // 应用E1的概率
             const double r = qpandalite::rand();
 
             if (r < prob_E1) {
-                for (size_t i = 0; i < N; ++i) {
-                    // 仅处理目标量子比特为0的基态
-                    if ((i & mask) != 0)
-                        continue;
+                // 仅处理目标量子比特为0的基态
+                parallel_for(base.count, [&](size_t k) {
+                    const size_t i0 = base(k);
+                    const size_t i1 = i0 + mask;
 
-                    size_t i0 = i;
-                    size_t i1 = i + mask;
+                    psi[i0] = psi[i1];
+                    psi[i1] = 0;
+                });
 
-                    state[i0] = state[i1];
-                    state[i1] = 0;
-                }
-
-                rescale_state(state, p1);
+                rescale_state(state, std::sqrt(p1));
             }
             else {
                 // 应用E0操作：衰减|1⟩态幅度
-                for (size_t i = 0; i < N; ++i) {
-                    if (i & mask) {
-                        state[i] *= std::sqrt(1 - gamma);
-                    }
-                }
+                const double damping = std::sqrt(1 - gamma);
+                parallel_for(base.count, [&](size_t k) {
+                    psi[base(k) + mask] *= damping;
+                });
 
                 // 归一化处理
-                const double norm = 1 - prob_E1;                
+                const double norm = std::sqrt(1 - prob_E1);
                 rescale_state(state, norm);
             }
         }
 
-        void kraus1q_unsafe_impl(std::vector<complex_t>& state, size_t qn, const std::vector<u22_t>& kraus, size_t total_qubit)
+        template<typename amp_t>
+        void kraus1q_unsafe_impl(std::vector<amp_t>& state, size_t qn, const std::vector<u22_t>& kraus, size_t total_qubit)
         {
             const size_t mask = pow2(qn); // 使用安全的幂计算函数
             const double r = qpandalite::rand();
@@ -683,7 +670,8 @@ namespace statevector_simulator_impl {
             rescale_state(state, final_norm);
         }
 
-        dtype get_prob_unsafe_impl(const std::vector<complex_t>& state, size_t qn, int qstate, size_t total_qubit)
+        template<typename amp_t>
+        dtype get_prob_unsafe_impl(const std::vector<amp_t>& state, size_t qn, int qstate, size_t total_qubit)
         {
             if (qstate == 0)
             {
@@ -700,7 +688,8 @@ namespace statevector_simulator_impl {
             }
         }
 
-        dtype get_prob_unsafe_impl(const std::vector<complex_t>& state, const std::map<size_t, int> measure_map, size_t total_qubit)
+        template<typename amp_t>
+        dtype get_prob_unsafe_impl(const std::vector<amp_t>& state, const std::map<size_t, int> measure_map, size_t total_qubit)
         {
             size_t mask_qubit = 0;
             size_t mask_state = 0;
@@ -722,5 +711,60 @@ namespace statevector_simulator_impl {
             return prob;
         }
 
+        template<typename amp_t>
+        dtype expval_pauli_unsafe_impl(const std::vector<amp_t>& state, const PauliMask& pauli, size_t total_qubit)
+        {
+            const amp_t* psi = state.data();
+            const size_t x_mask = pauli.x_mask;
+            const size_t z_mask = pauli.z_mask;
+            const complex_t phase = pauli.phase;
+
+            /* <psi|P|psi> = sum_b conj(psi[b ^ x]) * phase * (-1)^parity(b & z) * psi[b] */
+            return parallel_sum(pow2(total_qubit), [&](size_t b) {
+                const complex_t v = std::conj(complex_t(psi[b ^ x_mask])) * complex_t(psi[b]);
+                const double term = std::real(phase * v);
+                return bit_parity(b & z_mask) ? -term : term;
+            });
+        }
+
+#define INSTANTIATE_STATEVECTOR_IMPL(amp_t) \
+        template void hadamard_unsafe_impl(std::vector<amp_t>&, size_t, size_t, size_t); \
+        template void u22_unsafe_impl(std::vector<amp_t>&, size_t, complex_t, complex_t, complex_t, complex_t, size_t, size_t); \
+        template void u22_unsafe_impl(std::vector<amp_t>&, size_t, u22_t, size_t, size_t); \
+        template void u3_unsafe_impl(std::vector<amp_t>&, size_t, double, double, double, size_t, size_t, bool); \
+        template void x_unsafe_impl(std::vector<amp_t>&, size_t, size_t, size_t); \
+        template void y_unsafe_impl(std::vector<amp_t>&, size_t, size_t, size_t); \
+        template void z_unsafe_impl(std::vector<amp_t>&, size_t, size_t, size_t); \
+        template void s_unsafe_impl(std::vector<amp_t>&, size_t, size_t, size_t); \
+        template void sdg_unsafe_impl(std::vector<amp_t>&, size_t, size_t, size_t); \
+        template void t_unsafe_impl(std::vector<amp_t>&, size_t, size_t, size_t); \
+        template void tdg_unsafe_impl(std::vector<amp_t>&, size_t, size_t, size_t); \
+        template void cz_unsafe_impl(std::vector<amp_t>&, size_t, size_t, size_t, size_t); \
+        template void swap_unsafe_impl(std::vector<amp_t>&, size_t, size_t, size_t, size_t); \
+        template void iswap_unsafe_impl(std::vector<amp_t>&, size_t, size_t, size_t, size_t, bool); \
+        template void xy_unsafe_impl(std::vector<amp_t>&, size_t, size_t, double, size_t, size_t, bool); \
+        template void cnot_unsafe_impl(std::vector<amp_t>&, size_t, size_t, size_t, size_t); \
+        template void rz_unsafe_impl(std::vector<amp_t>&, size_t, double, size_t, size_t, bool); \
+        template void u1_unsafe_impl(std::vector<amp_t>&, size_t, double, size_t, size_t, bool); \
+        template void toffoli_unsafe_impl(std::vector<amp_t>&, size_t, size_t, size_t, size_t, size_t); \
+        template void cswap_unsafe_impl(std::vector<amp_t>&, size_t, size_t, size_t, size_t, size_t); \
+        template void zz_unsafe_impl(std::vector<amp_t>&, size_t, size_t, double, size_t, size_t); \
+        template void xx_unsafe_impl(std::vector<amp_t>&, size_t, size_t, double, size_t, size_t); \
+        template void yy_unsafe_impl(std::vector<amp_t>&, size_t, size_t, double, size_t, size_t); \
+        template void phase2q_unsafe_impl(std::vector<amp_t>&, size_t, size_t, double, double, double, size_t, size_t); \
+        template void uu15_unsafe_impl(std::vector<amp_t>&, size_t, size_t, const std::vector<double>&, size_t, size_t, bool); \
+        template void unitary_unsafe_impl(std::vector<amp_t>&, const std::vector<size_t>&, const std::vector<complex_t>&, size_t, size_t); \
+        template double prob_0(const std::vector<amp_t>&, size_t, size_t); \
+        template double prob_1(const std::vector<amp_t>&, size_t, size_t); \
+        template void rescale_state(std::vector<amp_t>&, double); \
+        template void amplitude_damping_unsafe_impl(std::vector<amp_t>&, size_t, double, size_t); \
+        template void kraus1q_unsafe_impl(std::vector<amp_t>&, size_t, const std::vector<u22_t>&, size_t); \
+        template dtype get_prob_unsafe_impl(const std::vector<amp_t>&, size_t, int, size_t); \
+        template dtype get_prob_unsafe_impl(const std::vector<amp_t>&, const std::map<size_t, int>, size_t); \
+        template dtype expval_pauli_unsafe_impl(const std::vector<amp_t>&, const PauliMask&, size_t);
+
+        INSTANTIATE_STATEVECTOR_IMPL(std::complex<double>)
+        INSTANTIATE_STATEVECTOR_IMPL(std::complex<float>)
+
 } // namespace statevector_simulator_impl
 } // namespace qpandalite
@@ -65,6 +65,8 @@ from .task_manager import (
     submit_batch,
     query_task,
     wait_for_result,
+    wait_for_results,
+    iter_results,
     save_task,
     get_task,
     list_tasks,
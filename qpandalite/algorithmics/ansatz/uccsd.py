@@ -3,6 +3,10 @@
 Implements a simplified UCCSD ansatz for variational quantum chemistry
 simulations.  Each single/double excitation is parameterised by an
 independent variational angle.
+
+The angles may be :class:`~qpandalite.circuit_builder.Parameter` objects
+(e.g. a :class:`~qpandalite.circuit_builder.Parameters` array); the circuit
+is then built once as a template and bound with :meth:`Circuit.bind_batch`.
 """
 
 __all__ = ["uccsd_ansatz"]
@@ -11,6 +15,17 @@ from typing import List, Optional, Tuple
 from itertools import combinations
 import numpy as np
 from qpandalite.circuit_builder import Circuit
+from qpandalite.circuit_builder.qcircuit import _is_symbolic
+
+
+def _angle(theta):
+    """``theta`` as a float, or unchanged if it is symbolic."""
+    return theta if _is_symbolic(theta) else float(theta)
+
+
+def _is_zero(theta) -> bool:
+    # symbolic angles are kept, whatever value they are bound to later
+    return not _is_symbolic(theta) and abs(theta) <= 1e-15
 
 
 def _single_excitation(
@@ -28,8 +43,8 @@ def _single_excitation(
     # This maps |01> → cos(θ)|01> - sin(θ)|10> in the {p,q} subspace
     # (when p is the higher orbital and q the lower)
     circuit.cx(p, q)
-    if abs(theta) > 1e-15:
-        circuit.ry(q, float(-theta))
+    if not _is_zero(theta):
+        circuit.ry(q, _angle(-theta))
     circuit.cx(p, q)
 
 
@@ -53,20 +68,23 @@ def _double_excitation(
     circuit.cx(j, a)
     circuit.cx(a, b)
 
+    half = theta / 2
+    skip = _is_zero(half)
+
     # Step 2: Ry on target
-    if abs(theta / 2) > 1e-15:
-        circuit.ry(b, float(theta / 2))
+    if not skip:
+        circuit.ry(b, _angle(half))
 
     # Step 3: Undo and redo with different control phase
     circuit.cx(a, b)
-    if abs(theta / 2) > 1e-15:
-        circuit.ry(b, float(-theta / 2))
+    if not skip:
+        circuit.ry(b, _angle(-half))
     circuit.cx(j, b)
-    if abs(theta / 2) > 1e-15:
-        circuit.ry(b, float(theta / 2))
+    if not skip:
+        circuit.ry(b, _angle(half))
     circuit.cx(a, b)
-    if abs(theta / 2) > 1e-15:
-        circuit.ry(b, float(-theta / 2))
+    if not skip:
+        circuit.ry(b, _angle(-half))
 
     # Step 4: Undo cascade
     circuit.cx(j, b)
@@ -91,6 +109,8 @@ def uccsd_ansatz(
         n_electrons: Number of occupied spin-orbitals.
         qubits: Qubit indices.  ``None`` → ``list(range(n_qubits))``.
         params: Variational parameters.  ``None`` → zeros (no excitation).
+            Symbolic entries (``Parameter`` objects or expressions) give a
+            template whose excitation gates are all present.
 
     Returns:
         A :class:`Circuit` object.
@@ -102,6 +122,9 @@ def uccsd_ansatz(
     Example:
         >>> from qpandalite.algorithmics.ansatz import uccsd_ansatz
         >>> c = uccsd_ansatz(n_qubits=4, n_electrons=2)
+        >>> from qpandalite.circuit_builder import Parameters
+        >>> template = uccsd_ansatz(4, 2, params=Parameters("t", size=5))
+        >>> programs = template.bind_batch(np.random.rand(100, 5))
     """
     if n_electrons > n_qubits:
         raise ValueError(
@@ -124,7 +147,7 @@ def uccsd_ansatz(
     if params is None:
         params = np.zeros(n_params)
     else:
-        params = np.asarray(params)
+        params = list(params)
         if len(params) != n_params:
             raise ValueError(
                 f"Expected {n_params} parameters "
@@ -143,17 +166,17 @@ def uccsd_ansatz(
     # Single excitations: occupied → virtual
     for occ in occupied:
         for virt in virtual:
-            if abs(params[idx]) > 1e-15:
-                _single_excitation(circuit, qubits[occ], qubits[virt], float(params[idx]))
+            if not _is_zero(params[idx]):
+                _single_excitation(circuit, qubits[occ], qubits[virt], params[idx])
             idx += 1
 
     # Double excitations: pairs of occupied → pairs of virtual
     for (i, j) in combinations(occupied, 2):
         for (a, b) in combinations(virtual, 2):
-            if abs(params[idx]) > 1e-15:
+            if not _is_zero(params[idx]):
                 _double_excitation(
                     circuit, qubits[i], qubits[j], qubits[a], qubits[b],
-                    float(params[idx])
+                    params[idx]
                 )
             idx += 1
 
@@ -2,6 +2,8 @@
 
 __all__ = [
     "pauli_expectation",
+    "pauli_sum_expectation",
+    "PauliSum",
     "state_tomography",
     "tomography_summary",
     "classical_shadow",
@@ -9,7 +11,8 @@ __all__ = [
     "basis_rotation_measurement",
 ]
 
-from .pauli_expectation import pauli_expectation
+from .pauli_expectation import pauli_expectation, pauli_sum_expectation
+from .pauli_sum import PauliSum
 from .state_tomography import state_tomography, tomography_summary
 from .classical_shadow import classical_shadow, shadow_expectation
 from .basis_rotation import basis_rotation_measurement
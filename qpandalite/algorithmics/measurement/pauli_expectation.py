@@ -1,10 +1,13 @@
-"""Pauli string expectation value measurement via basis rotation."""
+"""Pauli string expectation value measurement.
 
-__all__ = ["pauli_expectation"]
+In statevector mode (``shots=None``) the exact value is computed by the
+simulator's ``expval_pauli`` without changing the circuit; with ``shots``
+the circuit is rotated into the Pauli basis and sampled.
+"""
 
-from typing import Optional
+__all__ = ["pauli_expectation", "pauli_sum_expectation"]
 
-import numpy as np
+from typing import Optional, Sequence
 
 from qpandalite.circuit_builder import Circuit
 from qpandalite.simulator.qasm_simulator import QASM_Simulator
@@ -54,32 +57,21 @@ def _apply_basis_rotation(circuit: Circuit, pauli_string: str) -> Circuit:
     return rot_circuit
 
 
+def _final_state_simulator(circuit: Circuit) -> QASM_Simulator:
+    """Simulate ``circuit`` once and return the simulator holding the final state."""
+    sim = QASM_Simulator(backend_type='statevector')
+    sim.simulate_statevector(circuit.to_bytes())
+    return sim
+
+
 def _statevector_expectation(circuit: Circuit, pauli_string: str) -> float:
     """Compute the exact ⟨pauli_string⟩ expectation from the statevector.
 
-    Applies basis-rotation gates to rotate to the measurement basis, then
-    computes the expectation analytically from the final statevector.
+    The circuit is simulated once, without basis rotations, and the
+    expectation is evaluated on the final state by the C++ simulator.
     """
-    rot_circuit = _apply_basis_rotation(circuit, pauli_string)
-    n = rot_circuit.max_qubit + 1
-
-    # Use QASM simulator in statevector mode
-    sim = QASM_Simulator(backend_type='statevector', n_qubits=n)
-    qasm = rot_circuit.qasm
-    result = sim.simulate_statevector(qasm)
-
-    # result is a list of complex amplitudes, convert to probabilities
-    probs = np.abs(result) ** 2
-    exp_val = 0.0
-    for idx, p in enumerate(probs):
-        # Build bitstring for this index (big-endian: qubit 0 is MSB)
-        bitstring = format(idx, f'0{n}b')
-        parity = _parity(bitstring, pauli_string.upper())
-        if parity == 0:
-            exp_val += p
-        else:
-            exp_val -= p
-    return float(exp_val)
+    sim = _final_state_simulator(circuit)
+    return float(sim.simulator.expval_pauli(pauli_string))
 
 
 def _shots_expectation(circuit: Circuit, pauli_string: str, shots: int) -> float:
@@ -88,8 +80,7 @@ def _shots_expectation(circuit: Circuit, pauli_string: str, shots: int) -> float
     n = rot_circuit.max_qubit + 1
 
     sim = QASM_Simulator(backend_type='statevector', n_qubits=n)
-    qasm = rot_circuit.qasm
-    counts = sim.simulate_shots(qasm, shots=shots)
+    counts = sim.simulate_shots(rot_circuit.to_bytes(), shots=shots)
     total = sum(counts.values())
 
     exp_val = 0.0
@@ -151,9 +142,80 @@ def pauli_expectation(
         >>> abs(pauli_expectation(c, "ZZ", shots=10000) - 1.0) < 0.1
         True
     """
-    # Validate pauli_string
-    pauli_upper = pauli_string.upper()
+    _validate_pauli_string(pauli_string, circuit.max_qubit + 1)
+    _validate_shots(shots)
+
+    if shots is not None:
+        return _shots_expectation(circuit, pauli_string, shots)
+
+    return _statevector_expectation(circuit, pauli_string)
+
+
+def pauli_sum_expectation(
+    circuit: Circuit,
+    pauli_strings: Sequence[str],
+    coeffs: Optional[Sequence[float]] = None,
+    shots: Optional[int] = None,
+) -> float:
+    """Measure the expectation value of a weighted sum of Pauli strings.
+
+    In statevector mode (``shots=None``) the circuit is simulated once and
+    every term is evaluated on the final state, so a Hamiltonian with many
+    terms costs a single simulation. With ``shots``, qubit-wise commuting
+    terms share one measurement circuit (see :class:`PauliSum`).
+
+    Args:
+        circuit: Quantum circuit, as for :func:`pauli_expectation`.
+        pauli_strings: Pauli strings of the terms, each as for
+            :func:`pauli_expectation`.
+        coeffs: Real coefficient of each term. ``None`` gives every term
+            coefficient 1.
+        shots: Number of measurement shots per circuit. ``None`` uses
+            statevector mode for the exact value.
+
+    Returns:
+        ``sum_k coeffs[k] * ⟨psi|P_k|psi⟩`` as a float.
+
+    Raises:
+        ValueError: A Pauli string is invalid, or ``coeffs`` does not have
+            one entry per term.
+        ValueError: ``shots`` is not a positive integer.
+
+    Example:
+        >>> from qpandalite.circuit_builder import Circuit
+        >>> from qpandalite.algorithmics.measurement import pauli_sum_expectation
+        >>> c = Circuit()
+        >>> c.h(0)
+        >>> c.cx(0, 1)
+        >>> c.measure(0, 1)
+        >>> value = pauli_sum_expectation(c, ["ZZ", "XX", "ZI"], [0.5, 0.25, 1.0])
+        >>> abs(value - 0.75) < 1e-9
+        True
+    """
+    pauli_strings = list(pauli_strings)
+    coeffs = [1.0] * len(pauli_strings) if coeffs is None else [float(c) for c in coeffs]
+    if len(coeffs) != len(pauli_strings):
+        raise ValueError(
+            f"coeffs length ({len(coeffs)}) must match the number of "
+            f"Pauli strings ({len(pauli_strings)})"
+        )
+
     n_qubits = circuit.max_qubit + 1
+    for pauli_string in pauli_strings:
+        _validate_pauli_string(pauli_string, n_qubits)
+    _validate_shots(shots)
+
+    if shots is not None:
+        from .pauli_sum import PauliSum
+        return PauliSum(list(zip(pauli_strings, coeffs))).expectation(circuit, shots=shots)
+
+    sim = _final_state_simulator(circuit)
+    return float(sim.simulator.expval_pauli_sum(pauli_strings, coeffs))
+
+
+def _validate_pauli_string(pauli_string: str, n_qubits: int) -> None:
+    """Check that ``pauli_string`` has one I/X/Y/Z character per qubit."""
+    pauli_upper = pauli_string.upper()
 
     if len(pauli_upper) != n_qubits:
         raise ValueError(
@@ -167,9 +229,9 @@ def pauli_expectation(
                 f"pauli_string must contain only I/X/Y/Z, got: {pauli_string!r}"
             )
 
+
+def _validate_shots(shots: Optional[int]) -> None:
+    """Check that ``shots`` is None or a positive integer."""
     if shots is not None:
         if not isinstance(shots, int) or shots <= 0:
             raise ValueError(f"shots must be a positive integer, got: {shots}")
-        return _shots_expectation(circuit, pauli_string, shots)
-
-    return _statevector_expectation(circuit, pauli_string)
@@ -0,0 +1,254 @@
+"""Weighted sums of Pauli strings with grouped, commuting-term measurement."""
+
+__all__ = ["PauliSum"]
+
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from qpandalite.circuit_builder import Circuit
+from qpandalite.simulator.qasm_simulator import QASM_Simulator
+
+from .pauli_expectation import (
+    _apply_basis_rotation,
+    _final_state_simulator,
+    _validate_pauli_string,
+    _validate_shots,
+)
+
+TermsType = Union[Mapping[str, float], Iterable[Tuple[str, float]]]
+
+
+def _qubitwise_commute(basis: str, pauli_string: str) -> bool:
+    """Whether ``pauli_string`` can be measured in ``basis`` (I matches anything)."""
+    return all(b == 'I' or p == 'I' or b == p for b, p in zip(basis, pauli_string))
+
+
+def _merge_basis(basis: str, pauli_string: str) -> str:
+    """The measurement basis of ``basis`` extended by ``pauli_string``."""
+    return ''.join(b if b != 'I' else p for b, p in zip(basis, pauli_string))
+
+
+def _common_basis(pauli_strings: Sequence[str]) -> str:
+    """The product basis diagonalizing all ``pauli_strings``, if they commute qubit-wise."""
+    basis = 'I' * len(pauli_strings[0])
+    for pauli_string in pauli_strings:
+        if not _qubitwise_commute(basis, pauli_string):
+            raise ValueError(
+                f"Terms do not commute qubit-wise, no common basis for {pauli_string!r}"
+            )
+        basis = _merge_basis(basis, pauli_string)
+    return basis
+
+
+class PauliSum:
+    """A Hamiltonian ``H = sum_k c_k P_k`` of real-weighted Pauli strings.
+
+    Pauli strings follow the convention of :func:`pauli_expectation`:
+    character ``i`` acts on qubit ``i``, and all strings have the same
+    length. Repeated strings are merged by adding their coefficients.
+
+    Terms that commute qubit-wise (on every qubit the two strings are equal
+    or one of them is ``I``) are diagonal in a common product basis, so they
+    can all be estimated from the counts of a single measurement circuit.
+    :meth:`groups` partitions the terms this way; on hardware a VQE
+    iteration then submits one circuit per group instead of one per term.
+
+    Args:
+        terms: Either a dict mapping Pauli strings to coefficients, or an
+            iterable of ``(pauli_string, coeff)`` pairs.
+
+    Raises:
+        ValueError: A Pauli string contains characters other than I/X/Y/Z,
+            or the strings have different lengths.
+
+    Example:
+        >>> from qpandalite.circuit_builder import Circuit
+        >>> from qpandalite.algorithmics.measurement import PauliSum
+        >>> h = PauliSum({"ZZ": 0.5, "ZI": 0.2, "XX": 0.3, "YY": -0.1})
+        >>> [g.basis for g in h.groups()]
+        ['ZZ', 'XX', 'YY']
+        >>> c = Circuit()
+        >>> c.h(0)
+        >>> c.cx(0, 1)
+        >>> c.measure(0, 1)
+        >>> abs(h.expectation(c) - 0.9) < 1e-9
+        True
+    """
+
+    def __init__(self, terms: TermsType):
+        items = [(pauli_string.upper(), float(coeff)) for pauli_string, coeff in
+                 (terms.items() if isinstance(terms, Mapping) else terms)]
+        if not items:
+            raise ValueError("PauliSum needs at least one term")
+
+        self.n_qubits = len(items[0][0])
+        merged: Dict[str, float] = {}
+        for pauli_string, coeff in items:
+            _validate_pauli_string(pauli_string, self.n_qubits)
+            merged[pauli_string] = merged.get(pauli_string, 0.0) + coeff
+        self.terms: List[Tuple[str, float]] = list(merged.items())
+
+    @property
+    def pauli_strings(self) -> List[str]:
+        """The Pauli strings of the terms."""
+        return [pauli_string for pauli_string, _ in self.terms]
+
+    @property
+    def coeffs(self) -> List[float]:
+        """The coefficients of the terms."""
+        return [coeff for _, coeff in self.terms]
+
+    @property
+    def basis(self) -> str:
+        """The product basis measuring every term at once.
+
+        Raises:
+            ValueError: The terms do not all commute qubit-wise.
+        """
+        return _common_basis(self.pauli_strings)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __iter__(self):
+        return iter(self.terms)
+
+    def __repr__(self) -> str:
+        terms = ' + '.join(f'{coeff:g}*{pauli_string}' for pauli_string, coeff in self.terms)
+        return f'PauliSum({terms})'
+
+    def __add__(self, other: 'PauliSum') -> 'PauliSum':
+        if not isinstance(other, PauliSum):
+            return NotImplemented
+        return PauliSum(self.terms + other.terms)
+
+    def __mul__(self, scalar: float) -> 'PauliSum':
+        return PauliSum([(pauli_string, coeff * scalar) for pauli_string, coeff in self.terms])
+
+    __rmul__ = __mul__
+
+    def groups(self) -> List['PauliSum']:
+        """Partition the terms into qubit-wise commuting groups.
+
+        Terms are placed greedily, largest ``|coeff|`` first, into the first
+        group they commute with qubit-wise, so the dominant terms share
+        groups and the number of groups stays small.
+
+        Returns:
+            One PauliSum per group; each has a well-defined :attr:`basis`.
+        """
+        grouped: List[Tuple[str, List[Tuple[str, float]]]] = []
+        for pauli_string, coeff in sorted(self.terms, key=lambda term: -abs(term[1])):
+            for i, (basis, members) in enumerate(grouped):
+                if _qubitwise_commute(basis, pauli_string):
+                    members.append((pauli_string, coeff))
+                    grouped[i] = (_merge_basis(basis, pauli_string), members)
+                    break
+            else:
+                grouped.append((pauli_string, [(pauli_string, coeff)]))
+        return [PauliSum(members) for _, members in grouped]
+
+    def measurement_circuits(self, circuit: Circuit) -> List[Circuit]:
+        """Build one measurement circuit per group of :meth:`groups`.
+
+        Each circuit is ``circuit`` followed by the basis rotations of its
+        group (``H`` for X, ``S^dagger H`` for Y), as in
+        :func:`pauli_expectation`.
+
+        Args:
+            circuit: State-preparation circuit, measuring qubit ``i`` into
+                classical bit ``i``.
+
+        Returns:
+            The measurement circuits, in the order of :meth:`groups`.
+        """
+        self._check_circuit(circuit)
+        return [_apply_basis_rotation(circuit, group.basis) for group in self.groups()]
+
+    def expectation_from_counts(self, counts: Mapping[Union[int, str], float]) -> float:
+        """Evaluate all terms of a qubit-wise commuting PauliSum from one counts dict.
+
+        Args:
+            counts: Outcomes of the circuit measured in :attr:`basis`, as
+                counts or probabilities. Integer keys have qubit ``i`` in
+                bit ``i``; string keys are bitstrings with qubit 0 as the
+                rightmost character.
+
+        Returns:
+            ``sum_k c_k <P_k>`` estimated from the outcomes.
+
+        Raises:
+            ValueError: The terms do not all commute qubit-wise, or
+                ``counts`` is empty.
+        """
+        _common_basis(self.pauli_strings)  # every term must be diagonal in the measured basis
+        total = sum(counts.values())
+        if total <= 0:
+            raise ValueError("counts must contain at least one outcome")
+
+        masks = [(sum(1 << i for i, p in enumerate(pauli_string) if p != 'I'), coeff)
+                 for pauli_string, coeff in self.terms]
+        value = 0.0
+        for outcome, count in counts.items():
+            if isinstance(outcome, str):
+                outcome = int(outcome, 2)
+            p = count / total
+            for mask, coeff in masks:
+                value += -coeff * p if bin(outcome & mask).count('1') % 2 else coeff * p
+        return float(value)
+
+    def expectation_from_group_counts(self, group_counts: Sequence[Mapping[Union[int, str], float]]) -> float:
+        """Combine the counts of every measurement circuit into ``<H>``.
+
+        Args:
+            group_counts: One counts dict per circuit of
+                :meth:`measurement_circuits`, in the same order.
+
+        Returns:
+            The estimated expectation value of the whole sum.
+
+        Raises:
+            ValueError: The number of counts dicts does not match the number
+                of groups.
+        """
+        groups = self.groups()
+        if len(group_counts) != len(groups):
+            raise ValueError(
+                f"Expected one counts dict per group ({len(groups)}), got {len(group_counts)}"
+            )
+        return float(sum(group.expectation_from_counts(counts)
+                         for group, counts in zip(groups, group_counts)))
+
+    def expectation(self, circuit: Circuit, shots: Optional[int] = None) -> float:
+        """Compute ``<H>`` on the state prepared by ``circuit``.
+
+        Args:
+            circuit: Quantum circuit, as for :func:`pauli_expectation`.
+            shots: Number of shots per measurement circuit. ``None`` uses
+                statevector mode: the circuit is simulated once and every
+                term is evaluated on the final state.
+
+        Returns:
+            The expectation value as a float.
+
+        Raises:
+            ValueError: ``circuit`` does not match the number of qubits, or
+                ``shots`` is not a positive integer.
+        """
+        self._check_circuit(circuit)
+        _validate_shots(shots)
+
+        if shots is None:
+            sim = _final_state_simulator(circuit)
+            return float(sim.simulator.expval_pauli_sum(self.pauli_strings, self.coeffs))
+
+        sim = QASM_Simulator(backend_type='statevector')
+        group_counts = [sim.simulate_shots(measure_circuit.to_bytes(), shots=shots)
+                        for measure_circuit in self.measurement_circuits(circuit)]
+        return self.expectation_from_group_counts(group_counts)
+
+    def _check_circuit(self, circuit: Circuit) -> None:
+        if circuit.max_qubit + 1 != self.n_qubits:
+            raise ValueError(
+                f"PauliSum acts on {self.n_qubits} qubits but the circuit has "
+                f"{circuit.max_qubit + 1}"
+            )
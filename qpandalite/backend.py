@@ -132,6 +132,15 @@ class QuantumBackend(abc.ABC):
             self._adapter = self._create_adapter()
         return self._adapter
     
+    @property
+    def query_batch_per_task(self) -> bool:
+        """Whether ``query_batch`` yields exactly one result per task ID.
+        
+        Returns:
+            The capability flag of the adapter class of this backend.
+        """
+        return self._adapter_class.query_batch_per_task
+    
     @abc.abstractmethod
     def _create_adapter(self) -> QuantumAdapter:
         """Create and return the platform-specific adapter.
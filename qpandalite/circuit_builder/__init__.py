@@ -1,7 +1,8 @@
 from .qcircuit import Circuit
 from .qubit import Qubit, QReg, QRegSlice
-from .parameter import Parameter, Parameters
+from .parameter import Parameter, Parameters, CompiledExpressions, compile_expressions
 from .named_circuit import circuit_def, NamedCircuit
+from .binary_format import BinaryCircuit, opcodes_to_bytes, opcodes_from_bytes, is_binary_circuit
 from .opcode import (
     make_header_originir,
     make_header_qasm,
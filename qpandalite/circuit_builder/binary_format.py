@@ -0,0 +1,249 @@
+"""Compact binary format for circuits and opcode lists.
+
+OriginIR and QASM text have to be formatted and parsed again whenever a
+circuit is executed locally or shipped to another process. The binary
+format stores the opcodes as flat arrays instead:
+
+* a fixed 48-byte header (magic ``b"QPLC"``, version, counts),
+* the parameters of all opcodes as one float64 array,
+* the qubits, control qubits, classical bits, measured qubits and used
+  qubits as uint32 arrays,
+* per opcode: an operation index, the numbers of qubits, control qubits
+  and parameters (uint16 each) and a flag byte,
+* the table of operation names, UTF-8 and newline separated.
+
+All values are little-endian. Complex parameters (the matrix of a
+``UNITARY`` opcode, the Kraus operators of ``Kraus1Q``) are stored as their
+shape followed by interleaved real and imaginary parts.
+
+Decoding restores the opcodes exactly, except that tuples of parameters
+come back as lists. Parameters must be numbers: symbolic parameters are
+bound before encoding (see :meth:`Circuit.to_bytes`).
+
+Key exports:
+    BinaryCircuit: Decoded content of a binary circuit.
+    opcodes_to_bytes: Encode an opcode list and its measurements.
+    opcodes_from_bytes: Decode the output of opcodes_to_bytes.
+    is_binary_circuit: Whether an object holds an encoded circuit.
+"""
+
+from __future__ import annotations
+
+__all__ = ["BinaryCircuit", "opcodes_to_bytes", "opcodes_from_bytes", "is_binary_circuit"]
+
+import struct
+from typing import List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .opcode import OpcodeType
+
+_MAGIC = b"QPLC"
+_VERSION = 1
+# magic, version, reserved, qubit_num, cbit_num, opcodes, qubits, controls,
+# parameters, measured qubits, used qubits, cbits, name table bytes
+_header = struct.Struct("<4sHH10I")
+
+# flag bits of every opcode
+_DAGGER = 1
+_QUBIT_LIST = 2  # the qubit is a list, not an int
+_PARAMETER_LIST = 4  # the parameter is a list, not a scalar (or None)
+_CONTROLS = 8  # control qubits is a list, not None
+_COMPLEX = 16  # the parameter is a complex array
+_CBIT = 32  # the classical bit is an int, not None
+
+
+class BinaryCircuit(NamedTuple):
+    """Content of a binary circuit.
+
+    Attributes:
+        qubit_num: Number of qubits of the circuit.
+        cbit_num: Number of classical bits.
+        opcodes: The opcodes.
+        measure_list: Measured qubits, in classical bit order.
+        used_qubits: Qubits recorded by the circuit, in order of first use.
+    """
+
+    qubit_num: int
+    cbit_num: int
+    opcodes: List[OpcodeType]
+    measure_list: List[int]
+    used_qubits: List[int]
+
+
+def is_binary_circuit(data) -> bool:
+    """Whether ``data`` is a bytes-like object produced by :func:`opcodes_to_bytes`."""
+    return isinstance(data, (bytes, bytearray, memoryview)) and bytes(data[:4]) == _MAGIC
+
+
+def _encode_complex(parameter, params: list) -> None:
+    array = np.asarray(parameter, dtype=complex)
+    params.append(array.ndim)
+    params.extend(array.shape)
+    params.extend(np.ravel(array).view(np.float64).tolist())
+
+
+def opcodes_to_bytes(
+    qubit_num: int,
+    cbit_num: int,
+    opcodes: Sequence[OpcodeType],
+    measure_list: Sequence[int] = (),
+    used_qubits: Optional[Sequence[int]] = None,
+) -> bytes:
+    """Encode opcodes and measurements in the binary circuit format.
+
+    Args:
+        qubit_num: Number of qubits of the circuit.
+        cbit_num: Number of classical bits.
+        opcodes: The opcodes, with numeric parameters.
+        measure_list: Measured qubits, in classical bit order.
+        used_qubits: Qubits in order of first use (default: none recorded).
+
+    Returns:
+        The encoded circuit.
+
+    Raises:
+        TypeError: A parameter is not a number.
+        ValueError: A classical bit is a list.
+        OverflowError: An opcode has 65536 or more qubits or parameters.
+    """
+    names: dict = {}
+    op_index, flags, cbits = [], [], []
+    qubit_counts, qubits = [], []
+    control_counts, controls = [], []
+    param_counts, params = [], []
+
+    for operation, qubit, cbit, parameter, dagger, control_qubits in opcodes:
+        flag = _DAGGER if dagger else 0
+        op_index.append(names.setdefault(operation, len(names)))
+
+        if isinstance(qubit, list):
+            flag |= _QUBIT_LIST
+            qubits.extend(qubit)
+            qubit_counts.append(len(qubit))
+        else:
+            qubits.append(qubit)
+            qubit_counts.append(1)
+
+        if isinstance(cbit, list):
+            raise ValueError(f"The binary format does not store a list of cbits ({operation} {cbit}).")
+        if cbit is not None:
+            flag |= _CBIT
+            cbits.append(cbit)
+
+        n_params = len(params)
+        if operation in ("UNITARY", "Kraus1Q") and parameter is not None:
+            flag |= _COMPLEX | (_PARAMETER_LIST if isinstance(parameter, list) else 0)
+            _encode_complex(parameter, params)
+        elif isinstance(parameter, (list, tuple, np.ndarray)):
+            flag |= _PARAMETER_LIST
+            params.extend(float(p) for p in parameter)
+        elif parameter is not None:
+            params.append(float(parameter))
+        param_counts.append(len(params) - n_params)
+
+        if control_qubits is not None:
+            flag |= _CONTROLS
+            controls.extend(control_qubits)
+            control_counts.append(len(control_qubits))
+        else:
+            control_counts.append(0)
+        flags.append(flag)
+
+    used_qubits = list(used_qubits) if used_qubits is not None else []
+    name_table = "\n".join(names).encode("utf-8")
+    header = _header.pack(_MAGIC, _VERSION, 0, qubit_num, cbit_num, len(op_index), len(qubits),
+                          len(controls), len(params), len(measure_list), len(used_qubits),
+                          len(cbits), len(name_table))
+    return b"".join([
+        header,
+        np.asarray(params, dtype="<f8").tobytes(),
+        np.asarray(qubits, dtype="<u4").tobytes(),
+        np.asarray(controls, dtype="<u4").tobytes(),
+        np.asarray(list(measure_list), dtype="<u4").tobytes(),
+        np.asarray(used_qubits, dtype="<u4").tobytes(),
+        np.asarray(cbits, dtype="<u4").tobytes(),
+        np.asarray(op_index, dtype="<u2").tobytes(),
+        np.asarray(qubit_counts, dtype="<u2").tobytes(),
+        np.asarray(control_counts, dtype="<u2").tobytes(),
+        np.asarray(param_counts, dtype="<u2").tobytes(),
+        np.asarray(flags, dtype="u1").tobytes(),
+        name_table,
+    ])
+
+
+def _decode_complex(values: list):
+    ndim = int(values[0])
+    shape = [int(d) for d in values[1:1 + ndim]]
+    return np.array(values[1 + ndim:], dtype=np.float64).view(complex).reshape(shape)
+
+
+def opcodes_from_bytes(data) -> BinaryCircuit:
+    """Decode a circuit encoded by :func:`opcodes_to_bytes`.
+
+    Args:
+        data: A bytes-like object.
+
+    Returns:
+        The decoded :class:`BinaryCircuit`.
+
+    Raises:
+        ValueError: ``data`` is not a binary circuit of a supported version.
+    """
+    data = memoryview(data)
+    if len(data) < _header.size or bytes(data[:4]) != _MAGIC:
+        raise ValueError("Not a binary circuit.")
+    (_, version, _, qubit_num, cbit_num, n_ops, n_qubits, n_controls, n_params,
+     n_measure, n_used, n_cbits, name_bytes) = _header.unpack_from(data)
+    if version != _VERSION:
+        raise ValueError(f"Unsupported binary circuit version {version}.")
+
+    offset = _header.size
+
+    def take(dtype, count):
+        nonlocal offset
+        array = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+        offset += array.nbytes
+        return array.tolist()
+
+    params = take("<f8", n_params)
+    qubits = take("<u4", n_qubits)
+    controls = take("<u4", n_controls)
+    measure_list = take("<u4", n_measure)
+    used_qubits = take("<u4", n_used)
+    cbits = take("<u4", n_cbits)
+    op_index = take("<u2", n_ops)
+    qubit_counts = take("<u2", n_ops)
+    control_counts = take("<u2", n_ops)
+    param_counts = take("<u2", n_ops)
+    flags = take("u1", n_ops)
+    names = bytes(data[offset:offset + name_bytes]).decode("utf-8").split("\n")
+
+    opcodes = []
+    q = c = p = 0
+    cbit_iter = iter(cbits)
+    for i in range(n_ops):
+        flag = flags[i]
+        n = qubit_counts[i]
+        qubit = qubits[q:q + n] if flag & _QUBIT_LIST else qubits[q]
+        q += n
+
+        n = param_counts[i]
+        if flag & _COMPLEX:
+            parameter = _decode_complex(params[p:p + n])
+            if flag & _PARAMETER_LIST:
+                parameter = list(parameter)
+        elif flag & _PARAMETER_LIST:
+            parameter = params[p:p + n]
+        else:
+            parameter = params[p] if n else None
+        p += n
+
+        n = control_counts[i]
+        control_qubits = controls[c:c + n] if flag & _CONTROLS else None
+        c += n
+
+        opcodes.append((names[op_index[i]], qubit, next(cbit_iter) if flag & _CBIT else None,
+                        parameter, bool(flag & _DAGGER), control_qubits))
+
+    return BinaryCircuit(qubit_num, cbit_num, opcodes, measure_list, used_qubits)
@@ -25,6 +25,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+from .opcode import opcode_to_line_originir
+from .parameter import Parameter
 from .qcircuit import Circuit
 
 if TYPE_CHECKING:
@@ -130,6 +132,9 @@ class NamedCircuit:
             param_values: Concrete values for parameters
                 - dict: Mapping parameter names to values
                 - list: Values in order of params list
+                Parameters without a value are passed to the builder as
+                :class:`Parameter` objects, so the circuit keeps references
+                to them and can be bound later with :meth:`Circuit.bind`.
 
         Returns:
             The modified parent circuit
@@ -213,8 +218,7 @@ class NamedCircuit:
             if param_name in param_dict:
                 builder_args.append(param_dict[param_name])
             else:
-                # Pass None for unbound parameters (may cause issues downstream)
-                builder_args.append(None)
+                builder_args.append(Parameter(param_name))
 
         # Call the builder
         self._builder(*builder_args)
@@ -248,8 +252,7 @@ class NamedCircuit:
     def to_originir_def(self) -> str:
         """Export as OriginIR DEF block.
 
-        Note: This is a placeholder. Full DEF export requires
-        symbolic parameter support in OriginIR format.
+        Parameters are written by name, e.g. ``RX q[0], (2*theta)``.
         """
         lines = []
         # Header: DEF name(qreg_list) (param_list)
@@ -270,12 +273,8 @@ class NamedCircuit:
 
             c = Circuit(qregs=self._qregs)
             self(c, qreg_mapping=qreg_mapping)
-
-            for line in c.originir.split("\n"):
-                if line.startswith("QINIT") or line.startswith("CREG") or line.startswith("MEASURE"):
-                    continue
-                if line.strip():
-                    lines.append(line)
+            # the unbound opcodes, so that parameters keep their names
+            lines.extend(opcode_to_line_originir(opcode) for opcode in c.opcode_list)
 
         lines.append("ENDDEF")
         return "\n".join(lines)
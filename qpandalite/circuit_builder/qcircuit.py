@@ -4,6 +4,11 @@ This module provides a Circuit class for building quantum circuits programmatica
 It supports various quantum gates, controlled operations, dagger (adjoint) blocks,
 and measurement operations. The circuit can be exported to OriginIR or OpenQASM format.
 
+Gate parameters may be :class:`Parameter` objects or expressions of them. The
+opcodes then keep these references, and :meth:`Circuit.bind` /
+:meth:`Circuit.bind_batch` turn the circuit into executable programs by
+filling the parameter array of one compiled program.
+
 Key exports:
     Circuit: Main quantum circuit builder class.
     OpcodeType: Type alias for opcode tuples.
@@ -12,8 +17,12 @@ Key exports:
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Iterable, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import sympy as sp
 
+from .binary_format import opcodes_from_bytes, opcodes_to_bytes
 from .opcode import (
     make_header_originir,
     make_header_qasm,
@@ -22,9 +31,11 @@ from .opcode import (
     opcode_to_line_originir,
     opcode_to_line_qasm,
 )
+from .parameter import Parameter, compile_expressions, _parameter_by_name
+from .qubit import Qubit, QReg, QRegSlice
 
 if TYPE_CHECKING:
-    from .qubit import Qubit, QReg, QRegSlice
+    from qpandalite.simulator.opcode_simulator import CompiledProgram
 
 # Opcode: (op_name, qubits, cbits, params, dagger, control_qubits)
 QubitSpec = int | list[int]
@@ -40,6 +51,151 @@ __all__ = ["Circuit", "OpcodeType"]
 # Backward-compatible type alias
 OpcodeType = OpCode
 
+ParameterValues = Union[Mapping[str, float], Sequence[float], np.ndarray]
+
+
+def _is_symbolic(value) -> bool:
+    return isinstance(value, Parameter) or (isinstance(value, sp.Basic) and bool(value.free_symbols))
+
+
+def _parameter_slots(params) -> list:
+    """The entries of an opcode's parameter, as a list."""
+    return list(params) if isinstance(params, (list, tuple)) else [params]
+
+
+class _ParameterTable:
+    """The parameter references of an opcode list, compiled for binding.
+
+    Every symbolic entry of a gate parameter is a *slot*. The slot
+    expressions are compiled once with :func:`compile_expressions`, so the
+    slot values of a batch of parameter vectors take one array operation.
+    The opcodes are compiled to one program with placeholder values, and
+    ``positions`` locates the slots in its flat parameter array.
+    """
+
+    def __init__(self, opcodes: list[OpCode], names: list[str], qubit_num: int, measure_list: list[int]):
+        from qpandalite.simulator.opcode_simulator import CompiledProgram, _no_effect_operations
+
+        self.n_parameters = len(names)
+        # (opcode index, entry index or None for a scalar parameter) of every slot
+        self.slots: list[tuple[int, Optional[int]]] = []
+        expressions: list = []
+        template: list[OpCode] = []
+        positions: list[int] = []
+
+        for index, opcode in enumerate(opcodes):
+            operation, qubits, cbits, params, dagger, controls = opcode
+            entries = _parameter_slots(params)
+            symbolic = [i for i, entry in enumerate(entries) if _is_symbolic(entry)]
+            for i in symbolic:
+                slot = i if isinstance(params, (list, tuple)) else None
+                expressions.append(entries[i])
+                self.slots.append((index, slot))
+                entries[i] = 0.0
+            if symbolic:
+                params = entries if isinstance(params, (list, tuple)) else entries[0]
+                opcode = (operation, qubits, cbits, params, dagger, controls)
+            template.append(opcode)
+        self.template = template
+
+        self.expressions = compile_expressions(expressions, names)
+
+        self.compiled = CompiledProgram(qubit_num, template, measure_list)
+        program = self.compiled.program
+        if program is not None:
+            # index of each opcode in the program, which skips the no-effect operations
+            encoded_index, n_encoded = {}, 0
+            for index, opcode in enumerate(template):
+                if opcode[0] not in _no_effect_operations:
+                    encoded_index[index] = n_encoded
+                    n_encoded += 1
+            param_offsets = program.param_offsets
+            for index, slot in self.slots:
+                positions.append(param_offsets[encoded_index[index]] + (slot or 0))
+            self.params = np.array(program.params, dtype=float)
+        self.positions = np.array(positions, dtype=np.intp)
+
+    def slot_values(self, matrix: np.ndarray) -> np.ndarray:
+        """Values of every slot for each row of a ``(rows, n_parameters)`` matrix."""
+        return self.expressions(matrix)
+
+    def opcodes(self, values: np.ndarray) -> list[OpCode]:
+        """The opcodes with the slots set to ``values``."""
+        opcodes = list(self.template)
+        for (index, slot), value in zip(self.slots, values.tolist()):
+            operation, qubits, cbits, params, dagger, controls = opcodes[index]
+            if slot is None:
+                params = value
+            else:
+                params = list(params)
+                params[slot] = value
+            opcodes[index] = (operation, qubits, cbits, params, dagger, controls)
+        return opcodes
+
+    def programs(self, values: np.ndarray) -> list["CompiledProgram"]:
+        """One program per row of slot values."""
+        from qpandalite.simulator.opcode_simulator import CompiledProgram
+
+        if self.compiled.program is None:
+            return [CompiledProgram(self.compiled.qubit_num, self.opcodes(row), self.compiled.measure_qubit)
+                    for row in values]
+        params = np.tile(self.params, (len(values), 1))
+        params[:, self.positions] = values
+        return [self.compiled.with_params(row_params, lambda row=row: self.opcodes(row))
+                for row_params, row in zip(params, values)]
+
+
+class _OpcodeList(list):
+    """The opcode list of a circuit, counting its in-place edits.
+
+    Appending only lengthens the list, which the caches of :class:`Circuit`
+    detect from its length. Every other edit (replacing, deleting,
+    inserting or reordering opcodes) increments ``version``, so the cached
+    parameter table and text are rebuilt.
+    """
+
+    version = 0
+
+    def _edit(method):  # type: ignore[no-untyped-def]
+        def edit(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+            self.version += 1
+            return method(self, *args, **kwargs)
+
+        edit.__name__ = method.__name__
+        edit.__doc__ = method.__doc__
+        return edit
+
+    __setitem__ = _edit(list.__setitem__)
+    __delitem__ = _edit(list.__delitem__)
+    __imul__ = _edit(list.__imul__)
+    insert = _edit(list.insert)
+    pop = _edit(list.pop)
+    remove = _edit(list.remove)
+    clear = _edit(list.clear)
+    sort = _edit(list.sort)
+    reverse = _edit(list.reverse)
+    del _edit
+
+
+class _TextCache:
+    """Rendered text of one opcode list, extended as opcodes are appended.
+
+    ``lines`` holds one line per opcode of ``opcodes`` (the list object
+    itself, so a replaced list is detected, and its ``version``, so an
+    in-place edit is detected), rendered with the parameter values and,
+    for QASM, the qubit count in ``key``: multi-controlled gates are
+    decomposed with workspace qubits above ``qubit_num``. The full text is
+    assembled again only when the lines, header or measurements change.
+    """
+
+    def __init__(self, opcodes: _OpcodeList, key: tuple) -> None:
+        self.opcodes = opcodes
+        self.version = opcodes.version
+        self.key = key
+        self.lines: list[str] = []
+        self.text_key: Optional[tuple] = None
+        self.text = ""
+
 
 class CircuitControlContext:
     """Context manager for controlled gate blocks."""
@@ -96,7 +252,9 @@ class Circuit:
     Attributes
     ----------
     used_qubit_list : list[int]
-        Qubits referenced in the circuit.
+        Qubits referenced in the circuit, in order of first use. Assign a
+        new list rather than editing it in place, so the membership set
+        used by :meth:`record_qubit` stays in sync.
     circuit_str : str
         Raw string builder used by context managers.
     max_qubit : int
@@ -108,18 +266,23 @@ class Circuit:
     measure_list : list[int]
         Qubits scheduled for measurement.
     opcode_list : list[OpCode]
-        Internal list of gate opcodes.
+        Internal list of gate opcodes. Parametric gates may hold
+        :class:`Parameter` objects or expressions of them. An assigned
+        list is copied; in-place edits are tracked, so the cached text
+        and parameter table follow them.
+    _parameters : dict[str, Parameter]
+        Parameters referenced by the opcodes, in order of first use.
+    _text_cache : dict[str, _TextCache]
+        Rendered OriginIR / QASM lines, extended as opcodes are appended.
     _qregs : dict[str, QReg]
         Named quantum registers (if created with qregs parameter).
     """
 
-    used_qubit_list: list[int]
     circuit_str: str
     max_qubit: int
     qubit_num: int
     cbit_num: int
     measure_list: list[int]
-    opcode_list: list[OpCode]
     _qregs: dict[str, "QReg"]
 
     def __init__(
@@ -150,8 +313,6 @@ class Circuit:
             >>> qr_a = QReg(name="a", size=4)
             >>> c = Circuit(qregs=[qr_a])
         """
-        from .qubit import QReg as QRegClass
-
         self.used_qubit_list = []
         self.max_qubit = 0
         self.qubit_num = 0
@@ -159,6 +320,11 @@ class Circuit:
         self.measure_list = []
         self.opcode_list = []
         self.circuit_str = ""
+        self._parameters: dict[str, Parameter] = {}
+        # (opcode list, key, table) of the last parameter table
+        self._parameter_table: Optional[tuple[_OpcodeList, tuple, _ParameterTable]] = None
+        # "originir" / "qasm" -> rendered lines of opcode_list
+        self._text_cache: dict[str, _TextCache] = {}
         # Named register storage
         self._qregs = {}
         # Active-context state: accumulated control qubits and dagger flag for
@@ -178,7 +344,7 @@ class Circuit:
                 # Create QReg objects from dict
                 base_index = 0
                 for name, size in qregs.items():
-                    qreg = QRegClass(name=name, size=size, base_index=base_index)
+                    qreg = QReg(name=name, size=size, base_index=base_index)
                     self._qregs[name] = qreg
                     base_index += size
                 self.qubit_num = base_index
@@ -223,18 +389,14 @@ class Circuit:
         Returns:
             Integer qubit index or list of indices
         """
-        from .qubit import Qubit as QubitClass
-        from .qubit import QReg as QRegClass
-        from .qubit import QRegSlice as QRegSliceClass
-
         if isinstance(qubit, int):
             return qubit
-        elif isinstance(qubit, QubitClass):
+        elif isinstance(qubit, Qubit):
             return int(qubit)
-        elif isinstance(qubit, QRegClass):
+        elif isinstance(qubit, QReg):
             # QReg - return all qubit indices
             return [int(q) for q in qubit.qubits]
-        elif isinstance(qubit, QRegSliceClass):
+        elif isinstance(qubit, QRegSlice):
             return [int(q) for q in qubit]
         elif isinstance(qubit, list):
             # Recursively resolve list elements
@@ -242,11 +404,11 @@ class Circuit:
             for q in qubit:
                 if isinstance(q, int):
                     resolved.append(q)
-                elif isinstance(q, QubitClass):
+                elif isinstance(q, Qubit):
                     resolved.append(int(q))
-                elif isinstance(q, QRegClass):
+                elif isinstance(q, QReg):
                     resolved.extend(int(qi) for qi in q.qubits)
-                elif isinstance(q, QRegSliceClass):
+                elif isinstance(q, QRegSlice):
                     resolved.extend(int(qi) for qi in q)
                 else:
                     raise TypeError(f"Unsupported qubit type in list: {type(q)}")
@@ -262,24 +424,227 @@ class Circuit:
         new_circuit.qubit_num = self.qubit_num
         new_circuit.cbit_num = self.cbit_num
         new_circuit.measure_list = self.measure_list.copy()
-        new_circuit.opcode_list = self.opcode_list.copy()
+        new_circuit.opcode_list = self.opcode_list
         new_circuit.circuit_str = self.circuit_str
         new_circuit._active_controls = self._active_controls.copy()
         new_circuit._active_dagger = self._active_dagger
         new_circuit._control_stack = list(self._control_stack)
+        # the copy binds its own parameters; opcodes refer to them by name
+        for name, parameter in self._parameters.items():
+            new_circuit._parameters[name] = parameter._copy()
         return new_circuit
 
+    # ─────────────────── Parameters ───────────────────
+
+    @property
+    def parameters(self) -> list[Parameter]:
+        """The parameters referenced by the circuit, in order of first use."""
+        return list(self._parameters.values())
+
+    @property
+    def num_parameters(self) -> int:
+        """Number of :attr:`parameters`."""
+        return len(self._parameters)
+
+    @property
+    def parameter_names(self) -> list[str]:
+        """Names of :attr:`parameters`; the column order of :meth:`bind_batch`."""
+        return list(self._parameters)
+
+    def _register_parameters(self, params: ParamSpec) -> ParamSpec:
+        """Record the parameters referenced by ``params``; constant expressions become floats."""
+        def register(entry):
+            if isinstance(entry, Parameter):
+                self._parameters.setdefault(entry.name, entry)
+            elif isinstance(entry, sp.Basic):
+                if not entry.free_symbols:
+                    return float(entry)
+                for symbol in sorted(entry.free_symbols, key=lambda symbol: symbol.name):
+                    # the Parameter the expression was built from, bound values included
+                    if symbol.name not in self._parameters:
+                        self._parameters[symbol.name] = _parameter_by_name(symbol.name) or Parameter(symbol.name)
+            return entry
+
+        if isinstance(params, (list, tuple)):
+            return type(params)(register(entry) for entry in params)
+        return register(params)
+
+    def _get_parameter_table(self) -> _ParameterTable:
+        # rebuilt whenever the opcode list is replaced, edited or lengthened, or the measurements change
+        opcodes = self.opcode_list
+        key = (opcodes.version, len(opcodes), self.qubit_num, tuple(self.measure_list), tuple(self._parameters))
+        cached = self._parameter_table
+        if cached is None or cached[0] is not opcodes or cached[1] != key:
+            table = _ParameterTable(opcodes, list(self._parameters), self.qubit_num, self.measure_list)
+            self._parameter_table = cached = (opcodes, key, table)
+        return cached[2]
+
+    def _parameter_matrix(self, values) -> np.ndarray:
+        """Parameter vectors as a ``(rows, n_parameters)`` array.
+
+        Accepts a mapping (unlisted parameters use their bound value), a
+        sequence in :attr:`parameter_names` order, a list of mappings or a
+        matrix with one row per vector.
+        """
+        if isinstance(values, Mapping):
+            values = [values]
+        if isinstance(values, (list, tuple)) and values and isinstance(values[0], Mapping):
+            unknown = {name for row in values for name in row} - set(self._parameters)
+            if unknown:
+                raise ValueError(f"Unknown parameters {sorted(unknown)}")
+            return np.array([[row[name] if name in row else parameter.evaluate()
+                              for name, parameter in self._parameters.items()] for row in values],
+                            dtype=float)
+        matrix = np.array(values, dtype=float, ndmin=2)
+        if matrix.ndim != 2 or matrix.shape[1] != len(self._parameters):
+            raise ValueError(
+                f"Expected {len(self._parameters)} values per parameter vector "
+                f"{self.parameter_names}, got shape {np.shape(values)}"
+            )
+        return matrix
+
+    @property
+    def bound_opcode_list(self) -> list[OpCode]:
+        """The opcodes with every parameter reference replaced by its bound value.
+
+        Raises:
+            ValueError: A referenced parameter is not bound.
+        """
+        if not self._parameters:
+            return self.opcode_list
+        return self._bind_opcodes(self.opcode_list)
+
+    def _bind_opcodes(self, opcodes: Iterable[OpCode]) -> list[OpCode]:
+        """``opcodes`` with their parameter references replaced by the bound values.
+
+        Each reference is evaluated on its own, without compiling the
+        circuit, so the cost is proportional to the number of opcodes given.
+        """
+        parameters = self._parameters
+        values: dict[str, float] = {}
+
+        def value(name: str, default: Optional[Parameter] = None) -> float:
+            if name not in values:
+                parameter = parameters.get(name) or default or _parameter_by_name(name)
+                if parameter is None:
+                    raise ValueError(f"Parameter '{name}' is not bound and no value provided")
+                values[name] = parameter.evaluate()
+            return values[name]
+
+        def bind(entry):
+            if isinstance(entry, Parameter):
+                return value(entry.name, entry)
+            if isinstance(entry, sp.Basic) and entry.free_symbols:
+                return float(entry.xreplace({symbol: value(symbol.name) for symbol in entry.free_symbols}))
+            return entry
+
+        bound = []
+        for opcode in opcodes:
+            operation, qubits, cbits, params, dagger, controls = opcode
+            if isinstance(params, (list, tuple)):
+                if any(map(_is_symbolic, params)):
+                    opcode = (operation, qubits, cbits, [bind(entry) for entry in params], dagger, controls)
+            elif _is_symbolic(params):
+                opcode = (operation, qubits, cbits, bind(params), dagger, controls)
+            bound.append(opcode)
+        return bound
+
+    def bind(self, values: ParameterValues) -> "CompiledProgram":
+        """An executable program with the parameters set to ``values``.
+
+        The circuit is compiled once, with a placeholder for every
+        parameter reference; binding only writes the values into a copy of
+        the program's flat parameter array. The circuit itself is not
+        copied or changed, and no expression is evaluated symbolically.
+
+        Qubits are not remapped: the program simulates ``qubit_num`` qubits
+        and measures :attr:`measure_list`. Noise is not injected.
+
+        Args:
+            values: A mapping from parameter names to values (unlisted
+                parameters use their bound value), or a sequence in
+                :attr:`parameter_names` order.
+
+        Returns:
+            A :class:`~qpandalite.simulator.CompiledProgram`, accepted by
+            every ``simulate_*`` method of the simulators.
+
+        Raises:
+            ValueError: ``values`` does not match the parameters.
+
+        Example:
+            >>> theta = Parameter("theta")
+            >>> c = Circuit()
+            >>> c.rx(0, theta)
+            >>> c.ry(1, 2 * theta)
+            >>> c.measure(0, 1)
+            >>> program = c.bind({"theta": 0.3})
+            >>> OriginIR_Simulator().simulate_pmeasure(program)
+        """
+        return self.bind_batch(self._parameter_matrix(values))[0]
+
+    def bind_batch(self, values: ParameterValues) -> list["CompiledProgram"]:
+        """One executable program per parameter vector, as in :meth:`bind`.
+
+        All slot values of the batch are computed as one array operation.
+
+        Args:
+            values: A ``(rows, n_parameters)`` matrix with columns in
+                :attr:`parameter_names` order, or a list of mappings.
+
+        Returns:
+            A list of :class:`~qpandalite.simulator.CompiledProgram`.
+        """
+        table = self._get_parameter_table()
+        return table.programs(table.slot_values(self._parameter_matrix(values)))
+
+    def _bound_parameter_values(self) -> tuple:
+        """Bound values of the parameters, None for the unbound ones."""
+        return tuple(parameter.evaluate() if parameter.is_bound else None
+                     for parameter in self._parameters.values())
+
+    def _render(self, fmt: str) -> str:
+        """The circuit text in ``fmt`` ("originir" or "qasm").
+
+        Only the opcodes appended since the last call are rendered. The
+        lines are rendered again from scratch when :attr:`opcode_list` is
+        replaced or edited in place, when a parameter value changes and, for
+        QASM, when :attr:`qubit_num` changes.
+        """
+        values = self._bound_parameter_values()
+        key = (values, self.qubit_num) if fmt == "qasm" else (values,)
+        opcodes = self.opcode_list
+        cache = self._text_cache.get(fmt)
+        if (cache is None or cache.opcodes is not opcodes or cache.version != opcodes.version
+                or cache.key != key or len(cache.lines) > len(opcodes)):
+            cache = self._text_cache[fmt] = _TextCache(opcodes, key)
+
+        lines = cache.lines
+        if len(lines) < len(opcodes):
+            new_opcodes = self._bind_opcodes(opcodes[len(lines):])
+            if fmt == "qasm":
+                lines.extend(opcode_to_line_qasm(op, self.qubit_num) for op in new_opcodes)
+            else:
+                lines.extend(map(opcode_to_line_originir, new_opcodes))
+
+        measure_list = self.measure_list or []
+        text_key = (len(lines), self.qubit_num, self.cbit_num, tuple(measure_list))
+        if cache.text_key != text_key:
+            if fmt == "qasm":
+                header = make_header_qasm(self.qubit_num, self.cbit_num)
+                measure = make_measure_qasm(measure_list)
+            else:
+                header = make_header_originir(self.qubit_num, self.cbit_num)
+                measure = make_measure_originir(measure_list)
+            cache.text = header + "\n".join(lines) + "\n" + measure
+            cache.text_key = text_key
+        return cache.text
+
     def _make_originir_circuit(self) -> str:
-        header = make_header_originir(self.qubit_num, self.cbit_num)
-        circuit_str = "\n".join([opcode_to_line_originir(op) for op in self.opcode_list])
-        measure = make_measure_originir(self.measure_list)
-        return header + circuit_str + "\n" + measure
+        return self._render("originir")
 
     def _make_qasm_circuit(self) -> str:
-        header = make_header_qasm(self.qubit_num, self.cbit_num)
-        circuit_str = "\n".join([opcode_to_line_qasm(op, self.qubit_num) for op in self.opcode_list])
-        measure = make_measure_qasm(self.measure_list)
-        return header + circuit_str + "\n" + measure
+        return self._render("qasm")
 
     @property
     def circuit(self) -> str:
@@ -288,20 +653,90 @@ class Circuit:
 
     @property
     def originir(self) -> str:
-        """Generate the circuit in OriginIR format."""
+        """Generate the circuit in OriginIR format.
+
+        The text is cached and follows every change of the circuit,
+        including opcodes replaced or deleted in :attr:`opcode_list`.
+        """
         return self._make_originir_circuit()
 
     @property
     def qasm(self) -> str:
-        """Generate the circuit in OpenQASM format."""
+        """Generate the circuit in OpenQASM format.
+
+        Cached like :attr:`originir`.
+        """
         return self._make_qasm_circuit()
 
+    def to_bytes(self) -> bytes:
+        """Encode the circuit in the binary circuit format.
+
+        The binary form stores the opcodes as flat arrays (see
+        :mod:`~qpandalite.circuit_builder.binary_format`). Unlike
+        :attr:`originir` it is not formatted as text, and every ``simulate_*``
+        method of the simulators accepts it without parsing. Parameters are
+        stored with their bound values.
+
+        Returns:
+            The encoded circuit, restored by :meth:`from_bytes`.
+
+        Raises:
+            ValueError: A referenced parameter is not bound.
+        """
+        return opcodes_to_bytes(self.qubit_num, self.cbit_num, self.bound_opcode_list,
+                                self.measure_list, self.used_qubit_list)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Circuit":
+        """Build a circuit from the output of :meth:`to_bytes`.
+
+        Args:
+            data: A bytes-like object.
+
+        Returns:
+            A circuit with the same opcodes, measurements and qubits.
+
+        Raises:
+            ValueError: ``data`` is not a binary circuit.
+        """
+        decoded = opcodes_from_bytes(data)
+        circuit = cls()
+        circuit.opcode_list = decoded.opcodes
+        circuit.measure_list = decoded.measure_list
+        circuit.used_qubit_list = decoded.used_qubits
+        circuit.qubit_num = decoded.qubit_num
+        circuit.max_qubit = max(0, decoded.qubit_num - 1)
+        circuit.cbit_num = decoded.cbit_num
+        return circuit
+
+    @property
+    def opcode_list(self) -> list[OpCode]:
+        """The gate opcodes, in order."""
+        return self._opcode_list
+
+    @opcode_list.setter
+    def opcode_list(self, opcodes: Iterable[OpCode]) -> None:
+        self._opcode_list = _OpcodeList(opcodes)
+
+    @property
+    def used_qubit_list(self) -> list[int]:
+        """Qubits referenced in the circuit, in order of first use."""
+        return self._used_qubit_list
+
+    @used_qubit_list.setter
+    def used_qubit_list(self, qubits: list[int]) -> None:
+        self._used_qubit_list = list(qubits)
+        self._used_qubit_set = set(self._used_qubit_list)
+
     def record_qubit(self, qubits: int | list[int]) -> None:
         """Record the qubits used in the circuit."""
-        for qubit in qubits if isinstance(qubits, list) else [qubits]:
-            if qubit not in self.used_qubit_list:
-                self.used_qubit_list.append(qubit)
-                self.max_qubit = max(self.max_qubit, qubit)
+        used = self._used_qubit_set
+        for qubit in qubits if isinstance(qubits, list) else (qubits,):
+            if qubit not in used:
+                used.add(qubit)
+                self._used_qubit_list.append(qubit)
+                if qubit > self.max_qubit:
+                    self.max_qubit = qubit
         self.qubit_num = self.max_qubit + 1
 
     def add_gate(
@@ -319,7 +754,8 @@ class Circuit:
             operation: Gate name (e.g., "H", "CNOT", "RX")
             qubits: Target qubit(s) - can be int, Qubit, QRegSlice, or list
             cbits: Classical bit(s) for measurement
-            params: Gate parameters
+            params: Gate parameters; numbers, :class:`Parameter` objects or
+                expressions of them
             dagger: Whether to apply dagger (adjoint)
             control_qubits: Control qubit(s)
         """
@@ -327,32 +763,60 @@ class Circuit:
         resolved_qubits = self._resolve_qubit(qubits)
         resolved_controls = self._resolve_qubit(control_qubits) if control_qubits is not None else None
 
-        if operation in {"BARRIER", "I"}:
-            # These gates have no controlled / dagger semantics; store as-is.
-            merged_controls: QubitSpec = resolved_controls
-            merged_dagger = dagger
-        else:
-            # Merge explicit control_qubits with any active context controls.
-            base: list[int] = list(resolved_controls) if resolved_controls is not None else []
-            if self._active_controls:
-                overlap = set(base) & set(self._active_controls)
-                if overlap:
-                    raise ValueError(
-                        f"Qubit(s) {sorted(overlap)} appear in both "
-                        "control_qubits and an enclosing control() context block."
-                    )
-                base = base + list(self._active_controls)
-            merged_controls = base if base else None  # type: ignore[assignment]
-            # XOR active-dagger with the explicit dagger flag.
-            merged_dagger = dagger ^ self._active_dagger
+        merged_controls, merged_dagger = self._merge_context(operation, resolved_controls, dagger)
+        if params is not None:
+            params = self._register_parameters(params)
         opcode: OpCode = (operation, resolved_qubits, cbits, params, merged_dagger, merged_controls)  # type: ignore[assignment]
         self.opcode_list.append(opcode)
-        self.record_qubit(resolved_qubits if isinstance(resolved_qubits, list) else [resolved_qubits])
+        self.record_qubit(resolved_qubits)
+
+    def _merge_context(self, operation: str, controls: Optional[QubitSpec], dagger: bool) -> tuple:
+        """The control qubits and dagger flag of a gate inside the active control/dagger context."""
+        if operation in {"BARRIER", "I"}:
+            # These gates have no controlled / dagger semantics; store as-is.
+            return controls, dagger
+        # Merge explicit control_qubits with any active context controls.
+        base: list[int] = list(controls) if controls is not None else []
+        if self._active_controls:
+            overlap = set(base) & set(self._active_controls)
+            if overlap:
+                raise ValueError(
+                    f"Qubit(s) {sorted(overlap)} appear in both "
+                    "control_qubits and an enclosing control() context block."
+                )
+            base = base + list(self._active_controls)
+        # XOR active-dagger with the explicit dagger flag.
+        return (base if base else None), dagger ^ self._active_dagger
+
+    def extend(self, opcodes: Iterable[OpCode]) -> None:
+        """Append opcodes whose qubits are already integers.
+
+        The bulk counterpart of :meth:`add_gate` for opcodes taken from
+        another circuit, a parser or a generator: qubit references are not
+        resolved and the gates are not validated. An active control/dagger
+        context still applies, parameter references are registered, and the
+        target qubits are recorded, as :meth:`add_gate` does.
+
+        Args:
+            opcodes: ``(operation, qubits, cbits, params, dagger,
+                control_qubits)`` tuples with integer qubits.
+        """
+        in_context = bool(self._active_controls) or self._active_dagger
+        append = self.opcode_list.append
+        record_qubit = self.record_qubit
+        for operation, qubits, cbits, params, dagger, controls in opcodes:
+            if in_context:
+                controls, dagger = self._merge_context(operation, controls, dagger)
+            if params is not None and not isinstance(params, float):
+                params = self._register_parameters(params)
+            append((operation, qubits, cbits, params, dagger, controls))
+            record_qubit(qubits)
 
     def add_circuit(self, other: "Circuit") -> None:
         """Add all gates from another circuit into this circuit."""
-        for op in other.opcode_list:
-            self.add_gate(*op)
+        for name, parameter in other._parameters.items():
+            self._parameters.setdefault(name, parameter)
+        self.extend(other.opcode_list)
 
     @property
     def depth(self) -> int:
@@ -806,6 +1270,7 @@ class Circuit:
             unique_qubit_set.add(qubit)
 
         c = deepcopy(self)
+        c._text_cache = {}
 
         def remap_opcode(opcode: OpCode, mp: dict[int, int]) -> OpCode:
             op_name, qubits, cbits, params, dagger, control_qubits = opcode
@@ -822,8 +1287,7 @@ class Circuit:
 
         c.opcode_list = [remap_opcode(op, mapping) for op in self.opcode_list]
 
-        for i, old_qubit in enumerate(self.used_qubit_list):
-            c.used_qubit_list[i] = mapping[old_qubit]
+        c.used_qubit_list = [mapping[old_qubit] for old_qubit in self.used_qubit_list]
 
         for i, old_qubit in enumerate(self.measure_list):
             c.measure_list[i] = mapping[old_qubit]
@@ -112,7 +112,7 @@ def get_opcode_from_QASM2(operation, qubits, cbits, parameters):
     elif operation == "swap":
         return ("SWAP", qubits, cbits, parameters, False, None)
     elif operation == "ch":
-        return ("H", qubits, cbits, parameters, False, [qubits[0]])
+        return ("H", qubits[1], cbits, parameters, False, [qubits[0]])
     # 3-qubit gates
     elif operation == "ccx":
         return ("TOFFOLI", qubits, cbits, parameters, False, None)
@@ -0,0 +1,315 @@
+"""Shared HTTP sessions for the quantum cloud platforms.
+
+Building a request ad hoc (a fresh ``urllib`` opener or ``requests.get``)
+opens a new TCP connection and TLS handshake for every call. The sessions
+of this module keep a pool of keep-alive connections per host and are
+shared per name, so every caller talking to the same platform reuses them.
+A session also:
+
+* applies default connect and read timeouts,
+* retries idempotent requests that fail with a connection error or a
+  transient status (429, 5xx) with jittered exponential backoff, honouring
+  ``Retry-After``,
+* records the latency, errors and retries of the requests of every host.
+
+``get_http_session('ibm')`` routes its requests through the proxy of the
+IBM configuration (see :func:`qpandalite.network_utils.get_ibm_proxy_from_config`).
+The proxy is read when the session is created, so a changed configuration
+applies after :func:`close_http_sessions`.
+
+Key exports:
+    HTTPSessionConfig: Pool, retry, timeout and proxy settings.
+    HTTPSession: A pooled ``requests`` session with retries and metrics.
+    RequestMetrics: Latency statistics per host.
+    get_http_session: The shared session of a name.
+    close_http_sessions: Close every shared session.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "HTTPSessionConfig",
+    "HTTPSession",
+    "RequestMetrics",
+    "get_http_session",
+    "close_http_sessions",
+]
+
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@dataclass
+class HTTPSessionConfig:
+    """Settings of an :class:`HTTPSession`.
+
+    Attributes:
+        pool_connections: Number of hosts whose connection pools are kept.
+        pool_maxsize: Maximum number of kept connections per host.
+        max_retries: Retries of a failed idempotent request.
+        backoff_factor: Delay before the first retry in seconds; doubled
+            for every further retry.
+        backoff_max: Maximum delay between retries in seconds.
+        jitter: Fraction of the delay that is randomized (0 to 1), so that
+            clients failing together do not retry together.
+        retry_statuses: Response statuses that are retried.
+        retry_methods: HTTP methods that are retried.
+        connect_timeout: Default connection timeout in seconds.
+        read_timeout: Default read timeout in seconds.
+        proxies: Proxy URLs by scheme (``'http'``, ``'https'``), or None to
+            use the system proxy settings.
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    backoff_max: float = 30.0
+    jitter: float = 0.5
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    retry_methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    connect_timeout: float = 10.0
+    read_timeout: float = 30.0
+    proxies: dict[str, str] | None = None
+
+
+@dataclass
+class _EndpointStats:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    recent: deque = field(default_factory=lambda: deque(maxlen=RequestMetrics.window))
+
+
+class RequestMetrics:
+    """Latency statistics of the requests of a session, per host.
+
+    Every attempt of a request is recorded, including retried ones. The
+    percentiles are computed over the latest ``window`` attempts of a host.
+    """
+
+    window = 1000
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, _EndpointStats] = {}
+
+    def record(self, endpoint: str, seconds: float, error: bool = False, retry: bool = False) -> None:
+        """Record one request attempt.
+
+        Args:
+            endpoint: The host of the request.
+            seconds: Latency of the attempt.
+            error: Whether the attempt failed or returned an error status.
+            retry: Whether the attempt is retried.
+        """
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, _EndpointStats())
+            stats.requests += 1
+            stats.errors += error
+            stats.retries += retry
+            stats.total += seconds
+            stats.max = max(stats.max, seconds)
+            stats.recent.append(seconds)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Statistics of every host.
+
+        Returns:
+            ``{host: {'requests', 'errors', 'retries', 'mean_ms', 'p50_ms',
+            'p95_ms', 'max_ms'}}``.
+        """
+        with self._lock:
+            summary = {}
+            for endpoint, stats in self._endpoints.items():
+                recent = sorted(stats.recent)
+                summary[endpoint] = {
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "retries": stats.retries,
+                    "mean_ms": stats.total / stats.requests * 1000,
+                    "p50_ms": recent[len(recent) // 2] * 1000,
+                    "p95_ms": recent[min(len(recent) - 1, int(len(recent) * 0.95))] * 1000,
+                    "max_ms": stats.max * 1000,
+                }
+            return summary
+
+    def reset(self) -> None:
+        """Forget all recorded requests."""
+        with self._lock:
+            self._endpoints.clear()
+
+
+class HTTPSession:
+    """A ``requests`` session with connection pooling, retries and metrics.
+
+    Thread-safe: a session is meant to be shared by all callers talking to
+    the same platform.
+
+    Example:
+        >>> session = HTTPSession(HTTPSessionConfig(max_retries=5))
+        >>> response = session.get("https://example.com/api/version")
+        >>> session.metrics.summary()["example.com"]["p50_ms"]
+    """
+
+    def __init__(self, config: HTTPSessionConfig | None = None) -> None:
+        """Initialize the session.
+
+        Args:
+            config: Session settings (default: :class:`HTTPSessionConfig`).
+        """
+        self.config = config or HTTPSessionConfig()
+        self.metrics = RequestMetrics()
+        self.session = requests.Session()
+        # Retries are done by request() so that they are jittered and recorded
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            max_retries=0,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _retry_delay(self, retry: int, response: requests.Response | None) -> float:
+        """Delay before the ``retry``-th retry (counting from 0)."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.config.backoff_max)
+        delay = min(self.config.backoff_factor * 2 ** retry, self.config.backoff_max)
+        return delay * (1 - self.config.jitter * random.random())
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: float | tuple[float, float] | None = None,
+        retries: int | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a request, retrying transient failures.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            timeout: Timeout in seconds, or ``(connect, read)``; defaults to
+                the timeouts of the configuration.
+            retries: Maximum number of retries (default:
+                ``config.max_retries`` for the methods in
+                ``config.retry_methods``, 0 for the others).
+            **kwargs: Passed to :meth:`requests.Session.request`.
+
+        Returns:
+            The response. Error statuses are returned, not raised, once the
+            retries are exhausted.
+
+        Raises:
+            requests.RequestException: The last attempt failed.
+        """
+        method = method.upper()
+        if timeout is None:
+            timeout = (self.config.connect_timeout, self.config.read_timeout)
+        if retries is None:
+            retries = self.config.max_retries if method in self.config.retry_methods else 0
+        if self.config.proxies:
+            kwargs.setdefault("proxies", self.config.proxies)
+        endpoint = urlparse(url).netloc
+
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            response = None
+            try:
+                response = self.session.request(method, url, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                retry = attempt < retries
+                self.metrics.record(endpoint, time.perf_counter() - start, error=True, retry=retry)
+                if not retry:
+                    raise
+            else:
+                retry = attempt < retries and response.status_code in self.config.retry_statuses
+                self.metrics.record(
+                    endpoint,
+                    time.perf_counter() - start,
+                    error=response.status_code >= 400,
+                    retry=retry,
+                )
+                if not retry:
+                    return response
+                response.close()
+            time.sleep(self._retry_delay(attempt, response))
+            attempt += 1
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request (see :meth:`request`)."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request (see :meth:`request`); not retried by default."""
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
+
+
+_sessions: dict[str, HTTPSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def _default_config(name: str) -> HTTPSessionConfig:
+    """Default settings of the shared session ``name``."""
+    if name == "ibm":
+        from qpandalite.network_utils import get_ibm_proxy_from_config
+
+        try:
+            proxies = get_ibm_proxy_from_config()
+        except Exception:
+            # No configuration file or no IBM profile: use the system proxy
+            proxies = None
+        return HTTPSessionConfig(proxies=proxies)
+    return HTTPSessionConfig()
+
+
+def get_http_session(name: str = "default", config: HTTPSessionConfig | None = None) -> HTTPSession:
+    """The shared session of ``name`` (e.g. a platform name).
+
+    Args:
+        name: Session name. The ``'ibm'`` session uses the proxy of the IBM
+            configuration, read once when the session is created; call
+            :func:`close_http_sessions` to read it again.
+        config: Settings of the session. Passing settings replaces the
+            shared session of ``name``; otherwise an existing session is
+            returned, or one with the default settings is created.
+
+    Returns:
+        The shared :class:`HTTPSession`.
+    """
+    with _sessions_lock:
+        session = _sessions.get(name)
+        if session is not None and config is None:
+            return session
+        if session is not None:
+            session.close()
+        session = HTTPSession(config or _default_config(name))
+        _sessions[name] = session
+        return session
+
+
+def close_http_sessions() -> None:
+    """Close and forget every shared session."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
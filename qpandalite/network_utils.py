@@ -4,6 +4,9 @@ This module provides functions for:
 - Detecting system proxy settings
 - Testing proxy connectivity
 - Testing IBM Quantum connectivity with or without proxy
+
+HTTP requests go through the shared sessions of
+:mod:`qpandalite.http_session`.
 """
 
 from __future__ import annotations
@@ -181,7 +184,8 @@ def test_ibm_connectivity(
     Args:
         token: IBM Quantum API token. If None, tries to load from environment.
         proxy: Proxy configuration. Can be:
-            - None: uses system proxy settings
+            - None: uses system proxy settings (the proxy of the IBM
+              configuration, used by the shared 'ibm' session, is not applied)
             - str: proxy URL (used for both http and https)
             - dict: with 'http' and/or 'https' keys
         timeout: Request timeout in seconds (default: 30.0).
@@ -225,27 +229,23 @@ def test_ibm_connectivity(
     start_time = time.time()
 
     try:
-        import urllib.request
+        from qpandalite.http_session import get_http_session
+
+        # Shared IBM session for its pooled connections. The proxies are
+        # always passed, so the session's IBM config proxy does not replace
+        # the tested one; an empty dict leaves the system proxy to requests.
+        session = get_http_session("ibm")
 
-        # Build request
-        request = urllib.request.Request(
+        # Perform request (no retries: this measures a single round trip)
+        with session.get(
             ibm_api_url,
             headers={"Authorization": f"Bearer {token}"},
-            method="GET",
-        )
-
-        # Build proxy handler
-        proxy_handler = None
-        if proxies:
-            proxy_handler = urllib.request.ProxyHandler(proxies)
-            opener = urllib.request.build_opener(proxy_handler)
-        else:
-            opener = urllib.request.build_opener()
-
-        # Perform request
-        with opener.open(request, timeout=timeout) as response:
+            timeout=timeout,
+            retries=0,
+            proxies=proxies or {},
+        ) as response:
             response_time = (time.time() - start_time) * 1000
-            status_code = response.getcode()
+            status_code = response.status_code
 
             if 200 <= status_code < 300:
                 return {
@@ -7,19 +7,31 @@ Key exports:
     OriginIR_BaseParser: Base parser class for OriginIR circuits.
 """
 
-__all__ = ["OriginIR_BaseParser"]
+__all__ = ["OriginIR_BaseParser", "parser_engines"]
+import os
 from copy import deepcopy
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple, Union
 
 from qpandalite.circuit_builder import opcode_to_line_originir
 from qpandalite.circuit_builder.qcircuit import Circuit
 
+from .originir_fast_parser import OpcodeType, iter_program_body, parse_program_body
 from .originir_line_parser import OriginIR_LineParser
 
+# "fast": one tokenizer regex and a dispatch table (originir_fast_parser).
+# "line": OriginIR_LineParser.parse_line on every line.
+parser_engines = ("fast", "line")
+
 
 class OriginIR_BaseParser:
     """Parser for OriginIR quantum circuit representation.
 
+    Args:
+        engine: Parsing engine, one of :data:`parser_engines`. ``"fast"``
+            (default) tokenizes every statement with a single precompiled
+            regex; ``"line"`` uses :meth:`OriginIR_LineParser.parse_line`.
+            Both produce the same ``program_body`` and ``measure_qubits``.
+
     Attributes:
         n_qubit: Number of qubits.
         n_cbit: Number of classical bits.
@@ -28,7 +40,10 @@ class OriginIR_BaseParser:
         measure_qubits: List of measurement tuples (qubit, cbit).
     """
 
-    def __init__(self):
+    def __init__(self, engine: str = "fast"):
+        if engine not in parser_engines:
+            raise ValueError(f"engine must be one of {parser_engines}, got {engine!r}")
+        self.engine = engine
         self.n_qubit = None
         self.n_cbit = None
         self.program_body = list()
@@ -87,6 +102,12 @@ class OriginIR_BaseParser:
         current_lineno = self._extract_qinit_statement(lines)
         current_lineno = self._extract_creg_statement(lines, current_lineno)
 
+        if self.engine == "fast":
+            program_body, measure_qubits = parse_program_body(lines, current_lineno, self.n_qubit, self.n_cbit)
+            self.program_body.extend(program_body)
+            self.measure_qubits.extend(measure_qubits)
+            return
+
         control_qubits_set = set()
         dagger_count = 0
         dagger_stack = list()
@@ -217,6 +238,65 @@ class OriginIR_BaseParser:
         if dagger_stack:
             raise ValueError("Parse error at end.\nThe DAGGER operation is not closed at the end of the OriginIR.")
 
+    def parse_stream(self, source: Union[str, os.PathLike, Iterable[str]]) -> Iterator[OpcodeType]:
+        """Parse an OriginIR program incrementally, yielding its opcodes.
+
+        Unlike :meth:`parse`, the program is never held in memory as a
+        whole: lines are read one at a time (always with the ``"fast"``
+        engine) and every gate is yielded as soon as it is complete. Only the
+        gates of an open DAGGER block are buffered, since they are emitted in
+        reverse order at its ENDDAGGER.
+
+        ``n_qubit`` and ``n_cbit`` are set once the QINIT and CREG lines have
+        been read, i.e. before the first opcode is yielded, and
+        ``measure_qubits`` collects the MEASURE statements as they are read.
+        ``program_body`` and ``raw_originir`` are left untouched.
+
+        Args:
+            source: Path of an OriginIR file, or an iterable of lines (an open
+                file, ``text.splitlines()``, a generator, ...). A ``str`` is
+                always taken as a path.
+
+        Yields:
+            The opcodes :meth:`parse` would put in ``program_body``, in order.
+
+        Raises:
+            ValueError: The QINIT or CREG statement is missing, or a
+                statement is invalid (see :meth:`parse`).
+
+        Example:
+            >>> parser = OriginIR_BaseParser()
+            >>> lines = ["QINIT 2", "CREG 2", "H q[0]", "CNOT q[0], q[1]", "MEASURE q[1], c[0]"]
+            >>> [opcode[0] for opcode in parser.parse_stream(lines)]
+            ['H', 'CNOT']
+            >>> parser.n_qubit, parser.measure_qubits
+            (2, [(1, 0)])
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source) as fp:
+                yield from self.parse_stream(fp)
+            return
+
+        lines = iter(source)
+        numbered = enumerate(lines)
+        for statement in ("QINIT", "CREG"):
+            for lineno, line in numbered:
+                operation, q, c, parameter, dagger_flag, control_qubits = OriginIR_LineParser.parse_line(line.strip())
+                if operation is None:
+                    continue
+                if operation != statement:
+                    raise ValueError(f"OriginIR input does not have correct {statement} statement.")
+                if statement == "QINIT":
+                    self.n_qubit = q
+                else:
+                    self.n_cbit = c
+                break
+            else:
+                raise ValueError(f"Parse error. Input ends before the {statement} statement.")
+
+        # enumerate has consumed exactly the header lines from `lines`
+        yield from iter_program_body(lines, self.n_qubit, self.n_cbit, self.measure_qubits, lineno + 1)
+
     def to_extended_originir(self):
         """Convert parsed data back to extended OriginIR string.
 
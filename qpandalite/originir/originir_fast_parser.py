@@ -0,0 +1,248 @@
+"""Single-pass OriginIR program parser.
+
+The line parser (:class:`OriginIR_LineParser`) compares the first token of
+each line against every gate family and then runs the regex of that family;
+the base parser deep-copies the CONTROL set for every gate. This module
+parses the same language with one precompiled tokenizer regex covering all
+statement forms and a dispatch table giving the number of qubits and
+parameters of each operation, and shares the sorted CONTROL list between
+gates until a CONTROL/ENDCONTROL statement changes it.
+
+The result is identical to the line-by-line engine: the same
+``program_body`` and ``measure_qubits``, and the same exceptions
+(``NotImplementedError`` for unknown operations, ``RuntimeError`` for
+malformed lines, ``ValueError`` for out-of-range qubits, unbalanced blocks
+and DEF blocks). DEF blocks are not supported by either engine: the fast
+engine rejects DEF and ENDDEF with ``ValueError``, where the line engine
+raises ``ValueError`` for DEF but ``TypeError`` for an ENDDEF without DEF.
+
+Key exports:
+    iter_program_body: Parse statements incrementally, yielding opcodes.
+    parse_program_body: Parse the statements following QINIT and CREG.
+"""
+
+__all__ = ["iter_program_body", "parse_program_body"]
+import re
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# (number of qubits, number of parameters) of every operation, following the
+# gate families of OriginIR_LineParser.parse_line; BARRIER takes any number of
+# qubits (-1).
+_operation_shapes = {}
+for _names, _shape in [
+    (("H", "X", "Y", "Z", "S", "SX", "T", "I"), (1, 0)),
+    (("CZ", "CNOT", "SWAP", "ISWAP"), (2, 0)),
+    (("TOFFOLI", "CSWAP"), (3, 0)),
+    (("RX", "RY", "RZ", "U1", "RPhi90", "RPhi180",
+      "Depolarizing", "BitFlip", "AmplitudeDamping", "PhaseFlip"), (1, 1)),
+    (("RPhi", "U2"), (1, 2)),
+    (("U3", "PauliError1Q"), (1, 3)),
+    (("XX", "YY", "ZZ", "XY", "TwoQubitDepolarizing"), (2, 1)),
+    (("PHASE2Q",), (2, 3)),
+    (("UU15", "PauliError2Q"), (2, 15)),
+    (("BARRIER",), (-1, 0)),
+]:
+    _operation_shapes.update(dict.fromkeys(_names, _shape))
+
+# Statements without a gate shape, valid only in their plain form.
+_block_keywords = frozenset({"CONTROL", "ENDCONTROL", "MEASURE", "DAGGER", "ENDDAGGER"})
+# Statements of DEF blocks, which neither engine supports.
+_def_keywords = frozenset({"DEF", "ENDDEF"})
+
+_qid = r"q *\[ *\d+ *\]"
+_number = r"[-+]?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?"
+_qid_list = rf"{_qid}(?: *, *{_qid})*"
+
+# One regex for every statement form:
+#   OP q[a], q[b], (p1, p2) dagger controlled_by (q[c], q[d])
+#   MEASURE q[a], c[b]
+#   DAGGER / ENDDAGGER
+_statement = re.compile(
+    rf"(?P<op>[A-Za-z][A-Za-z\d]*) +(?P<qubits>{_qid_list})"
+    rf"(?: *, *\( *(?P<params>{_number}(?: *, *{_number})*) *\))?"
+    rf" *(?P<dagger>dagger)?"
+    rf" *(?:controlled_by *\( *(?P<ctrl>{_qid_list}) *\))? *"
+    rf"|MEASURE *q *\[ *(?P<measure_q>\d+) *\] *, *c *\[ *(?P<measure_c>\d+) *\]"
+    rf"|(?P<block>DAGGER|ENDDAGGER)"
+)
+_digits = re.compile(r"\d+")
+
+OpcodeType = Tuple[str, object, Optional[int], object, bool, Optional[List[int]]]
+
+
+def _parse_error(lineno: int, line: str, message: str) -> ValueError:
+    return ValueError(f"Parse error at line {lineno}: {line}\n{message}")
+
+
+def _unmatched_line(line: str) -> Exception:
+    """The exception the line parser raises for a line the tokenizer rejects."""
+    operation = line.split()[0]
+    if operation in _def_keywords:
+        return ValueError(f"DEF blocks are not supported: {line}")
+    if operation in _operation_shapes or operation in _block_keywords:
+        return RuntimeError(f"Error when parsing the line: {line}")
+    return NotImplementedError(f"A invalid line: {line}.")
+
+
+def iter_program_body(
+    lines: Iterable[str],
+    n_qubit: int,
+    n_cbit: int,
+    measure_qubits: List[Tuple[int, int]],
+    first_lineno: int = 0,
+) -> Iterator[OpcodeType]:
+    """Parse OriginIR statements one line at a time, yielding opcodes as they complete.
+
+    Gates outside DAGGER blocks are yielded as soon as their line is read;
+    the gates of a DAGGER block are held until its ENDDAGGER, then yielded in
+    reverse order. Memory is therefore bounded by the largest DAGGER block,
+    not by the program.
+
+    Args:
+        lines: The statements following QINIT and CREG.
+        n_qubit: Number of qubits declared by QINIT.
+        n_cbit: Number of classical bits declared by CREG.
+        measure_qubits: List receiving the ``(qubit, cbit)`` pair of every
+            MEASURE statement.
+        first_lineno: Line number of the first line, for error messages.
+
+    Yields:
+        The opcodes of :attr:`OriginIR_BaseParser.program_body`, in order.
+    """
+    control_qubits_set = set()
+    control_list: List[int] = []  # sorted(control_qubits_set), rebuilt on CONTROL/ENDCONTROL
+    dagger_stack: List[List[OpcodeType]] = []
+    shapes = _operation_shapes
+    match = _statement.fullmatch
+    findall = _digits.findall
+
+    for lineno, line in enumerate(lines, first_lineno):
+        line = line.strip()
+        if not line:
+            continue
+        m = match(line)
+        if m is None:
+            raise _unmatched_line(line)
+
+        operation = m.group("op")
+        if operation is None:
+            block = m.group("block")
+            if block is None:
+                qubit, cbit = int(m.group("measure_q")), int(m.group("measure_c"))
+                if qubit >= n_qubit:
+                    raise _parse_error(lineno, line, f"Qubit exceeds the maximum (QINIT {n_qubit}).")
+                if cbit and cbit >= n_cbit:
+                    raise _parse_error(lineno, line, f"Cbit exceeds the maximum (CBIT {n_cbit}).")
+                if control_qubits_set:
+                    raise _parse_error(lineno, line, "MEASURE operation is inside a CONTROL block.")
+                if dagger_stack:
+                    raise _parse_error(lineno, line, "MEASURE operation is inside a DAGGER block.")
+                measure_qubits.append((qubit, cbit))
+            elif block == "DAGGER":
+                dagger_stack.append([])
+            else:
+                if not dagger_stack:
+                    raise _parse_error(lineno, line, "Encounter ENDDAGGER operation before any DAGGER.")
+                reversed_ops = dagger_stack.pop()[::-1]
+                if dagger_stack:
+                    dagger_stack[-1].extend(reversed_ops)
+                else:
+                    yield from reversed_ops
+            continue
+
+        shape = shapes.get(operation)
+        if shape is None and operation not in ("CONTROL", "ENDCONTROL"):
+            raise _unmatched_line(line)
+        qubits = list(map(int, findall(m.group("qubits"))))
+        for qubit in qubits:
+            if qubit >= n_qubit:
+                raise _parse_error(lineno, line, f"Qubit exceeds the maximum (QINIT {n_qubit}).")
+
+        params, dagger, ctrl = m.group("params", "dagger", "ctrl")
+        if shape is None:
+            if params is not None or dagger is not None or ctrl is not None:
+                raise RuntimeError(f"Error when parsing the line: {line}")
+            if operation == "CONTROL":
+                control_qubits_set.update(qubits)
+            else:
+                control_qubits_set.difference_update(qubits)
+            control_list = sorted(control_qubits_set)
+            continue
+
+        n_qubits, n_params = shape
+        if n_qubits == -1:
+            # BARRIER takes every qubit named on the line and ignores a dagger flag,
+            # as OriginIR_LineParser.handle_barrier does
+            if params is not None:
+                raise RuntimeError(f"Error when parsing the line: {line}")
+            if ctrl is not None:
+                qubits.extend(map(int, findall(ctrl)))
+                for qubit in qubits:
+                    if qubit >= n_qubit:
+                        raise _parse_error(lineno, line, f"Qubit exceeds the maximum (QINIT {n_qubit}).")
+            dagger = ctrl = None
+            qubit = qubits
+        else:
+            if len(qubits) != n_qubits:
+                raise RuntimeError(f"Error when parsing the line: {line}")
+            qubit = qubits[0] if n_qubits == 1 else qubits
+
+        if n_params:
+            values = params.split(",") if params is not None else ()
+            if len(values) != n_params:
+                raise RuntimeError(f"Error when parsing the line: {line}")
+            parameter = float(values[0]) if n_params == 1 else [float(v) for v in values]
+        elif params is not None:
+            raise RuntimeError(f"Error when parsing the line: {line}")
+        else:
+            parameter = None
+
+        # the dagger flag flips once per enclosing DAGGER block
+        dagger_flag = (dagger is not None) ^ (len(dagger_stack) % 2 == 1)
+
+        if ctrl is None:
+            controls = control_list
+        else:
+            used = set(control_qubits_set)
+            for q in findall(ctrl):
+                q = int(q)
+                if q in used:
+                    raise _parse_error(lineno, line, f"Qubit {q} is duplicated in the CONTROL statement.")
+                used.add(q)
+            controls = sorted(used)
+        if controls:
+            for q in qubits:
+                if q in controls:
+                    raise _parse_error(lineno, line, f"Qubit {q} is duplicated in the CONTROL statement.")
+
+        opcode = (operation, qubit, None, parameter, dagger_flag, list(controls) if controls else None)
+        if dagger_stack:
+            dagger_stack[-1].append(opcode)
+        else:
+            yield opcode
+
+    if control_qubits_set:
+        raise ValueError("Parse error at end.\nThe CONTROL operation is not closed at the end of the OriginIR.")
+    if dagger_stack:
+        raise ValueError("Parse error at end.\nThe DAGGER operation is not closed at the end of the OriginIR.")
+
+
+def parse_program_body(
+    lines: List[str], start: int, n_qubit: int, n_cbit: int
+) -> Tuple[List[OpcodeType], List[Tuple[int, int]]]:
+    """Parse the OriginIR statements ``lines[start:]``.
+
+    Args:
+        lines: Lines of the program.
+        start: Index of the first line after QINIT and CREG.
+        n_qubit: Number of qubits declared by QINIT.
+        n_cbit: Number of classical bits declared by CREG.
+
+    Returns:
+        ``(program_body, measure_qubits)`` as produced by
+        :meth:`OriginIR_BaseParser.parse`.
+    """
+    measure_qubits: List[Tuple[int, int]] = []
+    program_body = list(iter_program_body(islice(lines, start, None), n_qubit, n_cbit, measure_qubits, start))
+    return program_body, measure_qubits
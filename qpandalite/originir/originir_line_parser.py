@@ -749,7 +749,7 @@ class OriginIR_LineParser:
             elif operation == "CONTROL":
                 operation, q = OriginIR_LineParser.handle_control(line)
             elif operation == "ENDCONTROL":
-                operation = "ENDCONTROL"
+                operation, q = OriginIR_LineParser.handle_control(line)
             elif operation == "DAGGER":
                 operation = OriginIR_LineParser.handle_dagger(line)
             elif operation == "ENDDAGGER":
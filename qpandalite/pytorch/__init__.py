@@ -3,18 +3,32 @@ PyTorch integration for quantum machine learning.
 
 This module provides tools for integrating quantum circuits with PyTorch:
 - Parameter-shift rule gradient computation
+- Adjoint-method gradients on the statevector simulator
 - QuantumLayer nn.Module for hybrid quantum-classical models
-- Batch execution utilities
+- Batch execution utilities (thread/process pools, vectorized simulation)
 """
 
-from .batch_executor import batch_execute, batch_execute_with_params
+from .adjoint import adjoint_gradient
+from .batch_executor import (
+    CircuitSkeleton,
+    PoolExecutor,
+    ProgramSweep,
+    VectorizedExecutor,
+    batch_execute,
+    batch_execute_with_params,
+)
 from .gradient import compute_all_gradients, parameter_shift_gradient
 from .quantum_layer import QuantumLayer
 
 __all__ = [
     "parameter_shift_gradient",
     "compute_all_gradients",
+    "adjoint_gradient",
     "QuantumLayer",
     "batch_execute",
     "batch_execute_with_params",
+    "CircuitSkeleton",
+    "PoolExecutor",
+    "ProgramSweep",
+    "VectorizedExecutor",
 ]
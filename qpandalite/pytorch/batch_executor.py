@@ -3,33 +3,76 @@ Batch execution utilities for quantum circuits.
 
 Provides parallel execution of multiple circuits using ThreadPoolExecutor
 or multiprocessing for performance optimization.
+
+For parameter sweeps and gradients a template is compiled once into a
+:class:`CircuitSkeleton`, and a whole matrix of parameter vectors is handed
+to a batch executor:
+
+- :class:`PoolExecutor` binds each row and evaluates ``expectation_fn`` in a
+  thread or process pool. Given an observable, it instead runs one compiled
+  ``OpcodeProgram`` per row on the C++ simulator, which releases the GIL, so
+  threads and processes both scale with the number of cores.
+- :class:`VectorizedExecutor` simulates all rows at once as a stack of
+  statevectors and evaluates a Pauli-sum observable.
 """
 
 from __future__ import annotations
 
+import copy
+import functools
+import os
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import numpy as np
 
+from qpandalite.algorithmics.measurement import PauliSum
+from qpandalite.simulator.gate_fusion import _opcode_qubits, block_unitary
+from qpandalite.simulator.opcode_simulator import StatevectorSimulator, _encode_opcodes, _no_effect_operations
+
+from .adjoint import (
+    _apply_matrix,
+    _circuit_opcodes,
+    _apply_observable,
+    _fixed_operations,
+    _gate_parameters,
+    _no_op_operations,
+    _parameter_list,
+    _with_parameters,
+    parametric_operations,
+)
+
 if TYPE_CHECKING:
     from qpandalite.circuit_builder import Circuit
 
-__all__ = ["batch_execute"]
+__all__ = ["batch_execute", "CircuitSkeleton", "PoolExecutor", "ProgramSweep", "VectorizedExecutor"]
+
+
+def _pool_class(pool: str):
+    if pool not in ("thread", "process"):
+        raise ValueError(f'pool must be "thread" or "process", got {pool!r}')
+    return ThreadPoolExecutor if pool == "thread" else ProcessPoolExecutor
 
 
 def batch_execute(
     circuits: list[Circuit],
     executor: Callable[[Circuit], np.ndarray],
     n_workers: int = 4,
+    pool: str = "thread",
 ) -> list[np.ndarray]:
     """Execute multiple circuits in parallel.
 
+    Threads only run in parallel while the simulator releases the GIL
+    (``run_program``, ``pmeasure``, ``expval_pauli_sum``, ...); executors
+    doing most of their work in Python should use ``pool="process"``.
+
     Args:
         circuits: List of circuits to execute
         executor: Function that executes a single circuit and returns results
-        n_workers: Number of parallel workers (threads)
+        n_workers: Number of parallel workers
+        pool: "thread" (default) or "process". Process pools need a
+            picklable ``executor``.
 
     Returns:
         List of results from each circuit execution
@@ -40,8 +83,8 @@ def batch_execute(
         ...     return sim.simulate(c.originir)
         >>> results = batch_execute([c1, c2, c3], simulate, n_workers=4)
     """
-    with ThreadPoolExecutor(max_workers=n_workers) as pool:
-        results = list(pool.map(executor, circuits))
+    with _pool_class(pool)(max_workers=n_workers) as workers:
+        results = list(workers.map(executor, circuits))
     return results
 
 
@@ -50,6 +93,7 @@ def batch_execute_with_params(
     param_values: list[dict[str, float]],
     executor: Callable[[Circuit], np.ndarray],
     n_workers: int = 4,
+    pool: str = "thread",
 ) -> list[np.ndarray]:
     """Execute a circuit template with different parameter bindings.
 
@@ -61,6 +105,7 @@ def batch_execute_with_params(
         param_values: List of parameter value dictionaries to bind
         executor: Function that executes a single circuit
         n_workers: Number of parallel workers
+        pool: "thread" (default) or "process"
 
     Returns:
         List of results from each parameter binding
@@ -78,4 +123,345 @@ def batch_execute_with_params(
                     bound_circuit._parameters[name].bind(value)
         circuits.append(bound_circuit)
 
-    return batch_execute(circuits, executor, n_workers)
+    return batch_execute(circuits, executor, n_workers, pool)
+
+
+def _bind_circuit(circuit_template, param_names, param_values):
+    """Copy ``circuit_template`` and bind its parameters to ``param_values``."""
+    bound_circuit = circuit_template.copy()
+    for name, value in zip(param_names, param_values, strict=True):
+        if name in bound_circuit._parameters:
+            bound_circuit._parameters[name].bind(float(value))
+    return bound_circuit
+
+
+def _structure(opcodes):
+    """Everything about an opcode list except its gate parameters."""
+    return [(operation, qubit, is_dagger, control_qubits_set, operation in parametric_operations
+             and len(_parameter_list(parameter)))
+            for operation, qubit, _, parameter, is_dagger, control_qubits_set in opcodes]
+
+
+class CircuitSkeleton:
+    """A parametric circuit template compiled once for repeated binding.
+
+    The template is bound a few times to find how the gate parameters of
+    its opcodes depend on the named parameters. When the dependence is
+    affine (``theta``, ``2 * theta + 1``, ...) it holds everywhere, so
+    binding a new parameter vector only fills the gate parameters of a
+    fixed opcode list: no Circuit is copied and nothing symbolic is
+    evaluated. Other templates fall back to copying and binding the
+    template on every :meth:`bind`.
+
+    Args:
+        circuit_template: Circuit, or template with ``_parameters`` and ``copy``.
+        param_names: Parameter names, in the column order of parameter vectors.
+        param_values: Point at which the template is compiled (default: zeros).
+        step: Step of the central differences giving :attr:`jacobian`.
+
+    Attributes:
+        opcodes: Opcodes of the template bound at ``param_values``.
+        n_qubits: Number of qubits of the bound circuit.
+        jacobian: ``d gate_parameters / d param_values`` at ``param_values``,
+            or None when the parametric gates change with the values.
+        affine: Whether the gate parameters are affine in the parameters.
+
+    Example:
+        >>> skeleton = CircuitSkeleton(template, ["theta", "phi"])
+        >>> circuits = [skeleton.bind(row) for row in np.random.rand(100, 2)]
+    """
+
+    def __init__(self, circuit_template, param_names, param_values=None, step=1e-4):
+        self.circuit_template = circuit_template
+        self.param_names = list(param_names)
+        values = np.zeros(len(self.param_names)) if param_values is None \
+            else np.asarray(param_values, dtype=float)
+
+        self._shell = _bind_circuit(circuit_template, self.param_names, values)
+        self.opcodes = list(_circuit_opcodes(self._shell))
+        self.n_qubits = self._shell.qubit_num
+        structure = _structure(self.opcodes)
+        base = _gate_parameters(self.opcodes)
+
+        self.jacobian = np.zeros((len(base), len(self.param_names)))
+        for i in range(len(self.param_names)):
+            columns = []
+            for sign in (1, -1):
+                shifted = values.copy()
+                shifted[i] += sign * step
+                opcodes = _circuit_opcodes(_bind_circuit(circuit_template, self.param_names, shifted))
+                if _structure(opcodes) != structure:
+                    self.jacobian = None
+                    break
+                columns.append(_gate_parameters(opcodes))
+            if self.jacobian is None:
+                break
+            self.jacobian[:, i] = (columns[0] - columns[1]) / (2 * step)
+
+        self.affine = self.jacobian is not None
+        if self.affine:
+            self._offset = base - self.jacobian @ values
+            probe = values + 0.5 + 0.25 * np.arange(len(values))
+            opcodes = _circuit_opcodes(_bind_circuit(circuit_template, self.param_names, probe))
+            self.affine = (_structure(opcodes) == structure and
+                           np.allclose(_gate_parameters(opcodes), self.gate_parameters(probe), atol=1e-8))
+
+    def __getstate__(self):
+        # an affine skeleton binds without its template, which need not be picklable
+        state = self.__dict__.copy()
+        if self.affine:
+            state["circuit_template"] = None
+        return state
+
+    def gate_parameters(self, param_values: np.ndarray) -> np.ndarray:
+        """Gate parameters for one parameter vector, or for each row of a matrix.
+
+        Raises:
+            ValueError: The template is not affine in its parameters.
+        """
+        if not self.affine:
+            raise ValueError("The gate parameters of this template are not affine in its parameters")
+        return self._offset + np.asarray(param_values, dtype=float) @ self.jacobian.T
+
+    def opcodes_for(self, gate_parameters: np.ndarray) -> list:
+        """The skeleton's opcodes with their gate parameters set to ``gate_parameters``."""
+        opcodes, column = [], 0
+        for opcode in self.opcodes:
+            if opcode[0] in parametric_operations:
+                k = len(_parameter_list(opcode[3]))
+                opcode = _with_parameters(opcode, gate_parameters[column:column + k])
+                column += k
+            opcodes.append(opcode)
+        return opcodes
+
+    def bind(self, param_values: np.ndarray) -> Circuit:
+        """A circuit bound to ``param_values``, without copying the template if possible."""
+        if not self.affine:
+            return _bind_circuit(self.circuit_template, self.param_names, param_values)
+        circuit = copy.copy(self._shell)
+        circuit.opcode_list = self.opcodes_for(self.gate_parameters(param_values))
+        return circuit
+
+
+class ProgramSweep:
+    """An affine skeleton compiled to an ``OpcodeProgram`` with a Pauli-sum observable.
+
+    Evaluating a row only writes the gate parameters into a copy of the
+    program's flat parameter array and runs it on the statevector
+    simulator; no opcodes or circuits are built. A sweep pickles as a few
+    NumPy arrays, which is how process pools receive it.
+
+    Args:
+        skeleton: Affine :class:`CircuitSkeleton` of a noiseless circuit.
+        observable: PauliSum, or dict mapping Pauli strings to coefficients.
+
+    Raises:
+        ValueError: The skeleton is not affine, or contains noise channels
+            or opcodes without an integer code.
+    """
+
+    def __init__(self, skeleton: CircuitSkeleton, observable):
+        if not skeleton.affine:
+            raise ValueError("The gate parameters of this template are not affine in its parameters")
+        observable = observable if isinstance(observable, PauliSum) else PauliSum(observable)
+        for operation, *_ in skeleton.opcodes:
+            if operation not in parametric_operations | _fixed_operations | _no_op_operations:
+                raise ValueError(f"ProgramSweep does not support operation {operation!r}")
+
+        self.program = _encode_opcodes(skeleton.opcodes)
+        if self.program is None:
+            raise ValueError("The circuit has opcodes that cannot be compiled to an OpcodeProgram")
+        self.n_qubits = skeleton.n_qubits
+        self.pauli_strings = observable.pauli_strings
+        self.coeffs = observable.coeffs
+        self.jacobian = skeleton.jacobian
+        self.offset = skeleton._offset
+
+        # where the gate parameters of the skeleton sit in program.params
+        param_offsets = self.program.param_offsets
+        positions, index = [], 0
+        for operation, *_ in skeleton.opcodes:
+            if operation in _no_effect_operations:
+                continue
+            if operation in parametric_operations:
+                positions.extend(range(param_offsets[index], param_offsets[index + 1]))
+            index += 1
+        self.positions = np.array(positions, dtype=np.intp)
+        self.params = np.array(self.program.params, dtype=float)
+
+    def __call__(self, param_matrix: np.ndarray) -> np.ndarray:
+        """Compute ``<observable>`` for every row of ``param_matrix``."""
+        simulator = StatevectorSimulator()
+        params = self.params.copy()
+        results = []
+        for gate_parameters in self.offset + np.atleast_2d(param_matrix) @ self.jacobian.T:
+            params[self.positions] = gate_parameters
+            simulator.init_n_qubit(self.n_qubits)
+            simulator.run_program(self.program.with_params(params.tolist()))
+            results.append(simulator.expval_pauli_sum(self.pauli_strings, self.coeffs))
+        return np.array(results, dtype=float)
+
+
+# state of a process-pool worker, set once by _init_worker
+_worker_task = None
+
+
+def _init_worker(task):
+    global _worker_task
+    _worker_task = task
+
+
+def _evaluate(task, rows):
+    """Evaluate a chunk of parameter rows with a sweep or ``(skeleton, expectation_fn)``."""
+    if isinstance(task, ProgramSweep):
+        return task(rows)
+    skeleton, expectation_fn = task
+    return np.array([expectation_fn(skeleton.bind(row)) for row in rows], dtype=float)
+
+
+def _run_chunk(rows):
+    return _evaluate(_worker_task, rows)
+
+
+class PoolExecutor:
+    """Batch executor evaluating the rows of a parameter matrix in a pool.
+
+    Without an observable, every row is bound to a circuit and
+    ``expectation_fn`` evaluates it. With an observable, the skeleton is
+    compiled once into a :class:`ProgramSweep` and ``expectation_fn`` is
+    not used.
+
+    Rows are split into chunks. A process pool receives the task (the
+    sweep, or the skeleton and ``expectation_fn``) once per worker through
+    its initializer, and only the chunks of the parameter matrix per call.
+
+    Args:
+        n_workers: Number of workers; 1 runs the batch in the calling thread,
+            None uses every core.
+        pool: "thread" or "process". Process pools need a picklable
+            ``expectation_fn``. Threads speed up the observable mode, where
+            the simulator runs without the GIL, but not ``expectation_fn``
+            doing its work in Python.
+        observable: PauliSum, or dict mapping Pauli strings to coefficients
+            (optional).
+    """
+
+    def __init__(self, n_workers: int | None = 1, pool: str = "thread", observable=None):
+        _pool_class(pool)
+        self.n_workers = (os.cpu_count() or 1) if n_workers is None else n_workers
+        self.pool = pool
+        self.observable = observable
+        # sweep of the last skeleton
+        self._skeleton = None
+        self._sweep = None
+
+    def _task(self, skeleton: CircuitSkeleton, expectation_fn):
+        if self.observable is None:
+            return skeleton, expectation_fn
+        if skeleton is not self._skeleton:
+            self._skeleton, self._sweep = skeleton, ProgramSweep(skeleton, self.observable)
+        return self._sweep
+
+    def __call__(self, skeleton: CircuitSkeleton, param_matrix: np.ndarray,
+                 expectation_fn: Callable[[Circuit], float] | None = None) -> np.ndarray:
+        """Evaluate every row of ``param_matrix``.
+
+        Raises:
+            ValueError: An observable is set and the skeleton cannot be
+                compiled into a :class:`ProgramSweep`.
+        """
+        param_matrix = np.atleast_2d(param_matrix)
+        task = self._task(skeleton, expectation_fn)
+        n_chunks = min(len(param_matrix), 4 * self.n_workers)
+        if self.n_workers == 1 or n_chunks <= 1:
+            return _evaluate(task, param_matrix)
+
+        # a few chunks per worker even out uneven rows
+        chunks = np.array_split(param_matrix, n_chunks)
+        if self.pool == "thread":
+            with ThreadPoolExecutor(max_workers=self.n_workers) as pool:
+                return np.concatenate(list(pool.map(functools.partial(_evaluate, task), chunks)))
+        with ProcessPoolExecutor(max_workers=self.n_workers, initializer=_init_worker,
+                                 initargs=(task,)) as pool:
+            return np.concatenate(list(pool.map(_run_chunk, chunks)))
+
+
+def _batched_gate_matrices(opcode, qubits, values):
+    """Matrices of a parametric gate for each row of ``values`` (rows x parameters)."""
+    varying = [slot for slot in range(values.shape[1]) if np.ptp(values[:, slot]) > 0]
+    if not varying:
+        return block_unitary([_with_parameters(opcode, values[0])], qubits)
+
+    if len(varying) == 1:
+        # entries are sums of exp(i m theta / 2), |m| <= 2: recover the five
+        # coefficient matrices from five samples over the 4 pi period
+        slot = varying[0]
+        samples = []
+        for j in range(5):
+            sample = values[0].copy()
+            sample[slot] = 4 * np.pi * j / 5
+            samples.append(block_unitary([_with_parameters(opcode, sample)], qubits))
+        m = np.arange(-2, 3)
+        coefficients = np.einsum('mj,jab->mab', np.exp(-2j * np.pi * np.outer(m, np.arange(5)) / 5),
+                                 np.array(samples)) / 5
+        return np.einsum('rm,mab->rab', np.exp(0.5j * np.outer(values[:, slot], m)), coefficients)
+
+    unique, inverse = np.unique(values, axis=0, return_inverse=True)
+    matrices = np.array([block_unitary([_with_parameters(opcode, row)], qubits) for row in unique])
+    return matrices[inverse.reshape(-1)]
+
+
+class VectorizedExecutor:
+    """Batch executor simulating every parameter vector at once.
+
+    All rows are evolved together as a ``(rows, 2^n)`` stack of
+    statevectors: each gate is applied to the whole stack in one NumPy
+    call, with one matrix per row for the gates whose parameters differ
+    between rows. ``<observable>`` is then evaluated for every row. This
+    suits small circuits and large batches (parameter-shift gradients,
+    batched inputs); ``expectation_fn`` is not used.
+
+    Args:
+        observable: PauliSum, or dict mapping Pauli strings to coefficients.
+    """
+
+    def __init__(self, observable):
+        self.observable = observable if isinstance(observable, PauliSum) else PauliSum(observable)
+        # matrices of the fixed gates of the last skeleton, by opcode index
+        self._skeleton = None
+        self._fixed_matrices = {}
+
+    def __call__(self, skeleton: CircuitSkeleton, param_matrix: np.ndarray,
+                 expectation_fn: Callable[[Circuit], float] | None = None) -> np.ndarray:
+        """Compute ``<observable>`` for every row of ``param_matrix``.
+
+        Raises:
+            ValueError: The template is not affine in its parameters, or the
+                circuit contains noise channels.
+        """
+        gate_parameters = np.atleast_2d(skeleton.gate_parameters(np.atleast_2d(param_matrix)))
+        if skeleton is not self._skeleton:
+            self._skeleton, self._fixed_matrices = skeleton, {}
+        n_qubits = skeleton.n_qubits
+        states = np.zeros((len(gate_parameters), 2 ** n_qubits), dtype=complex)
+        states[:, 0] = 1
+
+        column = 0
+        for index, opcode in enumerate(skeleton.opcodes):
+            operation = opcode[0]
+            if operation in _no_op_operations:
+                continue
+            qubits = sorted(_opcode_qubits(opcode))
+            if operation in parametric_operations:
+                k = len(_parameter_list(opcode[3]))
+                matrix = _batched_gate_matrices(opcode, qubits, gate_parameters[:, column:column + k])
+                column += k
+            elif operation in _fixed_operations:
+                if index not in self._fixed_matrices:
+                    self._fixed_matrices[index] = block_unitary([opcode], qubits)
+                matrix = self._fixed_matrices[index]
+            else:
+                raise ValueError(f"VectorizedExecutor does not support operation {operation!r}")
+            states = _apply_matrix(states, matrix, qubits, n_qubits)
+
+        return np.real(np.sum(states.conj() * _apply_observable(self.observable, states), axis=-1))
@@ -56,7 +56,7 @@ def parameter_shift_gradient(
         raise ValueError(f"Parameter '{param_name}' not found in circuit")
 
     param = circuit._parameters[param_name]
-    base_value = param._bound_value if param.is_bound() else 0.0
+    base_value = param.evaluate() if param.is_bound else 0.0
 
     # Plus shift circuit
     plus_circuit = circuit.copy()
@@ -7,18 +7,31 @@ Key exports:
     OpenQASM2_BaseParser: Base parser class for OpenQASM 2.0 circuits.
 """
 
-__all__ = ["OpenQASM2_BaseParser"]
+__all__ = ["OpenQASM2_BaseParser", "parser_engines"]
 from typing import List, Tuple
 from qpandalite.circuit_builder.qcircuit import Circuit
 from qpandalite.originir.originir_base_parser import OriginIR_BaseParser
 from qpandalite.circuit_builder.translate_qasm2_oir import get_opcode_from_QASM2
+from .qasm_fast_parser import parse_program_body, register_table
 from .qasm_line_parser import OpenQASM2_LineParser
 from .exceptions import NotSupportedGateError, RegisterDefinitionError, RegisterNotFoundError, RegisterOutOfRangeError
 
+# "fast": one tokenizer regex, a gate table and register offsets (qasm_fast_parser).
+# "line": OpenQASM2_LineParser.parse_line on every statement.
+parser_engines = ("fast", "line")
+
 
 class OpenQASM2_BaseParser:
     """Parser for OpenQASM 2.0 quantum circuit representation.
 
+    Args:
+        engine: Parsing engine for the program body, one of
+            :data:`parser_engines`. ``"fast"`` (default) tokenizes every
+            statement with a single precompiled regex and resolves registers
+            through a precomputed offset table; ``"line"`` uses
+            :meth:`OpenQASM2_LineParser.parse_line`. Both produce the same
+            ``program_body`` and ``measure_qubits``.
+
     Attributes:
         qregs: List of quantum register tuples (name, size).
         cregs: List of classical register tuples (name, size).
@@ -28,7 +41,10 @@ class OpenQASM2_BaseParser:
         measure_qubits: List of measurement tuples (qubit, cbit).
     """
 
-    def __init__(self):
+    def __init__(self, engine: str = "fast"):
+        if engine not in parser_engines:
+            raise ValueError(f"engine must be one of {parser_engines}, got {engine!r}")
+        self.engine = engine
         self.qregs = list()
         self.cregs = list()        
         self.n_qubit = None
@@ -88,16 +104,8 @@ class OpenQASM2_BaseParser:
         for code in codes:
             # strip leading and trailing whitespaces
             code = code.strip()
-            # remove comments and OPENQASM/include statements
-            if code.startswith('//'):
-                continue
-            elif code == '':
-                continue
-            elif code.startswith('include'):
-                continue
-            elif code.startswith('OPENQASM'):
-                continue
-            elif code.startswith('barrier'):
+            # remove empty statements, comments, OPENQASM/include statements and barriers
+            if not code or code.startswith(('//', 'include', 'OPENQASM', 'barrier')):
                 continue
             
             # handle qreg and creg definitions
@@ -221,45 +229,57 @@ class OpenQASM2_BaseParser:
         self._process_measurements()
 
         # process program body
-        for line in self.program_body_str:
-            operation, qubits, cbits, parameters = OpenQASM2_LineParser.parse_line(line)
-            if operation is None:
-                continue
-            
-            # transform the qubit from regname+index to qubit_id
-            # Note: register's validity is checked through _get_qubit_id
-            if qubits:
-                if isinstance(qubits, list):
-                    qubits = [self._get_qubit_id(qubit[0], qubit[1]) for qubit in qubits]
-                else:
-                    qubits = self._get_qubit_id(qubits[0], qubits[1])
-
-            if cbits:
-                if isinstance(cbits, list):
-                    cbits = [self._get_cbit_id(cbit[0], cbit[1]) for cbit in cbits]
-                else:
-                    cbits = self._get_cbit_id(cbits[0], cbits[1])
-            
-            # convert parameter to a scalar value
-            if parameters and isinstance(parameters, list) and len(parameters) == 1:
-                parameters = parameters[0]
+        if self.engine == "fast":
+            qubit_table = register_table(self.qregs)
+            self.program_body.extend(parse_program_body(self.program_body_str, qubit_table, self._parse_statement))
+        else:
+            for line in self.program_body_str:
+                opcode = self._parse_statement(line)
+                if opcode is not None:
+                    self.program_body.append(opcode)
+
+    def _parse_statement(self, line):
+        """Convert one program body statement to an opcode with the line engine.
+
+        Returns None for statements without an operation.
+        """
+        operation, qubits, cbits, parameters = OpenQASM2_LineParser.parse_line(line)
+        if operation is None:
+            return None
+
+        # transform the qubit from regname+index to qubit_id
+        # Note: register's validity is checked through _get_qubit_id
+        if qubits:
+            if isinstance(qubits, list):
+                qubits = [self._get_qubit_id(qubit[0], qubit[1]) for qubit in qubits]
+            else:
+                qubits = self._get_qubit_id(qubits[0], qubits[1])
+
+        if cbits:
+            if isinstance(cbits, list):
+                cbits = [self._get_cbit_id(cbit[0], cbit[1]) for cbit in cbits]
+            else:
+                cbits = self._get_cbit_id(cbits[0], cbits[1])
+
+        # convert parameter to a scalar value
+        if parameters and isinstance(parameters, list) and len(parameters) == 1:
+            parameters = parameters[0]
+
+        # transform into opcodes
+        # opcodes = (operation,qubits,cbit,parameter,dagger_flag,control_qubits_set)
+        opcode = get_opcode_from_QASM2(operation, qubits, cbits, parameters)
+
+        # check if opcode is correctely converted
+        if opcode is None:
+            raise NotImplementedError("Opcode is not converted correctly for "
+                                      f"line: {line}.\n"
+                                      f"operation: {operation}"
+                                      f"qubits: {qubits}"
+                                      f"cbits: {cbits}"
+                                      f"parameters: {parameters}"
+                                      )
+        return opcode
 
-            # transform into opcodes
-            # opcodes = (operation,qubits,cbit,parameter,dagger_flag,control_qubits_set)
-            opcode = get_opcode_from_QASM2(operation, qubits, cbits, parameters)
-            
-            # check if opcode is correctely converted
-            if opcode is None:
-                raise NotImplementedError("Opcode is not converted correctly for "
-                                          f"line: {line}.\n"
-                                          f"operation: {operation}"
-                                          f"qubits: {qubits}"
-                                          f"cbits: {cbits}"
-                                          f"parameters: {parameters}"
-                                          )
-
-            self.program_body.append(opcode)
-    
     def to_originir(self):
         """Convert parsed OpenQASM data to OriginIR string.
 
@@ -0,0 +1,191 @@
+"""Single-pass OpenQASM 2.0 program body parser.
+
+The line engine runs :meth:`OpenQASM2_LineParser.parse_line` on every
+statement (a chain of name comparisons, then the regex of the gate family),
+resolves each ``reg[i]`` by scanning the register list, evaluates every
+parameter with ``eval`` and finally maps the QASM gate to an opcode through
+:func:`get_opcode_from_QASM2`. This module parses the same statements with
+one precompiled tokenizer regex, a dispatch table giving the OriginIR
+operation and shape of each QASM gate, and a ``name -> (offset, size)``
+register table computed once per program.
+
+Statements the tokenizer or the tables do not accept (unknown gates,
+malformed arguments, unknown registers, out-of-range indices) are handed
+to a fallback that runs the line engine on them, so the opcodes and the
+exceptions are identical to the line engine's.
+
+Key exports:
+    register_table: Offsets of the registers of a program.
+    parse_program_body: Convert program body statements to opcodes.
+"""
+
+__all__ = ["register_table", "parse_program_body"]
+import math
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+# QASM gate -> (OriginIR operation, number of qubits, number of parameters,
+# dagger flag, number of leading control qubits), following
+# get_opcode_from_QASM2.
+_gate_table = {
+    "id": ("I", 1, 0, False, 0),
+    "h": ("H", 1, 0, False, 0),
+    "x": ("X", 1, 0, False, 0),
+    "y": ("Y", 1, 0, False, 0),
+    "z": ("Z", 1, 0, False, 0),
+    "s": ("S", 1, 0, False, 0),
+    "sdg": ("S", 1, 0, True, 0),
+    "sx": ("SX", 1, 0, False, 0),
+    "sxdg": ("SX", 1, 0, True, 0),
+    "t": ("T", 1, 0, False, 0),
+    "tdg": ("T", 1, 0, True, 0),
+    "cx": ("CNOT", 2, 0, False, 0),
+    "cy": ("Y", 2, 0, False, 1),
+    "cz": ("CZ", 2, 0, False, 0),
+    "swap": ("SWAP", 2, 0, False, 0),
+    "ch": ("H", 2, 0, False, 1),
+    "ccx": ("TOFFOLI", 3, 0, False, 0),
+    "cswap": ("CSWAP", 3, 0, False, 0),
+    "c3x": ("X", 4, 0, False, 3),
+    "rx": ("RX", 1, 1, False, 0),
+    "ry": ("RY", 1, 1, False, 0),
+    "rz": ("RZ", 1, 1, False, 0),
+    "u1": ("U1", 1, 1, False, 0),
+    "u2": ("U2", 1, 2, False, 0),
+    "u3": ("U3", 1, 3, False, 0),
+    "u": ("U3", 1, 3, False, 0),
+    "rxx": ("XX", 2, 1, False, 0),
+    "ryy": ("YY", 2, 1, False, 0),
+    "rzz": ("ZZ", 2, 1, False, 0),
+    "cu1": ("U1", 2, 1, False, 1),
+    "crx": ("RX", 2, 1, False, 1),
+    "cry": ("RY", 2, 1, False, 1),
+    "crz": ("RZ", 2, 1, False, 1),
+    "cu3": ("U3", 2, 3, False, 1),
+}
+
+_identifier = r"[A-Za-z_][A-Za-z_\d]*"
+_argument = rf"{_identifier} *\[ *\d+ *\]"
+
+# gate(p1, p2) reg[i], reg[j]  --  the parameters are optional; without them
+# the gate name must be followed by a space, as the line engine splits on it.
+_statement = re.compile(
+    rf"(?P<op>{_identifier})(?: *\((?P<params>[^()]+)\) *| +)"
+    rf"(?P<args>{_argument}(?: *, *{_argument})*) *"
+)
+_arguments = re.compile(rf"({_identifier}) *\[ *(\d+) *\]")
+# Literals whose float() equals their eval(); integers with leading zeros
+# (``01``) are a SyntaxError for eval and are left to it.
+_number = re.compile(r"[-+]?(?:(?:\d+\.\d*|\.\d+)(?:[eE][-+]?\d+)?|\d+[eE][-+]?\d+|0|[1-9]\d*)")
+
+OpcodeType = Tuple[str, object, Optional[int], object, bool, Optional[List[int]]]
+RegisterTable = Dict[str, Tuple[int, int]]
+
+
+def register_table(regs: List[Tuple[str, int]]) -> RegisterTable:
+    """Map every register name to ``(offset, size)``.
+
+    Args:
+        regs: ``(name, size)`` of every register, in declaration order.
+
+    Returns:
+        The offset of a register is the total size of the registers declared
+        before it, as in :meth:`OpenQASM2_BaseParser._compute_id`.
+    """
+    table = {}
+    offset = 0
+    for name, size in regs:
+        table[name] = (offset, size)
+        offset += size
+    return table
+
+
+def _parameter_value(expression: str, cache: Dict[str, float]) -> float:
+    """Value of one parameter expression, evaluated like OpenQASM2_LineParser.handle_parameters."""
+    value = cache.get(expression)
+    if value is None:
+        text = expression.strip()
+        if _number.fullmatch(text):
+            value = float(text)
+        else:
+            value = float(eval(text, {"pi": math.pi}))  # noqa: PGH001, S307
+        cache[expression] = value
+    return value
+
+
+def parse_program_body(
+    statements: List[str],
+    qubit_table: RegisterTable,
+    fallback: Callable[[str], OpcodeType],
+) -> List[OpcodeType]:
+    """Convert program body statements (without measurements) to opcodes.
+
+    Args:
+        statements: Stripped statements, as collected in
+            :attr:`OpenQASM2_BaseParser.program_body_str`.
+        qubit_table: :func:`register_table` of the quantum registers.
+        fallback: Converts a single statement with the line engine; called
+            for every statement this parser does not accept, and expected to
+            raise the appropriate error for invalid ones. Statements it
+            returns None for are skipped.
+
+    Returns:
+        The opcodes of :attr:`OpenQASM2_BaseParser.program_body`, in order.
+    """
+    gates = _gate_table
+    match = _statement.fullmatch
+    findall = _arguments.findall
+    value_of = _parameter_value
+    parameter_cache: Dict[str, float] = {}
+    program_body = []
+    append = program_body.append
+
+    def line_engine(line):
+        opcode = fallback(line)
+        if opcode is not None:
+            append(opcode)
+
+    for line in statements:
+        m = match(line)
+        gate = gates.get(m.group("op")) if m is not None else None
+        if gate is None:
+            line_engine(line)
+            continue
+        operation, n_qubits, n_params, dagger, n_controls = gate
+
+        qubits = []
+        for name, index in findall(m.group("args")):
+            register = qubit_table.get(name)
+            index = int(index)
+            if register is None or index >= register[1]:
+                qubits = None
+                break
+            qubits.append(register[0] + index)
+        if qubits is None or len(qubits) != n_qubits:
+            line_engine(line)
+            continue
+
+        params = m.group("params")
+        if n_params:
+            values = params.split(",") if params is not None else ()
+            if len(values) != n_params:
+                line_engine(line)
+                continue
+            if n_params == 1:
+                parameter = value_of(values[0], parameter_cache)
+            else:
+                parameter = [value_of(v, parameter_cache) for v in values]
+        elif params is not None:
+            line_engine(line)
+            continue
+        else:
+            parameter = None
+
+        if n_controls:
+            append((operation, qubits[n_controls], None, parameter, dagger, qubits[:n_controls]))
+        elif n_qubits == 1:
+            append((operation, qubits[0], None, parameter, dagger, None))
+        else:
+            append((operation, qubits, None, parameter, dagger, None))
+
+    return program_body
@@ -8,15 +8,22 @@ Key exports:
     - TopologyError: Exception for invalid qubit/topology configurations.
     - BaseSimulator: Abstract base for ideal circuit simulators.
     - BaseNoisySimulator: Abstract base for noisy circuit simulators.
+    - sample_counts: Draw all measurement shots from a probability vector at once.
+    - apply_readout_error: Apply per-qubit readout confusion to an array of outcomes.
+    - CompiledProgram: A preprocessed program returned by BaseSimulator.compile.
 """
 
-__all__ = ["TopologyError", "BaseSimulator", "BaseNoisySimulator"]
-import random
-from typing import Dict, List
+__all__ = ["TopologyError", "BaseSimulator", "BaseNoisySimulator",
+           "sample_counts", "apply_readout_error", "CompiledProgram"]
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Union
 import numpy as np
+from qpandalite_cpp import seed as _seed_cpp_rng
 
 from .error_model import ErrorLoader
-from .opcode_simulator import OpcodeSimulator
+from .opcode_simulator import OpcodeSimulator, CompiledProgram, stochastic_operations
+from .gate_fusion import fuse_opcodes
+from qpandalite.circuit_builder.binary_format import is_binary_circuit, opcodes_from_bytes
 from qpandalite.circuit_builder.qcircuit import OpcodeType
 
 
@@ -24,6 +31,84 @@ class TopologyError(Exception):
     """Exception raised when an invalid qubit or topology is used."""
     pass
 
+
+def sample_counts(prob_list, shots : int,
+                  rng : Optional[Union[int, np.random.Generator]] = None,
+                  return_array : bool = False):
+    """Draw ``shots`` measurement outcomes from a probability vector in one call.
+
+    All shots are drawn with a single multinomial sample instead of one
+    ``random.choices`` call per shot.
+
+    Args:
+        prob_list: Probability of each measurement outcome (as returned by pmeasure).
+        shots: Number of measurement shots to draw.
+        rng: Seed or ``numpy.random.Generator`` used for sampling. A fresh
+            generator is created when None.
+        return_array: If True, return the count array (length ``len(prob_list)``)
+            instead of a dict.
+
+    Returns:
+        Dictionary mapping outcome (int) to its count, containing only the
+        observed outcomes, or the count array if ``return_array`` is True.
+    """
+    rng = np.random.default_rng(rng)
+    probs = np.clip(np.asarray(prob_list, dtype=np.float64), 0, None)
+    total = probs.sum()
+    if total <= 0:
+        raise ValueError('Cannot sample from an all-zero probability list.')
+    # pmeasure results carry floating-point drift; multinomial requires sum <= 1
+    counts = rng.multinomial(shots, probs / total)
+    if return_array:
+        return counts
+
+    outcomes = np.flatnonzero(counts)
+    return dict(zip(outcomes.tolist(), counts[outcomes].tolist()))
+
+
+def apply_readout_error(outcomes, measure_qubit : List[int],
+                        readout_error : Dict[int, List[float]],
+                        rng : Optional[Union[int, np.random.Generator]] = None):
+    """Apply readout error to an array of measured outcomes.
+
+    Bit ``i`` of each outcome is the result of measuring ``measure_qubit[i]``.
+    Each bit is flipped independently according to the confusion matrix of
+    its qubit, with all shots handled in one array operation per qubit.
+    (Before, all bits of a shot shared one random draw, so their flips were
+    correlated.)
+
+    Args:
+        outcomes: Integer array of measured outcomes (decimal).
+        measure_qubit: Measured qubits, in classical-bit order.
+        readout_error: Dict mapping qubit index to ``[p01, p10]``, the probability
+            of reading 1 when the qubit is 0 and of reading 0 when it is 1.
+        rng: Seed or ``numpy.random.Generator`` used for sampling (optional).
+
+    Returns:
+        A new integer array with readout error applied.
+    """
+    rng = np.random.default_rng(rng)
+    outcomes = np.array(outcomes, dtype=np.int64)
+    for i, qubit in enumerate(measure_qubit):
+        if qubit not in readout_error:
+            continue
+        error_rate01, error_rate10 = readout_error[qubit][0], readout_error[qubit][1]
+        bits = (outcomes >> i) & 1
+        flip_prob = np.where(bits == 0, error_rate01, error_rate10)
+        flips = rng.random(outcomes.shape[0]) < flip_prob
+        outcomes ^= flips.astype(np.int64) << i
+    return outcomes
+
+
+def _simulate_trajectories(backend_type, n_qubit, program_body, measure_qubit, shots, cpp_seed):
+    # Runs in a worker process when trajectories are spread over a pool.
+    if cpp_seed is not None:
+        _seed_cpp_rng(cpp_seed)
+    opcode_simulator = OpcodeSimulator(backend_type)
+    return opcode_simulator.simulate_opcodes_trajectories(
+        n_qubit, program_body, measure_qubit, shots)
+
+
 class BaseSimulator:
     """Abstract base class for quantum circuit simulators.
 
@@ -54,6 +139,11 @@ class BaseSimulator:
         # If you want to disable it, set least_qubit_remapping=False.
         self.least_qubit_remapping = kwargs.pop('least_qubit_remapping', True)
 
+        # Gate fusion merges blocks of gates on at most fusion_max_qubits
+        # qubits into dense unitaries before simulation (see gate_fusion).
+        # Disabled by default; 2 is a good choice for most circuits.
+        self.fusion_max_qubits = kwargs.pop('fusion_max_qubits', None)
+
     def _clear(self):        
         self.qubit_num = 0
         self.measure_qubit = []
@@ -152,21 +242,43 @@ class BaseSimulator:
 
         return processed_measure_qubits
 
+    def _load_binary(self, data):
+        """Fill the parser with a binary circuit instead of parsing text."""
+        decoded = opcodes_from_bytes(data)
+        self.parser.n_qubit = decoded.qubit_num
+        self.parser.n_cbit = decoded.cbit_num
+        self.parser.program_body = decoded.opcodes
+        self.parser.measure_qubits = [(qubit, cbit) for cbit, qubit in enumerate(decoded.measure_list)]
+
     def simulate_preprocess(self, originir):
         """Parse and preprocess the quantum program.
 
         Extracts the actual used qubits, builds qubit mapping (e.g., q45 -> 0),
-        checks topology constraints, and returns processed program body and
-        measurement qubits.
+        checks topology constraints, fuses gates if ``fusion_max_qubits`` is
+        set, and returns processed program body and measurement qubits.
+
+        A :class:`CompiledProgram` is not parsed again; its opcodes and
+        measurement qubits are returned as they are. A binary circuit
+        (:meth:`Circuit.to_bytes`) is decoded instead of parsed, and then
+        mapped and checked like a parsed program.
 
         Args:
-            originir: Quantum program in the simulator's input format.
+            originir: Quantum program in the simulator's input format, a
+                binary circuit, or a CompiledProgram returned by :meth:`compile`.
 
         Returns:
             Tuple containing the processed program body and measurement qubits.
         """
         self._clear()
-        self.parser.parse(originir)
+        if isinstance(originir, CompiledProgram):
+            self.qubit_num = originir.qubit_num
+            self.qubit_mapping = dict(originir.qubit_mapping)
+            return originir, list(originir.measure_qubit)
+
+        if is_binary_circuit(originir):
+            self._load_binary(originir)
+        else:
+            self.parser.parse(originir)
         # update self.qubit_mapping
         self._extract_actual_used_qubits()
 
@@ -182,8 +294,32 @@ class BaseSimulator:
         for qubit in measure_qubit_cbit:
             measure_qubit.append(qubit[0])
 
+        if self.fusion_max_qubits:
+            processed_program_body = fuse_opcodes(processed_program_body, self.fusion_max_qubits)
+
         return processed_program_body, measure_qubit
     
+    def compile(self, quantum_code):
+        """Parse and preprocess a program once, for repeated execution.
+
+        Every ``simulate_*`` method accepts the returned program in place of
+        ``quantum_code`` and then skips parsing and qubit mapping; on the C++
+        backends the whole program runs in one ``run_program`` call instead of
+        one Python call per gate.
+
+        Args:
+            quantum_code: Quantum program code.
+
+        Returns:
+            CompiledProgram: The mapped (and, for noisy simulators,
+            error-injected) program with its measurement qubits.
+        """
+        processed_program_body, measure_qubit = self.simulate_preprocess(quantum_code)
+        if isinstance(processed_program_body, CompiledProgram):
+            return processed_program_body
+        return CompiledProgram(self.qubit_num, processed_program_body,
+                               measure_qubit, self.qubit_mapping)
+
     def simulate_pmeasure(self, quantum_code):
         """Compute measurement probabilities for all qubits.
 
@@ -258,28 +394,29 @@ class BaseSimulator:
             self.qubit_num, processed_program_body, measure_qubit)
         return result
     
-    def simulate_shots(self, quantum_code, shots):
+    def simulate_shots(self, quantum_code, shots, rng = None, return_array = False):
         """Execute the circuit multiple times and return measurement counts.
 
+        The program is parsed and simulated once; all shots are then drawn
+        from the measured probability vector in a single batched sample
+        (see :func:`sample_counts`).
+
         Args:
             quantum_code: Quantum program code.
             shots: Number of measurement shots to perform.
+            rng: Seed or ``numpy.random.Generator`` for reproducible sampling (optional).
+            return_array: If True, return the count array indexed by outcome
+                instead of a dict.
 
         Returns:
-            Dictionary mapping outcome bitstrings (int) to their count.
+            Dictionary mapping outcome bitstrings (int) to their count, or a
+            numpy count array if ``return_array`` is True.
         """
         processed_program_body, measure_qubit = self.simulate_preprocess(quantum_code)
-        pmeasured_result = self.simulate_pmeasure(quantum_code)
-        cum_weights = []
-        cumulative = 0
-        for prob in pmeasured_result:
-            cumulative += prob
-            cum_weights.append(cumulative)
-        result = {}
-        for _ in range(shots):
-            shot_result = random.choices(range(len(pmeasured_result)), cum_weights=cum_weights, k=1)[0]
-            result[shot_result] = result.get(shot_result, 0) + 1
-        return result
+        prob_list = self.opcode_simulator.simulate_opcodes_pmeasure(
+            self.qubit_num, processed_program_body, measure_qubit
+        )
+        return sample_counts(prob_list, shots, rng=rng, return_array=return_array)
         
     @property
     def simulator(self):
@@ -288,7 +425,7 @@ class BaseSimulator:
 
     @property
     def state(self):
-        """Return the current state of the simulator (statevector or density matrix)."""
+        """A copy of the current state of the simulator (statevector or flattened density matrix)."""
         return self.opcode_simulator.simulator.state
     
 class BaseNoisySimulator(BaseSimulator):
@@ -342,32 +479,7 @@ class BaseNoisySimulator(BaseSimulator):
 
     def _add_readout_error_single_shot(self, result, measure_qubit):
         # add measurement error to the result
-        
-        # to binary and reverse
-        measure_length = len(measure_qubit)
-        result_binary = bin(result)[2:].zfill(measure_length)[::-1]
-
-        result_binary_list = [bit for bit in result_binary]
-        # decide each measurement qubit has error or not
-        r = random.random()
-        for i in range(measure_length):
-            measure_qubit_index = measure_qubit[i]
-            measure_to = result_binary_list[i]
-            error_rate01 = self.readout_error.get(measure_qubit_index, [0, 0])
-            if measure_to == '0':
-                rate = error_rate01[0]
-            elif measure_to == '1':
-                rate = error_rate01[1]
-            else:
-                raise ValueError(f'Unexpected measurement result {measure_to} (neither 0 nor 1).')
-            if r < rate:
-                result_binary_list[i] = '1' if measure_to == '0' else '0'
-
-        # to decimal (first flip the list, then join the bits)
-        result = int(''.join(result_binary_list[::-1]), 2)
-
-        return result
-    
+        return int(apply_readout_error([result], measure_qubit, self.readout_error)[0])
 
     def simulate_preprocess(self, originir):
         """Parse, preprocess, and inject errors into the quantum program.
@@ -378,6 +490,9 @@ class BaseNoisySimulator(BaseSimulator):
         Returns:
             Tuple containing the error-injected program body and measurement qubits.
         """
+        if isinstance(originir, CompiledProgram):
+            # errors were already injected when the program was compiled
+            return super().simulate_preprocess(originir)
         processed_program_body, measure_qubit = super().simulate_preprocess(originir)
         if self.error_loader:
             self.error_loader.process_opcodes(processed_program_body)
@@ -456,22 +571,67 @@ class BaseNoisySimulator(BaseSimulator):
             result = self._add_readout_error_single_shot(result, measure_qubit)
         return result
 
-    def simulate_shots(self, quantum_code, shots):
+    def simulate_shots(self, quantum_code, shots, rng = None, return_array = False, n_workers = None):
         """Execute the noisy circuit multiple times and return measurement counts.
 
+        The program is parsed once. On the statevector backend the noiseless
+        prefix is simulated once and each shot replays only the opcodes from
+        the first noise channel on (see
+        :meth:`OpcodeSimulator.simulate_opcodes_trajectories`); programs
+        without noise channels, and the density_operator backend, are sampled
+        from the measured probabilities in one batch. Readout error is then
+        applied to all outcomes at once (see :func:`apply_readout_error`).
+
         Args:
             quantum_code: Quantum program code.
             shots: Number of measurement shots to perform.
+            rng: Seed or ``numpy.random.Generator`` for reproducible sampling (optional).
+                When given, it also seeds the C++ random engine used by noise
+                channels. That engine is global to the process, so this
+                reseeds the random stream of every other simulator in the
+                process as well (worker processes with ``n_workers`` > 1 are
+                seeded separately and leave the caller's engine untouched).
+            return_array: If True, return the count array indexed by outcome
+                instead of a dict.
+            n_workers: Number of worker processes to spread trajectories over.
+                Trajectories run in the current process when None or 1.
 
         Returns:
-            Dictionary mapping outcome bitstrings (int) to their count.
+            Dictionary mapping outcome bitstrings (int) to their count, or a
+            numpy count array if ``return_array`` is True.
         """
         processed_program_body, measure_qubit = self.simulate_preprocess(quantum_code)
-        results = {}
-        for _ in range(shots):
-            result = self.opcode_simulator.simulate_opcodes_shot(
+        seeded = rng is not None
+        rng = np.random.default_rng(rng)
+
+        is_noisy = any(opcode[0] in stochastic_operations for opcode in processed_program_body)
+        if self.opcode_simulator.simulator_typestr == 'density_operator' or not is_noisy:
+            prob_list = self.opcode_simulator.simulate_opcodes_pmeasure(
                 self.qubit_num, processed_program_body, measure_qubit)
-            if self.readout_error:
-                result = self._add_readout_error_single_shot(result, measure_qubit)
-            results[result] = results.get(result, 0) + 1
-        return results
\ No newline at end of file
+            counts = sample_counts(prob_list, shots, rng=rng, return_array=True)
+            outcomes = np.repeat(np.arange(len(counts)), counts)
+        elif n_workers is None or n_workers <= 1:
+            if seeded:
+                _seed_cpp_rng(int(rng.integers(2 ** 32)))
+            outcomes = self.opcode_simulator.simulate_opcodes_trajectories(
+                self.qubit_num, processed_program_body, measure_qubit, shots)
+        else:
+            chunks = [len(chunk) for chunk in np.array_split(np.arange(shots), n_workers)]
+            cpp_seeds = rng.integers(2 ** 32, size=len(chunks)).tolist()
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                results = pool.map(_simulate_trajectories,
+                                   [self.backend_type] * len(chunks),
+                                   [self.qubit_num] * len(chunks),
+                                   [processed_program_body] * len(chunks),
+                                   [measure_qubit] * len(chunks),
+                                   chunks, cpp_seeds)
+                outcomes = np.concatenate(list(results))
+
+        if self.readout_error:
+            outcomes = apply_readout_error(outcomes, measure_qubit, self.readout_error, rng)
+
+        counts = np.bincount(outcomes, minlength=2 ** len(measure_qubit))
+        if return_array:
+            return counts
+        observed = np.flatnonzero(counts)
+        return dict(zip(observed.tolist(), counts[observed].tolist()))
@@ -294,7 +294,12 @@ class ErrorLoader:
         self.insert_error(opcode)
 
     def process_opcodes(self, opcodes: list[OpCode]) -> None:
-        """Process a list of opcodes, inserting errors for each."""
+        """Process a list of opcodes, inserting errors for each.
+
+        Opcodes from a previous call are discarded, so one loader can be
+        reused across simulations.
+        """
+        self.opcodes = []
         for opcode in opcodes:
             self.insert_opcode(opcode)
 
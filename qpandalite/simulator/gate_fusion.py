@@ -0,0 +1,163 @@
+"""Gate fusion pass for the opcode simulators.
+
+Runs of gates acting on at most ``k`` qubits are merged into a single dense
+``UNITARY`` opcode, so the backend sweeps the state once per block instead
+of once per gate. Consecutive single-qubit gates on one qubit (k = 1) become
+one 2x2 matrix, applied by the ``u22`` kernel.
+
+Key exports:
+    - fuse_opcodes: Merge blocks of gates into ``UNITARY`` opcodes.
+    - block_unitary: Dense matrix of a list of gates on a few qubits.
+    - fusable_operations: Operations the pass is allowed to merge.
+    - max_fused_qubits: Largest supported block size.
+"""
+
+__all__ = ["fuse_opcodes", "block_unitary", "fusable_operations", "max_fused_qubits"]
+from typing import List
+import numpy as np
+from qpandalite_cpp import StatevectorSimulator
+from qpandalite.circuit_builder.qcircuit import OpcodeType
+from .opcode_simulator import CompiledProgram, _no_effect_operations
+
+# Largest block accepted by the generic k-qubit kernel.
+max_fused_qubits = 6
+
+# Unitary gates with an integer code; noise channels and anything else act
+# as fusion barriers.
+fusable_operations = frozenset({
+    'H', 'X', 'Y', 'Z', 'S', 'T', 'SX',
+    'CZ', 'SWAP', 'ISWAP', 'XY', 'CNOT',
+    'RX', 'RY', 'RZ', 'U1', 'U2', 'U3',
+    'RPhi90', 'RPhi180', 'RPhi',
+    'TOFFOLI', 'CSWAP',
+    'XX', 'YY', 'ZZ', 'PHASE2Q', 'UU15', 'UNITARY',
+})
+
+
+def _opcode_qubits(opcode):
+    """All qubits an opcode touches (targets and controls)."""
+    _, qubit, _, _, _, control_qubits_set = opcode
+    qubits = list(qubit) if isinstance(qubit, (list, tuple)) else [qubit]
+    if control_qubits_set:
+        qubits.extend(control_qubits_set)
+    return frozenset(int(q) for q in qubits)
+
+
+def block_unitary(opcodes : List[OpcodeType], qubits : List[int]) -> np.ndarray:
+    """Compute the dense matrix of a list of gates acting on ``qubits``.
+
+    The matrix is obtained by running the gates on every basis state of a
+    small statevector simulator, so it follows the backend's own gate
+    definitions exactly.
+
+    Args:
+        opcodes: Gates to merge, all acting within ``qubits``.
+        qubits: Qubits of the block; bit b of the matrix index corresponds to ``qubits[b]``.
+
+    Returns:
+        The row-major ``2^k x 2^k`` complex matrix.
+    """
+    local = {q : i for i, q in enumerate(qubits)}
+    local_opcodes = []
+    for operation, qubit, cbit, parameter, is_dagger, control_qubits_set in opcodes:
+        if isinstance(qubit, (list, tuple)):
+            qubit = [local[q] for q in qubit]
+        else:
+            qubit = local[qubit]
+        if control_qubits_set:
+            control_qubits_set = [local[q] for q in control_qubits_set]
+        local_opcodes.append((operation, qubit, cbit, parameter, is_dagger, control_qubits_set))
+
+    k = len(qubits)
+    program = CompiledProgram(k, local_opcodes, []).program
+    simulator = StatevectorSimulator()
+    matrix = np.empty((2 ** k, 2 ** k), dtype=complex)
+    for column in range(2 ** k):
+        simulator.init_n_qubit(k)
+        for b in range(k):
+            if (column >> b) & 1:
+                simulator.x(b)
+        simulator.run_program(program)
+        matrix[:, column] = simulator.state
+    return matrix
+
+
+def _gate_cost(opcode):
+    # amplitudes touched per group, the work of a dense gate on its targets
+    qubit = opcode[1]
+    return 2 ** (len(qubit) if isinstance(qubit, (list, tuple)) else 1)
+
+
+def _emit_block(block, fused):
+    gates, qubits = block
+    # a dense matrix only pays off if it is cheaper than the gates it replaces
+    if len(gates) == 1 or 2 ** len(qubits) > sum(_gate_cost(gate) for gate in gates):
+        fused.extend(gates)
+        return
+    qubits = sorted(qubits)
+    fused.append(('UNITARY', qubits, None, block_unitary(gates, qubits), False, None))
+
+
+def fuse_opcodes(opcodes : List[OpcodeType], max_qubits : int = 2) -> List[OpcodeType]:
+    """Merge blocks of gates acting on at most ``max_qubits`` qubits.
+
+    Gates are scanned in order and grouped greedily: a gate joins the blocks
+    sharing its qubits if the merged block stays within ``max_qubits``
+    qubits, otherwise those blocks are closed and the gate starts a new one.
+    Noise channels and gates wider than ``max_qubits`` close the blocks they
+    touch and are kept as they are. Blocks are only fused when the dense
+    matrix is cheaper to apply than the gates it replaces; single gates are
+    never rewritten. Opcodes without effect (``QINIT``, ``I``, ...) are dropped.
+
+    Args:
+        opcodes: Opcodes after qubit mapping.
+        max_qubits: Largest block size k, from 1 to ``max_fused_qubits``.
+
+    Returns:
+        The fused opcode list. Fused blocks are ``('UNITARY', qubits, None,
+        matrix, False, None)`` opcodes.
+    """
+    if not 1 <= max_qubits <= max_fused_qubits:
+        raise ValueError(f'max_qubits must be between 1 and {max_fused_qubits} (got {max_qubits}).')
+
+    fused = []
+    # open blocks, each is ([gates], {qubits}); a qubit belongs to at most one.
+    # An open block is disjoint from everything emitted while it is open, so
+    # blocks may be closed in any order.
+    blocks = {}
+
+    def open_blocks(qubits):
+        return list({id(blocks[q]) : blocks[q] for q in qubits if q in blocks}.values())
+
+    def close(block):
+        for q in block[1]:
+            del blocks[q]
+        _emit_block(block, fused)
+
+    for opcode in opcodes:
+        operation = opcode[0]
+        if operation in _no_effect_operations:
+            continue
+
+        qubits = _opcode_qubits(opcode)
+        touched = open_blocks(sorted(qubits))
+
+        if operation not in fusable_operations or len(qubits) > max_qubits:
+            for block in touched:
+                close(block)
+            fused.append(opcode)
+            continue
+
+        merged_qubits = set(qubits).union(*(block[1] for block in touched))
+        if len(merged_qubits) > max_qubits:
+            for block in touched:
+                close(block)
+            merged = ([opcode], set(qubits))
+        else:
+            merged = ([gate for block in touched for gate in block[0]] + [opcode], merged_qubits)
+        for q in merged[1]:
+            blocks[q] = merged
+
+    for block in open_blocks(sorted(blocks)):
+        _emit_block(block, fused)
+    return fused
@@ -1,7 +1,8 @@
 '''Opcode simulator, a fundamental simulator for QPanda-lite.
 It simulates from a basic opcode
 '''
-__all__ = ["backend_alias", "OpcodeSimulator"]
+__all__ = ["backend_alias", "OpcodeSimulator", "CompiledProgram", "stochastic_operations"]
+import copy
 from typing import List, Optional, Tuple, TYPE_CHECKING, Union
 from .qutip_sim_impl import DensityOperatorSimulatorQutip
 import numpy as np
@@ -10,18 +11,153 @@ from qpandalite.circuit_builder.qcircuit import OpcodeType
 if TYPE_CHECKING:
     from .qpandalite_cpp import *
 
+# Noise channels that the statevector backend samples at runtime.
+# Every opcode before the first of them acts identically on each shot.
+stochastic_operations = frozenset({
+    'PauliError1Q', 'Depolarizing', 'BitFlip', 'PhaseFlip',
+    'AmplitudeDamping', 'PauliError2Q', 'TwoQubitDepolarizing', 'Kraus1Q',
+})
+
+# Integer codes of the operations the C++ backends can run from an OpcodeProgram.
+compiled_op_codes = {name: int(code) for name, code in OpType.__members__.items()}
+
+# Operations that do not act on the state and are dropped when compiling.
+_no_effect_operations = frozenset({None, 'I', 'QINIT', 'CREG', 'BARRIER'})
+
+
+def _encode_opcodes(opcodes):
+    """Flatten a list of opcodes into an OpcodeProgram.
+
+    Returns None if some opcode has no integer code (e.g. Kraus1Q), in
+    which case the program has to be dispatched gate by gate.
+    """
+    ops, daggers = [], []
+    qubit_offsets, qubits = [0], []
+    param_offsets, params = [0], []
+    controller_offsets, controllers = [0], []
+    for operation, qubit, cbit, parameter, is_dagger, control_qubits_set in opcodes:
+        if operation in _no_effect_operations:
+            continue
+        if operation not in compiled_op_codes:
+            return None
+
+        ops.append(compiled_op_codes[operation])
+        # _simulate_common_gate always applies UU15 with dagger=True;
+        # keep both paths identical.
+        daggers.append(True if operation == 'UU15' else bool(is_dagger))
+        qubits.extend(qubit if isinstance(qubit, list) else [qubit])
+        qubit_offsets.append(len(qubits))
+        if operation == 'UNITARY':
+            # complex matrix as interleaved (real, imag) pairs
+            params.extend(np.ravel(np.asarray(parameter, dtype=complex)).view(np.float64).tolist())
+        elif parameter is not None:
+            params.extend(parameter if isinstance(parameter, (list, tuple)) else [parameter])
+        param_offsets.append(len(params))
+        if control_qubits_set:
+            controllers.extend(control_qubits_set)
+        controller_offsets.append(len(controllers))
+
+    return OpcodeProgram(ops, daggers, qubit_offsets, qubits,
+                         param_offsets, params, controller_offsets, controllers)
+
+
+class CompiledProgram:
+    """A preprocessed program, ready to be executed many times.
+
+    Produced by :meth:`BaseSimulator.compile`. It holds the opcodes after
+    qubit mapping (and error injection, for noisy simulators) together with
+    their integer-coded form, an ``OpcodeProgram``, which the C++ backends
+    run in a single ``run_program`` call.
+
+    A CompiledProgram is a read-only sequence of its opcodes, so it can be
+    passed to every ``simulate_*`` method in place of quantum code, and to
+    every ``OpcodeSimulator.simulate_opcodes_*`` method in place of a
+    program body. Slicing returns a CompiledProgram as well.
+
+    Attributes:
+        qubit_num: Number of simulated qubits.
+        opcodes: The mapped opcodes.
+        measure_qubit: Mapped qubits to measure, ordered by classical bit.
+        qubit_mapping: Mapping from the qubits of the source program to the simulated qubits.
+        program: The ``OpcodeProgram``, or None if some opcode can only be
+            dispatched from Python (e.g. Kraus1Q).
+    """
+    def __init__(self, qubit_num : int, opcodes : List[OpcodeType],
+                 measure_qubit : List[int], qubit_mapping : Optional[dict] = None):
+        self.qubit_num = qubit_num
+        self._opcodes = list(opcodes)
+        self._make_opcodes = None
+        self.measure_qubit = list(measure_qubit)
+        self.qubit_mapping = dict(qubit_mapping) if qubit_mapping else {q : q for q in range(qubit_num)}
+        self.program = _encode_opcodes(self._opcodes)
+
+    @property
+    def opcodes(self) -> List[OpcodeType]:
+        if self._opcodes is None:
+            self._opcodes = list(self._make_opcodes())
+            self._make_opcodes = None
+        return self._opcodes
+
+    def with_params(self, params, make_opcodes) -> 'CompiledProgram':
+        """The same program with its flat parameter array replaced.
+
+        Only the ``OpcodeProgram`` is copied, so a program compiled once can
+        be run for many parameter bindings cheaply.
+
+        Args:
+            params: The new ``program.params``, of the same length.
+            make_opcodes: Callable returning the opcodes matching ``params``.
+                It is only called when the opcodes are needed, i.e. when
+                the program is not run by ``run_program``.
+
+        Raises:
+            ValueError: The program could not be compiled to an
+                ``OpcodeProgram``, or ``params`` has the wrong length.
+        """
+        if self.program is None:
+            raise ValueError('The program has no OpcodeProgram to set parameters of.')
+        # not copy.copy, which would go through __reduce__ and encode the opcodes again
+        bound = object.__new__(CompiledProgram)
+        bound.__dict__.update(self.__dict__)
+        bound.program = self.program.with_params(np.asarray(params, dtype=float).tolist())
+        bound._opcodes, bound._make_opcodes = None, make_opcodes
+        return bound
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    def __iter__(self):
+        return iter(self.opcodes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CompiledProgram(self.qubit_num, self.opcodes[index],
+                                   self.measure_qubit, self.qubit_mapping)
+        return self.opcodes[index]
+
+    def __reduce__(self):
+        # the opcodes are part of the state anyway, the OpcodeProgram is rebuilt from them
+        return (CompiledProgram, (self.qubit_num, self.opcodes,
+                                  self.measure_qubit, self.qubit_mapping))
+
+    def __repr__(self):
+        return (f'CompiledProgram(qubit_num={self.qubit_num}, '
+                f'n_opcodes={len(self.opcodes)}, measure_qubit={self.measure_qubit})')
+
 
 def backend_alias(backend_type):
     """Resolve backend type aliases to canonical names.
 
-    Supported backends: statevector, density_matrix
+    Supported backends: statevector, statevector_f32, density_matrix
 
     Note: Uppercase and lowercase are both supported.
 
     Returns:
-        Canonical backend type string ("statevector" or "density_operator").
+        Canonical backend type string ("statevector", "statevector_f32",
+        "density_operator" or "density_operator_qutip").
     """
     statevector_alias = ['statevector', 'state_vector']
+    statevector_f32_alias = ['statevector_f32', 'state_vector_f32', 'statevector_complex64']
     density_operator_alias = ['density_matrix', 'density_operator',
                               'densitymatrix', 'densityoperator']
     density_operator_qutip_alias = ['density_matrix_qutip', 'density_operator_qutip']
@@ -29,6 +165,8 @@ def backend_alias(backend_type):
     backend_type = backend_type.lower()
     if backend_type in statevector_alias:
         return 'statevector'
+    elif backend_type in statevector_f32_alias:
+        return 'statevector_f32'
     elif backend_type in density_operator_alias:
         return 'density_operator'
     elif backend_type in density_operator_qutip_alias:
@@ -42,7 +180,9 @@ class OpcodeSimulator:
 
     Args:
         backend_type: Backend type for simulation. Supported: 'statevector',
-            'density_matrix', 'density_matrix_qutip'. Defaults to 'statevector'.
+            'statevector_f32', 'density_matrix', 'density_matrix_qutip'.
+            Defaults to 'statevector'. 'statevector_f32' stores the amplitudes
+            as complex64, which halves the memory and allows one more qubit.
 
     Attributes:
         simulator: The underlying C++ simulator instance.
@@ -53,13 +193,17 @@ class OpcodeSimulator:
 
         Args:
             backend_type: The backend type for simulation ("statevector" or "density_matrix").
-                Supported aliases: statevector, state_vector, density_matrix,
+                Supported aliases: statevector, state_vector, statevector_f32,
+                state_vector_f32, statevector_complex64, density_matrix,
                 density_operator, density_matrix_qutip, density_operator_qutip.
         """
         backend_type = backend_alias(backend_type)        
         if backend_type =='statevector':
             self.SimulatorType = StatevectorSimulator
             self.simulator_typestr = 'statevector'
+        elif backend_type == 'statevector_f32':
+            self.SimulatorType = StatevectorSimulatorF32
+            self.simulator_typestr = 'statevector'
         elif backend_type == 'density_operator':
             self.SimulatorType = DensityOperatorSimulator
             self.simulator_typestr = 'density_operator'
@@ -75,6 +219,14 @@ class OpcodeSimulator:
         """Reset the simulator by creating a fresh simulator instance."""
         self.simulator = self.SimulatorType()
 
+    def _init_simulator(self, n_qubit):
+        """Start a new simulation in |0...0>.
+
+        ``simulator.state`` returns a copy of the C++ buffer, so arrays
+        returned by earlier runs are not affected.
+        """
+        self.simulator.init_n_qubit(n_qubit)
+
     def _simulate_common_gate(self, operation, qubit, cbit, parameter, is_dagger, control_qubits_set):
         """Dispatch a single gate to the underlying simulator."""
         if operation == 'RX':
@@ -149,6 +301,11 @@ class OpcodeSimulator:
             self.simulator.uu15(qubit[0],
                                 qubit[1],
                                 parameter, control_qubits_set, True)
+        elif operation == 'UNITARY':
+            # parameter: row-major 2^k x 2^k complex matrix, flat or 2D;
+            # bit b of its index corresponds to qubit[b]
+            self.simulator.unitary(list(qubit), np.ravel(parameter).tolist(),
+                                   control_qubits_set, is_dagger)
         elif operation == 'PHASE2Q':
             self.simulator.phase2q(qubit[0], qubit[1],
                 parameter[0], parameter[1], parameter[2], 
@@ -244,6 +401,24 @@ class OpcodeSimulator:
 
         self._simulate_common_gate(operation, qubit, cbit, parameter, is_dagger, control_qubits_set)    
 
+    def simulate_program(self, program_body):
+        """Apply a list of opcodes to the current state of the simulator.
+
+        A :class:`CompiledProgram` is run by the C++ backends in a single
+        ``run_program`` call; anything else is dispatched gate by gate.
+
+        Args:
+            program_body: List of opcodes or a CompiledProgram.
+        """
+        if (isinstance(program_body, CompiledProgram) and program_body.program is not None
+                and hasattr(self.simulator, 'run_program')):
+            self.simulator.run_program(program_body.program)
+            return
+
+        for opcode in program_body:
+            operation, qubit, cbit, parameter, is_dagger, control_qubits_set = opcode
+            self.simulate_gate(operation, qubit, cbit, parameter, is_dagger, control_qubits_set)
+
     def simulate_opcodes_pmeasure(self, n_qubit, program_body, measure_qubits):
         """Compute measurement probabilities for a list of opcodes.
 
@@ -255,10 +430,8 @@ class OpcodeSimulator:
         Returns:
             List of probabilities for each measurement outcome.
         """
-        self.simulator.init_n_qubit(n_qubit)
-        for opcode in program_body:
-            operation, qubit, cbit, parameter, is_dagger, control_qubits_set = opcode
-            self.simulate_gate(operation, qubit, cbit, parameter, is_dagger, control_qubits_set)
+        self._init_simulator(n_qubit)
+        self.simulate_program(program_body)
         prob_list = self.simulator.pmeasure(measure_qubits)
         return prob_list
     
@@ -270,17 +443,16 @@ class OpcodeSimulator:
             program_body: List of opcodes to simulate.
 
         Returns:
-            Statevector as a complex numpy array.
+            Statevector as a complex numpy array, copied from the
+            simulator's buffer.
 
         Raises:
             ValueError: If backend is density_matrix type.
         """
         if self.simulator_typestr == 'density_matrix':
             raise ValueError('Density matrix is not supported for statevector simulation.')
-        self.simulator.init_n_qubit(n_qubit)
-        for opcode in program_body:
-            operation, qubit, cbit, parameter, is_dagger, control_qubits_set = opcode
-            self.simulate_gate(operation, qubit, cbit, parameter, is_dagger, control_qubits_set)
+        self._init_simulator(n_qubit)
+        self.simulate_program(program_body)
         statevector = self.simulator.state
         return statevector
     
@@ -299,14 +471,11 @@ class OpcodeSimulator:
         """
         if self.simulator_typestr == 'statevector':
             statevector = self.simulate_opcodes_statevector(n_qubit, program_body)
-            statevector = np.array(statevector)
             return np.abs(statevector) ** 2
 
         if self.simulator_typestr == 'density_operator':
-            self.simulator.init_n_qubit(n_qubit)
-            for opcode in program_body:
-                operation, qubit, cbit, parameter, is_dagger, control_qubits_set = opcode
-                self.simulate_gate(operation, qubit, cbit, parameter, is_dagger, control_qubits_set)
+            self._init_simulator(n_qubit)
+            self.simulate_program(program_body)
             return self.simulator.stateprob()
 
         raise ValueError('Unknown simulator type.')
@@ -325,18 +494,13 @@ class OpcodeSimulator:
             ValueError: If simulator type is unknown.
         """
         if self.simulator_typestr == 'density_operator':
-            self.simulator.init_n_qubit(n_qubit)
-            for opcode in program_body:
-                operation, qubit, cbit, parameter, is_dagger, control_qubits_set = opcode
-                self.simulate_gate(operation, qubit, cbit, parameter, is_dagger, control_qubits_set)
-            state = self.simulator.state
-            state = np.array(state)
-            density_matrix = np.reshape(state, (2 ** n_qubit, 2 ** n_qubit), order='C')
+            self._init_simulator(n_qubit)
+            self.simulate_program(program_body)
+            density_matrix = np.reshape(self.simulator.state, (2 ** n_qubit, 2 ** n_qubit), order='C')
             return density_matrix
 
         if self.simulator_typestr =='statevector':
             statevector = self.simulate_opcodes_statevector(n_qubit, program_body)
-            statevector = np.array(statevector)
             density_matrix = np.outer(statevector, np.conj(statevector))
             return density_matrix
 
@@ -358,8 +522,47 @@ class OpcodeSimulator:
         """
         if self.simulator_typestr == 'density_operator':
             raise NotImplementedError('Density matrix is not supported for shot simulation.')
-        self.simulator.init_n_qubit(n_qubit)
-        for opcode in program_body:
-            operation, qubit, cbit, parameter, is_dagger, control_qubits_set = opcode
-            self.simulate_gate(operation, qubit, cbit, parameter, is_dagger, control_qubits_set)
-        return self.simulator.measure_single_shot(measure_qubits)
\ No newline at end of file
+        self._init_simulator(n_qubit)
+        self.simulate_program(program_body)
+        return self.simulator.measure_single_shot(measure_qubits)
+
+    def simulate_opcodes_trajectories(self, n_qubit, program_body : List[OpcodeType], measure_qubits, shots):
+        """Sample one measurement outcome from each of ``shots`` noisy trajectories.
+
+        The noiseless prefix of the program (everything before the first
+        stochastic opcode, see ``stochastic_operations``) is simulated once;
+        every trajectory starts from a copy of that state and only replays
+        the remaining opcodes.
+
+        Args:
+            n_qubit: Number of qubits.
+            program_body: List of opcodes to simulate.
+            measure_qubits: Qubits to measure.
+            shots: Number of trajectories to sample.
+
+        Returns:
+            Integer numpy array of length ``shots`` with the measured outcomes (decimal).
+
+        Raises:
+            NotImplementedError: If backend is density_operator type.
+        """
+        if self.simulator_typestr == 'density_operator':
+            raise NotImplementedError('Density matrix is not supported for shot simulation.')
+
+        split = len(program_body)
+        for i, opcode in enumerate(program_body):
+            if opcode[0] in stochastic_operations:
+                split = i
+                break
+
+        self._init_simulator(n_qubit)
+        self.simulate_program(program_body[:split])
+
+        snapshot = self.simulator
+        suffix = program_body[split:]
+        results = np.empty(shots, dtype=np.int64)
+        for shot in range(shots):
+            self.simulator = copy.copy(snapshot)
+            self.simulate_program(suffix)
+            results[shot] = self.simulator.measure_single_shot(measure_qubits)
+        return results
@@ -9,12 +9,13 @@ Key exports:
 """
 
 __all__ = ["OriginIR_Simulator", "OriginIR_NoisySimulator"]
+import itertools
 import random
 from typing import Dict, List, Tuple, TYPE_CHECKING, Union
 from qpandalite.originir.originir_base_parser import OriginIR_BaseParser
 import warnings
-from .opcode_simulator import OpcodeSimulator
-from .base_simulator import BaseNoisySimulator, BaseSimulator
+from .opcode_simulator import OpcodeSimulator, CompiledProgram
+from .base_simulator import BaseNoisySimulator, BaseSimulator, TopologyError
 from .error_model import *
 
 if TYPE_CHECKING:
@@ -43,9 +44,6 @@ class OriginIR_Simulator(BaseSimulator):
     
     def _process_program_body(self):
 
-        lines = self.parser.originir
-        self.splitted_lines = lines.splitlines()
-
         processed_program_body = list()
         available_topology = self.available_topology
         program_body = self.parser.program_body
@@ -57,6 +55,8 @@ class OriginIR_Simulator(BaseSimulator):
             if isinstance(qubit, list) and (available_topology):
                 if len(qubit) > 2:                    
                     # i+2 because QINIT CREG are always excluded.
+                    # The program text is only regenerated for the error message.
+                    self.splitted_lines = self.parser.originir.splitlines()
                     raise ValueError('Real chip does not support gate of 3-qubit or more. '
                                      'The dummy server does not support either. '
                                      'You should consider decomposite it. \n'
@@ -65,6 +65,7 @@ class OriginIR_Simulator(BaseSimulator):
                 if ([int(qubit[0]), int(qubit[1])] not in available_topology) and \
                    ([int(qubit[1]), int(qubit[0])] not in available_topology):
                     # i+2 because QINIT CREG are always excluded.
+                    self.splitted_lines = self.parser.originir.splitlines()
                     raise ValueError('Unsupported topology.\n'
                                      f'Line {i + 2} ({self.splitted_lines[i + 2]}).')
             
@@ -88,7 +89,75 @@ class OriginIR_Simulator(BaseSimulator):
         self.parser = OriginIR_BaseParser()
         self.splitted_lines = None
 
-    
+    def _check_stream_opcode(self, opcode):
+        qubit = opcode[1]
+        qubits = qubit if isinstance(qubit, list) else [qubit]
+        if self.available_qubits:
+            for q in qubits + list(opcode[5] or []):
+                if q not in self.available_qubits:
+                    raise TopologyError('A invalid qubit is used. '
+                                        f'Available qubits: {self.available_qubits}\n'
+                                        f'Used: {q}.')
+        if self.available_topology and isinstance(qubit, list):
+            try:
+                self._check_topology(qubit)
+            except TopologyError as e:
+                raise ValueError(f'Opcode: {opcode}\nErrorinfo: {e}')
+
+    def simulate_stream(self, source, chunk_size : int = 4096):
+        """Simulate an OriginIR program while it is being parsed.
+
+        The program is read with :meth:`OriginIR_BaseParser.parse_stream`
+        and its gates are applied in chunks of ``chunk_size`` opcodes as
+        they arrive (each chunk runs in one C++ ``run_program`` call), so
+        neither the program text nor its opcode list is ever held in memory
+        as a whole. This is meant for generated programs too large for
+        :meth:`simulate_pmeasure`.
+
+        The simulator uses the qubit count declared by QINIT as is: there is
+        no least-qubit remapping (which needs every used qubit in advance)
+        and no gate fusion. ``available_qubits`` and ``available_topology``
+        are checked gate by gate.
+
+        Args:
+            source: Path of an OriginIR file, or an iterable of lines.
+            chunk_size: Number of opcodes handed to the backend at once.
+
+        Returns:
+            Measurement probabilities of the measured qubits, ordered by
+            classical bit, as :meth:`simulate_pmeasure`. The final state
+            stays available through :attr:`state`.
+        """
+        self._clear()
+        check = self.available_qubits or self.available_topology
+        chunk = []
+
+        def run_chunk():
+            self.opcode_simulator.simulate_program(CompiledProgram(self.qubit_num, chunk, []))
+            chunk.clear()
+
+        opcodes = self.parser.parse_stream(source)
+        # the first opcode comes after QINIT and CREG (or the stream ends)
+        first = next(opcodes, None)
+        self.qubit_num = self.parser.n_qubit
+        self.qubit_mapping = {q : q for q in range(self.qubit_num)}
+        self.opcode_simulator._init_simulator(self.qubit_num)
+
+        for opcode in itertools.chain([first] if first is not None else [], opcodes):
+            if check:
+                self._check_stream_opcode(opcode)
+            chunk.append(opcode)
+            if len(chunk) >= chunk_size:
+                run_chunk()
+        if chunk:
+            run_chunk()
+
+        if self.available_qubits:
+            for qubit, cbit in self.parser.measure_qubits:
+                self._check_stream_opcode(('MEASURE', qubit, cbit, None, False, None))
+        measure_qubit = [qubit for qubit, cbit in sorted(self._process_measure(), key=lambda k: k[1])]
+        return self.opcode_simulator.simulator.pmeasure(measure_qubit)
+
 
 class OriginIR_NoisySimulator(BaseNoisySimulator):
     """Noisy OriginIR quantum program simulator.
@@ -117,9 +186,6 @@ class OriginIR_NoisySimulator(BaseNoisySimulator):
     
     def _process_program_body(self):
 
-        lines = self.parser.originir
-        self.splitted_lines = lines.splitlines()
-
         processed_program_body = list()
         available_topology = self.available_topology
         program_body = self.parser.program_body
@@ -131,6 +197,8 @@ class OriginIR_NoisySimulator(BaseNoisySimulator):
             if isinstance(qubit, list) and (available_topology):
                 if len(qubit) > 2:                    
                     # i+2 because QINIT CREG are always excluded.
+                    # The program text is only regenerated for the error message.
+                    self.splitted_lines = self.parser.originir.splitlines()
                     raise ValueError('Real chip does not support gate of 3-qubit or more. '
                                      'The dummy server does not support either. '
                                      'You should consider decomposite it. \n'
@@ -139,6 +207,7 @@ class OriginIR_NoisySimulator(BaseNoisySimulator):
                 if ([int(qubit[0]), int(qubit[1])] not in available_topology) and \
                    ([int(qubit[1]), int(qubit[0])] not in available_topology):
                     # i+2 because QINIT CREG are always excluded.
+                    self.splitted_lines = self.parser.originir.splitlines()
                     raise ValueError('Unsupported topology.\n'
                                      f'Line {i + 2} ({self.splitted_lines[i + 2]}).')
             
@@ -2,10 +2,15 @@
 [Module qpandalite_cpp]
 """
 from __future__ import annotations
+import numpy
 import typing
-__all__ = ['DensityOperatorSimulator', 'StatevectorSimulator', 'rand', 'seed']
+__all__ = ['DensityOperatorSimulator', 'OpType', 'OpcodeProgram', 'StatevectorSimulator', 'StatevectorSimulatorF32', 'get_num_threads', 'rand', 'seed', 'set_num_threads']
 class DensityOperatorSimulator:
     max_qubit_num: typing.ClassVar[int] = 10
+    def __copy__(self) -> DensityOperatorSimulator:
+        ...
+    def __deepcopy__(self, memo: dict) -> DensityOperatorSimulator:
+        ...
     def __init__(self) -> None:
         ...
     def amplitude_damping(self, qn: int, gamma: float) -> None:
@@ -20,6 +25,10 @@ class DensityOperatorSimulator:
         ...
     def depolarizing(self, qn: int, p: float) -> None:
         ...
+    def expval_pauli(self, pauli_string: str) -> float:
+        ...
+    def expval_pauli_sum(self, terms: list[str], coeffs: list[float]) -> float:
+        ...
     @typing.overload
     def get_prob(self, arg0: int, arg1: int) -> float:
         ...
@@ -34,6 +43,8 @@ class DensityOperatorSimulator:
         ...
     def kraus1q(self, qn: int, kraus_ops: list[list[complex[4]]]) -> None:
         ...
+    def load_state(self, state: numpy.ndarray[numpy.complex128]) -> None:
+        ...
     def pauli_error_1q(self, qn: int, px: float, py: float, pz: float) -> None:
         ...
     def pauli_error_2q(self, qn1: int, qn2: int, p: list[float]) -> None:
@@ -54,6 +65,8 @@ class DensityOperatorSimulator:
         ...
     def rphi90(self, qn: int, phi: float, global_controller: list[int] = [], dagger: bool = False) -> None:
         ...
+    def run_program(self, program: OpcodeProgram) -> None:
+        ...
     def rx(self, qn: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
         ...
     def ry(self, qn: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
@@ -84,6 +97,8 @@ class DensityOperatorSimulator:
         ...
     def uu15(self, qn1: int, qn2: int, parameters: list[float], global_controller: list[int] = [], dagger: bool = False) -> None:
         ...
+    def unitary(self, qubits: list[int], matrix: list[complex], global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
     def x(self, qn: int, global_controller: list[int] = [], dagger: bool = False) -> None:
         ...
     def xx(self, qn1: int, qn2: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
@@ -99,13 +114,315 @@ class DensityOperatorSimulator:
     def zz(self, qn1: int, qn2: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
         ...
     @property
-    def state(self) -> list[complex]:
+    def state(self) -> numpy.ndarray[numpy.complex128]:
         ...
     @property
     def total_qubit(self) -> int:
         ...
+class OpType:
+    """
+    Members:
+    
+      H
+
+      X
+
+      Y
+
+      Z
+
+      S
+
+      T
+
+      SX
+
+      CZ
+
+      SWAP
+
+      ISWAP
+
+      XY
+
+      CNOT
+
+      RX
+
+      RY
+
+      RZ
+
+      U1
+
+      U2
+
+      U3
+
+      RPhi90
+
+      RPhi180
+
+      RPhi
+
+      TOFFOLI
+
+      CSWAP
+
+      XX
+
+      YY
+
+      ZZ
+
+      PHASE2Q
+
+      UU15
+
+      PauliError1Q
+
+      Depolarizing
+
+      BitFlip
+
+      PhaseFlip
+
+      AmplitudeDamping
+
+      PauliError2Q
+
+      TwoQubitDepolarizing
+
+      UNITARY
+    """
+    H: typing.ClassVar[OpType]  # value = <OpType.H: 0>
+    X: typing.ClassVar[OpType]  # value = <OpType.X: 1>
+    Y: typing.ClassVar[OpType]  # value = <OpType.Y: 2>
+    Z: typing.ClassVar[OpType]  # value = <OpType.Z: 3>
+    S: typing.ClassVar[OpType]  # value = <OpType.S: 4>
+    T: typing.ClassVar[OpType]  # value = <OpType.T: 5>
+    SX: typing.ClassVar[OpType]  # value = <OpType.SX: 6>
+    CZ: typing.ClassVar[OpType]  # value = <OpType.CZ: 7>
+    SWAP: typing.ClassVar[OpType]  # value = <OpType.SWAP: 8>
+    ISWAP: typing.ClassVar[OpType]  # value = <OpType.ISWAP: 9>
+    XY: typing.ClassVar[OpType]  # value = <OpType.XY: 10>
+    CNOT: typing.ClassVar[OpType]  # value = <OpType.CNOT: 11>
+    RX: typing.ClassVar[OpType]  # value = <OpType.RX: 12>
+    RY: typing.ClassVar[OpType]  # value = <OpType.RY: 13>
+    RZ: typing.ClassVar[OpType]  # value = <OpType.RZ: 14>
+    U1: typing.ClassVar[OpType]  # value = <OpType.U1: 15>
+    U2: typing.ClassVar[OpType]  # value = <OpType.U2: 16>
+    U3: typing.ClassVar[OpType]  # value = <OpType.U3: 17>
+    RPhi90: typing.ClassVar[OpType]  # value = <OpType.RPhi90: 18>
+    RPhi180: typing.ClassVar[OpType]  # value = <OpType.RPhi180: 19>
+    RPhi: typing.ClassVar[OpType]  # value = <OpType.RPhi: 20>
+    TOFFOLI: typing.ClassVar[OpType]  # value = <OpType.TOFFOLI: 21>
+    CSWAP: typing.ClassVar[OpType]  # value = <OpType.CSWAP: 22>
+    XX: typing.ClassVar[OpType]  # value = <OpType.XX: 23>
+    YY: typing.ClassVar[OpType]  # value = <OpType.YY: 24>
+    ZZ: typing.ClassVar[OpType]  # value = <OpType.ZZ: 25>
+    PHASE2Q: typing.ClassVar[OpType]  # value = <OpType.PHASE2Q: 26>
+    UU15: typing.ClassVar[OpType]  # value = <OpType.UU15: 27>
+    PauliError1Q: typing.ClassVar[OpType]  # value = <OpType.PauliError1Q: 28>
+    Depolarizing: typing.ClassVar[OpType]  # value = <OpType.Depolarizing: 29>
+    BitFlip: typing.ClassVar[OpType]  # value = <OpType.BitFlip: 30>
+    PhaseFlip: typing.ClassVar[OpType]  # value = <OpType.PhaseFlip: 31>
+    AmplitudeDamping: typing.ClassVar[OpType]  # value = <OpType.AmplitudeDamping: 32>
+    PauliError2Q: typing.ClassVar[OpType]  # value = <OpType.PauliError2Q: 33>
+    TwoQubitDepolarizing: typing.ClassVar[OpType]  # value = <OpType.TwoQubitDepolarizing: 34>
+    UNITARY: typing.ClassVar[OpType]  # value = <OpType.UNITARY: 35>
+    __members__: typing.ClassVar[dict[str, OpType]]  # value = {...}
+    def __eq__(self, other: typing.Any) -> bool:
+        ...
+    def __getstate__(self) -> int:
+        ...
+    def __hash__(self) -> int:
+        ...
+    def __index__(self) -> int:
+        ...
+    def __init__(self, value: int) -> None:
+        ...
+    def __int__(self) -> int:
+        ...
+    def __ne__(self, other: typing.Any) -> bool:
+        ...
+    def __repr__(self) -> str:
+        ...
+    def __setstate__(self, state: int) -> None:
+        ...
+    def __str__(self) -> str:
+        ...
+    @property
+    def name(self) -> str:
+        ...
+    @property
+    def value(self) -> int:
+        ...
+class OpcodeProgram:
+    params: list[float]
+    @typing.overload
+    def __init__(self) -> None:
+        ...
+    @typing.overload
+    def __init__(self, ops: list[int], daggers: list[bool], qubit_offsets: list[int], qubits: list[int], param_offsets: list[int], params: list[float], controller_offsets: list[int], controllers: list[int]) -> None:
+        ...
+    def __copy__(self) -> OpcodeProgram:
+        ...
+    def __getstate__(self) -> tuple:
+        ...
+    def __len__(self) -> int:
+        ...
+    def __setstate__(self, arg0: tuple) -> None:
+        ...
+    def validate(self) -> None:
+        ...
+    def with_params(self, params: list[float]) -> OpcodeProgram:
+        ...
+    @property
+    def controller_offsets(self) -> list[int]:
+        ...
+    @property
+    def controllers(self) -> list[int]:
+        ...
+    @property
+    def daggers(self) -> list[bool]:
+        ...
+    @property
+    def ops(self) -> list[int]:
+        ...
+    @property
+    def param_offsets(self) -> list[int]:
+        ...
+    @property
+    def qubit_offsets(self) -> list[int]:
+        ...
+    @property
+    def qubits(self) -> list[int]:
+        ...
 class StatevectorSimulator:
     max_qubit_num: typing.ClassVar[int] = 30
+    def __copy__(self) -> StatevectorSimulator:
+        ...
+    def __deepcopy__(self, memo: dict) -> StatevectorSimulator:
+        ...
+    def __init__(self) -> None:
+        ...
+    def amplitude_damping(self, qn: int, gamma: float) -> None:
+        ...
+    def bitflip(self, qn: int, p: float) -> None:
+        ...
+    def cnot(self, controller: int, target: int, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def cswap(self, controller: int, target1: int, target2: int, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def cz(self, qn1: int, qn2: int, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def depolarizing(self, qn: int, p: float) -> None:
+        ...
+    def expval_pauli(self, pauli_string: str) -> float:
+        ...
+    def expval_pauli_sum(self, terms: list[str], coeffs: list[float]) -> float:
+        ...
+    @typing.overload
+    def get_prob(self, qn: int, qstate: int) -> float:
+        ...
+    @typing.overload
+    def get_prob(self, measure_map: dict[int, int]) -> float:
+        ...
+    def hadamard(self, qn: int, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def init_n_qubit(self, arg0: int) -> None:
+        ...
+    def iswap(self, qn1: int, qn2: int, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def kraus1q(self, qn: int, kraus_ops: list[list[complex[4]]]) -> None:
+        ...
+    def load_state(self, state: numpy.ndarray[numpy.complex128]) -> None:
+        ...
+    @typing.overload
+    def measure_single_shot(self, qubit: int) -> int:
+        ...
+    @typing.overload
+    def measure_single_shot(self, qubits: list[int]) -> int:
+        ...
+    def pauli_error_1q(self, qn: int, px: float, py: float, pz: float) -> None:
+        ...
+    def pauli_error_2q(self, qn1: int, qn2: int, p: list[float]) -> None:
+        ...
+    def phase2q(self, qn1: int, qn2: int, theta1: float, theta2: float, thetazz: float, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def phaseflip(self, qn: int, p: float) -> None:
+        ...
+    @typing.overload
+    def pmeasure(self, qn: int) -> list[float]:
+        ...
+    @typing.overload
+    def pmeasure(self, measure_qubits: list[int]) -> list[float]:
+        ...
+    def rphi(self, qn: int, theta: float, phi: float, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def rphi180(self, qn: int, phi: float, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def rphi90(self, qn: int, phi: float, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def run_program(self, program: OpcodeProgram) -> None:
+        ...
+    def rx(self, qn: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def ry(self, qn: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def rz(self, qn: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def s(self, qn: int, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def swap(self, qn1: int, qn2: int, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def sx(self, qn: int, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def t(self, qn: int, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def toffoli(self, controller1: int, controller2: int, target: int, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def twoqubit_depolarizing(self, qn1: int, qn2: int, p: float) -> None:
+        ...
+    def u1(self, qn: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def u2(self, qn: int, phi: float, lamda: float, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def u22(self, qn: int, unitary: list[complex[4]], global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def u3(self, qn: int, theta: float, phi: float, lamda: float, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def uu15(self, qn1: int, qn2: int, parameters: list[float], global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def unitary(self, qubits: list[int], matrix: list[complex], global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def x(self, qn: int, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def xx(self, qn1: int, qn2: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def xy(self, qn1: int, qn2: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def y(self, qn: int, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def yy(self, qn1: int, qn2: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def z(self, qn: int, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    def zz(self, qn1: int, qn2: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
+    @property
+    def state(self) -> numpy.ndarray[numpy.complex128]:
+        ...
+    @property
+    def total_qubit(self) -> int:
+        ...
+class StatevectorSimulatorF32:
+    max_qubit_num: typing.ClassVar[int] = 31
+    def __copy__(self) -> StatevectorSimulatorF32:
+        ...
+    def __deepcopy__(self, memo: dict) -> StatevectorSimulatorF32:
+        ...
     def __init__(self) -> None:
         ...
     def amplitude_damping(self, qn: int, gamma: float) -> None:
@@ -120,6 +437,10 @@ class StatevectorSimulator:
         ...
     def depolarizing(self, qn: int, p: float) -> None:
         ...
+    def expval_pauli(self, pauli_string: str) -> float:
+        ...
+    def expval_pauli_sum(self, terms: list[str], coeffs: list[float]) -> float:
+        ...
     @typing.overload
     def get_prob(self, qn: int, qstate: int) -> float:
         ...
@@ -134,6 +455,8 @@ class StatevectorSimulator:
         ...
     def kraus1q(self, qn: int, kraus_ops: list[list[complex[4]]]) -> None:
         ...
+    def load_state(self, state: numpy.ndarray[numpy.complex64]) -> None:
+        ...
     @typing.overload
     def measure_single_shot(self, qubit: int) -> int:
         ...
@@ -160,6 +483,8 @@ class StatevectorSimulator:
         ...
     def rphi90(self, qn: int, phi: float, global_controller: list[int] = [], dagger: bool = False) -> None:
         ...
+    def run_program(self, program: OpcodeProgram) -> None:
+        ...
     def rx(self, qn: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
         ...
     def ry(self, qn: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
@@ -188,6 +513,8 @@ class StatevectorSimulator:
         ...
     def uu15(self, qn1: int, qn2: int, parameters: list[float], global_controller: list[int] = [], dagger: bool = False) -> None:
         ...
+    def unitary(self, qubits: list[int], matrix: list[complex], global_controller: list[int] = [], dagger: bool = False) -> None:
+        ...
     def x(self, qn: int, global_controller: list[int] = [], dagger: bool = False) -> None:
         ...
     def xx(self, qn1: int, qn2: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
@@ -203,12 +530,16 @@ class StatevectorSimulator:
     def zz(self, qn1: int, qn2: int, theta: float, global_controller: list[int] = [], dagger: bool = False) -> None:
         ...
     @property
-    def state(self) -> list[complex]:
+    def state(self) -> numpy.ndarray[numpy.complex64]:
         ...
     @property
     def total_qubit(self) -> int:
         ...
+def get_num_threads() -> int:
+    ...
 def rand() -> float:
     ...
 def seed(arg0: int) -> None:
     ...
+def set_num_threads(n: int) -> None:
+    ...
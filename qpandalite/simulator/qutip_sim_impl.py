@@ -665,6 +665,26 @@ class DensityOperatorSimulatorQutip:
             self.u1(q2, theta2, control_qubits_set, True)
             self.u1(q1, theta1, control_qubits_set, True)
 
+    def unitary(
+        self,
+        qubits: list[int],
+        matrix: list[complex],
+        control_qubits_set: list[int] | None = None,
+        is_dagger: bool = False,
+    ) -> None:
+        """Apply a generic k-qubit gate.
+
+        Args:
+            qubits: Target qubit indices; bit b of the matrix index corresponds to ``qubits[b]``.
+            matrix: Row-major ``2^k x 2^k`` matrix, flat or nested.
+            control_qubits_set: Control qubits.
+            is_dagger: Whether to apply the dagger version.
+        """
+        k = len(qubits)
+        U = Qobj(np.asarray(matrix, dtype=complex).reshape(2**k, 2**k), dims=[[2] * k, [2] * k])
+        # QuTiP orders the tensor factors from the most significant bit
+        self._apply_unitary(U, list(reversed(qubits)), control_qubits_set, is_dagger)
+
     # ─────────────────── Noise models ───────────────────
 
     def pauli_error_1q(self, qubit: int, px: float, py: float, pz: float) -> None:
@@ -36,6 +36,11 @@ class QuantumAdapter(abc.ABC):
 
     name: str = "base"
 
+    # True if ``query_batch`` returns, on success, exactly one result per
+    # task ID, in the order of the IDs. Adapters that merge the results of
+    # several tasks into one flat list must leave this False.
+    query_batch_per_task: bool = False
+
     # -------------------------------------------------------------------------
     # Circuit translation
     # -------------------------------------------------------------------------
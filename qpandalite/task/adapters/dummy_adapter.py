@@ -23,6 +23,9 @@ Usage:
     task_id = adapter.submit(originir_circuit, shots=1000)
     result = adapter.query(task_id)
 
+    # Batches are simulated in a worker pool, one simulator per worker
+    task_ids = adapter.submit_batch(circuits, shots=1000, max_workers=4)
+
 Environment Variable:
     QPANDALITE_DUMMY: Set to 'true', '1', or 'yes' to enable dummy mode
     globally. When set, all task submissions use local simulation instead
@@ -35,6 +38,8 @@ __all__ = ["DummyAdapter", "QPANDALITE_DUMMY"]
 
 import hashlib
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from .base import QuantumAdapter, TASK_STATUS_SUCCESS, TASK_STATUS_FAILED
@@ -73,12 +78,15 @@ class DummyAdapter(QuantumAdapter):
     """
 
     name = "dummy"
+    query_batch_per_task = True
 
     def __init__(
         self,
         noise_model: Optional[Dict[str, Any]] = None,
         available_qubits: Optional[List[int]] = None,
         available_topology: Optional[List[List[int]]] = None,
+        max_workers: Optional[int] = None,
+        pool: str = "thread",
     ) -> None:
         """Initialize the DummyAdapter.
 
@@ -90,20 +98,33 @@ class DummyAdapter(QuantumAdapter):
                 - 'readout': Readout error rate
             available_qubits: List of available qubit indices.
             available_topology: List of [u, v] edges for qubit connectivity.
+            max_workers: Maximum number of workers simulating a batch
+                (default: the number of CPUs). 1 simulates in the caller.
+            pool: ``"thread"`` (default) or ``"process"``. Threads run in
+                parallel while the C++ simulator releases the GIL; processes
+                also parallelize parsing, which dominates small circuits.
 
         Raises:
             MissingDependencyError: If simulation dependencies are not installed.
+            ValueError: If ``pool`` is not ``"thread"`` or ``"process"``.
         """
         from ..optional_deps import MissingDependencyError, check_simulation
 
         if not check_simulation():
             raise MissingDependencyError("qutip", "simulation")
 
+        if pool not in ("thread", "process"):
+            raise ValueError(f'pool must be "thread" or "process", got {pool!r}')
+
         self.noise_model = noise_model
         self.available_qubits = available_qubits or []
         self.available_topology = available_topology or []
+        self.max_workers = max_workers
+        self.pool = pool
         self._cache: Dict[str, Dict[str, Any]] = {}
         self._simulator_cls = None  # Lazy loaded
+        # One reusable simulator per thread
+        self._local = threading.local()
 
     def _get_simulator_cls(self):
         """Lazily load the simulator class."""
@@ -112,6 +133,17 @@ class DummyAdapter(QuantumAdapter):
             self._simulator_cls = OriginIR_Simulator
         return self._simulator_cls
 
+    def _get_simulator(self):
+        """The simulator of the calling thread, created on first use."""
+        simulator = getattr(self._local, "simulator", None)
+        if simulator is None:
+            simulator = self._get_simulator_cls()(
+                available_qubits=self.available_qubits,
+                available_topology=self.available_topology,
+            )
+            self._local.simulator = simulator
+        return simulator
+
     def _generate_task_id(self, circuit: str) -> str:
         """Generate a deterministic task ID from circuit content.
 
@@ -168,21 +200,7 @@ class DummyAdapter(QuantumAdapter):
             Task ID for result retrieval.
         """
         task_id = self._generate_task_id(circuit)
-        try:
-            unified_result = self._simulate(circuit, shots)
-            self._cache[task_id] = {
-                "status": TASK_STATUS_SUCCESS,
-                "result": unified_result.to_dict() if hasattr(unified_result, 'to_dict') else {
-                    "counts": unified_result.counts,
-                    "probabilities": unified_result.probabilities,
-                },
-                "unified_result": unified_result,
-            }
-        except Exception as e:
-            self._cache[task_id] = {
-                "status": TASK_STATUS_FAILED,
-                "error": str(e),
-            }
+        self._cache[task_id] = _cache_entry(self._get_simulator(), circuit, shots)
         return task_id
 
     def submit_batch(
@@ -190,19 +208,54 @@ class DummyAdapter(QuantumAdapter):
         circuits: List[str],
         *,
         shots: int = 1000,
+        max_workers: Optional[int] = None,
         **kwargs: Any,
     ) -> List[str]:
         """Simulate multiple circuits locally.
 
+        Distinct circuits are spread over a pool of at most ``max_workers``
+        workers, each reusing one simulator; identical circuits share a task
+        ID and are simulated once.
+
         Args:
             circuits: List of circuits in OriginIR format.
             shots: Number of measurement shots per circuit.
+            max_workers: Overrides the adapter's ``max_workers``.
             **kwargs: Additional parameters (ignored).
 
         Returns:
             List of task IDs, one per circuit.
         """
-        return [self.submit(c, shots=shots) for c in circuits]
+        task_ids = [self._generate_task_id(c) for c in circuits]
+        distinct = list(dict(zip(task_ids, circuits)).items())
+        if max_workers is None:
+            max_workers = self.max_workers
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(distinct)))
+
+        originirs = [circuit for _, circuit in distinct]
+        if max_workers == 1:
+            simulator = self._get_simulator()
+            entries = [_cache_entry(simulator, c, shots) for c in originirs]
+        elif self.pool == "thread":
+            with ThreadPoolExecutor(max_workers=max_workers) as workers:
+                entries = list(workers.map(
+                    lambda c: _cache_entry(self._get_simulator(), c, shots), originirs))
+        else:
+            # a few chunks per worker even out uneven circuits
+            chunksize = max(1, len(originirs) // (4 * max_workers))
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self.available_qubits, self.available_topology),
+            ) as workers:
+                entries = list(workers.map(_simulate_in_worker, originirs,
+                                           [shots] * len(originirs), chunksize=chunksize))
+
+        for (task_id, _), entry in zip(distinct, entries):
+            self._cache[task_id] = entry
+        return task_ids
 
     # -------------------------------------------------------------------------
     # Task query
@@ -286,32 +339,7 @@ class DummyAdapter(QuantumAdapter):
         Raises:
             RuntimeError: If simulation fails.
         """
-        Simulator = self._get_simulator_cls()
-
-        # Create simulator with optional constraints
-        sim = Simulator(
-            available_qubits=self.available_qubits,
-            available_topology=self.available_topology,
-        )
-
-        # Run simulation to get probability distribution
-        probs = sim.simulate_pmeasure(originir)
-        n_qubits = sim.qubit_num
-
-        # Convert probability list to dict
-        prob_dict = {}
-        for i, p in enumerate(probs):
-            if p > 0:
-                bin_key = bin(i)[2:].zfill(n_qubits)
-                prob_dict[bin_key] = float(p)
-
-        # Create unified result
-        return UnifiedResult.from_probabilities(
-            probabilities=prob_dict,
-            shots=shots,
-            platform="dummy",
-            task_id=self._generate_task_id(originir),
-        )
+        return _simulate_pmeasure(self._get_simulator(), originir, shots)
 
     def _simulate_with_noise(
         self,
@@ -364,4 +392,64 @@ class DummyAdapter(QuantumAdapter):
             shots=shots,
             platform="dummy",
             task_id=self._generate_task_id(originir),
-        )
\ No newline at end of file
+        )
+
+
+def _simulate_pmeasure(simulator, originir: str, shots: int) -> UnifiedResult:
+    """Measurement probabilities of ``originir`` on ``simulator`` as a UnifiedResult."""
+    # Run simulation to get probability distribution
+    probs = simulator.simulate_pmeasure(originir)
+    n_qubits = simulator.qubit_num
+
+    # Convert probability list to dict
+    prob_dict = {}
+    for i, p in enumerate(probs):
+        if p > 0:
+            bin_key = bin(i)[2:].zfill(n_qubits)
+            prob_dict[bin_key] = float(p)
+
+    # Create unified result
+    return UnifiedResult.from_probabilities(
+        probabilities=prob_dict,
+        shots=shots,
+        platform="dummy",
+        task_id=hashlib.sha256(originir.encode()).hexdigest()[:16],
+    )
+
+
+def _cache_entry(simulator, originir: str, shots: int) -> Dict[str, Any]:
+    """Simulate ``originir`` and build its entry of the result cache."""
+    try:
+        unified_result = _simulate_pmeasure(simulator, originir, shots)
+        return {
+            "status": TASK_STATUS_SUCCESS,
+            "result": unified_result.to_dict() if hasattr(unified_result, 'to_dict') else {
+                "counts": unified_result.counts,
+                "probabilities": unified_result.probabilities,
+            },
+            "unified_result": unified_result,
+        }
+    except Exception as e:
+        return {
+            "status": TASK_STATUS_FAILED,
+            "error": str(e),
+        }
+
+
+# Simulator of a process pool worker, created by _init_worker
+_worker_simulator = None
+
+
+def _init_worker(available_qubits: List[int], available_topology: List[List[int]]) -> None:
+    """Create the reusable simulator of a process pool worker."""
+    global _worker_simulator
+    from qpandalite.simulator import OriginIR_Simulator
+    _worker_simulator = OriginIR_Simulator(
+        available_qubits=available_qubits,
+        available_topology=available_topology,
+    )
+
+
+def _simulate_in_worker(originir: str, shots: int) -> Dict[str, Any]:
+    """Cache entry of ``originir``, simulated in a process pool worker."""
+    return _cache_entry(_worker_simulator, originir, shots)
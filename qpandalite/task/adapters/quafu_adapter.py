@@ -34,6 +34,7 @@ class QuafuAdapter(QuantumAdapter):
     """
 
     name = "quafu"
+    query_batch_per_task = True
 
     # Valid chip IDs
     VALID_CHIP_IDS = frozenset(
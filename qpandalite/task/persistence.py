@@ -7,11 +7,20 @@ JSON object representing one task record.
 Storage location: ~/.qpandalite/tasks/tasks.jsonl
 
 The JSONL format provides:
-- Simple append-only writes for new tasks
-- Line-by-line reading for efficient lookups
+- Append-only writes: saving, updating and deleting a task appends one line
+- Constant-time lookups through an offset index
 - Human-readable format for debugging
 - No external database dependencies
 
+A later line for a task supersedes the earlier ones, and a line with
+``"_deleted": true`` deletes the task. The index maps every task ID to the
+byte offset of its latest line. It is built on first use, saved to the
+sidecar file ``tasks.jsonl.idx``, and brought up to date by reading only the
+lines appended since. Once superseded lines outnumber the live records (and
+``compact_threshold``), the file is compacted in a background thread.
+Processes sharing the file coordinate through ``flock`` on
+``tasks.jsonl.lock`` where the platform provides it.
+
 Usage:
     from qpandalite.task.persistence import TaskPersistence
 
@@ -39,24 +48,47 @@ from __future__ import annotations
 __all__ = ["TaskPersistence", "DEFAULT_CACHE_DIR"]
 
 import json
+import os
+import threading
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: threads of one process are still serialized
+    fcntl = None
 
 # Default storage directory
 DEFAULT_CACHE_DIR = Path.home() / ".qpandalite" / "tasks"
 
+# key of the line appended by delete()
+_DELETED = "_deleted"
+_INDEX_VERSION = 1
+_TERMINAL_STATES = ("success", "failed", "cancelled")
+
+# task_id -> (byte offset of the latest record, platform, status)
+IndexEntry = Tuple[int, Any, Any]
+
 
 class TaskPersistence:
     """JSONL-based task storage manager.
 
     Manages persistent storage of quantum task records in JSONL format.
-    Each record is a JSON object on a single line, enabling efficient
-    append operations and line-by-line reading.
+    Each record is a JSON object on a single line. Every write appends a
+    line, and an offset index makes lookups and counts independent of the
+    size of the file.
 
     Attributes:
         cache_dir: Directory containing the tasks.jsonl file.
         tasks_file: Path to the tasks.jsonl file.
+        index_file: Path to the sidecar file of the offset index.
+        compact_threshold: Minimum number of superseded lines before the
+            file is compacted.
+        background_compaction: Compact in a background thread rather
+            than in the call that crossed the threshold.
 
     Example:
         >>> persistence = TaskPersistence()
@@ -66,16 +98,41 @@ class TaskPersistence:
         'running'
     """
 
-    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+    # lines indexed since the sidecar was written before it is written again
+    index_save_interval = 1000
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        compact_threshold: int = 1000,
+        background_compaction: bool = True,
+    ) -> None:
         """Initialize the persistence manager.
 
         Args:
             cache_dir: Optional custom cache directory. Defaults to
                 ~/.qpandalite/tasks/
+            compact_threshold: Minimum number of superseded lines before
+                the file is compacted.
+            background_compaction: Compact in a background thread.
         """
         self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.tasks_file = self.cache_dir / "tasks.jsonl"
+        self.index_file = self.cache_dir / "tasks.jsonl.idx"
+        self.lock_file = self.cache_dir / "tasks.jsonl.lock"
+        self.compact_threshold = compact_threshold
+        self.background_compaction = background_compaction
+
+        self._lock = threading.RLock()
+        # task_id -> IndexEntry, in order of first save; None until first use
+        self._index: Optional[Dict[str, IndexEntry]] = None
+        self._counts: Counter = Counter()  # (platform, status) -> number of tasks
+        self._inode: Optional[int] = None  # identity of the indexed tasks_file
+        self._indexed_size = 0  # bytes of tasks_file covered by the index
+        self._lines = 0  # lines within _indexed_size, live or superseded
+        self._unsaved = 0  # lines indexed since the sidecar was written
+        self._compaction: Optional[threading.Thread] = None
 
     def save(
         self,
@@ -117,14 +174,14 @@ class TaskPersistence:
             **metadata,
         }
 
-        with open(self.tasks_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        with self._locked():
+            self._append(record)
+        self._maybe_compact()
 
     def load(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Load a task record by ID.
 
-        Searches through all records to find the one with matching task_id.
-        Returns the most recent record if there are duplicates.
+        Looks the task up in the offset index and reads its latest record.
 
         Args:
             task_id: The task identifier to look up.
@@ -137,21 +194,15 @@ class TaskPersistence:
             >>> if record:
             ...     print(record['status'])
         """
-        if not self.tasks_file.exists():
-            return None
-
-        # Search from end to get most recent entry
-        records = list(self._iter_records())
-        for record in reversed(records):
-            if record.get("task_id") == task_id:
-                return record
-        return None
+        with self._locked():
+            entry = self._refresh().get(task_id)
+            return self._read_many([entry[0]])[0] if entry else None
 
     def update(self, task_id: str, **updates: Any) -> bool:
         """Update an existing task record.
 
-        Reads all records, updates the matching one, and rewrites the file.
-        The update_time is automatically set.
+        Appends the updated record; the previous line is dropped at the
+        next compaction. The update_time is automatically set.
 
         Args:
             task_id: The task identifier to update.
@@ -164,22 +215,16 @@ class TaskPersistence:
             >>> success = persistence.update("task-123", status="success",
             ...                               result={"counts": {"00": 512}})
         """
-        if not self.tasks_file.exists():
-            return False
-
-        records = list(self._iter_records())
-        found = False
-
-        for record in records:
-            if record.get("task_id") == task_id:
-                record.update(updates)
-                record["update_time"] = datetime.now().isoformat()
-                found = True
-                break
-
-        if found:
-            self._write_all(records)
-        return found
+        with self._locked():
+            entry = self._refresh().get(task_id)
+            if entry is None:
+                return False
+            record = self._read_many([entry[0]])[0]
+            record.update(updates)
+            record["update_time"] = datetime.now().isoformat()
+            self._append(record)
+        self._maybe_compact()
+        return True
 
     def upsert(
         self,
@@ -201,8 +246,9 @@ class TaskPersistence:
             result: Optional result dict.
             **metadata: Additional metadata.
         """
-        existing = self.load(task_id)
-        if existing:
+        with self._locked():
+            exists = task_id in self._refresh()
+        if exists:
             self.update(task_id, status=status, result=result, **metadata)
         else:
             self.save(task_id, platform, status, result=result, **metadata)
@@ -215,6 +261,9 @@ class TaskPersistence:
     ) -> List[Dict[str, Any]]:
         """List all tasks with optional filtering.
 
+        The filters are applied to the index; only the returned records
+        are read.
+
         Args:
             platform: Filter by platform name.
             status: Filter by task status.
@@ -227,20 +276,16 @@ class TaskPersistence:
             >>> # Get all successful OriginQ tasks
             >>> tasks = persistence.list_all(platform="originq", status="success")
         """
-        results = []
-        for record in self._iter_records():
-            if platform and record.get("platform") != platform:
-                continue
-            if status and record.get("status") != status:
-                continue
-            results.append(record)
-
-        # Return most recent first
-        results.reverse()
-
-        if limit:
-            results = results[:limit]
-        return results
+        with self._locked():
+            offsets = [
+                offset for offset, entry_platform, entry_status in self._refresh().values()
+                if (not platform or entry_platform == platform) and (not status or entry_status == status)
+            ]
+            # Return most recent first
+            offsets.reverse()
+            if limit:
+                offsets = offsets[:limit]
+            return self._read_many(offsets)
 
     def list_by_platform(self, platform: str) -> List[Dict[str, Any]]:
         """List all tasks for a specific platform.
@@ -259,16 +304,18 @@ class TaskPersistence:
         Returns:
             List of tasks with status 'pending' or 'running'.
         """
-        results = []
-        for record in self._iter_records():
-            if record.get("status") in ("pending", "running"):
-                results.append(record)
-        return results
+        with self._locked():
+            offsets = [
+                offset for offset, _, entry_status in self._refresh().values()
+                if entry_status in ("pending", "running")
+            ]
+            return self._read_many(offsets)
 
     def clear_completed(self) -> int:
         """Remove all completed tasks from storage.
 
-        Removes tasks with status 'success', 'failed', or 'cancelled'.
+        Removes tasks with status 'success', 'failed', or 'cancelled', and
+        compacts the file.
 
         Returns:
             Number of tasks removed.
@@ -277,46 +324,39 @@ class TaskPersistence:
             >>> removed = persistence.clear_completed()
             >>> print(f"Removed {removed} completed tasks")
         """
-        if not self.tasks_file.exists():
-            return 0
-
-        kept = []
-        removed = 0
-        terminal_states = ("success", "failed", "cancelled")
-
-        for record in self._iter_records():
-            if record.get("status") in terminal_states:
-                removed += 1
-            else:
-                kept.append(record)
-
-        self._write_all(kept)
-        return removed
+        with self._locked(exclusive=True):
+            completed = {
+                task_id for task_id, (_, _, entry_status) in self._refresh().items()
+                if entry_status in _TERMINAL_STATES
+            }
+            if completed:
+                self._rewrite(exclude=completed)
+            return len(completed)
 
     def delete(self, task_id: str) -> bool:
         """Delete a specific task record.
 
+        Appends a deletion line; the task's lines are dropped at the next
+        compaction.
+
         Args:
             task_id: The task identifier to delete.
 
         Returns:
             True if the task was found and deleted, False otherwise.
         """
-        if not self.tasks_file.exists():
-            return False
-
-        records = list(self._iter_records())
-        original_len = len(records)
-        records = [r for r in records if r.get("task_id") != task_id]
-
-        if len(records) < original_len:
-            self._write_all(records)
-            return True
-        return False
+        with self._locked():
+            if task_id not in self._refresh():
+                return False
+            self._append({"task_id": task_id, _DELETED: True})
+        self._maybe_compact()
+        return True
 
     def count(self, platform: Optional[str] = None, status: Optional[str] = None) -> int:
         """Count tasks with optional filtering.
 
+        Counts are kept per platform and status, so no record is read.
+
         Args:
             platform: Filter by platform name.
             status: Filter by task status.
@@ -324,32 +364,224 @@ class TaskPersistence:
         Returns:
             Number of matching tasks.
         """
-        return len(self.list_all(platform=platform, status=status))
-
-    def _iter_records(self) -> Iterator[Dict[str, Any]]:
-        """Iterate over all records in the storage file.
-
-        Yields:
-            Each record as a dict.
+        with self._locked():
+            index = self._refresh()
+            if not platform and not status:
+                return len(index)
+            return sum(
+                n for (entry_platform, entry_status), n in self._counts.items()
+                if (not platform or entry_platform == platform) and (not status or entry_status == status)
+            )
+
+    def compact(self) -> None:
+        """Rewrite tasks.jsonl with only the latest record of every task."""
+        with self._locked(exclusive=True):
+            self._refresh()
+            self._rewrite()
+
+    def close(self) -> None:
+        """Wait for a running compaction and save the up-to-date index sidecar."""
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+        with self._locked():
+            self._refresh()
+            if self._unsaved:
+                self._save_index()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _locked(self, exclusive: bool = False) -> Iterator[None]:
+        """Serialize threads, and share the file with other processes.
+
+        Appends and reads take a shared lock; rewriting the file takes an
+        exclusive one, so that no line is appended to the replaced file.
         """
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.lock_file, "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Append one record and index it (if the index is in use)."""
+        with open(self.tasks_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if self._index is not None:
+            self._refresh()
+
+    def _read_many(self, offsets: List[int]) -> List[Dict[str, Any]]:
+        """The records at ``offsets``, read in file order."""
+        if not offsets:
+            return []
+        records = {}
+        with open(self.tasks_file, "rb") as f:
+            for offset in sorted(set(offsets)):
+                f.seek(offset)
+                records[offset] = json.loads(f.readline())
+        return [records[offset] for offset in offsets]
+
+    def _rewrite(self, exclude: Iterable[str] = ()) -> None:
+        """Replace tasks.jsonl by the latest record of every indexed task not in ``exclude``."""
         if not self.tasks_file.exists():
             return
-
-        with open(self.tasks_file, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        yield json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
-    def _write_all(self, records: List[Dict[str, Any]]) -> None:
-        """Write all records to the storage file.
-
-        Args:
-            records: List of records to write.
+        exclude = set(exclude)
+        entries = []
+        size = 0
+        tmp_file = self.tasks_file.with_name(f"{self.tasks_file.name}.{os.getpid()}.tmp")
+        with open(self.tasks_file, "rb") as src, open(tmp_file, "wb") as dst:
+            for task_id, (offset, platform, status) in self._index.items():
+                if task_id in exclude:
+                    continue
+                src.seek(offset)
+                line = src.readline()
+                dst.write(line)
+                entries.append((task_id, size, platform, status))
+                size += len(line)
+        os.replace(tmp_file, self.tasks_file)
+
+        self._reset(os.stat(self.tasks_file).st_ino)
+        for entry in entries:
+            self._set(*entry)
+        self._indexed_size = size
+        self._lines = len(entries)
+        self._save_index()
+
+    def _maybe_compact(self) -> None:
+        """Compact once superseded lines exceed the threshold and the live records."""
+        with self._lock:
+            if self._index is None:
+                return
+            superseded = self._lines - len(self._index)
+            if superseded < self.compact_threshold or superseded < len(self._index):
+                return
+            if self._compaction is not None and self._compaction.is_alive():
+                return
+            if self.background_compaction:
+                self._compaction = threading.Thread(
+                    target=self._compact_quietly, name="TaskPersistence-compaction", daemon=True
+                )
+                self._compaction.start()
+                return
+        self.compact()
+
+    def _compact_quietly(self) -> None:
+        try:
+            self.compact()
+        except OSError:
+            # the file is left as it was; the next threshold crossing retries
+            pass
+
+    # ------------------------------------------------------------------
+    # Offset index
+    # ------------------------------------------------------------------
+
+    def _refresh(self) -> Dict[str, IndexEntry]:
+        """The index, brought up to date with tasks.jsonl.
+
+        The index is loaded from the sidecar (or built) on first use and
+        whenever the file was replaced, then extended with the lines
+        appended since it was last read.
         """
-        with open(self.tasks_file, "w", encoding="utf-8") as f:
-            for record in records:
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
\ No newline at end of file
+        try:
+            stat = os.stat(self.tasks_file)
+        except FileNotFoundError:
+            self._reset(None)
+            return self._index
+        if self._index is None or stat.st_ino != self._inode or stat.st_size < self._indexed_size:
+            self._reset(stat.st_ino)
+            self._load_index(stat)
+        if stat.st_size > self._indexed_size:
+            self._scan()
+        return self._index
+
+    def _reset(self, inode: Optional[int]) -> None:
+        self._index = {}
+        self._counts.clear()
+        self._inode = inode
+        self._indexed_size = 0
+        self._lines = 0
+        self._unsaved = 0
+
+    def _set(self, task_id: str, offset: int, platform: Any, status: Any) -> None:
+        previous = self._index.get(task_id)
+        if previous is not None:
+            self._counts[previous[1:]] -= 1
+        self._index[task_id] = (offset, platform, status)
+        self._counts[(platform, status)] += 1
+
+    def _remove(self, task_id: str) -> None:
+        previous = self._index.pop(task_id, None)
+        if previous is not None:
+            self._counts[previous[1:]] -= 1
+
+    def _scan(self) -> None:
+        """Index the complete lines after ``_indexed_size``."""
+        offset = self._indexed_size
+        with open(self.tasks_file, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # a record still being written by another process
+                    break
+                self._lines += 1
+                self._unsaved += 1
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # blank or corrupt line, skipped as before
+                    record = None
+                if isinstance(record, dict) and record.get("task_id") is not None:
+                    if record.get(_DELETED):
+                        self._remove(record["task_id"])
+                    else:
+                        self._set(record["task_id"], offset, record.get("platform"), record.get("status"))
+                offset += len(line)
+        self._indexed_size = offset
+        if self._unsaved >= self.index_save_interval:
+            self._save_index()
+
+    def _load_index(self, stat: os.stat_result) -> None:
+        """Start from the sidecar if it describes this file."""
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                data = json.load(f)
+            if (data["version"] != _INDEX_VERSION or data["inode"] != stat.st_ino
+                    or data["size"] > stat.st_size):
+                return
+            for task_id, offset, platform, status in data["tasks"]:
+                self._set(task_id, offset, platform, status)
+        except (OSError, ValueError, KeyError, TypeError):
+            self._reset(stat.st_ino)
+            return
+        self._indexed_size = data["size"]
+        self._lines = data["lines"]
+
+    def _save_index(self) -> None:
+        """Write the sidecar; it is only a cache, so failures are ignored."""
+        data = {
+            "version": _INDEX_VERSION,
+            "inode": self._inode,
+            "size": self._indexed_size,
+            "lines": self._lines,
+            "tasks": [[task_id, *entry] for task_id, entry in self._index.items()],
+        }
+        tmp_file = self.index_file.with_name(
+            f"{self.index_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_file, self.index_file)
+        except OSError:
+            tmp_file.unlink(missing_ok=True)
+            return
+        self._unsaved = 0
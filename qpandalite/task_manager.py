@@ -7,6 +7,8 @@ Environment Variables:
     QPANDALITE_DUMMY: Set to 'true', '1', or 'yes' to enable dummy mode.
         When enabled, all task submissions use local simulation instead
         of real quantum backends. Useful for development and testing.
+    QPANDALITE_TASK_STORE: Storage backend of the local task cache,
+        ``'sqlite'`` (default, ``tasks.db``) or ``'json'`` (``tasks.json``).
 
 Usage:
     from qpandalite.task_manager import submit_task, query_task, wait_for_result
@@ -42,12 +44,20 @@ __all__ = [
     # Task query
     "query_task",
     "wait_for_result",
+    "wait_for_results",
+    "iter_results",
     # Cache management
     "save_task",
     "get_task",
     "list_tasks",
     "clear_completed_tasks",
     "clear_cache",
+    # Task stores
+    "TaskStore",
+    "JSONTaskStore",
+    "SQLiteTaskStore",
+    "TASK_STORES",
+    "get_task_store",
     # Classes
     "TaskInfo",
     "TaskManager",
@@ -56,15 +66,20 @@ __all__ = [
     "is_dummy_mode",
 ]
 
+import abc
+import asyncio
 import json
 import os
+import sqlite3
+import threading
 import time
 import warnings
+from contextlib import closing, contextmanager
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Iterator
 
 if TYPE_CHECKING:
     from qpandalite.circuit_builder.qcircuit import Circuit
@@ -99,6 +114,7 @@ from qpandalite.task.adapters.base import (
 
 DEFAULT_CACHE_DIR = Path.home() / ".qpandalite" / "cache"
 TASKS_CACHE_FILE = "tasks.json"
+TASKS_DB_FILE = "tasks.db"
 
 # Environment variable for global dummy mode
 QPANDALITE_DUMMY = os.environ.get("QPANDALITE_DUMMY", "").lower() in ("true", "1", "yes")
@@ -244,6 +260,291 @@ def _save_tasks_cache(tasks: dict[str, dict], cache_dir: Path | None = None) ->
         warnings.warn(f"Failed to save tasks cache: {e}")
 
 
+# -----------------------------------------------------------------------------
+# Task Store
+# -----------------------------------------------------------------------------
+
+def _status_text(status: str) -> str:
+    """The stored text of a status (the value of a TaskStatus member)."""
+    return status.value if isinstance(status, Enum) else str(status)
+
+
+class TaskStore(abc.ABC):
+    """Storage backend of the local task cache.
+
+    Subclasses store :class:`TaskInfo` records by task ID. Register a
+    subclass in :data:`TASK_STORES` to select it with
+    ``QPANDALITE_TASK_STORE`` or :func:`get_task_store`.
+    """
+
+    @abc.abstractmethod
+    def get(self, task_id: str) -> TaskInfo | None:
+        """The task with ID ``task_id``, or None if it is not stored."""
+        ...
+
+    def put(self, task_info: TaskInfo) -> None:
+        """Insert a task, or replace the stored task with the same ID."""
+        self.put_many([task_info])
+
+    @abc.abstractmethod
+    def put_many(self, task_infos: Iterable[TaskInfo]) -> None:
+        """Insert or replace several tasks at once."""
+        ...
+
+    @abc.abstractmethod
+    def list(self, status: str | None = None, backend: str | None = None) -> list[TaskInfo]:
+        """The stored tasks, optionally filtered by status and backend."""
+        ...
+
+    @abc.abstractmethod
+    def remove_statuses(self, statuses: Iterable[str]) -> int:
+        """Remove the tasks whose status is one of ``statuses``; returns their number."""
+        ...
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all tasks."""
+        ...
+
+
+class JSONTaskStore(TaskStore):
+    """The whole cache in one ``tasks.json`` file.
+
+    Every write loads and rewrites the file, and concurrent writers can
+    overwrite each other's updates. Kept for compatibility; prefer
+    :class:`SQLiteTaskStore`.
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.cache_dir = cache_dir
+
+    def get(self, task_id: str) -> TaskInfo | None:
+        tasks = _load_tasks_cache(self.cache_dir)
+        if task_id not in tasks:
+            return None
+        return TaskInfo.from_dict(tasks[task_id])
+
+    def put_many(self, task_infos: Iterable[TaskInfo]) -> None:
+        tasks = _load_tasks_cache(self.cache_dir)
+        for task_info in task_infos:
+            tasks[task_info.task_id] = task_info.to_dict()
+        _save_tasks_cache(tasks, self.cache_dir)
+
+    def list(self, status: str | None = None, backend: str | None = None) -> list[TaskInfo]:
+        results = []
+        for task_data in _load_tasks_cache(self.cache_dir).values():
+            task_info = TaskInfo.from_dict(task_data)
+            if status is not None and task_info.status != status:
+                continue
+            if backend is not None and task_info.backend != backend:
+                continue
+            results.append(task_info)
+        return results
+
+    def remove_statuses(self, statuses: Iterable[str]) -> int:
+        statuses = {_status_text(status) for status in statuses}
+        tasks = _load_tasks_cache(self.cache_dir)
+        to_remove = [task_id for task_id, data in tasks.items() if data.get("status") in statuses]
+        for task_id in to_remove:
+            del tasks[task_id]
+        if to_remove:
+            _save_tasks_cache(tasks, self.cache_dir)
+        return len(to_remove)
+
+    def clear(self) -> None:
+        cache_file = _get_cache_file(self.cache_dir)
+        if cache_file.exists():
+            try:
+                cache_file.unlink()
+            except (IOError, OSError) as e:
+                warnings.warn(f"Failed to clear cache: {e}")
+
+
+class SQLiteTaskStore(TaskStore):
+    """Tasks in an SQLite database, ``tasks.db`` in the cache directory.
+
+    Each task is one row keyed by task ID, with indexed ``backend`` and
+    ``status`` columns and the full record as JSON. A write touches only
+    its own rows, in one transaction. The database runs in WAL mode, so
+    readers do not block the writer. Concurrent writers, including other
+    processes, wait for each other for up to ``timeout`` seconds.
+
+    An existing ``tasks.json`` in the cache directory is imported when the
+    store is opened, then renamed to ``tasks.json.migrated``. Tasks
+    already in the database are kept.
+
+    Database errors are reported as warnings, like the errors of the JSON
+    cache; reads then return no task.
+
+    Args:
+        cache_dir: Optional custom cache directory.
+        timeout: Seconds to wait for a lock held by another writer.
+    """
+
+    _schema = (
+        "CREATE TABLE IF NOT EXISTS tasks ("
+        " task_id TEXT PRIMARY KEY,"
+        " backend TEXT NOT NULL,"
+        " status TEXT NOT NULL,"
+        " data TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS tasks_backend ON tasks (backend)",
+        "CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status)",
+    )
+    # rows keep their position (rowid) on update, so list() returns the
+    # tasks in order of first submission, as the JSON cache does
+    _upsert = (
+        "INSERT INTO tasks (task_id, backend, status, data) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT (task_id) DO UPDATE SET "
+        "backend = excluded.backend, status = excluded.status, data = excluded.data"
+    )
+
+    def __init__(self, cache_dir: Path | None = None, timeout: float = 30.0) -> None:
+        cache_path = cache_dir or DEFAULT_CACHE_DIR
+        cache_path.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = cache_path
+        self.path = cache_path / TASKS_DB_FILE
+        self.timeout = timeout
+        with self._guard("open the task store"):
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                for statement in self._schema:
+                    conn.execute(statement)
+            self._migrate_json()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # one short-lived connection per operation, so the store can be
+        # shared between threads
+        with closing(sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)) as conn:
+            yield conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as conn:
+            # take the write lock up front: a deferred transaction that reads
+            # before writing can fail instead of waiting for another writer
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @staticmethod
+    @contextmanager
+    def _guard(action: str) -> Iterator[None]:
+        try:
+            yield
+        except sqlite3.Error as e:
+            warnings.warn(f"Failed to {action}: {e}")
+
+    @staticmethod
+    def _row(task_info: TaskInfo) -> tuple[str, str, str, str]:
+        data = task_info.to_dict()
+        return (task_info.task_id, task_info.backend, _status_text(task_info.status),
+                json.dumps(data, ensure_ascii=False))
+
+    def _migrate_json(self) -> None:
+        json_file = self.cache_dir / TASKS_CACHE_FILE
+        if not json_file.exists():
+            return
+        tasks = _load_tasks_cache(self.cache_dir)
+        rows = [self._row(TaskInfo.from_dict(data)) for data in tasks.values()]
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO tasks (task_id, backend, status, data) VALUES (?, ?, ?, ?)", rows
+            )
+        try:
+            json_file.replace(json_file.with_name(TASKS_CACHE_FILE + ".migrated"))
+        except OSError:
+            # another process migrated the file first
+            pass
+
+    def get(self, task_id: str) -> TaskInfo | None:
+        with self._guard("load task"):
+            with self._connect() as conn:
+                row = conn.execute("SELECT data FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+            return TaskInfo.from_dict(json.loads(row[0])) if row else None
+        return None
+
+    def put_many(self, task_infos: Iterable[TaskInfo]) -> None:
+        rows = [self._row(task_info) for task_info in task_infos]
+        with self._guard("save tasks"):
+            with self._transaction() as conn:
+                conn.executemany(self._upsert, rows)
+
+    def list(self, status: str | None = None, backend: str | None = None) -> list[TaskInfo]:
+        conditions, arguments = [], []
+        if status is not None:
+            conditions.append("status = ?")
+            arguments.append(_status_text(status))
+        if backend is not None:
+            conditions.append("backend = ?")
+            arguments.append(backend)
+        query = "SELECT data FROM tasks"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        with self._guard("list tasks"):
+            with self._connect() as conn:
+                rows = conn.execute(query + " ORDER BY rowid", arguments).fetchall()
+            return [TaskInfo.from_dict(json.loads(row[0])) for row in rows]
+        return []
+
+    def remove_statuses(self, statuses: Iterable[str]) -> int:
+        statuses = sorted({_status_text(status) for status in statuses})
+        if not statuses:
+            return 0
+        with self._guard("remove tasks"):
+            with self._transaction() as conn:
+                placeholders = ", ".join("?" * len(statuses))
+                return conn.execute(f"DELETE FROM tasks WHERE status IN ({placeholders})", statuses).rowcount
+        return 0
+
+    def clear(self) -> None:
+        with self._guard("clear cache"):
+            with self._transaction() as conn:
+                conn.execute("DELETE FROM tasks")
+
+
+# name -> TaskStore subclass, selected by QPANDALITE_TASK_STORE
+TASK_STORES: dict[str, type[TaskStore]] = {
+    "sqlite": SQLiteTaskStore,
+    "json": JSONTaskStore,
+}
+
+_task_stores: dict[tuple[str, Path], TaskStore] = {}
+_task_stores_lock = threading.Lock()
+
+
+def get_task_store(cache_dir: Path | None = None, kind: str | None = None) -> TaskStore:
+    """The task store of a cache directory.
+
+    Stores are created once per directory and kind, so the JSON cache of a
+    directory is migrated only once per process.
+
+    Args:
+        cache_dir: Optional custom cache directory.
+        kind: A key of :data:`TASK_STORES`. Defaults to the
+            ``QPANDALITE_TASK_STORE`` environment variable, or ``'sqlite'``.
+
+    Returns:
+        The :class:`TaskStore`.
+
+    Raises:
+        ValueError: ``kind`` is not a registered store.
+    """
+    kind = kind or os.environ.get("QPANDALITE_TASK_STORE", "sqlite").lower()
+    if kind not in TASK_STORES:
+        raise ValueError(f"Unknown task store '{kind}'. Available stores: {', '.join(TASK_STORES)}")
+    key = (kind, Path(cache_dir or DEFAULT_CACHE_DIR).resolve())
+    with _task_stores_lock:
+        store = _task_stores.get(key)
+        if store is None:
+            store = _task_stores[key] = TASK_STORES[kind](cache_dir)
+        return store
+
+
 def save_task(task_info: TaskInfo, cache_dir: Path | None = None) -> None:
     """Save a task to the local cache.
     
@@ -251,10 +552,8 @@ def save_task(task_info: TaskInfo, cache_dir: Path | None = None) -> None:
         task_info: Task information to save.
         cache_dir: Optional custom cache directory.
     """
-    tasks = _load_tasks_cache(cache_dir)
     task_info.update_time = datetime.now().isoformat()
-    tasks[task_info.task_id] = task_info.to_dict()
-    _save_tasks_cache(tasks, cache_dir)
+    get_task_store(cache_dir).put(task_info)
 
 
 def get_task(task_id: str, cache_dir: Path | None = None) -> TaskInfo | None:
@@ -267,10 +566,7 @@ def get_task(task_id: str, cache_dir: Path | None = None) -> TaskInfo | None:
     Returns:
         TaskInfo if found, None otherwise.
     """
-    tasks = _load_tasks_cache(cache_dir)
-    if task_id not in tasks:
-        return None
-    return TaskInfo.from_dict(tasks[task_id])
+    return get_task_store(cache_dir).get(task_id)
 
 
 def list_tasks(
@@ -288,16 +584,7 @@ def list_tasks(
     Returns:
         List of TaskInfo objects matching the filters.
     """
-    tasks = _load_tasks_cache(cache_dir)
-    results = []
-    for task_data in tasks.values():
-        task_info = TaskInfo.from_dict(task_data)
-        if status is not None and task_info.status != status:
-            continue
-        if backend is not None and task_info.backend != backend:
-            continue
-        results.append(task_info)
-    return results
+    return get_task_store(cache_dir).list(status=status, backend=backend)
 
 
 def clear_completed_tasks(cache_dir: Path | None = None) -> int:
@@ -309,17 +596,8 @@ def clear_completed_tasks(cache_dir: Path | None = None) -> int:
     Returns:
         Number of tasks removed.
     """
-    tasks = _load_tasks_cache(cache_dir)
     completed_statuses = {TaskStatus.SUCCESS, TaskStatus.FAILED, TaskStatus.CANCELLED}
-    to_remove = [
-        task_id for task_id, data in tasks.items()
-        if data.get("status") in completed_statuses
-    ]
-    for task_id in to_remove:
-        del tasks[task_id]
-    if to_remove:
-        _save_tasks_cache(tasks, cache_dir)
-    return len(to_remove)
+    return get_task_store(cache_dir).remove_statuses(completed_statuses)
 
 
 def clear_cache(cache_dir: Path | None = None) -> None:
@@ -328,12 +606,7 @@ def clear_cache(cache_dir: Path | None = None) -> None:
     Args:
         cache_dir: Optional custom cache directory.
     """
-    cache_file = _get_cache_file(cache_dir)
-    if cache_file.exists():
-        try:
-            cache_file.unlink()
-        except (IOError, OSError) as e:
-            warnings.warn(f"Failed to clear cache: {e}")
+    get_task_store(cache_dir).clear()
 
 
 # -----------------------------------------------------------------------------
@@ -637,11 +910,16 @@ def _submit_batch_dummy(
 ) -> list[str]:
     """Submit multiple circuits using the dummy adapter.
 
+    The circuits are simulated in the adapter's worker pool and all task
+    infos are written to the task store in one bulk operation.
+
     Args:
         circuits: List of QPanda-lite Circuits to simulate.
         backend: The backend name (used for logging/metadata only).
         shots: Number of measurement shots per circuit.
         **kwargs: Additional parameters.
+            - max_workers: Maximum number of simulation workers.
+            - pool: "thread" (default) or "process".
 
     Returns:
         List of task IDs from the dummy adapter.
@@ -653,23 +931,27 @@ def _submit_batch_dummy(
         noise_model=kwargs.get("noise_model"),
         available_qubits=kwargs.get("available_qubits"),
         available_topology=kwargs.get("available_topology"),
+        max_workers=kwargs.get("max_workers"),
+        pool=kwargs.get("pool", "thread"),
     )
 
     # Submit all circuits
     originir_circuits = [c.originir for c in circuits]
     task_ids = dummy_adapter.submit_batch(originir_circuits, shots=shots)
 
-    # Create and save task info for each
+    # Map adapter status to TaskStatus
+    status_map = {
+        TASK_STATUS_SUCCESS: TaskStatus.SUCCESS,
+        TASK_STATUS_FAILED: TaskStatus.FAILED,
+        TASK_STATUS_RUNNING: TaskStatus.RUNNING,
+    }
+
+    # Create task info for each and save them together
+    update_time = datetime.now().isoformat()
+    task_infos = []
     for task_id in task_ids:
         result = dummy_adapter.query(task_id)
         adapter_status = result.get("status", TASK_STATUS_RUNNING)
-
-        # Map adapter status to TaskStatus
-        status_map = {
-            TASK_STATUS_SUCCESS: TaskStatus.SUCCESS,
-            TASK_STATUS_FAILED: TaskStatus.FAILED,
-            TASK_STATUS_RUNNING: TaskStatus.RUNNING,
-        }
         task_status = status_map.get(adapter_status, TaskStatus.FAILED)
 
         task_info = TaskInfo(
@@ -678,10 +960,12 @@ def _submit_batch_dummy(
             status=task_status,
             shots=shots,
             metadata={"batch": True, "batch_size": len(circuits)},
+            update_time=update_time,
         )
         if adapter_status == TASK_STATUS_SUCCESS:
             task_info.result = result.get("result")
-        save_task(task_info)
+        task_infos.append(task_info)
+    get_task_store().put_many(task_infos)
 
     return task_ids
 
@@ -744,7 +1028,6 @@ def query_task(task_id: str, backend: str | None = None) -> TaskInfo:
         if isinstance(mapped_error, NetworkError):
             raise mapped_error from e
         # For other errors, try to use cached info
-        cached_task = get_task(task_id)
         if cached_task is not None:
             return cached_task
         raise TaskNotFoundError(
@@ -752,6 +1035,18 @@ def query_task(task_id: str, backend: str | None = None) -> TaskInfo:
             task_id=task_id,
         ) from e
     
+    task_info = _task_info_from_result(task_id, backend, result, cached_task)
+    save_task(task_info)
+    return task_info
+
+
+def _task_info_from_result(
+    task_id: str,
+    backend: str,
+    result: dict[str, Any],
+    cached_task: TaskInfo | None,
+) -> TaskInfo:
+    """Build the TaskInfo of an adapter query result."""
     # Map adapter status to TaskStatus
     adapter_status = result.get("status", TASK_STATUS_RUNNING)
     status_map = {
@@ -772,13 +1067,10 @@ def query_task(task_id: str, backend: str | None = None) -> TaskInfo:
     )
     
     # Merge with existing metadata if available
-    cached_task = get_task(task_id)
     if cached_task is not None:
         task_info.submit_time = cached_task.submit_time
         task_info.shots = cached_task.shots
         task_info.metadata = cached_task.metadata
-    
-    save_task(task_info)
     return task_info
 
 
@@ -848,6 +1140,280 @@ def wait_for_result(
         time.sleep(poll_interval)
 
 
+@dataclass
+class _PollState:
+    """Polling state of one task in :func:`wait_for_results`."""
+
+    backend: str
+    cached: TaskInfo | None
+    status: str
+    interval: float
+    due: float = 0.0
+
+
+def _finished_result(task_info: TaskInfo, raise_on_failure: bool) -> tuple[str, dict | None]:
+    """``(task_id, result)`` of a finished task, raising on failure if requested."""
+    if task_info.status == TaskStatus.FAILED:
+        if raise_on_failure:
+            raise TaskFailedError(
+                f"Task '{task_info.task_id}' failed on backend '{task_info.backend}'.",
+                task_id=task_info.task_id,
+                backend=task_info.backend,
+            )
+        return task_info.task_id, None
+    return task_info.task_id, task_info.result
+
+
+async def wait_for_results(
+    task_ids: Iterable[str],
+    backend: str | None = None,
+    timeout: float = 300.0,
+    poll_interval: float = 1.0,
+    max_poll_interval: float = 30.0,
+    backoff: float = 1.5,
+    max_concurrency: int = 8,
+    raise_on_failure: bool = True,
+    cache_dir: Path | None = None,
+) -> AsyncIterator[tuple[str, dict | None]]:
+    """Wait for many tasks concurrently and yield their results as they complete.
+
+    Every task is polled on its own schedule: the interval starts at
+    ``poll_interval``, grows by ``backoff`` (up to ``max_poll_interval``)
+    each time a poll finds the task in the same state and is reset when the
+    state changes. The tasks due in the same round are grouped by backend.
+    When a group has several tasks and the backend's ``query_batch`` returns
+    one result per task (``query_batch_per_task``), the group is first probed
+    with it; if all of them have succeeded this yields the results of the
+    whole group from one query. Otherwise the tasks are queried one
+    by one in worker threads, at most ``max_concurrency`` at a time, and the
+    batch probe of that backend is skipped until one of its tasks completes.
+
+    Args:
+        task_ids: The task identifiers.
+        backend: The backend name of tasks not found in the cache.
+        timeout: Maximum time to wait for all tasks, in seconds.
+        poll_interval: Initial time between status checks of a task.
+        max_poll_interval: Maximum time between status checks of a task.
+        backoff: Growth factor of the interval of a task whose state is unchanged.
+        max_concurrency: Maximum number of queries in flight.
+        raise_on_failure: If True, raises TaskFailedError on the first failed
+            task; otherwise failed tasks are yielded with result None.
+        cache_dir: Optional custom cache directory.
+
+    Yields:
+        ``(task_id, result)`` of every task, in order of completion.
+
+    Raises:
+        TaskTimeoutError: If some tasks have not completed within the timeout.
+        TaskFailedError: If a task fails and raise_on_failure is True.
+        TaskNotFoundError: If a task is not found.
+        BackendNotFoundError: If a backend is not recognized.
+        NetworkError: If a network error occurs.
+
+    Example:
+        >>> async for task_id, result in wait_for_results(task_ids):
+        ...     print(task_id, result['counts'])
+    """
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    store = get_task_store(cache_dir)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    pending: dict[str, _PollState] = {}
+    completed: list[TaskInfo] = []
+    for task_id in dict.fromkeys(task_ids):
+        cached_task = store.get(task_id)
+        task_backend = cached_task.backend if cached_task is not None else backend
+        if task_backend is None:
+            raise TaskNotFoundError(
+                f"Task '{task_id}' not found in local cache. "
+                "Please provide the backend parameter.",
+                task_id=task_id,
+            )
+        # Results of dummy tasks are already stored
+        if cached_task is not None and task_backend.startswith("dummy:"):
+            completed.append(cached_task)
+            continue
+        pending[task_id] = _PollState(
+            backend=task_backend,
+            cached=cached_task,
+            status=cached_task.status if cached_task is not None else TaskStatus.PENDING,
+            interval=poll_interval,
+        )
+
+    instances: dict[str, Any] = {}
+    for task_backend in {state.backend for state in pending.values()}:
+        actual_backend = task_backend.split(":", 1)[-1]
+        try:
+            instances[task_backend] = backend_module.get_backend(actual_backend)
+        except ValueError as e:
+            raise BackendNotFoundError(str(e)) from e
+    # Only backends whose batch results map one-to-one onto the task IDs
+    probe_batch = {
+        task_backend: getattr(instance, "query_batch_per_task", False) is True
+        for task_backend, instance in instances.items()
+    }
+
+    async def query_batch(task_backend: str, ids: list[str]) -> dict[str, dict] | None:
+        async with semaphore:
+            try:
+                batch = await asyncio.to_thread(instances[task_backend].query_batch, ids)
+            except Exception:
+                # Not implemented by the adapter, or failed: query one by one
+                return None
+        results = batch.get("result")
+        if (
+            batch.get("status") == TASK_STATUS_SUCCESS
+            and isinstance(results, list)
+            and len(results) == len(ids)
+        ):
+            return {
+                task_id: {"status": TASK_STATUS_SUCCESS, "result": result}
+                for task_id, result in zip(ids, results)
+            }
+        return None
+
+    async def query(task_backend: str, task_id: str) -> dict | None:
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(instances[task_backend].query, task_id)
+            except Exception as e:
+                mapped_error = _map_adapter_error(e, task_backend)
+                if isinstance(mapped_error, NetworkError):
+                    raise mapped_error from e
+                if pending[task_id].cached is None:
+                    raise TaskNotFoundError(
+                        f"Task '{task_id}' not found: {e}",
+                        task_id=task_id,
+                    ) from e
+                # Keep polling the cached task, as query_task does
+                return None
+
+    async def poll(task_backend: str, ids: list[str]) -> dict[str, dict | None]:
+        if len(ids) > 1 and probe_batch[task_backend]:
+            results = await query_batch(task_backend, ids)
+            if results is not None:
+                return results
+            probe_batch[task_backend] = False
+        answers = await asyncio.gather(*(query(task_backend, task_id) for task_id in ids))
+        return dict(zip(ids, answers))
+
+    deadline = start_time + timeout
+    polled = False
+    while True:
+        for task_info in completed:
+            yield _finished_result(task_info, raise_on_failure)
+        completed = []
+        if not pending:
+            return
+
+        if polled and loop.time() >= deadline:
+            raise TaskTimeoutError(
+                f"Timeout waiting for {len(pending)} tasks to complete.",
+                task_id=next(iter(pending)),
+                timeout=timeout,
+            )
+        # Poll every task a last time at the deadline
+        next_due = min(min(state.due for state in pending.values()), deadline)
+        if next_due > loop.time():
+            await asyncio.sleep(next_due - loop.time())
+
+        groups: dict[str, list[str]] = {}
+        now = loop.time()
+        for task_id, state in pending.items():
+            if state.due <= now or now >= deadline:
+                groups.setdefault(state.backend, []).append(task_id)
+        answers = await asyncio.gather(*(poll(name, ids) for name, ids in groups.items()))
+        polled = True
+
+        updated = []
+        now = loop.time()
+        for task_backend, results in zip(groups, answers):
+            for task_id, result in results.items():
+                state = pending[task_id]
+                task_info = (
+                    _task_info_from_result(task_id, task_backend, result, state.cached)
+                    if result is not None else None
+                )
+                if task_info is not None:
+                    updated.append(task_info)
+                    if task_info.status in (TaskStatus.SUCCESS, TaskStatus.FAILED):
+                        completed.append(task_info)
+                        probe_batch[task_backend] = True
+                        del pending[task_id]
+                        continue
+                    if task_info.status != state.status:
+                        state.interval = poll_interval
+                    else:
+                        state.interval = min(state.interval * backoff, max_poll_interval)
+                    state.status = task_info.status
+                    state.cached = task_info
+                else:
+                    state.interval = min(state.interval * backoff, max_poll_interval)
+                state.due = now + state.interval
+        if updated:
+            await asyncio.to_thread(store.put_many, updated)
+
+
+def iter_results(
+    task_ids: Iterable[str],
+    backend: str | None = None,
+    timeout: float = 300.0,
+    poll_interval: float = 1.0,
+    max_poll_interval: float = 30.0,
+    backoff: float = 1.5,
+    max_concurrency: int = 8,
+    raise_on_failure: bool = True,
+    cache_dir: Path | None = None,
+) -> Iterator[tuple[str, dict | None]]:
+    """Synchronous version of :func:`wait_for_results`.
+
+    Runs the poller on a private event loop, so it cannot be called from
+    a running event loop; use :func:`wait_for_results` there.
+
+    Args:
+        task_ids: The task identifiers.
+        backend: The backend name of tasks not found in the cache.
+        timeout: Maximum time to wait for all tasks, in seconds.
+        poll_interval: Initial time between status checks of a task.
+        max_poll_interval: Maximum time between status checks of a task.
+        backoff: Growth factor of the interval of a task whose state is unchanged.
+        max_concurrency: Maximum number of queries in flight.
+        raise_on_failure: If True, raises TaskFailedError on the first failed task.
+        cache_dir: Optional custom cache directory.
+
+    Yields:
+        ``(task_id, result)`` of every task, in order of completion.
+
+    Example:
+        >>> for task_id, result in iter_results(task_ids, timeout=600):
+        ...     print(task_id, result['counts'])
+    """
+    loop = asyncio.new_event_loop()
+    results = wait_for_results(
+        task_ids,
+        backend,
+        timeout=timeout,
+        poll_interval=poll_interval,
+        max_poll_interval=max_poll_interval,
+        backoff=backoff,
+        max_concurrency=max_concurrency,
+        raise_on_failure=raise_on_failure,
+        cache_dir=cache_dir,
+    )
+    try:
+        while True:
+            try:
+                item = loop.run_until_complete(results.__anext__())
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        loop.run_until_complete(results.aclose())
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+
 # -----------------------------------------------------------------------------
 # TaskManager Class
 # -----------------------------------------------------------------------------
@@ -968,6 +1534,70 @@ class TaskManager:
             raise_on_failure=raise_on_failure,
         )
     
+    def wait_for_results(
+        self,
+        task_ids: Iterable[str],
+        backend: str | None = None,
+        timeout: float = 300.0,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        raise_on_failure: bool = True,
+    ) -> AsyncIterator[tuple[str, dict | None]]:
+        """Wait for many tasks concurrently (async iterator).
+        
+        Args:
+            task_ids: The task IDs.
+            backend: Optional backend name.
+            timeout: Maximum wait time for all tasks in seconds.
+            poll_interval: Initial time between status checks of a task.
+            max_poll_interval: Maximum time between status checks of a task.
+            raise_on_failure: Whether to raise on task failure.
+            
+        Returns:
+            Async iterator of ``(task_id, result)`` in order of completion.
+        """
+        return wait_for_results(
+            task_ids,
+            backend,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            raise_on_failure=raise_on_failure,
+            cache_dir=self._cache_dir,
+        )
+    
+    def iter_results(
+        self,
+        task_ids: Iterable[str],
+        backend: str | None = None,
+        timeout: float = 300.0,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        raise_on_failure: bool = True,
+    ) -> Iterator[tuple[str, dict | None]]:
+        """Wait for many tasks concurrently (blocking iterator).
+        
+        Args:
+            task_ids: The task IDs.
+            backend: Optional backend name.
+            timeout: Maximum wait time for all tasks in seconds.
+            poll_interval: Initial time between status checks of a task.
+            max_poll_interval: Maximum time between status checks of a task.
+            raise_on_failure: Whether to raise on task failure.
+            
+        Returns:
+            Iterator of ``(task_id, result)`` in order of completion.
+        """
+        return iter_results(
+            task_ids,
+            backend,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            raise_on_failure=raise_on_failure,
+            cache_dir=self._cache_dir,
+        )
+    
     def list_tasks(
         self,
         status: str | None = None,
@@ -5,6 +5,8 @@ This module tests:
 - compute_all_gradients function
 - batch_execute function
 - batch_execute_with_params function
+- CircuitSkeleton and the batch executors
+- batched parameter-shift helpers of QuantumLayer
 - QuantumLayer class (when PyTorch is available)
 """
 
@@ -14,9 +16,12 @@ from unittest.mock import MagicMock, Mock, patch
 import numpy as np
 import pytest
 
-# Setup mocks for dependencies
-mock_cpp = MagicMock()
-sys.modules['qpandalite_cpp'] = mock_cpp
+# Setup mocks for dependencies; the real extension is kept when it is built,
+# since later tests pickle its objects by module name
+try:
+    import qpandalite_cpp  # noqa: F401
+except ImportError:
+    sys.modules['qpandalite_cpp'] = MagicMock()
 
 mock_pyqpanda3 = MagicMock()
 mock_pyqpanda3.core.draw_qprog = MagicMock()
@@ -116,6 +121,13 @@ class TestBatchExecute:
         batch_execute(circuits, executor, n_workers=1)
         assert executor.call_count == 3
 
+    def test_batch_execute_invalid_pool(self):
+        """Test batch_execute rejects unknown pool kinds."""
+        from qpandalite.pytorch.batch_executor import batch_execute
+
+        with pytest.raises(ValueError, match="pool"):
+            batch_execute([], Mock(), pool="fiber")
+
 
 # =============================================================================
 # Test batch_execute_with_params
@@ -347,6 +359,163 @@ class TestQuantumLayerWithPytorch:
         assert "n_params" in repr_str
 
 
+class _Template:
+    """A duck-typed template: rx(2 * a + 1), h, rz(b), ry(a - b) (or ry(a * a) if squared)."""
+
+    squared = False
+
+    def __init__(self):
+        self.values = {"a": 0.0, "b": 0.0}
+        self.qubit_num = 2
+        self._parameters = {}
+        for name in self.values:
+            param = MagicMock()
+            param.bind = lambda v, name=name: self._bind(name, v)
+            self._parameters[name] = param
+        self._build()
+
+    def _bind(self, name, value):
+        self.values[name] = value
+        self._build()
+
+    def _build(self):
+        a, b = self.values["a"], self.values["b"]
+        self.opcode_list = [
+            ("RX", 0, None, 2 * a + 1, False, None),
+            ("H", 0, None, None, False, None),
+            ("RZ", 0, None, b, False, None),
+            ("RY", 1, None, a * a if self.squared else a - b, False, None),
+        ]
+
+    def copy(self):
+        return type(self)()
+
+
+class _SquaredTemplate(_Template):
+    squared = True
+
+
+class TestCircuitSkeleton:
+    """Tests for CircuitSkeleton."""
+
+    def test_affine_template(self):
+        """Gate parameters of an affine template are filled without copying it."""
+        from qpandalite.pytorch.batch_executor import CircuitSkeleton
+
+        skeleton = CircuitSkeleton(_Template(), ["a", "b"], [0.3, -0.2])
+        assert skeleton.affine
+        assert np.allclose(skeleton.jacobian, [[2, 0], [0, 1], [1, -1]])
+        assert np.allclose(skeleton.gate_parameters([[1.0, 2.0], [0.0, 0.0]]),
+                           [[3.0, 2.0, -1.0], [1.0, 0.0, 0.0]])
+
+        with patch.object(_Template, "copy") as template_copy:
+            circuit = skeleton.bind([1.0, 2.0])
+        template_copy.assert_not_called()
+        assert circuit.opcode_list[1] == ("H", 0, None, None, False, None)
+        assert np.allclose([circuit.opcode_list[i][3] for i in (0, 2, 3)], [3.0, 2.0, -1.0])
+        assert np.isclose(skeleton.opcodes[0][3], 2 * 0.3 + 1)
+
+    def test_non_affine_template(self):
+        """Other templates are bound by copying the template."""
+        from qpandalite.pytorch.batch_executor import CircuitSkeleton
+
+        skeleton = CircuitSkeleton(_SquaredTemplate(), ["a", "b"], [0.3, -0.2])
+        assert not skeleton.affine
+        assert np.isclose(skeleton.bind([1.5, 0.0]).opcode_list[3][3], 2.25)
+        with pytest.raises(ValueError, match="affine"):
+            skeleton.gate_parameters([1.5, 0.0])
+
+    def test_pool_executor(self):
+        """PoolExecutor evaluates expectation_fn on every bound row."""
+        from qpandalite.pytorch.batch_executor import CircuitSkeleton, PoolExecutor
+
+        skeleton = CircuitSkeleton(_Template(), ["a", "b"])
+        rows = np.array([[0.0, 1.0], [1.0, 2.0], [2.0, 3.0]])
+        expectation_fn = lambda c: c.opcode_list[0][3]  # noqa: E731
+        for executor in [PoolExecutor(), PoolExecutor(n_workers=2)]:
+            assert np.allclose(executor(skeleton, rows, expectation_fn), [1.0, 3.0, 5.0])
+        with pytest.raises(ValueError, match="pool"):
+            PoolExecutor(pool="gpu")
+
+
+class TestBatchedParameterShift:
+    """Tests for the batched parameter-shift helpers of QuantumLayer."""
+
+    def test_shifted_rows(self):
+        """Shifted rows are ordered (sign, row, column)."""
+        from qpandalite.pytorch.quantum_layer import _shifted_rows
+
+        rows = _shifted_rows(np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]]), [0, 2], 0.5)
+        assert rows.shape == (8, 3)
+        assert np.allclose(rows[1], [0.0, 0.0, 0.5])
+        assert np.allclose(rows[2], [1.5, 1.0, 1.0])
+        assert np.allclose(rows[7], [1.0, 1.0, 0.5])
+
+    def test_parameter_shift_batch(self):
+        """One execute call gives exact gradients of sums of sinusoids."""
+        from qpandalite.pytorch.quantum_layer import _parameter_shift_batch
+
+        execute = Mock(side_effect=lambda m: np.sin(m[:, 0]) + np.cos(2 * m[:, 1]) * np.cos(m[:, 2]))
+        values = np.random.default_rng(0).normal(size=(4, 3))
+        grads = _parameter_shift_batch(execute, values, [0, 2], np.pi / 2)
+        assert execute.call_count == 1
+        assert np.allclose(grads[:, 0], np.cos(values[:, 0]))
+        assert np.allclose(grads[:, 1], 0.0)
+        assert np.allclose(grads[:, 2], -np.cos(2 * values[:, 1]) * np.sin(values[:, 2]))
+
+    def test_parameter_rows(self):
+        """Every input row is followed by the trainable parameters."""
+        from qpandalite.pytorch.quantum_layer import _parameter_rows
+
+        rows = _parameter_rows(np.array([[1.0, 2.0], [3.0, 4.0]]), np.array([5.0, 6.0, 7.0]))
+        assert np.allclose(rows, [[1, 2, 5, 6, 7], [3, 4, 5, 6, 7]])
+        assert _parameter_rows(np.zeros((1, 0)), np.array([0.5])).shape == (1, 1)
+
+    def test_gradients_of_inputs_and_parameters(self):
+        """The backward pass layout: input and parameter columns of every row at once."""
+        from qpandalite.pytorch.quantum_layer import _parameter_rows, _parameter_shift_batch
+
+        def execute(m):
+            # one input feature x, parameters a and b
+            return np.cos(m[:, 0] + m[:, 1]) * np.sin(m[:, 2])
+
+        inputs = np.array([[0.1], [0.7], [-1.2]])
+        params = np.array([0.3, 0.9])
+        values = _parameter_rows(inputs, params)
+        grads = _parameter_shift_batch(execute, values, [0, 1, 2], np.pi / 2)
+
+        x, a, b = values.T
+        assert np.allclose(grads[:, 0], -np.sin(x + a) * np.sin(b))
+        assert np.allclose(grads[:, 1], -np.sin(x + a) * np.sin(b))
+        assert np.allclose(grads[:, 2], np.cos(x + a) * np.cos(b))
+        # parameter gradients of the layer sum over the rows
+        assert np.allclose(grads[:, 1:].sum(axis=0), [
+            np.sum(-np.sin(x + a) * np.sin(b)), np.sum(np.cos(x + a) * np.cos(b))])
+
+    def test_layer_ignores_input_without_input_names(self):
+        """A layer without input_names keeps ignoring x, with a DeprecationWarning."""
+        torch = pytest.importorskip("torch")
+        from qpandalite.pytorch.quantum_layer import QuantumLayer
+
+        executor = Mock(side_effect=lambda skeleton, rows, fn: np.zeros(len(rows)))
+        layer = QuantumLayer(_Template(), None, batch_executor=executor)
+        with pytest.warns(DeprecationWarning, match="input_names"):
+            out = layer(torch.rand(4, 3))
+        assert out.shape == (1,)
+
+    def test_layer_arguments(self):
+        """QuantumLayer validates diff_method, observable and input_names."""
+        pytest.importorskip("torch")
+        from qpandalite.pytorch.quantum_layer import QuantumLayer
+
+        with pytest.raises(ValueError, match="observable"):
+            QuantumLayer(_Template(), None, diff_method="adjoint")
+        with pytest.raises(ValueError, match="diff_method"):
+            QuantumLayer(_Template(), None, diff_method="backprop")
+        with pytest.raises(ValueError, match="not found"):
+            QuantumLayer(_Template(), None, input_names=["x"])
+
+
 # =============================================================================
 # Test Module Exports
 # =============================================================================
@@ -364,6 +533,9 @@ class TestModuleExports:
         """Test batch_executor module exports."""
         from qpandalite.pytorch.batch_executor import __all__
         assert "batch_execute" in __all__
+        assert "CircuitSkeleton" in __all__
+        assert "ProgramSweep" in __all__
+        assert "VectorizedExecutor" in __all__
 
     def test_quantum_layer_exports(self):
         """Test quantum_layer module exports."""
@@ -377,6 +549,7 @@ class TestModuleExports:
         assert "batch_execute" in __all__
         assert "parameter_shift_gradient" in __all__
         assert "compute_all_gradients" in __all__
+        assert "adjoint_gradient" in __all__
 
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ import numpy as np
 import pytest
 
 from qpandalite.circuit_builder import Circuit
-from qpandalite.algorithmics.measurement import pauli_expectation
+from qpandalite.algorithmics.measurement import pauli_expectation, pauli_sum_expectation
 
 
 class TestSingleQubitPauli:
@@ -210,3 +210,52 @@ class TestPauliEdgeCases:
         exact = pauli_expectation(c, "X", shots=None)
         sampled = pauli_expectation(c, "X", shots=8192)
         assert abs(sampled - exact) < 0.05
+
+
+class TestPauliSumExpectation:
+    """Weighted sums of Pauli strings evaluated on one simulation."""
+
+    def _circuit(self):
+        c = Circuit()
+        c.ry(0, 0.7)
+        c.cx(0, 1)
+        c.rx(2, 0.3)
+        c.s(1)
+        c.measure(0, 1, 2)
+        return c
+
+    def test_matches_single_terms(self):
+        """The sum equals the weighted single-string expectations."""
+        c = self._circuit()
+        terms = ["ZZI", "XYI", "IIY", "YXZ", "III"]
+        coeffs = [0.5, -1.2, 0.3, 2.0, 0.1]
+        expected = sum(k * pauli_expectation(c, p) for p, k in zip(terms, coeffs))
+        assert np.isclose(pauli_sum_expectation(c, terms, coeffs), expected)
+
+    def test_default_coeffs(self):
+        """Without coefficients every term has weight 1."""
+        c = self._circuit()
+        terms = ["ZII", "IZI"]
+        expected = pauli_expectation(c, "ZII") + pauli_expectation(c, "IZI")
+        assert np.isclose(pauli_sum_expectation(c, terms), expected)
+
+    def test_shots(self):
+        """Shots mode is close to the exact value."""
+        c = Circuit()
+        c.h(0)
+        c.cx(0, 1)
+        c.measure(0, 1)
+        sampled = pauli_sum_expectation(c, ["ZZ", "XX"], [0.5, 0.5], shots=4096)
+        assert abs(sampled - 1.0) < 0.05
+
+    def test_coeffs_length_raises(self):
+        """One coefficient per term is required."""
+        c = self._circuit()
+        with pytest.raises(ValueError, match="coeffs"):
+            pauli_sum_expectation(c, ["ZZZ", "XXX"], [1.0])
+
+    def test_invalid_term_raises(self):
+        """Every term is validated."""
+        c = self._circuit()
+        with pytest.raises(ValueError):
+            pauli_sum_expectation(c, ["ZZZ", "ZQZ"])
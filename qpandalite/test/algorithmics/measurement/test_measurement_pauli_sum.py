@@ -0,0 +1,95 @@
+"""Tests for PauliSum: term handling, qubit-wise commuting grouping and
+grouped measurement."""
+
+import numpy as np
+import pytest
+
+from qpandalite.circuit_builder import Circuit
+from qpandalite.algorithmics.measurement import PauliSum, pauli_expectation
+
+
+def _circuit():
+    c = Circuit()
+    c.ry(0, 0.7)
+    c.cx(0, 1)
+    c.rx(2, 0.3)
+    c.s(1)
+    c.measure(0, 1, 2)
+    return c
+
+
+class TestPauliSumTerms:
+    """Construction and arithmetic."""
+
+    def test_merge_duplicates(self):
+        h = PauliSum([("zz", 0.5), ("ZZ", 0.25), ("XI", 1.0)])
+        assert h.terms == [("ZZ", 0.75), ("XI", 1.0)]
+        assert h.n_qubits == 2
+        assert len(h) == 2
+
+    def test_add_and_scale(self):
+        h = 2 * (PauliSum({"ZZ": 0.5}) + PauliSum({"ZZ": 0.5, "XX": 1.0}))
+        assert dict(h.terms) == {"ZZ": 2.0, "XX": 2.0}
+
+    def test_invalid_terms_raise(self):
+        with pytest.raises(ValueError):
+            PauliSum({"ZZ": 1.0, "ZZZ": 1.0})
+        with pytest.raises(ValueError):
+            PauliSum({"ZA": 1.0})
+        with pytest.raises(ValueError):
+            PauliSum({})
+
+
+class TestPauliSumGrouping:
+    """Qubit-wise commuting groups."""
+
+    def test_groups_commute(self):
+        h = PauliSum({"ZZI": 1.0, "ZIZ": 0.5, "XXI": 0.4, "IXX": 0.3, "YIY": 0.2, "III": -1.0, "IZI": 0.1})
+        groups = h.groups()
+        assert sorted(p for g in groups for p in g.pauli_strings) == sorted(h.pauli_strings)
+        for group in groups:
+            basis = group.basis
+            for pauli_string in group.pauli_strings:
+                assert all(p in ("I", b) for p, b in zip(pauli_string, basis))
+        assert len(groups) == 3
+
+    def test_basis_raises_when_not_commuting(self):
+        with pytest.raises(ValueError, match="commute"):
+            PauliSum({"ZZ": 1.0, "XZ": 1.0}).basis
+
+    def test_one_circuit_per_group(self):
+        h = PauliSum({"ZZI": 1.0, "ZIZ": 0.5, "XXI": 0.4, "IXX": 0.3})
+        circuits = h.measurement_circuits(_circuit())
+        assert len(circuits) == len(h.groups()) == 2
+
+
+class TestPauliSumExpectation:
+    """Expectation values from the statevector and from grouped counts."""
+
+    def test_exact_matches_terms(self):
+        c = _circuit()
+        h = PauliSum({"ZZI": 0.5, "XYI": -1.2, "IIY": 0.3, "YXZ": 2.0, "III": 0.1})
+        expected = sum(k * pauli_expectation(c, p) for p, k in h.terms)
+        assert np.isclose(h.expectation(c), expected)
+
+    def test_from_counts(self):
+        # Bell state measured in the ZZ basis: outcomes 00 and 11
+        h = PauliSum({"ZZ": 0.5, "ZI": 0.2, "II": 1.0})
+        assert np.isclose(h.expectation_from_counts({0: 500, 3: 500}), 1.5)
+        assert np.isclose(h.expectation_from_counts({"00": 0.5, "11": 0.5}), 1.5)
+        # qubit 0 is the rightmost character
+        assert np.isclose(PauliSum({"ZI": 1.0}).expectation_from_counts({"01": 1}), -1.0)
+
+    def test_from_counts_requires_commuting(self):
+        with pytest.raises(ValueError):
+            PauliSum({"ZZ": 1.0, "XX": 1.0}).expectation_from_counts({0: 1})
+
+    def test_group_counts_length_raises(self):
+        h = PauliSum({"ZZ": 1.0, "XX": 1.0})
+        with pytest.raises(ValueError, match="group"):
+            h.expectation_from_group_counts([{0: 1}])
+
+    def test_shots_close_to_exact(self):
+        c = _circuit()
+        h = PauliSum({"ZZI": 0.5, "XXI": -0.4, "IIY": 0.3, "ZIZ": 0.2})
+        assert abs(h.expectation(c, shots=8192) - h.expectation(c)) < 0.05
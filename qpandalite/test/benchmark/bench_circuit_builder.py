@@ -0,0 +1,70 @@
+"""Construction throughput of the circuit builder.
+
+Builds a random circuit of single- and two-qubit gates gate by gate, copies
+it into a second circuit with ``add_circuit`` and appends its opcodes with
+``extend``, and reports the gates per second of each path:
+
+    python -m qpandalite.test.benchmark.bench_circuit_builder --gates 1000000 --qubits 100
+"""
+
+import argparse
+import random
+import time
+
+from qpandalite.circuit_builder import Circuit
+
+
+def make_gates(n_gates: int, n_qubits: int = 100, seed: int = 0) -> list:
+    """``(gate, qubits, parameter)`` triples of a random circuit."""
+    random.seed(seed)
+    gates = []
+    for _ in range(n_gates):
+        kind = random.randrange(3)
+        if kind == 0:
+            gates.append(('h', (random.randrange(n_qubits),), None))
+        elif kind == 1:
+            gates.append(('rx', (random.randrange(n_qubits),), random.uniform(0, 6.28)))
+        else:
+            q1, q2 = random.sample(range(n_qubits), 2)
+            gates.append(('cnot', (q1, q2), None))
+    return gates
+
+
+def build(gates: list) -> Circuit:
+    """A circuit built with one builder method call per gate."""
+    c = Circuit()
+    for name, qubits, parameter in gates:
+        if parameter is None:
+            getattr(c, name)(*qubits)
+        else:
+            getattr(c, name)(*qubits, parameter)
+    return c
+
+
+def benchmark(gates: list) -> dict:
+    """Gates per second of gate-by-gate construction, add_circuit and extend."""
+    results = {}
+    start = time.perf_counter()
+    circuit = build(gates)
+    results['add_gate'] = len(gates) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    Circuit().add_circuit(circuit)
+    results['add_circuit'] = len(gates) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    Circuit().extend(circuit.opcode_list)
+    results['extend'] = len(gates) / (time.perf_counter() - start)
+    return results
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--gates', type=int, default=1000000)
+    arg_parser.add_argument('--qubits', type=int, default=100)
+    args = arg_parser.parse_args()
+
+    results = benchmark(make_gates(args.gates, args.qubits))
+    print(f'{args.gates} gates on {args.qubits} qubits')
+    for path, rate in results.items():
+        print(f'{path:>11}: {rate:12,.0f} gates/s')
@@ -0,0 +1,70 @@
+"""Parsing throughput of the OriginIR parser engines.
+
+Generates a random OriginIR program (with CONTROL/DAGGER blocks) and reports
+the lines per second of every engine in ``parser_engines``:
+
+    python -m qpandalite.test.benchmark.bench_originir_parser --lines 200000
+"""
+
+import argparse
+import random
+import time
+
+from qpandalite.circuit_builder.random_originir import random_originir
+from qpandalite.originir.originir_base_parser import OriginIR_BaseParser, parser_engines
+
+
+def _with_blocks(program: str, n_qubits: int, block_size: int = 50) -> str:
+    """Wrap every other run of ``block_size`` gates in a CONTROL or DAGGER block."""
+    lines = program.splitlines()
+    header, body = lines[:2], lines[2:]
+    gates = [line for line in body if not line.startswith('MEASURE')]
+    measures = [line for line in body if line.startswith('MEASURE')]
+    control = f'q[{n_qubits}]'
+
+    result = list(header)
+    for k, start in enumerate(range(0, len(gates), block_size)):
+        block = gates[start:start + block_size]
+        if k % 4 == 1:
+            block = [f'CONTROL {control}'] + block + [f'ENDCONTROL {control}']
+        elif k % 4 == 3:
+            block = ['DAGGER'] + block + ['ENDDAGGER']
+        result.extend(block)
+    return '\n'.join(result + measures)
+
+
+def make_program(n_lines: int, n_qubits: int = 20, seed: int = 0) -> str:
+    """A random program of about ``n_lines`` lines; the last qubit only controls blocks."""
+    random.seed(seed)
+    program = random_originir(n_qubits, n_lines)
+    program = program.replace(f'QINIT {n_qubits}', f'QINIT {n_qubits + 1}', 1)
+    return _with_blocks(program, n_qubits)
+
+
+def benchmark(program: str, repeat: int = 3) -> dict:
+    """Best lines per second of every engine on ``program``."""
+    n_lines = len(program.splitlines())
+    results = {}
+    for engine in parser_engines:
+        best = float('inf')
+        for _ in range(repeat):
+            parser = OriginIR_BaseParser(engine=engine)
+            start = time.perf_counter()
+            parser.parse(program)
+            best = min(best, time.perf_counter() - start)
+        results[engine] = n_lines / best
+    return results
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--lines', type=int, default=200000)
+    arg_parser.add_argument('--qubits', type=int, default=20)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    program = make_program(args.lines, args.qubits)
+    results = benchmark(program, args.repeat)
+    print(f'{len(program.splitlines())} lines')
+    for engine, rate in results.items():
+        print(f'{engine:>6}: {rate:12,.0f} lines/s  ({rate / results["line"]:.2f}x)')
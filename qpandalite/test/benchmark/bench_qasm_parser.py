@@ -0,0 +1,79 @@
+"""Parsing throughput of the OpenQASM 2.0 parser engines.
+
+Parses every QASMBench circuit the parser supports (QASMBench.pkl, without
+transpiling) and a large random program, and reports the statements and
+circuits per second of every engine in ``parser_engines``:
+
+    python -m qpandalite.test.benchmark.bench_qasm_parser --gates 200000
+"""
+
+import argparse
+import pickle
+import random
+import time
+from pathlib import Path
+
+from qpandalite.circuit_builder.random_qasm import random_qasm
+from qpandalite.qasm.qasm_base_parser import OpenQASM2_BaseParser, parser_engines
+
+
+def load_qasmbench(path=Path(__file__).parent.parent / 'QASMBench.pkl') -> list:
+    """The QASMBench circuits the parser supports (no gate definitions or if statements)."""
+    with open(path, 'rb') as fp:
+        dataset = pickle.load(fp)
+
+    circuits = []
+    for circuit in dataset:
+        try:
+            OpenQASM2_BaseParser(engine='line').parse(circuit)
+        except Exception:
+            # gate definitions, if statements, whole-register arguments, ...
+            continue
+        circuits.append(circuit)
+    return circuits
+
+
+def make_program(n_gates: int, n_qubits: int = 20, seed: int = 0) -> str:
+    """A random program of ``n_gates`` gates followed by measurements."""
+    random.seed(seed)
+    return random_qasm(n_qubits, n_gates, measurements=True)
+
+
+def _count_statements(circuit: str) -> int:
+    parser = OpenQASM2_BaseParser(engine='line')
+    parser.parse(circuit)
+    return len(parser.program_body) + len(parser.measure_qubits)
+
+
+def benchmark(circuits: list, repeat: int = 3) -> dict:
+    """Best ``(statements/s, circuits/s)`` of every engine on ``circuits``."""
+    n_statements = sum(_count_statements(circuit) for circuit in circuits)
+    results = {}
+    for engine in parser_engines:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for circuit in circuits:
+                OpenQASM2_BaseParser(engine=engine).parse(circuit)
+            best = min(best, time.perf_counter() - start)
+        results[engine] = (n_statements / best, len(circuits) / best)
+    return results
+
+
+def _report(title: str, results: dict):
+    print(title)
+    for engine, (statements, circuits) in results.items():
+        speedup = statements / results['line'][0]
+        print(f'{engine:>6}: {statements:12,.0f} statements/s {circuits:10,.1f} circuits/s  ({speedup:.2f}x)')
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--gates', type=int, default=200000)
+    arg_parser.add_argument('--qubits', type=int, default=20)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    circuits = load_qasmbench()
+    _report(f'QASMBench: {len(circuits)} circuits', benchmark(circuits, args.repeat))
+    _report(f'Random program: {args.gates} gates', benchmark([make_program(args.gates, args.qubits)], args.repeat))
@@ -3,7 +3,7 @@
 import numpy as np
 import pytest
 
-from qpandalite.circuit_builder import Circuit
+from qpandalite.circuit_builder import Circuit, Parameters
 from qpandalite.simulator.originir_simulator import OriginIR_Simulator
 from qpandalite.algorithmics.ansatz import hea, qaoa_ansatz, uccsd_ansatz
 
@@ -109,3 +109,16 @@ class TestUCCSD:
         c = uccsd_ansatz(n_qubits=4, n_electrons=2, params=np.ones(5) * 0.1)
         sv = _statevector(c)
         assert abs(np.linalg.norm(sv) - 1.0) < 1e-10
+
+    def run_test_symbolic_template(self):
+        # a Parameters template bound to values simulates like the numeric ansatz
+        template = uccsd_ansatz(n_qubits=4, n_electrons=2, params=Parameters("t", size=5))
+        assert template.parameter_names == [f"t_{i}" for i in range(5)]
+        template.measure(0, 1, 2, 3)
+        rows = np.random.default_rng(3).uniform(-1, 1, size=(3, 5))
+        sim = OriginIR_Simulator(backend_type='statevector', least_qubit_remapping=False)
+        for program, row in zip(template.bind_batch(rows), rows):
+            c = uccsd_ansatz(n_qubits=4, n_electrons=2, params=row)
+            c.measure(0, 1, 2, 3)
+            np.testing.assert_allclose(sim.simulate_pmeasure(program), sim.simulate_pmeasure(c.originir),
+                                       atol=1e-10)
@@ -0,0 +1,109 @@
+"""
+Unit tests for the binary circuit format (qpandalite.circuit_builder.binary_format).
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from qpandalite.circuit_builder import (
+    Circuit,
+    Parameter,
+    is_binary_circuit,
+    opcodes_from_bytes,
+    opcodes_to_bytes,
+)
+from qpandalite.circuit_builder.random_originir import random_originir
+from qpandalite.originir.originir_base_parser import OriginIR_BaseParser
+
+
+def _sample_circuit():
+    c = Circuit()
+    c.h(0)
+    c.cnot(0, 1)
+    c.u3(2, 0.1, 0.2, 0.3)
+    with c.control(0, 1):
+        c.rx(2, 0.3)
+    with c.dagger():
+        c.s(2)
+        c.rphi(3, 0.4, 0.5)
+    c.barrier(0, 1, 2)
+    c.measure(3, 1, 2)
+    return c
+
+
+class TestRoundTrip:
+    """Encoding and decoding restores the circuit."""
+
+    def test_circuit_round_trip(self):
+        c = _sample_circuit()
+        restored = Circuit.from_bytes(c.to_bytes())
+        assert restored.opcode_list == c.opcode_list
+        assert restored.measure_list == c.measure_list
+        assert restored.used_qubit_list == c.used_qubit_list
+        assert restored.qubit_num == c.qubit_num
+        assert restored.cbit_num == c.cbit_num
+        assert restored.originir == c.originir
+
+    def test_random_programs(self):
+        random.seed(18)
+        for _ in range(20):
+            parser = OriginIR_BaseParser()
+            parser.parse(random_originir(5, 40, allow_dagger=True))
+            data = opcodes_to_bytes(parser.n_qubit, parser.n_cbit, parser.program_body)
+            decoded = opcodes_from_bytes(data)
+            assert decoded.opcodes == parser.program_body
+            assert decoded.qubit_num == parser.n_qubit
+
+    def test_complex_parameters(self):
+        matrix = np.array([[0, 1j], [1j, 0]])
+        kraus = [np.eye(2) * np.sqrt(0.9), np.array([[0, 1], [1, 0]]) * np.sqrt(0.1)]
+        opcodes = [
+            ("UNITARY", 0, None, matrix, False, None),
+            ("Kraus1Q", 1, None, kraus, False, None),
+            ("MEASURE", 1, 0, None, False, None),
+        ]
+        decoded = opcodes_from_bytes(opcodes_to_bytes(2, 1, opcodes))
+        np.testing.assert_array_equal(decoded.opcodes[0][3], matrix)
+        for restored, original in zip(decoded.opcodes[1][3], kraus):
+            np.testing.assert_array_equal(restored, original)
+        assert decoded.opcodes[2] == opcodes[2]
+
+    def test_bound_parameters(self):
+        theta = Parameter("theta")
+        c = Circuit()
+        c.rx(0, theta)
+        c.measure(0)
+        theta.bind(0.7)
+        decoded = opcodes_from_bytes(c.to_bytes())
+        assert decoded.opcodes[0][3] == pytest.approx(0.7)
+
+
+class TestInvalidInput:
+    """Inputs the format rejects."""
+
+    def test_is_binary_circuit(self):
+        assert is_binary_circuit(_sample_circuit().to_bytes())
+        assert not is_binary_circuit(_sample_circuit().originir)
+        assert not is_binary_circuit(b"QINIT 2")
+
+    def test_not_a_binary_circuit(self):
+        with pytest.raises(ValueError):
+            opcodes_from_bytes(b"QINIT 2\nCREG 2\n")
+
+    def test_unsupported_version(self):
+        data = bytearray(_sample_circuit().to_bytes())
+        data[4] = 99
+        with pytest.raises(ValueError):
+            opcodes_from_bytes(bytes(data))
+
+    def test_cbit_list(self):
+        with pytest.raises(ValueError):
+            opcodes_to_bytes(2, 2, [("MEASURE", [0, 1], [0, 1], None, False, None)])
+
+    def test_unbound_parameter(self):
+        c = Circuit()
+        c.rx(0, Parameter("theta"))
+        with pytest.raises(ValueError):
+            c.to_bytes()
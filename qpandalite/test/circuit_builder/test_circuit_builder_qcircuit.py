@@ -3,7 +3,8 @@ Comprehensive unit tests for qpandalite.circuit_builder.qcircuit.Circuit.
 """
 
 import pytest
-from qpandalite.circuit_builder import Circuit
+from qpandalite.circuit_builder import Circuit, Parameter
+from qpandalite.circuit_builder.opcode import make_header_originir, make_measure_originir, opcode_to_line_originir
 
 
 # =============================================================================
@@ -783,6 +784,112 @@ class TestOriginirQasmProperties:
         assert len(gate_lines) == 3
 
 
+# =============================================================================
+# TestTextCache
+# =============================================================================
+
+
+def _rendered_originir(c):
+    """originir rendered without the cache."""
+    lines = "\n".join(opcode_to_line_originir(op) for op in c.bound_opcode_list)
+    return make_header_originir(c.qubit_num, c.cbit_num) + lines + "\n" + make_measure_originir(c.measure_list)
+
+
+class TestTextCache:
+    """The cached originir / qasm text follows every change of the circuit."""
+
+    def test_repeated_access_returns_cached_text(self):
+        c = Circuit()
+        c.h(0)
+        c.measure(0)
+        assert c.originir is c.originir
+        assert c.qasm is c.qasm
+
+    def test_append_after_access(self):
+        c = Circuit()
+        c.h(0)
+        first = c.originir
+        c.cnot(0, 1)
+        with c.control(2):
+            c.x(1)
+        with c.dagger():
+            c.s(1)
+        c.measure(0, 1)
+        assert c.originir != first
+        assert c.originir == _rendered_originir(c)
+
+    def test_qasm_follows_qubit_num(self):
+        """Multi-controlled gates use workspace qubits above qubit_num."""
+        c = Circuit()
+        with c.control(0, 1, 2):
+            c.x(3)
+        before = c.qasm
+        c.h(6)
+        after = c.qasm
+        assert after != before
+        assert after == Circuit.from_bytes(c.to_bytes()).qasm
+
+    def test_replaced_or_shortened_opcode_list(self):
+        c = Circuit()
+        c.h(0)
+        c.x(1)
+        c.originir
+        c.opcode_list.pop()
+        assert "X q[1]" not in c.originir
+        c.opcode_list = [("Y", 0, None, None, False, None)]
+        assert c.originir == _rendered_originir(c)
+
+    def test_opcode_edited_in_place(self):
+        """originir and qasm agree after an opcode is replaced in place."""
+        c = Circuit()
+        c.h(0)
+        c.h(1)
+        c.measure(0, 1)
+        c.originir
+        c.qasm
+        c.opcode_list[1] = ("X", 1, None, None, False, None)
+        assert "X q[1]" in c.originir
+        assert "x q[1];" in c.qasm
+        assert c.originir == _rendered_originir(c)
+        c.opcode_list.insert(0, ("Y", 0, None, None, False, None))
+        assert c.originir == _rendered_originir(c)
+
+    def test_parameter_value_change(self):
+        theta = Parameter("theta")
+        c = Circuit()
+        c.rx(0, theta)
+        theta.bind(0.5)
+        first = c.originir
+        theta.bind(0.25)
+        assert c.originir != first
+        assert c.originir == _rendered_originir(c)
+
+    def test_parametric_append_renders_only_new_opcodes(self):
+        """Rendering evaluates the appended references; it does not compile the circuit."""
+        theta, phi = Parameter("theta"), Parameter("phi")
+        theta.bind(0.3)
+        phi.bind(-0.2)
+        c = Circuit()
+        for qubit in range(4):
+            c.rx(qubit, 2 * theta + phi)
+            c.u3(qubit, theta, 0.1, phi)
+            c.originir
+            c.qasm
+        assert c._parameter_table is None
+        assert c.originir == _rendered_originir(c)
+        assert "RX q[3], (0.3999" in c.originir
+
+    def test_remapping_renders_new_qubits(self):
+        c = Circuit()
+        c.cnot(0, 1)
+        c.measure(0, 1)
+        c.originir
+        remapped = c.remapping({0: 4, 1: 2})
+        assert remapped.originir == _rendered_originir(remapped)
+        assert "CNOT q[4], q[2]" in remapped.originir
+        assert c.originir == _rendered_originir(c)
+
+
 # =============================================================================
 # TestGateCombinations
 # =============================================================================
@@ -1133,3 +1240,73 @@ class TestQubitNumCbitNumTracking:
         c = Circuit()
         c.measure(0, 2)
         assert c.cbit_num == 2
+
+
+# =============================================================================
+# TestExtend
+# =============================================================================
+
+
+class TestExtend:
+    """Tests for the bulk extend() path and the qubit bookkeeping."""
+
+    def test_extend_records_targets(self):
+        """extend records the qubits add_gate records: the targets."""
+        c = Circuit()
+        c.extend([
+            ("H", 2, None, None, False, None),
+            ("CNOT", [2, 0], None, None, False, None),
+            ("RX", 1, None, 0.5, False, [4]),
+        ])
+        assert len(c.opcode_list) == 3
+        assert c.used_qubit_list == [2, 0, 1]
+        assert c.qubit_num == 3
+
+    def test_extend_applies_active_context(self):
+        c = Circuit()
+        with c.control(3):
+            with c.dagger():
+                c.extend([("S", 0, None, None, False, None)])
+        assert c.opcode_list == [("S", 0, None, None, True, [3])]
+
+    def test_add_circuit_matches_source(self):
+        src = Circuit()
+        src.h(0)
+        with src.control(1):
+            src.rx(2, 0.3)
+        dst = Circuit()
+        dst.add_circuit(src)
+        assert dst.opcode_list == src.opcode_list
+        # control() records its qubits when the block opens; add_circuit,
+        # like add_gate, records only the targets
+        assert dst.used_qubit_list == [0, 2]
+
+    def test_add_circuit_keeps_qubit_bookkeeping(self):
+        src = Circuit()
+        src.add_gate("H", 0, control_qubits=[3])
+        dst = Circuit()
+        dst.add_circuit(src)
+        assert dst.used_qubit_list == src.used_qubit_list == [0]
+        assert dst.qubit_num == src.qubit_num == 1
+
+    def test_add_circuit_registers_parameters(self):
+        theta = Parameter("theta")
+        src = Circuit()
+        src.rx(0, theta)
+        dst = Circuit()
+        dst.add_circuit(src)
+        assert dst.parameter_names == ["theta"]
+
+    def test_record_qubit_after_assignment(self):
+        c = Circuit()
+        c.used_qubit_list = [3, 1]
+        c.record_qubit([1, 3, 5])
+        assert c.used_qubit_list == [3, 1, 5]
+
+    def test_record_qubit_after_remapping(self):
+        c = Circuit()
+        c.cnot(0, 1)
+        remapped = c.remapping({0: 5, 1: 6})
+        remapped.h(0)
+        assert remapped.used_qubit_list == [5, 6, 0]
+        assert c.used_qubit_list == [0, 1]
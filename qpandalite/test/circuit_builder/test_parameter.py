@@ -4,14 +4,16 @@ Comprehensive unit tests for qpandalite.circuit_builder.parameter.
 Tests cover:
 - Parameter: creation, naming, symbolic expressions, binding
 - Parameters: array creation, indexing, batch binding
-- Parametric circuits: gates with symbolic parameters
+- Parametric circuits: gates with symbolic parameters, bind / bind_batch
 - Parameter evaluation and binding
 """
 
+import numpy as np
 import pytest
 import sympy as sp
-from qpandalite.circuit_builder.parameter import Parameter, Parameters
+from qpandalite.circuit_builder.parameter import Parameter, Parameters, compile_expressions
 from qpandalite.circuit_builder import Circuit
+from qpandalite.simulator import OriginIR_Simulator
 
 
 # =============================================================================
@@ -143,19 +145,190 @@ class TestParametricCircuit:
         """Circuit tracks parameters used in gates."""
         c = Circuit()
         theta = Parameter(name="theta")
-        # Add gate with parameter (Phase 2 feature - to be implemented)
-        # c.rx(0, theta)
-        # assert c.num_parameters == 1
-        # assert "theta" in c.parameter_names
+        c.rx(0, theta)
+        assert c.num_parameters == 1
+        assert "theta" in c.parameter_names
+        assert c.opcode_list[0][3] is theta
 
     def test_circuit_with_multiple_parameters(self):
         """Circuit can use multiple parameters."""
         c = Circuit()
         theta = Parameter(name="theta")
         phi = Parameter(name="phi")
-        # c.rx(0, theta)
-        # c.ry(1, phi)
-        # assert c.num_parameters == 2
+        c.rx(0, theta)
+        c.ry(1, phi)
+        c.u3(0, 0.1, theta * 2, sp.pi / 2)
+        assert c.num_parameters == 2
+        assert c.parameter_names == ["theta", "phi"]
+        assert c.opcode_list[2][3][2] == pytest.approx(np.pi / 2)
+
+    def test_expression_registers_its_parameters(self):
+        """Parameters used only inside expressions are tracked by name."""
+        alphas = Parameters(name="alpha", size=2)
+        c = Circuit()
+        c.rz(0, alphas[1] - alphas[0] / 2)
+        assert c.parameter_names == ["alpha_0", "alpha_1"]
+
+    def test_originir_uses_bound_values(self):
+        """Exports substitute bound values and reject unbound parameters."""
+        theta = Parameter(name="theta")
+        c = Circuit()
+        c.rx(0, 2 * theta)
+        with pytest.raises(ValueError, match="not bound"):
+            c.originir
+        c.parameters[0].bind(0.25)
+        assert "RX q[0], (0.5)" in c.originir
+
+    def test_expression_uses_the_parameter_object(self):
+        """A bound Parameter used only inside an expression keeps its value."""
+        theta = Parameter(name="theta")
+        theta.bind(0.3)
+        c = Circuit()
+        c.rx(0, 2 * theta)
+        assert c.parameters[0] is theta
+        assert "RX q[0], (0.6)" in c.originir
+        assert c.bound_opcode_list[0][3] == pytest.approx(0.6)
+        assert Circuit.from_bytes(c.to_bytes()).opcode_list[0][3] == pytest.approx(0.6)
+
+        # a copy of the circuit does not take over the name
+        c.copy()
+        d = Circuit()
+        d.ry(0, theta + 1)
+        assert d.parameters[0] is theta
+
+    def test_copy_binds_independently(self):
+        """Binding a copy leaves the original circuit unchanged."""
+        theta = Parameter(name="theta")
+        c = Circuit()
+        c.rx(0, theta)
+        c.parameters[0].bind(1.0)
+        d = c.copy()
+        d._parameters["theta"].bind(2.0)
+        assert c._parameters["theta"].evaluate() == 1.0
+        assert d.bound_opcode_list[0][3] == 2.0
+
+
+def _ansatz():
+    theta, phi = Parameter("theta"), Parameter("phi")
+    c = Circuit()
+    c.h(0)
+    c.rx(0, theta)
+    c.ry(1, 2 * theta + phi)
+    c.u3(2, theta, 0.1, phi)
+    c.cnot(0, 1)
+    with c.control(0):
+        c.rz(2, phi - theta)
+    c.measure(0, 1, 2)
+    return c
+
+
+def _fixed(theta, phi):
+    c = Circuit()
+    c.h(0)
+    c.rx(0, theta)
+    c.ry(1, 2 * theta + phi)
+    c.u3(2, theta, 0.1, phi)
+    c.cnot(0, 1)
+    with c.control(0):
+        c.rz(2, phi - theta)
+    c.measure(0, 1, 2)
+    return c
+
+
+class TestCircuitBind:
+    """Tests for Circuit.bind and Circuit.bind_batch."""
+
+    def test_bind_matches_fixed_circuit(self):
+        """A bound program simulates like the circuit built with the values."""
+        sim = OriginIR_Simulator()
+        program = _ansatz().bind({"theta": 0.3, "phi": -0.7})
+        expected = sim.simulate_pmeasure(_fixed(0.3, -0.7).originir)
+        assert np.allclose(sim.simulate_pmeasure(program), expected)
+        assert program.opcodes == _fixed(0.3, -0.7).opcode_list
+
+    def test_bind_batch(self):
+        """Every row of a matrix gives its own program."""
+        sim = OriginIR_Simulator()
+        c = _ansatz()
+        rows = np.random.default_rng(0).uniform(-np.pi, np.pi, size=(4, 2))
+        programs = c.bind_batch(rows)
+        assert len(programs) == 4
+        for program, (theta, phi) in zip(programs, rows):
+            expected = sim.simulate_pmeasure(_fixed(theta, phi).originir)
+            assert np.allclose(sim.simulate_pmeasure(program), expected)
+
+    def test_bind_does_not_change_circuit(self):
+        """Binding neither binds the parameters nor changes the opcodes."""
+        c = _ansatz()
+        opcodes = list(c.opcode_list)
+        c.bind([0.1, 0.2])
+        assert c.opcode_list == opcodes
+        assert not any(parameter.is_bound for parameter in c.parameters)
+
+    def test_bind_sequence_and_defaults(self):
+        """Sequences follow parameter_names; mappings fall back to bound values."""
+        c = _ansatz()
+        c._parameters["phi"].bind(0.2)
+        assert c.bind([0.1, 0.2]).opcodes == c.bind({"theta": 0.1}).opcodes
+
+    def test_opcode_edited_in_place(self):
+        """Replacing an opcode in place rebuilds the compiled program."""
+        c = _ansatz()
+        c.bind([0.1, 0.2])
+        c.opcode_list[0] = ("X", 0, None, None, False, None)
+        assert c.bind([0.1, 0.2]).opcodes[0][0] == "X"
+        for parameter in c.parameters:
+            parameter.bind(0.5)
+        c.opcode_list[0] = ("Y", 0, None, None, False, None)
+        assert c.bound_opcode_list[0][0] == "Y"
+        del c.opcode_list[0]
+        assert c.bind([0.1, 0.2]).opcodes == _fixed(0.1, 0.2).opcode_list[1:]
+
+    def test_bind_invalid_values(self):
+        """Wrong sizes and unknown names are rejected."""
+        c = _ansatz()
+        with pytest.raises(ValueError):
+            c.bind([0.1])
+        with pytest.raises(ValueError, match="Unknown"):
+            c.bind({"theta": 0.1, "gamma": 0.2})
+
+
+# =============================================================================
+# TestCompileExpressions
+# =============================================================================
+
+
+class TestCompileExpressions:
+    """Tests for compile_expressions."""
+
+    def test_matches_substitution(self):
+        """Compiled values equal sympy substitution, for single vectors and batches."""
+        theta, phi = Parameter("theta"), Parameter("phi")
+        expressions = [theta, 2 * theta - phi / 3, 1.5, sp.cos(phi.symbol) * theta.symbol, -phi]
+        f = compile_expressions(expressions, [theta, phi])
+        assert not f.affine
+        rows = np.random.default_rng(1).uniform(-2, 2, size=(6, 2))
+        values = f(rows)
+        assert values.shape == (6, 5)
+        for row, result in zip(rows, values):
+            subs = {theta.symbol: row[0], phi.symbol: row[1]}
+            expected = [float(sp.sympify(e if not isinstance(e, Parameter) else e.symbol).subs(subs))
+                        for e in expressions]
+            assert np.allclose(result, expected)
+        assert np.allclose(f(rows[0]), values[0])
+
+    def test_affine_expressions(self):
+        """Affine expressions compile to a coefficient matrix."""
+        alphas = Parameters("alpha", size=3)
+        f = compile_expressions([alphas[0] + alphas[2] * 2, sp.pi * alphas[1]], alphas.names)
+        assert f.affine
+        assert np.allclose(f([1.0, 2.0, 3.0]), [7.0, 2 * np.pi])
+
+    def test_unknown_parameter(self):
+        """Expressions may only use the listed parameters."""
+        theta, phi = Parameter("theta"), Parameter("phi")
+        with pytest.raises(ValueError, match="unknown"):
+            compile_expressions([theta + phi], [theta])
 
 
 # =============================================================================
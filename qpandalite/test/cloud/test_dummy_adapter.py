@@ -128,6 +128,41 @@ class TestDummyAdapter:
         assert result["status"] == "success"
         assert len(result["result"]) == 2
 
+    @pytest.mark.skipif(
+        not HAS_CPP_BACKEND,
+        reason="Cannot run simulation (qpandalite_cpp not available)"
+    )
+    @pytest.mark.parametrize("pool,max_workers", [("thread", 1), ("thread", 4), ("process", 2)])
+    def test_submit_batch_workers(self, pool, max_workers):
+        """Test that worker pools give the results of serial submission."""
+        from qpandalite.task.adapters.dummy_adapter import DummyAdapter
+
+        circuits = [
+            f"QINIT 2\nCREG 2\nRX q[0], ({0.1 * i})\nCNOT q[0], q[1]\nMEASURE q[0], c[0]\nMEASURE q[1], c[1]"
+            for i in range(12)
+        ]
+        circuits.append(circuits[0])
+        circuits.append("QINIT 2\nCREG 2\nNOT_A_GATE q[0]")
+
+        serial = DummyAdapter()
+        expected = [serial.query(serial.submit(c, shots=100)) for c in circuits]
+
+        adapter = DummyAdapter(max_workers=max_workers, pool=pool)
+        task_ids = adapter.submit_batch(circuits, shots=100)
+
+        assert task_ids == [serial._generate_task_id(c) for c in circuits]
+        assert task_ids[0] == task_ids[-2]
+        for task_id, result in zip(task_ids, expected):
+            assert adapter.query(task_id) == result
+        assert expected[-1]["status"] == "failed"
+
+    def test_invalid_pool(self):
+        """Test that an unknown pool kind is rejected."""
+        from qpandalite.task.adapters.dummy_adapter import DummyAdapter
+
+        with pytest.raises(ValueError):
+            DummyAdapter(pool="fiber")
+
     def test_clear_cache(self, adapter):
         """Test clearing the cache."""
         circuit = "QINIT 2\nCREG 2\nH q[0]\nMEASURE q[0], c[0]"
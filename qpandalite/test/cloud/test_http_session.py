@@ -0,0 +1,160 @@
+"""Tests for qpandalite.http_session.
+
+Requests are answered by a scripted transport adapter mounted on the
+session, so no network access is needed.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from qpandalite.http_session import (
+    HTTPSession,
+    HTTPSessionConfig,
+    RequestMetrics,
+    close_http_sessions,
+    get_http_session,
+)
+
+
+class _ScriptedAdapter(BaseAdapter):
+    """Transport adapter returning scripted statuses or raising exceptions."""
+
+    def __init__(self, outcomes):
+        super().__init__()
+        self.outcomes = list(outcomes)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append((request, kwargs))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        status, headers = outcome if isinstance(outcome, tuple) else (outcome, {})
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response.url = request.url
+        response.request = request
+        response._content = b"{}"
+        return response
+
+    def close(self):
+        pass
+
+
+def _session(outcomes, **config):
+    session = HTTPSession(HTTPSessionConfig(backoff_factor=0.001, **config))
+    adapter = _ScriptedAdapter(outcomes)
+    session.session.mount("https://", adapter)
+    return session, adapter
+
+
+class TestRetries:
+    """Retry policy of HTTPSession.request."""
+
+    def test_retries_transient_status(self):
+        session, adapter = _session([503, 502, 200])
+        response = session.get("https://api.example.com/tasks/1")
+        assert response.status_code == 200
+        assert len(adapter.requests) == 3
+
+    def test_retries_connection_error(self):
+        session, adapter = _session([requests.ConnectionError("reset"), 200])
+        assert session.get("https://api.example.com/").status_code == 200
+        assert len(adapter.requests) == 2
+
+    def test_gives_up_after_max_retries(self):
+        session, adapter = _session([500, 500, 500], max_retries=2)
+        assert session.get("https://api.example.com/").status_code == 500
+        assert len(adapter.requests) == 3
+
+        session, adapter = _session([requests.Timeout("slow")] * 2, max_retries=1)
+        with pytest.raises(requests.Timeout):
+            session.get("https://api.example.com/")
+
+    def test_post_is_not_retried(self):
+        session, adapter = _session([503, 200])
+        assert session.post("https://api.example.com/submit").status_code == 503
+        assert len(adapter.requests) == 1
+        session, adapter = _session([503, 200])
+        assert session.post("https://api.example.com/submit", retries=1).status_code == 200
+
+    def test_client_error_is_not_retried(self):
+        session, adapter = _session([404])
+        assert session.get("https://api.example.com/").status_code == 404
+        assert len(adapter.requests) == 1
+
+    def test_retry_delay(self):
+        session = HTTPSession(HTTPSessionConfig(backoff_factor=1.0, backoff_max=5.0, jitter=0.5))
+        for retry in range(5):
+            delay = session._retry_delay(retry, None)
+            limit = min(2 ** retry, 5.0)
+            assert limit * 0.5 <= delay <= limit
+
+        response = requests.Response()
+        response.headers["Retry-After"] = "3"
+        assert session._retry_delay(0, response) == 3.0
+
+    def test_timeout_and_proxies(self):
+        proxies = {"https": "http://proxy.example.com:8080"}
+        session, adapter = _session([200, 200], connect_timeout=2.0, read_timeout=7.0, proxies=proxies)
+        session.get("https://api.example.com/")
+        _, kwargs = adapter.requests[0]
+        assert kwargs["timeout"] == (2.0, 7.0)
+        assert kwargs["proxies"]["https"] == proxies["https"]
+
+        session.get("https://api.example.com/", timeout=1.0)
+        assert adapter.requests[1][1]["timeout"] == 1.0
+
+
+class TestMetrics:
+    """Latency metrics recorded by the session."""
+
+    def test_records_attempts_per_host(self):
+        session, _ = _session([503, 200, 200])
+        session.get("https://a.example.com/x")
+        session.get("https://a.example.com/y")
+        summary = session.metrics.summary()["a.example.com"]
+        assert summary["requests"] == 3
+        assert summary["errors"] == 1
+        assert summary["retries"] == 1
+        assert 0 <= summary["p50_ms"] <= summary["p95_ms"] <= summary["max_ms"]
+
+    def test_percentiles(self):
+        metrics = RequestMetrics()
+        for ms in range(1, 101):
+            metrics.record("host", ms / 1000)
+        summary = metrics.summary()["host"]
+        assert summary["p50_ms"] == pytest.approx(51)
+        assert summary["p95_ms"] == pytest.approx(96)
+        assert summary["mean_ms"] == pytest.approx(50.5)
+        metrics.reset()
+        assert metrics.summary() == {}
+
+
+class TestSharedSessions:
+    """get_http_session / close_http_sessions."""
+
+    def teardown_method(self):
+        close_http_sessions()
+
+    def test_shared_per_name(self):
+        assert get_http_session("quafu") is get_http_session("quafu")
+        assert get_http_session("quafu") is not get_http_session("originq")
+
+        config = HTTPSessionConfig(pool_maxsize=32)
+        session = get_http_session("quafu", config)
+        assert session.config is config
+        assert get_http_session("quafu") is session
+
+    def test_ibm_proxy_from_config(self):
+        proxies = {"https": "http://proxy.example.com:8080"}
+        with patch("qpandalite.network_utils.get_ibm_proxy_from_config", return_value=proxies):
+            assert get_http_session("ibm").config.proxies == proxies
+
+    def test_ibm_without_config(self):
+        with patch("qpandalite.network_utils.get_ibm_proxy_from_config", side_effect=FileNotFoundError):
+            assert get_http_session("ibm").config.proxies is None
@@ -205,11 +205,10 @@ class TestTestIbmConnectivity(unittest.TestCase):
         os.environ["IBM_TOKEN"] = "env_token_123"
 
         # Mock the actual HTTP request to avoid network calls
-        with patch("urllib.request.OpenerDirector.open") as mock_open:
-            mock_response = MagicMock()
-            mock_response.getcode.return_value = 200
-            mock_open.return_value.__enter__ = MagicMock(return_value=mock_response)
-            mock_open.return_value.__exit__ = MagicMock(return_value=False)
+        with patch("qpandalite.http_session.HTTPSession.request") as mock_request:
+            mock_response = MagicMock(status_code=200)
+            mock_response.__enter__.return_value = mock_response
+            mock_request.return_value = mock_response
 
             result = test_ibm_connectivity()
 
@@ -230,11 +229,10 @@ class TestTestIbmConnectivity(unittest.TestCase):
 
     def test_with_string_proxy(self):
         """Test with string proxy configuration."""
-        with patch("urllib.request.OpenerDirector.open") as mock_open:
-            mock_response = MagicMock()
-            mock_response.getcode.return_value = 200
-            mock_open.return_value.__enter__ = MagicMock(return_value=mock_response)
-            mock_open.return_value.__exit__ = MagicMock(return_value=False)
+        with patch("qpandalite.http_session.HTTPSession.request") as mock_request:
+            mock_response = MagicMock(status_code=200)
+            mock_response.__enter__.return_value = mock_response
+            mock_request.return_value = mock_response
 
             result = test_ibm_connectivity(
                 token="test_token",
@@ -244,10 +242,31 @@ class TestTestIbmConnectivity(unittest.TestCase):
             # String proxy should be converted to dict
             self.assertIsNotNone(result["proxy_used"])
 
+    def test_without_proxy_ignores_ibm_config_proxy(self):
+        """proxy=None uses the system proxy, not the proxy of the IBM session."""
+        from qpandalite.http_session import close_http_sessions
+
+        config_proxy = {"https": "http://config-proxy.example.com:8080"}
+        close_http_sessions()
+        try:
+            with patch("qpandalite.network_utils.get_ibm_proxy_from_config", return_value=config_proxy), \
+                    patch("qpandalite.network_utils.detect_system_proxy", return_value={}), \
+                    patch("requests.Session.request") as mock_request:
+                mock_response = MagicMock(status_code=200)
+                mock_response.__enter__.return_value = mock_response
+                mock_request.return_value = mock_response
+                result = test_ibm_connectivity(token="test_token")
+        finally:
+            close_http_sessions()
+
+        self.assertTrue(result["success"])
+        self.assertEqual(mock_request.call_args.kwargs["proxies"], {})
+        self.assertIsNone(result["proxy_used"])
+
     def test_connectivity_failure(self):
         """Test handling of connection failure."""
-        with patch("urllib.request.OpenerDirector.open") as mock_open:
-            mock_open.side_effect = Exception("Connection refused")
+        with patch("qpandalite.http_session.HTTPSession.request") as mock_request:
+            mock_request.side_effect = Exception("Connection refused")
 
             result = test_ibm_connectivity(token="test_token")
 
@@ -270,11 +289,10 @@ class TestIntegration(unittest.TestCase):
             self.assertEqual(proxies["https"], "http://proxy.example.com:8080")
 
             # Test IBM connectivity with detected proxy
-            with patch("urllib.request.OpenerDirector.open") as mock_open:
-                mock_response = MagicMock()
-                mock_response.getcode.return_value = 200
-                mock_open.return_value.__enter__ = MagicMock(return_value=mock_response)
-                mock_open.return_value.__exit__ = MagicMock(return_value=False)
+            with patch("qpandalite.http_session.HTTPSession.request") as mock_request:
+                mock_response = MagicMock(status_code=200)
+                mock_response.__enter__.return_value = mock_response
+                mock_request.return_value = mock_response
 
                 result = test_ibm_connectivity(proxy=proxies)
                 self.assertTrue(result["success"])
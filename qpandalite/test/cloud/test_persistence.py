@@ -220,3 +220,105 @@ class TestTaskPersistence:
 
         assert "submit_time" in record
         assert "update_time" in record
+
+
+class TestTaskPersistenceIndex:
+    """Tests for append-only updates, the offset index and compaction."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @staticmethod
+    def _lines(persistence):
+        with open(persistence.tasks_file) as f:
+            return [json.loads(line) for line in f]
+
+    def test_update_appends(self, temp_dir):
+        """Updates and deletes append a line instead of rewriting the file."""
+        persistence = TaskPersistence(cache_dir=temp_dir)
+        persistence.save("task-1", "originq", "running")
+        persistence.update("task-1", status="success")
+        persistence.delete("task-1")
+
+        lines = self._lines(persistence)
+        assert [line.get("status") for line in lines] == ["running", "success", None]
+        assert lines[-1]["_deleted"] is True
+        assert persistence.load("task-1") is None
+        assert persistence.count() == 0
+
+    def test_list_keeps_first_save_order(self, temp_dir):
+        """An updated task keeps its position in list_all."""
+        persistence = TaskPersistence(cache_dir=temp_dir)
+        for i in range(3):
+            persistence.save(f"task-{i}", "originq", "running")
+        persistence.update("task-0", status="success")
+
+        assert [r["task_id"] for r in persistence.list_all()] == ["task-2", "task-1", "task-0"]
+
+    def test_compaction(self, temp_dir):
+        """Superseded lines are dropped once they exceed the threshold."""
+        persistence = TaskPersistence(cache_dir=temp_dir, compact_threshold=10, background_compaction=False)
+        persistence.save("task-1", "originq", "running")
+        persistence.save("task-2", "quafu", "running")
+        for i in range(12):
+            persistence.update("task-1", step=i)
+
+        assert len(self._lines(persistence)) < 14
+        assert persistence.load("task-1")["step"] == 11
+        persistence.compact()
+        assert [line["task_id"] for line in self._lines(persistence)] == ["task-1", "task-2"]
+
+    def test_background_compaction(self, temp_dir):
+        """close() waits for a compaction started in the background."""
+        persistence = TaskPersistence(cache_dir=temp_dir, compact_threshold=5)
+        persistence.save("task-1", "originq", "running")
+        for i in range(8):
+            persistence.update("task-1", step=i)
+        persistence.close()
+
+        assert len(self._lines(persistence)) <= 3
+        assert persistence.load("task-1")["step"] == 7
+
+    def test_index_sidecar_reused(self, temp_dir):
+        """A new instance starts from the sidecar and reads appended lines."""
+        persistence = TaskPersistence(cache_dir=temp_dir)
+        persistence.save("task-1", "originq", "success")
+        persistence.save("task-2", "quafu", "running")
+        persistence.close()
+        assert persistence.index_file.exists()
+
+        # appended by another process after the sidecar was written
+        with open(persistence.tasks_file, "a") as f:
+            f.write(json.dumps({"task_id": "task-3", "platform": "ibm", "status": "success"}) + "\n")
+
+        reopened = TaskPersistence(cache_dir=temp_dir)
+        assert reopened.count() == 3
+        assert reopened.count(status="success") == 2
+        assert reopened.load("task-3")["platform"] == "ibm"
+
+    def test_stale_sidecar_ignored(self, temp_dir):
+        """A sidecar describing another file is rebuilt from the file."""
+        persistence = TaskPersistence(cache_dir=temp_dir)
+        persistence.save("task-1", "originq", "success")
+        persistence.close()
+
+        persistence.tasks_file.unlink()
+        with open(persistence.tasks_file, "w") as f:
+            f.write(json.dumps({"task_id": "other", "platform": "quafu", "status": "running"}) + "\n")
+
+        reopened = TaskPersistence(cache_dir=temp_dir)
+        assert [r["task_id"] for r in reopened.list_all()] == ["other"]
+
+    def test_external_writer_seen(self, temp_dir):
+        """Two instances sharing the file see each other's writes."""
+        first = TaskPersistence(cache_dir=temp_dir)
+        second = TaskPersistence(cache_dir=temp_dir)
+        first.save("task-1", "originq", "running")
+        assert second.load("task-1")["status"] == "running"
+        second.update("task-1", status="success")
+        assert first.load("task-1")["status"] == "success"
+        first.compact()
+        assert second.list_all()[0]["status"] == "success"
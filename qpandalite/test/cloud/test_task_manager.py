@@ -32,6 +32,10 @@ from qpandalite.task_manager import (
     list_tasks,
     clear_completed_tasks,
     clear_cache,
+    JSONTaskStore,
+    SQLiteTaskStore,
+    TaskStore,
+    get_task_store,
 )
 from qpandalite.exceptions import (
     AuthenticationError,
@@ -184,8 +188,8 @@ class TestCacheManagement:
         """Test save_task function."""
         save_task(sample_task_info, temp_cache_dir)
 
-        loaded = _load_tasks_cache(temp_cache_dir)
-        assert "test-task-123" in loaded
+        loaded = get_task_store(temp_cache_dir).list()
+        assert [task.task_id for task in loaded] == ["test-task-123"]
 
     def test_get_task_found(self, sample_task_info: TaskInfo, temp_cache_dir: Path):
         """Test get_task when task exists."""
@@ -258,6 +262,105 @@ class TestCacheManagement:
         assert not cache_file.exists()
 
 
+# =============================================================================
+# Test Task Stores
+# =============================================================================
+
+class TestTaskStore:
+    """Tests for the SQLite and JSON task stores."""
+
+    def test_default_store_is_sqlite(self, temp_cache_dir: Path):
+        """The default store keeps tasks in tasks.db."""
+        store = get_task_store(temp_cache_dir)
+        assert isinstance(store, SQLiteTaskStore)
+        assert store is get_task_store(temp_cache_dir)
+        assert (temp_cache_dir / "tasks.db").exists()
+
+    def test_json_store_selected_by_env(self, temp_cache_dir: Path, sample_task_info: TaskInfo):
+        """QPANDALITE_TASK_STORE=json selects the legacy tasks.json store."""
+        with patch.dict("os.environ", {"QPANDALITE_TASK_STORE": "json"}):
+            assert isinstance(get_task_store(temp_cache_dir), JSONTaskStore)
+            save_task(sample_task_info, temp_cache_dir)
+        assert "test-task-123" in _load_tasks_cache(temp_cache_dir)
+
+    def test_unknown_store(self, temp_cache_dir: Path):
+        """An unregistered store name raises ValueError."""
+        with pytest.raises(ValueError):
+            get_task_store(temp_cache_dir, kind="redis")
+
+    def test_incomplete_store(self):
+        """A store missing an abstract method cannot be instantiated."""
+        class GetOnlyStore(TaskStore):
+            def get(self, task_id):
+                return None
+
+        with pytest.raises(TypeError):
+            GetOnlyStore()
+
+    def test_upsert_keeps_order(self, temp_cache_dir: Path):
+        """Updating a task replaces it in place."""
+        store = SQLiteTaskStore(temp_cache_dir)
+        for i in range(3):
+            store.put(TaskInfo(task_id=f"task-{i}", backend="quafu", status=TaskStatus.RUNNING))
+        store.put(TaskInfo(task_id="task-0", backend="quafu", status=TaskStatus.SUCCESS,
+                           result={"counts": {"0": 10}}))
+
+        tasks = store.list()
+        assert [task.task_id for task in tasks] == ["task-0", "task-1", "task-2"]
+        assert tasks[0].status == TaskStatus.SUCCESS
+        assert tasks[0].result == {"counts": {"0": 10}}
+        assert [task.task_id for task in store.list(status=TaskStatus.RUNNING)] == ["task-1", "task-2"]
+
+    def test_filter_by_status_and_backend(self, temp_cache_dir: Path):
+        """Both filters apply together."""
+        store = SQLiteTaskStore(temp_cache_dir)
+        store.put_many([
+            TaskInfo(task_id="a", backend="quafu", status=TaskStatus.SUCCESS),
+            TaskInfo(task_id="b", backend="originq", status=TaskStatus.SUCCESS),
+            TaskInfo(task_id="c", backend="quafu", status=TaskStatus.RUNNING),
+        ])
+        tasks = store.list(status="success", backend="quafu")
+        assert [task.task_id for task in tasks] == ["a"]
+
+    def test_migrate_json_cache(self, temp_cache_dir: Path):
+        """An existing tasks.json is imported and renamed."""
+        _save_tasks_cache({
+            "task-1": TaskInfo(task_id="task-1", backend="quafu", status="success").to_dict(),
+            "task-2": TaskInfo(task_id="task-2", backend="ibm").to_dict(),
+        }, temp_cache_dir)
+
+        store = SQLiteTaskStore(temp_cache_dir)
+        assert store.get("task-1").status == "success"
+        assert store.get("task-2").backend == "ibm"
+        assert not (temp_cache_dir / "tasks.json").exists()
+        assert (temp_cache_dir / "tasks.json.migrated").exists()
+
+    def test_migration_keeps_newer_rows(self, temp_cache_dir: Path):
+        """Tasks already in the database are not overwritten by the JSON cache."""
+        store = SQLiteTaskStore(temp_cache_dir)
+        store.put(TaskInfo(task_id="task-1", backend="quafu", status=TaskStatus.SUCCESS))
+        _save_tasks_cache({"task-1": TaskInfo(task_id="task-1", backend="quafu").to_dict()}, temp_cache_dir)
+
+        assert SQLiteTaskStore(temp_cache_dir).get("task-1").status == "success"
+
+    def test_concurrent_writers(self, temp_cache_dir: Path):
+        """Writes from several threads are all kept."""
+        import threading
+
+        store = SQLiteTaskStore(temp_cache_dir)
+
+        def write(worker: int) -> None:
+            for i in range(25):
+                store.put(TaskInfo(task_id=f"task-{worker}-{i}", backend="quafu"))
+
+        threads = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(store.list()) == 100
+
+
 # =============================================================================
 # Test Error Mapping
 # =============================================================================
@@ -465,6 +568,174 @@ class TestWaitForResult:
                 wait_for_result("task-1", backend="quafu", timeout=0.1, poll_interval=0.05)
 
 
+class _ScriptedBackend:
+    """Backend whose tasks succeed after a given number of queries."""
+
+    def __init__(self, polls_until_done: dict, failed=(), batch=True):
+        self.remaining = dict(polls_until_done)
+        self.failed = set(failed)
+        self.queries = []
+        self.batch_queries = []
+        self.query_batch_per_task = batch
+        if not batch:
+            self.query_batch = MagicMock(side_effect=NotImplementedError)
+
+    def _status(self, task_id):
+        if self.remaining[task_id] > 0:
+            self.remaining[task_id] -= 1
+            return {"status": "running"}
+        if task_id in self.failed:
+            return {"status": "failed"}
+        return {"status": "success", "result": {"counts": {task_id: 1}}}
+
+    def query(self, task_id):
+        self.queries.append(task_id)
+        return self._status(task_id)
+
+    def query_batch(self, task_ids):
+        self.batch_queries.append(list(task_ids))
+        results = [self._status(task_id) for task_id in task_ids]
+        if all(r["status"] == "success" for r in results):
+            return {"status": "success", "result": [r["result"] for r in results]}
+        return {"status": "running", "result": []}
+
+
+class TestWaitForResults:
+    """Tests for the concurrent wait_for_results / iter_results."""
+
+    def _cache(self, temp_cache_dir: Path, task_ids, backend="quafu"):
+        for task_id in task_ids:
+            save_task(TaskInfo(task_id=task_id, backend=backend, shots=100), cache_dir=temp_cache_dir)
+
+    def test_yields_in_order_of_completion(self, temp_cache_dir: Path):
+        from qpandalite.task_manager import iter_results
+
+        self._cache(temp_cache_dir, ["a", "b", "c"])
+        backend = _ScriptedBackend({"a": 3, "b": 0, "c": 1})
+        with patch("qpandalite.task_manager.backend_module.get_backend", return_value=backend):
+            results = list(iter_results(["a", "b", "c"], poll_interval=0.01, cache_dir=temp_cache_dir))
+
+        assert [task_id for task_id, _ in results] == ["b", "c", "a"]
+        assert results[0][1] == {"counts": {"b": 1}}
+        # Results are written back to the cache, keeping the submission info
+        cached = get_task("a", cache_dir=temp_cache_dir)
+        assert cached.status == TaskStatus.SUCCESS
+        assert cached.shots == 100
+
+    def test_batch_query_completes_group(self, temp_cache_dir: Path):
+        from qpandalite.task_manager import iter_results
+
+        self._cache(temp_cache_dir, ["a", "b"])
+        backend = _ScriptedBackend({"a": 0, "b": 0})
+        with patch("qpandalite.task_manager.backend_module.get_backend", return_value=backend):
+            results = dict(iter_results(["a", "b"], cache_dir=temp_cache_dir))
+
+        assert results == {"a": {"counts": {"a": 1}}, "b": {"counts": {"b": 1}}}
+        assert backend.batch_queries == [["a", "b"]]
+        assert backend.queries == []
+
+    def test_merged_batch_results_are_not_used(self, temp_cache_dir: Path):
+        from qpandalite.task_manager import iter_results
+
+        self._cache(temp_cache_dir, ["a", "b"])
+        backend = _ScriptedBackend({"a": 0, "b": 0})
+        # Merges the results of all tasks, as the OriginQ and IBM adapters do
+        backend.query_batch_per_task = False
+        with patch("qpandalite.task_manager.backend_module.get_backend", return_value=backend):
+            results = dict(iter_results(["a", "b"], cache_dir=temp_cache_dir))
+
+        assert results == {"a": {"counts": {"a": 1}}, "b": {"counts": {"b": 1}}}
+        assert backend.batch_queries == []
+        assert sorted(backend.queries) == ["a", "b"]
+
+    def test_query_batch_capability_of_adapters(self):
+        from qpandalite.task.adapters.base import QuantumAdapter
+        from qpandalite.task.adapters.dummy_adapter import DummyAdapter
+
+        assert QuantumAdapter.query_batch_per_task is False
+        assert DummyAdapter.query_batch_per_task is True
+
+    def test_without_batch_query(self, temp_cache_dir: Path):
+        from qpandalite.task_manager import iter_results
+
+        self._cache(temp_cache_dir, ["a", "b"])
+        backend = _ScriptedBackend({"a": 1, "b": 0}, batch=False)
+        with patch("qpandalite.task_manager.backend_module.get_backend", return_value=backend):
+            results = dict(iter_results(["a", "b"], poll_interval=0.01, cache_dir=temp_cache_dir))
+
+        assert set(results) == {"a", "b"}
+        assert backend.queries.count("a") == 2
+
+    def test_backoff(self, temp_cache_dir: Path):
+        from qpandalite.task_manager import iter_results
+
+        self._cache(temp_cache_dir, ["a"])
+        backend = _ScriptedBackend({"a": 5})
+        times = []
+        query = backend.query
+        backend.query = lambda task_id: times.append(time.monotonic()) or query(task_id)
+        with patch("qpandalite.task_manager.backend_module.get_backend", return_value=backend):
+            list(iter_results(
+                ["a"], poll_interval=0.01, max_poll_interval=0.08, backoff=2.0, cache_dir=temp_cache_dir,
+            ))
+
+        gaps = [t2 - t1 for t1, t2 in zip(times, times[1:])]
+        assert len(gaps) == 5
+        assert gaps[0] < 0.04
+        assert gaps[-1] >= 0.07
+
+    def test_failure(self, temp_cache_dir: Path):
+        from qpandalite.task_manager import iter_results
+
+        self._cache(temp_cache_dir, ["a", "b"])
+        backend = _ScriptedBackend({"a": 0, "b": 1}, failed={"a"})
+        with patch("qpandalite.task_manager.backend_module.get_backend", return_value=backend):
+            with pytest.raises(TaskFailedError):
+                list(iter_results(["a", "b"], poll_interval=0.01, cache_dir=temp_cache_dir))
+
+        backend = _ScriptedBackend({"a": 0, "b": 1}, failed={"a"})
+        with patch("qpandalite.task_manager.backend_module.get_backend", return_value=backend):
+            results = dict(iter_results(
+                ["a", "b"], poll_interval=0.01, raise_on_failure=False, cache_dir=temp_cache_dir,
+            ))
+        assert results == {"a": None, "b": {"counts": {"b": 1}}}
+
+    def test_timeout(self, temp_cache_dir: Path):
+        from qpandalite.task_manager import iter_results
+
+        self._cache(temp_cache_dir, ["a", "b"])
+        backend = _ScriptedBackend({"a": 0, "b": 10**6})
+        with patch("qpandalite.task_manager.backend_module.get_backend", return_value=backend):
+            results = iter_results(["a", "b"], timeout=0.1, poll_interval=0.02, cache_dir=temp_cache_dir)
+            with pytest.raises(TaskTimeoutError):
+                for task_id, _ in results:
+                    assert task_id == "a"
+
+    def test_dummy_and_unknown_tasks(self, temp_cache_dir: Path):
+        from qpandalite.task_manager import iter_results
+
+        save_task(
+            TaskInfo(task_id="d", backend="dummy:originq", status=TaskStatus.SUCCESS, result={"counts": {}}),
+            cache_dir=temp_cache_dir,
+        )
+        assert list(iter_results(["d"], cache_dir=temp_cache_dir)) == [("d", {"counts": {}})]
+        with pytest.raises(TaskNotFoundError):
+            list(iter_results(["missing"], cache_dir=temp_cache_dir))
+
+    def test_async_iteration(self, temp_cache_dir: Path):
+        import asyncio
+
+        self._cache(temp_cache_dir, ["a", "b"])
+        backend = _ScriptedBackend({"a": 1, "b": 2})
+        manager = TaskManager(cache_dir=temp_cache_dir)
+
+        async def collect():
+            return [task_id async for task_id, _ in manager.wait_for_results(["a", "b"], poll_interval=0.01)]
+
+        with patch("qpandalite.task_manager.backend_module.get_backend", return_value=backend):
+            assert asyncio.run(collect()) == ["a", "b"]
+
+
 # =============================================================================
 # Test submit_batch with mocks
 # =============================================================================
@@ -488,6 +759,31 @@ class TestSubmitBatch:
         adapter = _get_adapter("ibm")
         assert adapter is not None
 
+    def test_dummy_batch_single_store_write(self, temp_cache_dir: Path):
+        """Test that a dummy batch is written to the task store at once."""
+        from qpandalite.circuit_builder import Circuit
+        from qpandalite.task_manager import submit_batch
+
+        circuits = []
+        for i in range(5):
+            c = Circuit()
+            c.rx(0, 0.1 * i)
+            c.measure(0)
+            circuits.append(c)
+
+        with patch("qpandalite.task_manager.DEFAULT_CACHE_DIR", temp_cache_dir):
+            store = get_task_store()
+            with patch.object(store, "put", wraps=store.put) as put, \
+                    patch.object(store, "put_many", wraps=store.put_many) as put_many:
+                task_ids = submit_batch(circuits, "originq", shots=100, dummy=True, max_workers=2)
+            tasks = {task.task_id: task for task in store.list()}
+
+        assert put.call_count == 0
+        assert put_many.call_count == 1
+        assert set(tasks) == set(task_ids)
+        assert all(task.status == TaskStatus.SUCCESS for task in tasks.values())
+        assert all(task.backend == "dummy:originq" for task in tasks.values())
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,3 +1,6 @@
+import tempfile
+from pathlib import Path
+
 from qpandalite.originir import OriginIR_BaseParser
 import qpandalite.simulator as qsim
 import numpy as np
@@ -40,5 +43,105 @@ def run_test_originir_parser():
         print(f'Test {i+1} passed.')
 
 
+_block_program = """QINIT 5
+CREG 3
+H q[0]
+CONTROL q[3], q[4]
+RX q[0], (0.5) dagger
+DAGGER
+CNOT  q [ 1 ] , q[2] controlled_by (q[0])
+DAGGER
+U3 q[1], ( -1.5, 2e-3 , 3. ) dagger
+ENDDAGGER
+
+ZZ q[0], q[1], (0.25)
+BARRIER q[0], q[1], q[2]
+BARRIER q[1] dagger
+ENDDAGGER
+ENDCONTROL q[3]
+Depolarizing q[2], (0.01)
+ENDCONTROL q[4]
+UU15 q[0], q[1], (1,2,3,4,5,6,7,8,9,10,11,12,13,14,15)
+MEASURE q[0], c[0]
+MEASURE q[2], c[2]"""
+
+_invalid_programs = {
+    "QINIT 2\nCREG 1\nFOO q[0]": NotImplementedError,
+    "QINIT 2\nCREG 1\nRX q[0]": RuntimeError,
+    "QINIT 2\nCREG 1\nH q[0], q[1]": RuntimeError,
+    "QINIT 2\nCREG 1\nCNOT q[0], q[1], (0.5)": RuntimeError,
+    "QINIT 2\nCREG 1\nH q[2]": ValueError,
+    "QINIT 2\nCREG 1\nMEASURE q[0], c[1]": ValueError,
+    "QINIT 2\nCREG 1\nCONTROL q[0]\nX q[0]\nENDCONTROL q[0]": ValueError,
+    "QINIT 2\nCREG 1\nX q[1] controlled_by (q[1])": ValueError,
+    "QINIT 2\nCREG 1\nDAGGER\nMEASURE q[0], c[0]\nENDDAGGER": ValueError,
+    "QINIT 2\nCREG 1\nENDDAGGER": ValueError,
+    "QINIT 2\nCREG 1\nCONTROL q[0]\nX q[1]": ValueError,
+    "QINIT 2\nCREG 1\nDEF foo(q[0]) ()\nH q[0]\nENDDEF": ValueError,
+    "QINIT 2\nCREG 1\nDEF": ValueError,
+}
+
+
+@qpandalite_test('Test OriginIR Parser Engines')
+def run_test_parser_engines():
+    # The fast engine produces exactly the output of the line-by-line engine
+    programs = [_block_program] + [random_originir(6, 200) for _ in range(20)]
+    for program in programs:
+        fast, line = OriginIR_BaseParser(engine='fast'), OriginIR_BaseParser(engine='line')
+        fast.parse(program)
+        line.parse(program)
+        if fast.program_body != line.program_body or fast.measure_qubits != line.measure_qubits:
+            raise NotMatchError(f'Engines differ on\n{program}\n'
+                                f'fast: {fast.program_body}\nline: {line.program_body}')
+
+    # ... and raises the same exceptions
+    for program, error in _invalid_programs.items():
+        for engine in ('fast', 'line'):
+            try:
+                OriginIR_BaseParser(engine=engine).parse(program)
+            except error:
+                pass
+            else:
+                raise NotMatchError(f'Engine {engine!r} should raise {error.__name__} on\n{program}')
+
+
+@qpandalite_test('Test OriginIR Parse Stream')
+def run_test_parse_stream():
+    # parse_stream yields the program body of parse, from lines or from a file
+    programs = [_block_program] + [random_originir(6, 200) for _ in range(5)]
+    for program in programs:
+        reference = OriginIR_BaseParser()
+        reference.parse(program)
+        stream = OriginIR_BaseParser()
+        opcodes = list(stream.parse_stream(iter(program.splitlines())))
+        if (opcodes != reference.program_body or stream.measure_qubits != reference.measure_qubits
+                or (stream.n_qubit, stream.n_cbit) != (reference.n_qubit, reference.n_cbit)):
+            raise NotMatchError(f'parse_stream differs from parse on\n{program}')
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'program.ir'
+        path.write_text(_block_program)
+        stream = OriginIR_BaseParser()
+        for source in (path, str(path)):
+            if list(stream.parse_stream(source)) != _program_body(_block_program):
+                raise NotMatchError(f'parse_stream({type(source).__name__}) differs from parse.')
+
+    for program, error in _invalid_programs.items():
+        try:
+            list(OriginIR_BaseParser().parse_stream(program.splitlines()))
+        except error:
+            pass
+        else:
+            raise NotMatchError(f'parse_stream should raise {error.__name__} on\n{program}')
+
+
+def _program_body(program):
+    parser = OriginIR_BaseParser()
+    parser.parse(program)
+    return parser.program_body
+
+
 if __name__ == '__main__':
-    run_test_originir_parser()
\ No newline at end of file
+    run_test_originir_parser()
+    run_test_parser_engines()
+    run_test_parse_stream()
\ No newline at end of file
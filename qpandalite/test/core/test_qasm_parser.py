@@ -1,5 +1,5 @@
 from qpandalite.circuit_builder.qasm_spec import generate_sub_gateset_qasm
-from qpandalite.qasm import OpenQASM2_BaseParser
+from qpandalite.qasm import OpenQASM2_BaseParser, RegisterNotFoundError, RegisterOutOfRangeError
 import qpandalite.simulator as qsim
 import numpy as np
 
@@ -56,5 +56,80 @@ def run_test_qasm_parser():
         print(f'Test {i+1} passed.')
 
 
+_register_program = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg a[2];
+creg c[4];
+qreg b [ 3 ];
+h a[1];
+cx a[0],b[2];
+u3 (pi/2, -0.5*pi, 1e-3) b[0];
+rzz(0.25) b[1] , a[0];
+ch a[1], b[0];
+cy b[2],a[0];
+c3x a[0],a[1],b[0],b[1];
+cu3(0.1,0.2,0.3) b[2],a[1];
+barrier a[0],b[1];
+sdg  b [ 1 ] ;
+measure b[2] -> c[0];
+measure a[0] -> c[3];
+"""
+
+_qasm_header = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\ncreg c[2];\n'
+
+_invalid_statements = {
+    'foo q[0];': NotImplementedError,
+    'u0(1) q[0];': NotImplementedError,
+    'xq[0];': NotImplementedError,
+    'rx q[0];': RuntimeError,
+    'h(0.5) q[0];': RuntimeError,
+    'cx q[0];': RuntimeError,
+    'rx(0.1,0.2) q[0];': ValueError,
+    'rx(01) q[0];': SyntaxError,
+    'x r[0];': RegisterNotFoundError,
+    'cx q[0],q[2];': RegisterOutOfRangeError,
+}
+
+
+@qpandalite_test('Test QASM Parser Engines')
+def run_test_parser_engines():
+    # The fast engine produces exactly the output of the line engine
+    programs = [_register_program] + [random_qasm(6, 200, measurements=True) for _ in range(20)]
+    for program in programs:
+        fast, line = OpenQASM2_BaseParser(engine='fast'), OpenQASM2_BaseParser(engine='line')
+        fast.parse(program)
+        line.parse(program)
+        if (fast.program_body != line.program_body or fast.measure_qubits != line.measure_qubits
+                or fast.n_qubit != line.n_qubit):
+            raise NotMatchError(f'Engines differ on\n{program}\n'
+                                f'fast: {fast.program_body}\nline: {line.program_body}')
+
+    # ... and raises the same exceptions
+    for statement, error in _invalid_statements.items():
+        for engine in ('fast', 'line'):
+            try:
+                OpenQASM2_BaseParser(engine=engine).parse(_qasm_header + statement)
+            except error:
+                pass
+            else:
+                raise NotMatchError(f'Engine {engine!r} should raise {error.__name__} on {statement}')
+
+    # registers are laid out in declaration order: a[0..1] -> 0..1, b[0..2] -> 2..4
+    parser = OpenQASM2_BaseParser()
+    parser.parse(_register_program)
+    if parser.program_body[4] != ('H', 2, None, None, False, [1]):
+        raise NotMatchError(f'ch is parsed as {parser.program_body[4]}')
+    if parser.measure_qubits != [(4, 0), (0, 3)]:
+        raise NotMatchError(f'Measurements are parsed as {parser.measure_qubits}')
+
+    try:
+        OpenQASM2_BaseParser(engine='regex')
+    except ValueError:
+        pass
+    else:
+        raise NotMatchError('An unknown engine should be rejected.')
+
+
 if __name__ == '__main__':
-    run_test_qasm_parser()
\ No newline at end of file
+    run_test_qasm_parser()
+    run_test_parser_engines()
\ No newline at end of file
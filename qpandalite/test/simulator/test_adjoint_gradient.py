@@ -0,0 +1,138 @@
+# Test the adjoint-method gradients against finite differences and the
+# parameter-shift rule, on circuits using every parametric gate.
+
+import numpy as np
+from qpandalite.circuit_builder import Circuit
+from qpandalite.algorithmics.measurement import PauliSum
+from qpandalite.simulator.opcode_simulator import OpcodeSimulator
+from qpandalite.pytorch.adjoint import adjoint_gradient, parametric_operations, _gate_parameters
+from qpandalite.test._utils import qpandalite_test, NotMatchError
+
+
+def _random_opcodes(rng):
+    def angle():
+        return float(rng.uniform(-np.pi, np.pi))
+
+    return [
+        ('H', 0, None, None, False, None),
+        ('H', 1, None, None, False, None),
+        ('RX', 0, None, angle(), False, None),
+        ('RY', 1, None, angle(), True, None),
+        ('RZ', 2, None, angle(), False, {0}),
+        ('U1', 1, None, angle(), False, None),
+        ('U2', 2, None, [angle(), angle()], False, None),
+        ('U3', 0, None, [angle(), angle(), angle()], True, {2}),
+        ('XX', [0, 1], None, angle(), False, None),
+        ('YY', [1, 2], None, angle(), False, None),
+        ('ZZ', [0, 2], None, angle(), True, None),
+        ('XY', [0, 1], None, angle(), False, None),
+        ('XY', [1, 2], None, angle(), True, {0}),
+        ('RPhi', 1, None, [angle(), angle()], False, None),
+        ('RPhi90', 0, None, angle(), False, None),
+        ('RPhi180', 2, None, angle(), True, None),
+        ('PHASE2Q', [0, 1], None, [angle(), angle(), angle()], False, None),
+        ('UU15', [2, 0], None, [angle() for _ in range(15)], False, None),
+        ('CNOT', [0, 2], None, None, False, None),
+        ('ISWAP', [1, 2], None, None, True, None),
+        ('BARRIER', [0, 1, 2], None, None, False, None),
+        ('RY', 2, None, angle(), False, {0, 1}),
+    ]
+
+
+def _with_gate_parameters(opcodes, values):
+    """Opcodes with the flat gate parameters replaced by ``values``."""
+    result, i = [], 0
+    for operation, qubit, cbit, parameter, is_dagger, control_qubits_set in opcodes:
+        if operation in parametric_operations:
+            if isinstance(parameter, list):
+                parameter = [float(v) for v in values[i:i + len(parameter)]]
+                i += len(parameter)
+            else:
+                parameter = float(values[i])
+                i += 1
+        result.append((operation, qubit, cbit, parameter, is_dagger, control_qubits_set))
+    return result
+
+
+def _test_expectation_value():
+    rng = np.random.default_rng(10)
+    opcodes = _random_opcodes(rng)
+    observable = PauliSum({'ZXY': 0.7, 'XIZ': -0.3, 'YYI': 0.2, 'III': 0.1})
+
+    value, _ = adjoint_gradient(opcodes, observable)
+    simulator = OpcodeSimulator('statevector')
+    simulator.simulate_opcodes_statevector(3, opcodes)
+    expected = simulator.simulator.expval_pauli_sum(observable.pauli_strings, observable.coeffs)
+    if not np.isclose(value, expected):
+        raise NotMatchError(f'Adjoint expectation {value} differs from expval_pauli_sum {expected}.')
+
+
+def _test_match_finite_difference(n_circuits):
+    rng = np.random.default_rng(11)
+    observable = {'ZXY': 0.7, 'XIZ': -0.3, 'YYI': 0.2}
+    step = 1e-6
+    for _ in range(n_circuits):
+        opcodes = _random_opcodes(rng)
+        theta = _gate_parameters(opcodes)
+        _, gradient = adjoint_gradient(opcodes, observable)
+        if len(gradient) != len(theta):
+            raise NotMatchError(f'Expected {len(theta)} gradients, got {len(gradient)}.')
+
+        for k in range(len(theta)):
+            plus, minus = theta.copy(), theta.copy()
+            plus[k] += step
+            minus[k] -= step
+            expected = (adjoint_gradient(_with_gate_parameters(opcodes, plus), observable)[0] -
+                        adjoint_gradient(_with_gate_parameters(opcodes, minus), observable)[0]) / (2 * step)
+            if not np.isclose(gradient[k], expected, atol=1e-6):
+                raise NotMatchError(f'Gradient {k} is {gradient[k]}, finite difference gives {expected}.\n'
+                                    f'{opcodes}')
+
+
+def _test_match_parameter_shift():
+    # Pauli rotations: dE/dtheta = (E(theta + pi/2) - E(theta - pi/2)) / 2
+    c = Circuit()
+    for q in range(4):
+        c.ry(q, 0.3 + 0.2 * q)
+        c.rz(q, -0.4 * q)
+    for q in range(3):
+        c.cnot(q, q + 1)
+    for q in range(4):
+        c.rx(q, 0.1 * q - 0.5)
+    c.measure(0, 1, 2, 3)
+    observable = {'ZZII': 1.0, 'IXXI': 0.5, 'IIYZ': -0.25}
+
+    _, gradient = adjoint_gradient(c, observable)
+    opcodes = c.opcode_list
+    theta = _gate_parameters(opcodes)
+    for k in range(len(theta)):
+        plus, minus = theta.copy(), theta.copy()
+        plus[k] += np.pi / 2
+        minus[k] -= np.pi / 2
+        expected = 0.5 * (adjoint_gradient(_with_gate_parameters(opcodes, plus), observable, 4)[0] -
+                          adjoint_gradient(_with_gate_parameters(opcodes, minus), observable, 4)[0])
+        if not np.isclose(gradient[k], expected):
+            raise NotMatchError(f'Gradient {k} is {gradient[k]}, parameter shift gives {expected}.')
+
+
+def _test_invalid_input():
+    for opcodes, observable in [([('Depolarizing', 0, None, 0.1, False, None)], {'Z': 1.0}),
+                                ([('RX', 0, None, 0.1, False, None)], {'ZZ': 1.0})]:
+        try:
+            adjoint_gradient(opcodes, observable, n_qubits=1)
+        except ValueError:
+            pass
+        else:
+            raise NotMatchError(f'adjoint_gradient should reject {opcodes} with {observable}.')
+
+
+@qpandalite_test('Test Adjoint Gradient')
+def run_test_adjoint_gradient():
+    _test_expectation_value()
+    _test_match_finite_difference(3)
+    _test_match_parameter_shift()
+    _test_invalid_input()
+
+
+if __name__ == '__main__':
+    run_test_adjoint_gradient()
@@ -0,0 +1,131 @@
+# Test that a CompiledProgram (BaseSimulator.compile) gives the same results
+# as simulating the source program directly.
+
+import pickle
+import random
+import numpy as np
+from qpandalite.circuit_builder import Circuit, opcodes_to_bytes
+from qpandalite.circuit_builder.random_originir import random_originir
+from qpandalite.circuit_builder.originir_spec import available_originir_error_channels
+from qpandalite.originir.originir_base_parser import OriginIR_BaseParser
+from qpandalite.simulator.originir_simulator import OriginIR_Simulator, OriginIR_NoisySimulator
+from qpandalite.simulator.qasm_simulator import QASM_Simulator
+from qpandalite.simulator.opcode_simulator import CompiledProgram
+from qpandalite.simulator.error_model import ErrorLoader_GenericError, Depolarizing
+from qpandalite.test._utils import qpandalite_test, NotMatchError
+
+
+def _controlled_originir():
+    c = Circuit()
+    c.h(0)
+    c.h(1)
+    with c.control(0, 1):
+        c.rx(2, 0.3)
+        c.u3(3, 0.1, 0.2, 0.3)
+    with c.dagger():
+        c.s(2)
+        c.rphi(3, 0.4, 0.5)
+    c.cswap(0, 2, 3)
+    c.measure(3, 1, 2)
+    return c.originir
+
+
+def _test_compiled_matches_source(backend_type):
+    random.seed(2024)
+    sim = OriginIR_Simulator(backend_type=backend_type)
+    programs = [random_originir(4, 30, allow_dagger=True) for _ in range(10)]
+    programs.append(_controlled_originir())
+
+    for originir in programs:
+        compiled = sim.compile(originir)
+        if not isinstance(compiled, CompiledProgram) or compiled.program is None:
+            raise NotMatchError(f'Program was not compiled: {compiled}')
+
+        expected = np.array(sim.simulate_pmeasure(originir))
+        # run the same compiled program twice
+        for _ in range(2):
+            actual = np.array(sim.simulate_pmeasure(compiled))
+            if not np.allclose(expected, actual):
+                raise NotMatchError('Compiled program gives different probabilities.\n'
+                                    f'Program:\n{originir}\n'
+                                    f'expected: {expected}\nactual: {actual}')
+
+        if sim.opcode_simulator.simulator_typestr == 'statevector':
+            if not np.allclose(sim.simulate_statevector(originir), sim.simulate_statevector(compiled)):
+                raise NotMatchError(f'Compiled program gives a different statevector.\n{originir}')
+
+
+def _test_compiled_noisy_program():
+    random.seed(7)
+    channel_set = {k: v for k, v in available_originir_error_channels.items() if k != 'Kraus1Q'}
+    error_loader = ErrorLoader_GenericError([Depolarizing(0.02)])
+    sim = OriginIR_NoisySimulator(backend_type='density_matrix', error_loader=error_loader)
+    for _ in range(5):
+        originir = random_originir(3, 20, channel_set=channel_set)
+        compiled = sim.compile(originir)
+        if compiled.program is None:
+            raise NotMatchError('Noisy program was not compiled.')
+        # the error loader must not be applied a second time
+        if not np.allclose(sim.simulate_pmeasure(originir), sim.simulate_pmeasure(compiled)):
+            raise NotMatchError(f'Compiled noisy program gives different probabilities.\n{originir}')
+
+    # Kraus1Q has no integer code; the program falls back to gate-by-gate dispatch
+    kraus = [np.sqrt(0.9) * np.eye(2), np.sqrt(0.1) * np.array([[0, 1], [1, 0]])]
+    compiled = CompiledProgram(1, [('H', 0, None, None, False, None),
+                                   ('Kraus1Q', 0, None, kraus, None, None)], [0])
+    if compiled.program is not None:
+        raise NotMatchError('Kraus1Q should not be integer coded.')
+    prob = sim.simulate_pmeasure(compiled)
+    if not np.allclose(prob, [0.5, 0.5]):
+        raise NotMatchError(f'Unexpected probabilities with Kraus1Q: {prob}')
+
+
+def _test_compiled_program_sequence():
+    sim = OriginIR_Simulator()
+    compiled = sim.compile(_controlled_originir())
+    if compiled.measure_qubit != [3, 1, 2]:
+        raise NotMatchError(f'Unexpected measure qubits: {compiled.measure_qubit}')
+    if len(compiled[:3]) != 3 or not isinstance(compiled[:3], CompiledProgram):
+        raise NotMatchError('Slicing a CompiledProgram should return a CompiledProgram.')
+
+    restored = pickle.loads(pickle.dumps(compiled))
+    if restored.opcodes != compiled.opcodes or list(restored.program.ops) != list(compiled.program.ops):
+        raise NotMatchError('CompiledProgram does not survive pickling.')
+
+
+def _test_binary_circuit():
+    # a binary circuit gives the same results as its OriginIR text
+    random.seed(18)
+    sim = OriginIR_Simulator()
+    programs = [random_originir(4, 30, allow_dagger=True) for _ in range(5)]
+    programs.append(_controlled_originir())
+    for originir in programs:
+        parser = OriginIR_BaseParser()
+        parser.parse(originir)
+        measure_list = [qubit for qubit, _ in sorted(parser.measure_qubits, key=lambda m: m[1])]
+        data = opcodes_to_bytes(parser.n_qubit, parser.n_cbit, parser.program_body, measure_list)
+        if not np.allclose(sim.simulate_pmeasure(originir), sim.simulate_pmeasure(data)):
+            raise NotMatchError(f'Binary circuit gives different probabilities.\n{originir}')
+
+    c = Circuit()
+    c.h(0)
+    with c.control(0):
+        c.rx(1, 0.3)
+    c.measure(1, 0)
+    if not np.allclose(QASM_Simulator().simulate_pmeasure(c.qasm),
+                       QASM_Simulator().simulate_pmeasure(c.to_bytes())):
+        raise NotMatchError('Binary circuit gives different probabilities with QASM_Simulator.')
+
+
+@qpandalite_test('Test Compiled Program')
+def run_test_compiled_program():
+    _test_compiled_matches_source('statevector')
+    _test_compiled_matches_source('density_matrix')
+    _test_compiled_matches_source('density_matrix_qutip')
+    _test_compiled_noisy_program()
+    _test_compiled_program_sequence()
+    _test_binary_circuit()
+
+
+if __name__ == '__main__':
+    run_test_compiled_program()
@@ -0,0 +1,82 @@
+# Test the native Pauli expectation values (expval_pauli, expval_pauli_sum)
+# of the C++ simulators against dense matrices.
+
+import itertools
+import numpy as np
+from qpandalite.simulator.opcode_simulator import OpcodeSimulator
+from qpandalite.test._utils import qpandalite_test, NotMatchError
+
+_paulis = {
+    'I': np.eye(2),
+    'X': np.array([[0, 1], [1, 0]]),
+    'Y': np.array([[0, -1j], [1j, 0]]),
+    'Z': np.diag([1, -1]),
+}
+
+
+def _pauli_matrix(pauli_string, n_qubits):
+    # character i acts on qubit i, which is bit i of the state index
+    matrix = np.eye(1)
+    for pauli in reversed(pauli_string.upper().ljust(n_qubits, 'I')):
+        matrix = np.kron(matrix, _paulis[pauli])
+    return matrix
+
+
+def _test_expval_pauli():
+    n_qubits = 3
+    rng = np.random.default_rng(8)
+    psi = rng.normal(size=8) + 1j * rng.normal(size=8)
+    psi /= np.linalg.norm(psi)
+    a = rng.normal(size=(8, 8)) + 1j * rng.normal(size=(8, 8))
+    rho = a @ a.conj().T
+    rho /= np.trace(rho)
+
+    simulators = []
+    for backend_type, state, atol in [('statevector', psi, 1e-10),
+                                      ('statevector_f32', psi, 1e-5),
+                                      ('density_matrix', rho, 1e-10)]:
+        simulator = OpcodeSimulator(backend_type).simulator
+        simulator.load_state(state)
+        simulators.append((backend_type, simulator, state, atol))
+
+    terms = [''.join(p) for p in itertools.product('IXYZ', repeat=n_qubits)] + ['x', 'yZ', '']
+    for backend_type, simulator, state, atol in simulators:
+        for pauli_string in terms:
+            matrix = _pauli_matrix(pauli_string, n_qubits)
+            if state.ndim == 1:
+                expected = np.real(state.conj() @ matrix @ state)
+            else:
+                expected = np.real(np.trace(state @ matrix))
+            actual = simulator.expval_pauli(pauli_string)
+            if not np.isclose(actual, expected, atol=atol):
+                raise NotMatchError(f'{backend_type}: <{pauli_string}> = {actual}, expected {expected}')
+
+        coeffs = list(np.linspace(-1, 1, len(terms)))
+        expected = sum(c * simulator.expval_pauli(p) for p, c in zip(terms, coeffs))
+        if not np.isclose(simulator.expval_pauli_sum(terms, coeffs), expected, atol=atol):
+            raise NotMatchError(f'{backend_type}: expval_pauli_sum differs from the sum of terms.')
+
+
+def _test_expval_pauli_errors():
+    for backend_type in ['statevector', 'density_matrix']:
+        simulator = OpcodeSimulator(backend_type).simulator
+        simulator.init_n_qubit(2)
+        for bad_call in [lambda: simulator.expval_pauli('ZZZ'),
+                         lambda: simulator.expval_pauli('ZA'),
+                         lambda: simulator.expval_pauli_sum(['Z', 'X'], [1.0])]:
+            try:
+                bad_call()
+            except ValueError:
+                pass
+            else:
+                raise NotMatchError(f'{backend_type}: invalid Pauli input should raise ValueError.')
+
+
+@qpandalite_test('Test Expval Pauli')
+def run_test_expval_pauli():
+    _test_expval_pauli()
+    _test_expval_pauli_errors()
+
+
+if __name__ == '__main__':
+    run_test_expval_pauli()
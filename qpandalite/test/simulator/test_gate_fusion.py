@@ -0,0 +1,138 @@
+# Test that gate fusion (fusion_max_qubits) does not change the simulation
+# results, and that the generic UNITARY opcode matches the gates it replaces.
+
+import random
+import numpy as np
+from qpandalite.circuit_builder import Circuit
+from qpandalite.circuit_builder.random_originir import random_originir
+from qpandalite.simulator.originir_simulator import OriginIR_Simulator
+from qpandalite.simulator.opcode_simulator import OpcodeSimulator
+from qpandalite.simulator.gate_fusion import fuse_opcodes, block_unitary
+from qpandalite.test._utils import qpandalite_test, NotMatchError
+
+
+def _rotation_layers_originir(n_qubits, n_layers):
+    c = Circuit()
+    for layer in range(n_layers):
+        for q in range(n_qubits):
+            c.rx(q, 0.1 * q + layer)
+            c.rz(q, 0.2 * layer)
+            c.ry(q, 0.3)
+        for q in range(0, n_qubits - 1, 2):
+            c.cnot(q, q + 1)
+        for q in range(1, n_qubits - 1, 2):
+            c.cz(q, q + 1)
+    with c.control(0):
+        c.u3(2, 0.1, 0.2, 0.3)
+    c.measure(*range(n_qubits))
+    return c.originir
+
+
+def _test_fusion_matches_unfused(backend_type, n_programs):
+    random.seed(2025)
+    programs = [random_originir(4, 40, allow_dagger=True) for _ in range(n_programs)]
+    programs.append(_rotation_layers_originir(5, 4))
+
+    reference = OriginIR_Simulator(backend_type=backend_type)
+    for max_qubits in [1, 2, 3]:
+        sim = OriginIR_Simulator(backend_type=backend_type, fusion_max_qubits=max_qubits)
+        for originir in programs:
+            expected = np.array(reference.simulate_pmeasure(originir))
+            actual = np.array(sim.simulate_pmeasure(originir))
+            if not np.allclose(expected, actual):
+                raise NotMatchError(f'Fused program (k = {max_qubits}) gives different probabilities.\n'
+                                    f'Program:\n{originir}\n'
+                                    f'expected: {expected}\nactual: {actual}')
+
+            if backend_type == 'statevector':
+                compiled = sim.compile(originir)
+                if not np.allclose(reference.simulate_statevector(originir),
+                                   sim.simulate_statevector(compiled)):
+                    raise NotMatchError(f'Fused program (k = {max_qubits}) gives a different statevector.\n{originir}')
+                if len(compiled) >= len(reference.compile(originir)):
+                    raise NotMatchError('Fusion did not reduce the number of opcodes.')
+
+
+def _test_fusion_blocks():
+    opcodes = [
+        ('RX', 0, None, 0.1, False, None),
+        ('RZ', 0, None, 0.2, False, None),
+        ('H', 1, None, None, False, None),
+        ('Depolarizing', 1, None, 0.01, False, None),
+        ('S', 1, None, None, True, None),
+        ('CNOT', [0, 1], None, None, False, None),
+        ('TOFFOLI', [0, 1, 2], None, None, False, None),
+    ]
+
+    # single-qubit runs only; the noise channel and the wide gates are barriers.
+    # The block on qubit 0 stays open until the CNOT closes it.
+    fused = fuse_opcodes(opcodes, max_qubits=1)
+    operations = [opcode[0] for opcode in fused]
+    if operations != ['H', 'Depolarizing', 'UNITARY', 'S', 'CNOT', 'TOFFOLI']:
+        raise NotMatchError(f'Unexpected fused operations: {operations}')
+    expected = block_unitary(opcodes[:2], [0])
+    if fused[2][1] != [0] or not np.allclose(fused[2][3], expected):
+        raise NotMatchError(f'Unexpected fused block: {fused[2]}')
+
+    # S and CNOT merge into one block; the Toffoli is wider than k
+    fused = fuse_opcodes(opcodes, max_qubits=2)
+    operations = [opcode[0] for opcode in fused]
+    if operations != ['H', 'Depolarizing', 'UNITARY', 'TOFFOLI']:
+        raise NotMatchError(f'Unexpected fused operations: {operations}')
+
+    try:
+        fuse_opcodes(opcodes, max_qubits=7)
+    except ValueError:
+        pass
+    else:
+        raise NotMatchError('max_qubits beyond the kernel limit should raise ValueError.')
+
+
+def _test_unitary_opcode():
+    rng = np.random.default_rng(3)
+    for k in [1, 2, 3]:
+        a = rng.normal(size=(2 ** k, 2 ** k)) + 1j * rng.normal(size=(2 ** k, 2 ** k))
+        u, _ = np.linalg.qr(a)
+        qubits = [3, 0, 2][:k]
+        for is_dagger in [False, True]:
+            for control in [None, {1}]:
+                unitary = ('UNITARY', qubits, None, u, is_dagger, control)
+                prepare = [('H', q, None, None, False, None) for q in range(4)] + \
+                          [('RY', 1, None, 0.7, False, None)]
+                states = []
+                for backend_type in ['statevector', 'density_matrix', 'density_matrix_qutip']:
+                    sim = OpcodeSimulator(backend_type)
+                    states.append(np.array(sim.simulate_opcodes_stateprob(4, prepare + [unitary])))
+
+                # reference: apply the matrix in numpy
+                sim = OpcodeSimulator('statevector')
+                psi = np.array(sim.simulate_opcodes_statevector(4, prepare))
+                matrix = u.conj().T if is_dagger else u
+                expected = np.zeros_like(psi)
+                for i in range(16):
+                    if control and not (i >> 1) & 1:
+                        expected[i] += psi[i]
+                        continue
+                    col = sum(((i >> q) & 1) << b for b, q in enumerate(qubits))
+                    base = i & ~sum(1 << q for q in qubits)
+                    for row in range(2 ** k):
+                        j = base | sum(((row >> b) & 1) << q for b, q in enumerate(qubits))
+                        expected[j] += matrix[row, col] * psi[i]
+                if not np.allclose(np.array(sim.simulate_opcodes_statevector(4, prepare + [unitary])), expected):
+                    raise NotMatchError(f'UNITARY opcode is wrong (k = {k}, dagger = {is_dagger}, control = {control}).')
+                for prob in states:
+                    if not np.allclose(prob, np.abs(expected) ** 2):
+                        raise NotMatchError(f'UNITARY opcode differs between backends (k = {k}).')
+
+
+@qpandalite_test('Test Gate Fusion')
+def run_test_gate_fusion():
+    _test_unitary_opcode()
+    _test_fusion_blocks()
+    _test_fusion_matches_unfused('statevector', 10)
+    _test_fusion_matches_unfused('density_matrix', 5)
+    _test_fusion_matches_unfused('density_matrix_qutip', 1)
+
+
+if __name__ == '__main__':
+    run_test_gate_fusion()
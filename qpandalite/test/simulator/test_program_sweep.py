@@ -0,0 +1,85 @@
+# Test that PoolExecutor in observable mode (one compiled OpcodeProgram per
+# row, run in threads or worker processes) matches VectorizedExecutor, and
+# that OpcodeProgram pickles to the same program.
+
+import pickle
+import numpy as np
+from qpandalite.pytorch.adjoint import adjoint_gradient
+from qpandalite.pytorch.batch_executor import CircuitSkeleton, PoolExecutor, ProgramSweep, VectorizedExecutor
+from qpandalite.simulator.opcode_simulator import _encode_opcodes
+from qpandalite.test._utils import qpandalite_test, NotMatchError
+from qpandalite.test.simulator.test_vectorized_executor import _Template, _observable
+
+
+def _expectation(circuit):
+    return adjoint_gradient(circuit, _observable)[0]
+
+
+def _test_program_pickle():
+    skeleton = CircuitSkeleton(_Template(), _Template.names)
+    program = _encode_opcodes(skeleton.opcodes)
+    restored = pickle.loads(pickle.dumps(program))
+    for field in ['ops', 'daggers', 'qubit_offsets', 'qubits', 'param_offsets', 'params',
+                  'controller_offsets', 'controllers']:
+        if list(getattr(restored, field)) != list(getattr(program, field)):
+            raise NotMatchError(f'OpcodeProgram.{field} changed through pickling.')
+
+    params = np.arange(len(program.params), dtype=float)
+    rebound = program.with_params(params.tolist())
+    if list(rebound.params) != params.tolist() or list(program.params) == params.tolist():
+        raise NotMatchError('with_params should replace the parameters of a copy only.')
+    try:
+        program.with_params([0.0])
+    except ValueError:
+        pass
+    else:
+        raise NotMatchError('with_params should reject a parameter array of the wrong size.')
+
+
+def _test_match_vectorized():
+    rng = np.random.default_rng(14)
+    skeleton = CircuitSkeleton(_Template(), _Template.names)
+    rows = rng.uniform(-np.pi, np.pi, size=(23, len(_Template.names)))
+    expected = VectorizedExecutor(_observable)(skeleton, rows)
+
+    for executor in [PoolExecutor(observable=_observable),
+                     PoolExecutor(3, 'thread', observable=_observable),
+                     PoolExecutor(2, 'process', observable=_observable)]:
+        actual = executor(skeleton, rows)
+        if not np.allclose(actual, expected):
+            raise NotMatchError(f'{executor.pool} PoolExecutor with {executor.n_workers} workers '
+                                f'differs by {np.max(np.abs(actual - expected))}.')
+
+    # the generic mode ships the skeleton to the worker processes once
+    actual = PoolExecutor(2, 'process')(skeleton, rows[:6], _expectation)
+    if not np.allclose(actual, expected[:6]):
+        raise NotMatchError('Process PoolExecutor with expectation_fn differs from VectorizedExecutor.')
+
+
+def _test_invalid_skeleton():
+    class _Noisy(_Template):
+        def copy(self):
+            return _Noisy()
+
+        def build(self):
+            c = super().build()
+            c.opcode_list.append(('Depolarizing', 0, None, 0.1, False, None))
+            return c
+
+    try:
+        ProgramSweep(CircuitSkeleton(_Noisy(), _Template.names), _observable)
+    except ValueError:
+        pass
+    else:
+        raise NotMatchError('ProgramSweep should reject noise channels.')
+
+
+@qpandalite_test('Test Program Sweep')
+def run_test_program_sweep():
+    _test_program_pickle()
+    _test_match_vectorized()
+    _test_invalid_skeleton()
+
+
+if __name__ == '__main__':
+    run_test_program_sweep()
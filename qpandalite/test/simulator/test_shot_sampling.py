@@ -0,0 +1,149 @@
+# Test the batched shot sampling of BaseSimulator.simulate_shots and
+# BaseNoisySimulator.simulate_shots.
+
+import numpy as np
+from qpandalite.circuit_builder import Circuit
+from qpandalite.simulator.originir_simulator import OriginIR_Simulator, OriginIR_NoisySimulator
+from qpandalite.simulator.base_simulator import sample_counts, apply_readout_error
+from qpandalite.simulator.error_model import ErrorLoader_GenericError, Depolarizing, AmplitudeDamping
+from qpandalite.test._utils import qpandalite_test, NotMatchError
+
+
+def _ghz_originir(n_qubits):
+    c = Circuit()
+    c.h(0)
+    for i in range(n_qubits - 1):
+        c.cx(i, i + 1)
+    c.measure(*range(n_qubits))
+    return c.originir
+
+
+def _test_sample_counts_reproducible():
+    prob_list = [0.1, 0.2, 0.3, 0.4]
+    counts1 = sample_counts(prob_list, 1000, rng=42)
+    counts2 = sample_counts(prob_list, 1000, rng=np.random.default_rng(42))
+    if counts1 != counts2:
+        raise NotMatchError(f'Seeded sampling differs: {counts1} vs {counts2}')
+
+    counts_array = sample_counts(prob_list, 1000, rng=42, return_array=True)
+    if counts_array.shape != (4,) or counts_array.sum() != 1000:
+        raise NotMatchError(f'Unexpected count array: {counts_array}')
+    if dict(enumerate(counts_array.tolist())) != counts1:
+        raise NotMatchError('Count array does not match count dict.')
+
+
+def _test_simulate_shots_ghz(backend_type):
+    n_qubits = 4
+    shots = 20000
+    sim = OriginIR_Simulator(backend_type=backend_type)
+    counts = sim.simulate_shots(_ghz_originir(n_qubits), shots, rng=7)
+
+    if set(counts.keys()) - {0, 2 ** n_qubits - 1}:
+        raise NotMatchError(f'Unexpected outcomes for GHZ state: {counts}')
+    if sum(counts.values()) != shots:
+        raise NotMatchError(f'Total counts {sum(counts.values())} != {shots}')
+    if abs(counts.get(0, 0) / shots - 0.5) > 0.03:
+        raise NotMatchError(f'GHZ outcome frequencies are off: {counts}')
+
+    counts_array = sim.simulate_shots(_ghz_originir(n_qubits), shots, rng=7, return_array=True)
+    if counts_array.shape != (2 ** n_qubits,):
+        raise NotMatchError(f'Unexpected count array shape: {counts_array.shape}')
+    if dict((k, v) for k, v in enumerate(counts_array.tolist()) if v) != counts:
+        raise NotMatchError('Count array does not match count dict for the same seed.')
+
+
+def _test_apply_readout_error():
+    outcomes = np.array([0b00, 0b01, 0b10, 0b11])
+    # qubit 0 always flips, qubit 1 never does
+    flipped = apply_readout_error(outcomes, [0, 1], {0: [1.0, 1.0], 1: [0.0, 0.0]}, rng=0)
+    if flipped.tolist() != [0b01, 0b00, 0b11, 0b10]:
+        raise NotMatchError(f'Unexpected readout flips: {flipped}')
+    # bit i belongs to measure_qubit[i], not to qubit i
+    flipped = apply_readout_error(outcomes, [5, 3], {3: [1.0, 1.0]}, rng=0)
+    if flipped.tolist() != [0b10, 0b11, 0b00, 0b01]:
+        raise NotMatchError(f'Readout error applied to the wrong bit: {flipped}')
+
+
+def _test_readout_error_independent_per_qubit():
+    # every qubit draws its own flip: P(11) = 0.3 * 0.3, P(01) = P(10) = 0.3 * 0.7
+    shots = 100000
+    flipped = apply_readout_error(np.zeros(shots, dtype=np.int64), [0, 1],
+                                  {0: [0.3, 0.0], 1: [0.3, 0.0]}, rng=5)
+    frequencies = np.bincount(flipped, minlength=4) / shots
+    expected = np.array([0.49, 0.21, 0.21, 0.09])
+    if np.max(np.abs(frequencies - expected)) > 0.01:
+        raise NotMatchError(f'Readout flips are not independent per qubit: {frequencies}')
+
+
+def _test_noisy_shots_readout_only():
+    c = Circuit()
+    c.x(0)
+    c.measure(0, 1)
+    shots = 20000
+    sim = OriginIR_NoisySimulator(readout_error={0: [0.0, 0.2]})
+    counts = sim.simulate_shots(c.originir, shots, rng=1)
+    # qubit 0 is |1> and read as 0 with probability 0.2; qubit 1 is exact
+    if set(counts.keys()) - {0b00, 0b01}:
+        raise NotMatchError(f'Unexpected outcomes: {counts}')
+    if abs(counts.get(0b00, 0) / shots - 0.2) > 0.02:
+        raise NotMatchError(f'Readout error rate is off: {counts}')
+
+
+def _noisy_originir():
+    c = Circuit()
+    c.h(0)
+    c.cx(0, 1)
+    c.ry(2, 0.7)
+    c.cx(1, 2)
+    c.measure(0, 1, 2)
+    return c.originir
+
+
+def _test_noisy_trajectories_match_density_operator():
+    shots = 20000
+    error_loader = ErrorLoader_GenericError([Depolarizing(0.05), AmplitudeDamping(0.05)])
+    readout_error = {0: [0.02, 0.03], 2: [0.05, 0.01]}
+
+    sv_sim = OriginIR_NoisySimulator(backend_type='statevector',
+                                     error_loader=error_loader,
+                                     readout_error=readout_error)
+    counts = sv_sim.simulate_shots(_noisy_originir(), shots, rng=3, return_array=True)
+
+    dm_sim = OriginIR_NoisySimulator(backend_type='density_matrix',
+                                     error_loader=error_loader,
+                                     readout_error=readout_error)
+    prob_list = np.array(dm_sim.simulate_pmeasure(_noisy_originir()))
+
+    if np.max(np.abs(counts / shots - prob_list)) > 0.02:
+        raise NotMatchError('Noisy trajectories do not match the density operator.\n'
+                            f'trajectories: {counts / shots}\n'
+                            f'density operator: {prob_list}')
+
+    # the same seed gives the same counts, also when reusing the simulator
+    counts_again = sv_sim.simulate_shots(_noisy_originir(), shots, rng=3, return_array=True)
+    if not np.array_equal(counts, counts_again):
+        raise NotMatchError('Seeded noisy sampling is not reproducible.')
+
+    counts_pool = sv_sim.simulate_shots(_noisy_originir(), 2000, rng=3, n_workers=2)
+    if sum(counts_pool.values()) != 2000:
+        raise NotMatchError(f'Process pool returned {sum(counts_pool.values())} shots.')
+
+
+@qpandalite_test('Test Shot Sampling')
+def run_test_shot_sampling():
+    _test_sample_counts_reproducible()
+    _test_simulate_shots_ghz('statevector')
+    _test_simulate_shots_ghz('density_matrix')
+
+
+@qpandalite_test('Test Noisy Shot Sampling')
+def run_test_noisy_shot_sampling():
+    _test_apply_readout_error()
+    _test_readout_error_independent_per_qubit()
+    _test_noisy_shots_readout_only()
+    _test_noisy_trajectories_match_density_operator()
+
+
+if __name__ == '__main__':
+    run_test_shot_sampling()
+    run_test_noisy_shot_sampling()
@@ -0,0 +1,80 @@
+# Test OriginIR_Simulator.simulate_stream, which applies the gates of a
+# program while it is parsed, against simulate_pmeasure on the whole text.
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from qpandalite.circuit_builder.random_originir import random_originir
+from qpandalite.simulator.originir_simulator import OriginIR_Simulator
+from qpandalite.simulator.base_simulator import TopologyError
+from qpandalite.test._utils import qpandalite_test, NotMatchError
+
+_program = """QINIT 4
+CREG 3
+H q[0]
+CONTROL q[3]
+RX q[1], (0.7)
+DAGGER
+CNOT q[0], q[2]
+U3 q[2], (0.3, -1.2, 0.5)
+ENDDAGGER
+ENDCONTROL q[3]
+X q[3]
+RY q[0], (1.1) dagger controlled_by (q[3])
+MEASURE q[2], c[0]
+MEASURE q[0], c[2]
+MEASURE q[1], c[1]"""
+
+
+def _test_match_pmeasure():
+    reference = OriginIR_Simulator(least_qubit_remapping=False)
+    programs = [_program] + [random_originir(5, 100) for _ in range(5)]
+    for backend_type in ('statevector', 'density_matrix'):
+        sim = OriginIR_Simulator(backend_type)
+        for program in programs:
+            expected = reference.simulate_pmeasure(program)
+            # a chunk size of 3 splits the program into many backend calls
+            for chunk_size in (3, 4096):
+                actual = sim.simulate_stream(program.splitlines(), chunk_size=chunk_size)
+                if not np.allclose(actual, expected):
+                    raise NotMatchError(f'simulate_stream ({backend_type}, chunk_size={chunk_size}) '
+                                        f'gives {actual}, expected {expected}\n{program}')
+
+    # the final state stays in the simulator
+    sim = OriginIR_Simulator()
+    sim.simulate_stream(_program.splitlines())
+    if not np.allclose(sim.state, reference.simulate_statevector(_program)):
+        raise NotMatchError('The final state of simulate_stream differs from simulate_statevector.')
+
+
+def _test_from_file():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'program.ir'
+        path.write_text(_program)
+        actual = OriginIR_Simulator().simulate_stream(path)
+    expected = OriginIR_Simulator(least_qubit_remapping=False).simulate_pmeasure(_program)
+    if not np.allclose(actual, expected):
+        raise NotMatchError(f'simulate_stream from a file gives {actual}, expected {expected}.')
+
+
+def _test_available_qubits():
+    for kwargs, error in [({'available_qubits': [0, 1, 2]}, TopologyError),
+                          ({'available_topology': [[0, 1], [1, 2]]}, ValueError)]:
+        try:
+            OriginIR_Simulator(**kwargs).simulate_stream(_program.splitlines())
+        except error:
+            pass
+        else:
+            raise NotMatchError(f'simulate_stream should raise {error.__name__} with {kwargs}.')
+
+
+@qpandalite_test('Test Simulate Stream')
+def run_test_simulate_stream():
+    _test_match_pmeasure()
+    _test_from_file()
+    _test_available_qubits()
+
+
+if __name__ == '__main__':
+    run_test_simulate_stream()
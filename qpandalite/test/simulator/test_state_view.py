@@ -0,0 +1,77 @@
+# Test the NumPy array of the C++ simulator state and load_state.
+
+import numpy as np
+from qpandalite.simulator.opcode_simulator import OpcodeSimulator
+from qpandalite.test._utils import qpandalite_test, NotMatchError
+
+
+def _test_state_array():
+    for backend_type, dtype in [('statevector', np.complex128),
+                                ('statevector_f32', np.complex64),
+                                ('density_matrix', np.complex128)]:
+        simulator = OpcodeSimulator(backend_type).simulator
+        simulator.init_n_qubit(3)
+        simulator.hadamard(0)
+        state = simulator.state
+        if not isinstance(state, np.ndarray) or state.dtype != dtype:
+            raise NotMatchError(f'{backend_type}: state is not a {dtype} array ({type(state)}).')
+        # the array owns its data: later gates and re-initialization leave it unchanged
+        expected = state.copy()
+        simulator.x(1)
+        if np.shares_memory(state, simulator.state) or not np.array_equal(state, expected):
+            raise NotMatchError(f'{backend_type}: state shares the simulator buffer.')
+        simulator.init_n_qubit(6)
+        if not np.array_equal(state, expected):
+            raise NotMatchError(f'{backend_type}: state changed after init_n_qubit.')
+
+
+def _test_returned_state_is_kept():
+    sim = OpcodeSimulator('statevector')
+    first = sim.simulate_opcodes_statevector(2, [('X', 0, None, None, False, None)])
+    sim.simulate_opcodes_statevector(2, [('X', 1, None, None, False, None)])
+    if not np.allclose(first, [0, 1, 0, 0]):
+        raise NotMatchError(f'Earlier statevector changed after another simulation: {first}')
+
+
+def _test_load_state():
+    rng = np.random.default_rng(7)
+    psi = rng.normal(size=8) + 1j * rng.normal(size=8)
+    psi /= np.linalg.norm(psi)
+    opcodes = [('CNOT', [0, 2], None, None, False, None), ('RY', 1, None, 0.3, False, None)]
+
+    expected = None
+    for backend_type in ['statevector', 'statevector_f32']:
+        sim = OpcodeSimulator(backend_type)
+        sim.simulator.load_state(psi)
+        if sim.simulator.total_qubit != 3:
+            raise NotMatchError(f'load_state sets total_qubit = {sim.simulator.total_qubit}')
+        sim.simulate_program(opcodes)
+        if expected is None:
+            expected = np.array(sim.simulator.state)
+        elif not np.allclose(sim.simulator.state, expected, atol=1e-5):
+            raise NotMatchError(f'{backend_type}: evolution from a loaded state differs.')
+
+    sim = OpcodeSimulator('density_matrix')
+    sim.simulator.load_state(np.outer(psi, psi.conj()))
+    sim.simulate_program(opcodes)
+    if not np.allclose(np.reshape(sim.simulator.state, (8, 8)), np.outer(expected, expected.conj())):
+        raise NotMatchError('density_matrix: evolution from a loaded state differs.')
+
+    for backend_type, size in [('statevector', 6), ('density_matrix', 8)]:
+        try:
+            OpcodeSimulator(backend_type).simulator.load_state(np.ones(size))
+        except ValueError:
+            pass
+        else:
+            raise NotMatchError(f'{backend_type}: load_state should reject a state of size {size}.')
+
+
+@qpandalite_test('Test State View')
+def run_test_state_view():
+    _test_state_array()
+    _test_returned_state_is_kept()
+    _test_load_state()
+
+
+if __name__ == '__main__':
+    run_test_state_view()
@@ -0,0 +1,62 @@
+# Test that the single-precision statevector backend (statevector_f32) agrees
+# with the double-precision one to float32 accuracy on every entry point.
+
+import random
+import numpy as np
+from qpandalite.circuit_builder.random_originir import random_originir
+from qpandalite.simulator.originir_simulator import OriginIR_Simulator
+from qpandalite.simulator.opcode_simulator import OpcodeSimulator, backend_alias
+from qpandalite.test._utils import qpandalite_test, NotMatchError
+
+# float32 keeps about 7 significant digits; errors grow slowly with depth
+_atol = 1e-5
+
+
+def _test_backend_alias():
+    for alias in ['statevector_f32', 'State_Vector_F32', 'statevector_complex64']:
+        if backend_alias(alias) != 'statevector_f32':
+            raise NotMatchError(f'backend_alias({alias!r}) = {backend_alias(alias)!r}')
+
+    sim = OpcodeSimulator('statevector_f32')
+    if sim.simulator_typestr != 'statevector':
+        raise NotMatchError(f'Unexpected simulator_typestr: {sim.simulator_typestr}')
+    if type(sim.simulator).max_qubit_num != type(OpcodeSimulator('statevector').simulator).max_qubit_num + 1:
+        raise NotMatchError('statevector_f32 should allow one more qubit than statevector.')
+
+
+def _test_match_double(n_programs):
+    random.seed(6)
+    double = OriginIR_Simulator(backend_type='statevector')
+    single = OriginIR_Simulator(backend_type='statevector_f32')
+    for _ in range(n_programs):
+        originir = random_originir(5, 60, allow_dagger=True)
+        expected = np.array(double.simulate_statevector(originir))
+        actual = np.array(single.simulate_statevector(originir))
+        if not np.allclose(expected, actual, atol=_atol):
+            raise NotMatchError(f'statevector_f32 differs from statevector by '
+                                f'{np.max(np.abs(expected - actual))}.\n{originir}')
+
+        expected = np.array(double.simulate_pmeasure(originir))
+        actual = np.array(single.simulate_pmeasure(originir))
+        if not np.allclose(expected, actual, atol=_atol):
+            raise NotMatchError(f'statevector_f32 gives different probabilities.\n{originir}')
+
+        # compiled programs run through run_program, fused ones through the k-qubit kernel
+        for sim in [single, OriginIR_Simulator(backend_type='statevector_f32', fusion_max_qubits=2)]:
+            actual = np.array(sim.simulate_pmeasure(sim.compile(originir)))
+            if not np.allclose(expected, actual, atol=_atol):
+                raise NotMatchError(f'Compiled statevector_f32 program gives different probabilities.\n{originir}')
+
+        counts = single.simulate_shots(originir, shots=1000, rng=1, return_array=True)
+        if np.sum(counts) != 1000:
+            raise NotMatchError(f'Unexpected number of shots: {np.sum(counts)}')
+
+
+@qpandalite_test('Test Statevector F32')
+def run_test_statevector_f32():
+    _test_backend_alias()
+    _test_match_double(10)
+
+
+if __name__ == '__main__':
+    run_test_statevector_f32()
@@ -0,0 +1,70 @@
+# Test that the multithreaded statevector kernels give the same state for any
+# thread count, and agree with the density operator backend.
+
+import random
+import numpy as np
+from qpandalite.simulator import set_num_threads, get_num_threads
+from qpandalite.simulator.opcode_simulator import OpcodeSimulator
+from qpandalite.test._utils import qpandalite_test, NotMatchError
+
+
+def _random_opcodes(n_qubits, n_gates, seed):
+    rng = random.Random(seed)
+    gates = [('H', 1, 0), ('X', 1, 0), ('Y', 1, 0), ('Z', 1, 0), ('S', 1, 0), ('T', 1, 0),
+             ('SX', 1, 0), ('RX', 1, 1), ('RY', 1, 1), ('RZ', 1, 1), ('U1', 1, 1),
+             ('CZ', 2, 0), ('SWAP', 2, 0), ('ISWAP', 2, 0), ('CNOT', 2, 0),
+             ('XY', 2, 1), ('XX', 2, 1), ('YY', 2, 1), ('ZZ', 2, 1),
+             ('TOFFOLI', 3, 0), ('CSWAP', 3, 0)]
+    opcodes = []
+    for _ in range(n_gates):
+        name, nqubit, nparam = rng.choice(gates)
+        qubits = rng.sample(range(n_qubits), nqubit + 1)
+        qubit = qubits[0] if nqubit == 1 else qubits[:nqubit]
+        parameter = rng.uniform(0, 2 * np.pi) if nparam else None
+        control = {qubits[-1]} if rng.random() < 0.3 else None
+        opcodes.append((name, qubit, None, parameter, rng.random() < 0.5, control))
+    return opcodes
+
+
+def _test_thread_count_independent():
+    # large enough to run the kernels in parallel
+    n_qubits = 16
+    opcodes = _random_opcodes(n_qubits, 100, seed=1)
+    default_threads = get_num_threads()
+    try:
+        states = []
+        for n_threads in [1, 4]:
+            set_num_threads(n_threads)
+            if get_num_threads() not in (1, n_threads):
+                raise NotMatchError(f'get_num_threads() = {get_num_threads()}')
+            sim = OpcodeSimulator('statevector')
+            states.append(np.array(sim.simulate_opcodes_statevector(n_qubits, opcodes)))
+    finally:
+        set_num_threads(0)
+
+    if get_num_threads() != default_threads:
+        raise NotMatchError('set_num_threads(0) does not restore the default.')
+    if not np.allclose(states[0], states[1]):
+        raise NotMatchError('Statevector depends on the number of threads.')
+    if not np.isclose(np.linalg.norm(states[0]), 1):
+        raise NotMatchError(f'State is not normalized: {np.linalg.norm(states[0])}')
+
+
+def _test_match_density_operator():
+    n_qubits = 4
+    for seed in range(10):
+        opcodes = _random_opcodes(n_qubits, 30, seed)
+        sv = np.array(OpcodeSimulator('statevector').simulate_opcodes_statevector(n_qubits, opcodes))
+        dm = OpcodeSimulator('density_matrix').simulate_opcodes_density_operator(n_qubits, opcodes)
+        if not np.allclose(np.outer(sv, sv.conj()), dm):
+            raise NotMatchError(f'Statevector and density operator differ for {opcodes}')
+
+
+@qpandalite_test('Test Statevector Threads')
+def run_test_statevector_threads():
+    _test_thread_count_independent()
+    _test_match_density_operator()
+
+
+if __name__ == '__main__':
+    run_test_statevector_threads()
@@ -0,0 +1,105 @@
+# Test that VectorizedExecutor (all parameter vectors simulated as one stack
+# of statevectors) matches per-circuit simulation, and that batched
+# parameter-shift gradients through it match the adjoint method.
+
+import numpy as np
+from qpandalite.circuit_builder import Circuit
+from qpandalite.pytorch.adjoint import adjoint_gradient
+from qpandalite.pytorch.batch_executor import CircuitSkeleton, PoolExecutor, VectorizedExecutor
+from qpandalite.pytorch.quantum_layer import _parameter_shift_batch
+from qpandalite.test._utils import qpandalite_test, NotMatchError
+
+
+class _Parameter:
+    def __init__(self, template, name):
+        self.template, self.name = template, name
+
+    def bind(self, value):
+        self.template.values[self.name] = value
+        self.template.rebuild()
+
+
+class _Template:
+    """Template with inputs x0, x1 and weights w0..w5, bound by rebuilding the circuit."""
+
+    names = ['x0', 'x1', 'w0', 'w1', 'w2', 'w3', 'w4', 'w5']
+
+    def __init__(self):
+        self.values = dict.fromkeys(self.names, 0.0)
+        self._parameters = {name: _Parameter(self, name) for name in self.names}
+        self.rebuild()
+
+    def copy(self):
+        return _Template()
+
+    def rebuild(self):
+        circuit = self.build()
+        self.opcode_list = circuit.opcode_list
+        self.qubit_num = circuit.qubit_num
+
+    def build(self):
+        v = self.values
+        c = Circuit()
+        c.ry(0, v['x0'])
+        c.ry(1, v['x1'])
+        c.rx(2, 0.5 * v['x0'] + 0.1)
+        for q in range(3):
+            c.rz(q, v[f'w{q}'])
+        c.cnot(0, 1)
+        c.cnot(1, 2)
+        with c.control(0):
+            c.u3(2, v['w3'], v['w4'], 0.2)
+        c.xx(0, 1, v['w5'])
+        c.ry(1, v['w3'] - v['w5'])
+        c.measure(0, 1, 2)
+        return c
+
+
+_observable = {'ZZI': 0.5, 'IXY': -1.0, 'ZIZ': 0.25}
+
+
+def _test_match_per_circuit():
+    rng = np.random.default_rng(12)
+    skeleton = CircuitSkeleton(_Template(), _Template.names)
+    if not skeleton.affine:
+        raise NotMatchError('The template should be affine in its parameters.')
+
+    rows = rng.uniform(-np.pi, np.pi, size=(40, len(_Template.names)))
+    expected = PoolExecutor()(skeleton, rows, lambda c: adjoint_gradient(c, _observable)[0])
+    actual = VectorizedExecutor(_observable)(skeleton, rows)
+    if not np.allclose(actual, expected):
+        raise NotMatchError(f'VectorizedExecutor differs by {np.max(np.abs(actual - expected))}.')
+
+    # a single distinct row, and rows where only one weight varies
+    for batch in [rows[:1], np.repeat(rows[:1], 3, axis=0) + np.outer([0, 1, 2], np.eye(8)[3])]:
+        expected = PoolExecutor()(skeleton, batch, lambda c: adjoint_gradient(c, _observable)[0])
+        if not np.allclose(VectorizedExecutor(_observable)(skeleton, batch), expected):
+            raise NotMatchError(f'VectorizedExecutor is wrong for the batch\n{batch}')
+
+
+def _test_batched_parameter_shift():
+    rng = np.random.default_rng(13)
+    skeleton = CircuitSkeleton(_Template(), _Template.names)
+    executor = VectorizedExecutor(_observable)
+    rows = rng.uniform(-np.pi, np.pi, size=(5, len(_Template.names)))
+
+    # w0, w1, w2 and w4 each enter one gate with frequency 1, where the shift rule is exact
+    columns = [2, 3, 4, 6]
+    grads = _parameter_shift_batch(lambda m: executor(skeleton, m), rows, columns, np.pi / 2)
+    for row, grad in zip(rows, grads):
+        _, gate_grads = adjoint_gradient(skeleton.bind(row), _observable)
+        expected = skeleton.jacobian.T @ gate_grads
+        if not np.allclose(grad[columns], expected[columns]):
+            raise NotMatchError(f'Batched parameter shift {grad[columns]} differs from adjoint {expected[columns]}.')
+        if np.any(np.delete(grad, columns)):
+            raise NotMatchError('Columns that were not requested got gradients.')
+
+
+@qpandalite_test('Test Vectorized Executor')
+def run_test_vectorized_executor():
+    _test_match_per_circuit()
+    _test_batched_parameter_shift()
+
+
+if __name__ == '__main__':
+    run_test_vectorized_executor()